@@ -5,11 +5,14 @@ Flask Application Factory
 from flask import Flask
 from flask_cors import CORS
 
+from app.utils.upload_spool import SpooledRequest
+
 
 def create_app():
     """Create and configure the Flask application"""
     
     app = Flask(__name__)
+    app.request_class = SpooledRequest  # Large uploads are spooled to disk, not memory
     
     # Configuration
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
@@ -59,10 +62,20 @@ def create_app():
     # Health check route
     @app.route('/api/health', methods=['GET'])
     def health_check():
+        from app.services.legal_aid_service import get_pincode_cache_stats
+        from app.routes.legal_aid_routes import legal_aid_service
+        from app.routes.scheme_routes import scheme_service
         return {
             'status': 'healthy',
             'message': 'Rural Legal Saathi API is running',
-            'version': '1.0.0'
+            'version': '1.0.0',
+            'caches': {
+                'pincode': get_pincode_cache_stats()
+            },
+            'snapshots': {
+                'dlsaDirectory': legal_aid_service.directory_info(),
+                'schemes': scheme_service.snapshot_info()
+            }
         }
     
     # Error handlers
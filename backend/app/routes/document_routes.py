@@ -3,13 +3,64 @@ Document Analysis Routes
 Handles document upload and OCR analysis
 """
 
-from flask import Blueprint, request, jsonify
-from app.services.document_service import DocumentService
-from app.utils.helpers import validate_file_upload
+import json
+
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from app.services.document_service import DocumentService, get_cached_summary
+from app.utils.helpers import validate_file_upload, format_sse, SSE_HEADERS
+from app.utils.upload_spool import allow_large_upload, unpack_zip_upload
 
 document_bp = Blueprint('document', __name__)
 document_service = DocumentService()
 
+DOCUMENT_EXTENSIONS = {'png', 'jpg', 'jpeg', 'pdf'}
+# Paralegal camps: 20-50 documents per family
+BATCH_MAX_FILES = 60
+BATCH_MAX_UPLOAD = 128 * 1024 * 1024
+
+
+def _get_document_file():
+    """
+    Find and validate the uploaded document
+    Returns (file, None) or (None, error response)
+    """
+    # Debug: Log what files are in the request
+    print(f"Request files: {list(request.files.keys())}")
+    print(f"Request content type: {request.content_type}")
+    print(f"Request method: {request.method}")
+    print(f"Request form data: {list(request.form.keys())}")
+    
+    # Get file from request (supports both 'document' and 'file' field names)
+    file = None
+    for field_name in ['document', 'file']:
+        if field_name in request.files:
+            file = request.files[field_name]
+            print(f"Found file in field: {field_name}, filename: {file.filename}")
+            break
+    
+    if not file or file.filename == '':
+        return None, (jsonify({
+            'success': False,
+            'error': 'No file found',
+            'message': 'कृपया एक फ़ाइल अपलोड करें',
+            'debug': {
+                'available_files': list(request.files.keys()),
+                'content_type': request.content_type,
+                'form_keys': list(request.form.keys())
+            }
+        }), 400)
+    
+    # Check file extension
+    file_ext = file.filename.rsplit('.', 1)[-1].lower() if '.' in file.filename else ''
+    if file_ext not in DOCUMENT_EXTENSIONS:
+        return None, (jsonify({
+            'success': False,
+            'error': 'Invalid file type',
+            'message': f'केवल PNG, JPG, PDF फ़ाइलें स्वीकार हैं। आपकी फ़ाइल: {file_ext}'
+        }), 400)
+    
+    return file, None
+
 
 @document_bp.route('/analyze-document', methods=['POST'])
 def analyze_document():
@@ -20,41 +71,9 @@ def analyze_document():
     Response: Simplified text explanation in Hindi with OCR extraction
     """
     try:
-        # Debug: Log what files are in the request
-        print(f"Request files: {list(request.files.keys())}")
-        print(f"Request content type: {request.content_type}")
-        print(f"Request method: {request.method}")
-        print(f"Request form data: {list(request.form.keys())}")
-        
-        # Get file from request (supports both 'document' and 'file' field names)
-        file = None
-        for field_name in ['document', 'file']:
-            if field_name in request.files:
-                file = request.files[field_name]
-                print(f"Found file in field: {field_name}, filename: {file.filename}")
-                break
-        
-        if not file or file.filename == '':
-            return jsonify({
-                'success': False,
-                'error': 'No file found',
-                'message': 'कृपया एक फ़ाइल अपलोड करें',
-                'debug': {
-                    'available_files': list(request.files.keys()),
-                    'content_type': request.content_type,
-                    'form_keys': list(request.form.keys())
-                }
-            }), 400
-        
-        # Check file extension
-        allowed_extensions = {'png', 'jpg', 'jpeg', 'pdf'}
-        file_ext = file.filename.rsplit('.', 1)[-1].lower() if '.' in file.filename else ''
-        if file_ext not in allowed_extensions:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid file type',
-                'message': f'केवल PNG, JPG, PDF फ़ाइलें स्वीकार हैं। आपकी फ़ाइल: {file_ext}'
-            }), 400
+        file, error_response = _get_document_file()
+        if error_response:
+            return error_response
         
         # Process document with OCR and AI
         result = document_service.analyze_document(file)
@@ -71,3 +90,105 @@ def analyze_document():
             'error': str(e),
             'message': 'दस्तावेज़ विश्लेषण में त्रुटि हुई। कृपया पुनः प्रयास करें।'
         }), 500
+
+
+@document_bp.route('/analyze-document/stream', methods=['POST'])
+def analyze_document_stream():
+    """
+    Analyze uploaded document and stream each stage as Server-Sent Events
+    
+    Request: multipart/form-data with 'document' field (same as /analyze-document)
+    Events: ocr -> classification -> key_info -> simplified -> done
+            ('error' replaces the remaining events if a stage fails)
+            The first 'simplified' event is the instant rule-based summary; a
+            second one with simplifiedSource 'ai' follows when Gemini finishes.
+    """
+    file, error_response = _get_document_file()
+    if error_response:
+        return error_response
+    
+    def generate():
+        for stage, payload in document_service.analyze_document_stages(file, stream=True):
+            yield format_sse(stage, payload)
+    
+    # stream_with_context keeps the upload open while the generator runs
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers=SSE_HEADERS)
+
+
+@document_bp.route('/analyze-documents/batch', methods=['POST'])
+@allow_large_upload(BATCH_MAX_UPLOAD)
+def analyze_documents_batch():
+    """
+    Analyze many documents in one request (e.g. at legal-aid camps)
+    
+    Request: multipart/form-data with several 'documents' files and/or one
+             'archive' zip of PNG/JPG/PDF files
+    Response: JSON Lines, one analysis result per file as soon as it finishes
+              ({index, filename, success, data | error, message})
+    """
+    uploads = [f for f in request.files.getlist('documents') if f and f.filename]
+    invalid = [f.filename for f in uploads if f.filename.rsplit('.', 1)[-1].lower() not in DOCUMENT_EXTENSIONS]
+    if invalid:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid file type',
+            'message': f'केवल PNG, JPG, PDF फ़ाइलें स्वीकार हैं। ये फ़ाइलें गलत हैं: {", ".join(invalid)}'
+        }), 400
+    
+    unpacked = []
+    archive = request.files.get('archive')
+    if archive and archive.filename:
+        try:
+            unpacked = unpack_zip_upload(archive, DOCUMENT_EXTENSIONS, BATCH_MAX_FILES, BATCH_MAX_UPLOAD)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'message': 'ZIP फ़ाइल नहीं खुल पाई। कृपया सही ZIP अपलोड करें।'
+            }), 400
+    
+    files = uploads + unpacked
+    if not files:
+        return jsonify({
+            'success': False,
+            'error': 'No file found',
+            'message': 'कृपया एक या अधिक फ़ाइलें अपलोड करें'
+        }), 400
+    if len(files) > BATCH_MAX_FILES:
+        for f in unpacked:
+            f.close()
+        return jsonify({
+            'success': False,
+            'error': 'Too many files',
+            'message': f'एक बार में अधिकतम {BATCH_MAX_FILES} फ़ाइलें भेजें'
+        }), 400
+    
+    def generate():
+        try:
+            for result in document_service.analyze_batch(files):
+                yield json.dumps(result, ensure_ascii=False) + '\n'
+        finally:
+            for f in unpacked:
+                f.close()
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={**SSE_HEADERS, 'X-Total-Files': str(len(files))})
+
+@document_bp.route('/analyze-document/summary/<summary_key>', methods=['GET'])
+def get_ai_summary(summary_key):
+    """
+    Fetch the AI summary for a document analyzed with aiPending=true
+    
+    Response: {'ready': false} until the background Gemini call lands
+    """
+    summary = get_cached_summary(summary_key)
+    if not summary:
+        return jsonify({'success': True, 'ready': False})
+    return jsonify({
+        'success': True,
+        'ready': True,
+        'data': {
+            'simplifiedText': summary,
+            'simplifiedSource': 'ai'
+        }
+    })
@@ -3,11 +3,34 @@ Draft Generator Routes
 Handles generating complaint letters and legal drafts
 """
 
-from flask import Blueprint, request, jsonify
+import os
+import json
+
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from werkzeug.utils import secure_filename
 from app.services.draft_service import DraftService
+from app.services.draft_pdf_service import DraftPDFService, draft_pdf_key
+from app.utils.batch_rows import read_request_rows, stream_zip, JSONL
+from app.utils.helpers import format_sse, SSE_HEADERS
 
 draft_bp = Blueprint('draft', __name__)
 draft_service = DraftService()
+draft_pdf_service = DraftPDFService()
+
+# Most rows accepted by /generate-drafts/batch in one request
+BATCH_MAX_ROWS = int(os.environ.get('DRAFT_BATCH_MAX_ROWS', '200'))
+
+
+_TRUE_STRINGS = ('1', 'true', 'yes')
+
+
+def _use_cache(data):
+    """Requests may send "bypassCache": true to force a fresh AI result"""
+    bypass = data.get('bypassCache', False)
+    # CSV batch rows carry it as text: "false" or "0" must not bypass
+    if isinstance(bypass, str):
+        bypass = bypass.strip().lower() in _TRUE_STRINGS
+    return not bypass
 
 
 @draft_bp.route('/enhance-details', methods=['POST'])
@@ -44,7 +67,7 @@ def enhance_details():
                 'message': 'कृपया अपनी समस्या पहले लिखें'
             }), 400
 
-        result = draft_service.enhance_details(issue_type, details, language)
+        result = draft_service.enhance_details(issue_type, details, language, use_cache=_use_cache(data))
 
         return jsonify({
             'success': True,
@@ -101,11 +124,12 @@ def rewrite_problem():
                 'message': 'कृपया अपनी समस्या थोड़ा विस्तार से लिखें'
             }), 400
 
-        result = draft_service.rewrite_problem(problem)
+        result = draft_service.rewrite_problem(problem, use_cache=_use_cache(data))
 
         return jsonify({
             'success': True,
-            'rewritten': result['rewritten']
+            'rewritten': result['rewritten'],
+            'cached': result.get('cached', False)
         })
 
     except ValueError as ve:
@@ -123,6 +147,121 @@ def rewrite_problem():
         }), 500
 
 
+def _get_languages(value):
+    """
+    "hindi"/"english", or a list of them for several copies of one letter.
+    Unknown languages fall back to Hindi; a one-item list is a plain language.
+    """
+    if not isinstance(value, list):
+        value = [value]
+    languages = []
+    for language in value:
+        language = language.lower().strip() if isinstance(language, str) else ''
+        if language in ['hindi', 'english'] and language not in languages:
+            languages.append(language)
+    if len(languages) > 1:
+        return languages
+    return languages[0] if languages else 'hindi'
+
+
+_INVALID_ROW_ERROR = {
+    'success': False,
+    'error': 'Invalid row',
+    'message': 'यह पंक्ति पढ़ी नहीं जा सकी'
+}
+
+# Accepted JSON types of generate-draft fields (null is treated as missing)
+_DRAFT_FIELD_TYPES = {
+    'issueType': str,
+    'details': str,
+    'language': (str, list),
+    'subject': str,
+    'senderInfo': dict,
+    # DraftService takes a recipient name on its own or {name, office}
+    'recipient': (str, dict)
+}
+
+
+def _validate_draft_data(data, allow_multiple=False):
+    """
+    Validate one generate-draft payload (a JSON body or a batch row).
+    With allow_multiple, "language" may be a list and comes back as one.
+    Returns (kwargs for DraftService.generate_draft, None) or (None, error dict).
+    """
+    if not data:
+        return None, {
+            'success': False,
+            'error': 'No data provided',
+            'message': 'कृपया समस्या की जानकारी दें'
+        }
+    
+    if not isinstance(data, dict):
+        return None, dict(_INVALID_ROW_ERROR)
+    
+    # Batch rows come from user files: a number or list in a text field is a row error, not a crash
+    for field, expected in _DRAFT_FIELD_TYPES.items():
+        value = data.get(field)
+        if value is not None and not isinstance(value, expected):
+            return None, {
+                'success': False,
+                'error': f'Invalid {field}',
+                'message': f'{field} का मान सही प्रकार का नहीं है'
+            }
+    
+    issue_type = (data.get('issueType') or '').strip()
+    details = (data.get('details') or '').strip()
+    language = _get_languages(data.get('language') or 'hindi')
+    
+    if isinstance(language, list) and not allow_multiple:
+        return None, {
+            'success': False,
+            'error': 'Only one language is supported here',
+            'message': 'कृपया एक ही भाषा चुनें'
+        }
+    
+    if not issue_type:
+        return None, {
+            'success': False,
+            'error': 'Issue type is required',
+            'message': 'कृपया समस्या का प्रकार चुनें'
+        }
+    
+    if not details:
+        return None, {
+            'success': False,
+            'error': 'Details are required',
+            'message': 'कृपया समस्या का विवरण लिखें'
+        }
+    
+    if len(details) < 20:
+        return None, {
+            'success': False,
+            'error': 'Details too short',
+            'message': 'कृपया समस्या के बारे में थोड़ा और विस्तार से बताएं'
+        }
+    
+    return {
+        'issue_type': issue_type,
+        'details': details,
+        'language': language,
+        'sender_info': data.get('senderInfo') or {},
+        'recipient': data.get('recipient') or {},
+        'subject_line': data.get('subject') or '',
+        'use_cache': _use_cache(data)
+    }, None
+
+
+def _get_draft_request(allow_multiple=False):
+    """
+    Validate a generate-draft JSON body.
+    Returns (kwargs for DraftService.generate_draft, None) or (None, error response).
+    """
+    params, error = _validate_draft_data(request.get_json(silent=True), allow_multiple)
+    if error:
+        return None, (jsonify(error), 400)
+    return params, None
+
+
 @draft_bp.route('/generate-draft', methods=['POST'])
 def generate_draft():
     """
@@ -133,6 +272,8 @@ def generate_draft():
         "issueType": "land_dispute",
         "details": "मेरे पड़ोसी ने मेरी ज़मीन पर कब्ज़ा कर लिया है...",
         "language": "hindi" or "english"  [optional, defaults to "hindi"]
+                    or ["hindi", "english"] for both letters, drafted concurrently
+        "bypassCache": true  [optional, skip the cached AI letter for these inputs]
     }
     
     Response:
@@ -141,52 +282,19 @@ def generate_draft():
         "tips": [...],
         "language": "hindi"
     }
+    With a language list, data is keyed by language:
+    {"data": {"hindi": {...}, "english": {...}}, "language": ["hindi", "english"]}
     """
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided',
-                'message': 'कृपया समस्या की जानकारी दें'
-            }), 400
-        
-        issue_type = data.get('issueType', '').strip()
-        details = data.get('details', '').strip()
-        language = data.get('language', 'hindi').lower().strip()
+        params, error_response = _get_draft_request(allow_multiple=True)
+        if error_response:
+            return error_response
         
-        # Validate language parameter
-        if language not in ['hindi', 'english']:
-            language = 'hindi'
-        
-        if not issue_type:
-            return jsonify({
-                'success': False,
-                'error': 'Issue type is required',
-                'message': 'कृपया समस्या का प्रकार चुनें'
-            }), 400
-        
-        if not details:
-            return jsonify({
-                'success': False,
-                'error': 'Details are required',
-                'message': 'कृपया समस्या का विवरण लिखें'
-            }), 400
-        
-        if len(details) < 20:
-            return jsonify({
-                'success': False,
-                'error': 'Details too short',
-                'message': 'कृपया समस्या के बारे में थोड़ा और विस्तार से बताएं'
-            }), 400
-        
-        # Generate draft
-        sender_info = data.get('senderInfo', {})
-        recipient = data.get('recipient', {})
-        subject_line = data.get('subject', '')
-        
-        result = draft_service.generate_draft(issue_type, details, language, sender_info, recipient, subject_line)
+        language = params.pop('language')
+        if isinstance(language, list):
+            result = draft_service.generate_drafts(languages=language, **params)
+        else:
+            result = draft_service.generate_draft(language=language, **params)
         
         return jsonify({
             'success': True,
@@ -200,3 +308,166 @@ def generate_draft():
             'error': str(e),
             'message': 'पत्र बनाने में त्रुटि हुई। कृपया पुनः प्रयास करें।'
         }), 500
+
+
+@draft_bp.route('/generate-draft/stream', methods=['POST'])
+def generate_draft_stream():
+    """
+    Generate a complaint letter and stream it as Server-Sent Events
+    
+    Request JSON: same as /generate-draft
+    Events: delta (repeated) -> done
+            delta: {text, source} - the next piece of the letter ('ai' or 'template')
+            reset: {source} - drop the text so far; the template letter follows
+            done:  {success, data, language} - same payload /generate-draft returns
+            error: {success, error, message}
+    """
+    params, error_response = _get_draft_request()
+    if error_response:
+        return error_response
+    
+    def generate():
+        try:
+            for event, payload in draft_service.generate_draft_stream(**params):
+                if event == 'done':
+                    payload = {'success': True, 'data': payload, 'language': params['language']}
+                yield format_sse(event, payload)
+        except Exception as e:
+            yield format_sse('error', {
+                'success': False,
+                'error': str(e),
+                'message': 'पत्र बनाने में त्रुटि हुई। कृपया पुनः प्रयास करें।'
+            })
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers=SSE_HEADERS)
+
+
+@draft_bp.route('/generate-drafts/batch', methods=['POST'])
+def generate_drafts_batch():
+    """
+    Draft many letters in one request (e.g. NGO caseworkers with a case sheet)
+    
+    Request: rows of {issueType, details, senderInfo, recipient, language, subject} as
+             - a 'rows' file upload (.jsonl or .csv; CSV columns such as
+               senderInfo.name or recipient.office fill the nested objects), or
+             - a JSON Lines / CSV body, or a JSON body {"rows": [...]}
+    Query:   format=jsonl (default) or format=zip
+    Response: jsonl - one line per row as soon as it is drafted
+                      ({index, issueType, language, success, data | error, message})
+              zip   - one .txt letter per drafted row plus results.jsonl
+                      (the same lines without the letters, with each row's file name)
+    """
+    output = (request.args.get('format') or request.form.get('format') or JSONL).lower()
+    if output not in (JSONL, 'zip'):
+        return jsonify({
+            'success': False,
+            'error': 'Unsupported output format',
+            'message': 'format केवल jsonl या zip हो सकता है'
+        }), 400
+    
+    rows, error = read_request_rows(request, BATCH_MAX_ROWS)
+    if error:
+        return jsonify(error), 400
+    
+    valid = []
+    invalid = []
+    for index, row in enumerate(rows):
+        params, error = _validate_draft_data(row) if row is not None else (None, dict(_INVALID_ROW_ERROR))
+        if error:
+            invalid.append({'index': index, **error})
+        else:
+            valid.append((index, params))
+    
+    def results():
+        yield from invalid
+        yield from draft_service.generate_batch(valid)
+    
+    headers = {**SSE_HEADERS, 'X-Total-Rows': str(len(rows))}
+    
+    if output == JSONL:
+        def generate():
+            for result in results():
+                yield json.dumps(result, ensure_ascii=False) + '\n'
+        
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson', headers=headers)
+    
+    def entries():
+        manifest = []
+        for result in results():
+            data = result.pop('data', None)
+            if data:
+                result['file'] = secure_filename(f"{result['index']:03d}_{result['issueType']}_{result['language']}.txt")
+                result['draftSource'] = data.get('draftSource')
+                yield result['file'], data['draft']
+            manifest.append(result)
+        manifest.sort(key=lambda item: item['index'])
+        yield 'results.jsonl', ''.join(json.dumps(item, ensure_ascii=False) + '\n' for item in manifest)
+    
+    headers['Content-Disposition'] = 'attachment; filename=drafts.zip'
+    return Response(stream_with_context(stream_zip(entries())), mimetype='application/zip', headers=headers)
+
+
+@draft_bp.route('/generate-draft/pdf', methods=['POST'])
+def generate_draft_pdf():
+    """
+    Render a generated letter as an A4 PDF (for phones that print badly from the browser)
+    
+    Request JSON:
+    {
+        "draft": "सेवा में,\n...",      [the letter text from /generate-draft]
+        "language": "hindi" or "english"  [optional, defaults to "hindi"]
+    }
+    
+    Response: application/pdf, streamed; ETag is the draft hash, so a repeat
+              request with If-None-Match gets 304 without re-rendering.
+              503 if PDF export isn't set up on this server (print from the browser instead).
+    """
+    data = request.get_json(silent=True) or {}
+    draft = data.get('draft')
+    if not isinstance(draft, str) or not draft.strip():
+        return jsonify({
+            'success': False,
+            'error': 'Draft text is required',
+            'message': 'कृपया पहले पत्र बनाएं'
+        }), 400
+    language = data.get('language', 'hindi')
+    if language not in ['hindi', 'english']:
+        language = 'hindi'
+    
+    key = draft_pdf_key(draft, language)
+    if key in request.if_none_match:
+        return Response(status=304, headers={'ETag': f'"{key}"'})
+    
+    try:
+        key, pdf = draft_pdf_service.render(draft, language)
+    except RuntimeError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'message': 'PDF अभी उपलब्ध नहीं है। कृपया ब्राउज़र से प्रिंट करें।'
+        }), 503
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'message': 'PDF बनाने में त्रुटि हुई। कृपया पुनः प्रयास करें।'
+        }), 500
+    
+    return Response(draft_pdf_service.stream(pdf), mimetype='application/pdf', headers={
+        'Content-Length': str(len(pdf)),
+        'Content-Disposition': 'attachment; filename=draft.pdf',
+        'ETag': f'"{key}"'
+    })
+
+
+@draft_bp.route('/draft-cache/stats', methods=['GET'])
+def draft_cache_stats():
+    """
+    Draft cache statistics: hits per tier (memory/mongo), misses, hit ratio
+    and AI latency saved, for generate-draft, enhance-details and rewrite-problem,
+    plus PDF export status and cache hits
+    """
+    return jsonify({
+        'success': True,
+        'data': {**draft_service.get_cache_stats(), 'pdf': draft_pdf_service.get_stats()}
+    })
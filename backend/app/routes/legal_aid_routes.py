@@ -3,12 +3,44 @@ Legal Aid Finder Routes
 Handles finding nearby legal aid offices
 """
 
-from flask import Blueprint, request, jsonify
-from app.services.legal_aid_service import LegalAidService
+import io
+import os
+import csv
+import json
+
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from app.services.legal_aid_service import (
+    LegalAidService, DEFAULT_RESULT_LIMIT, MAX_SUGGESTIONS, MAX_BATCH_NEAREST
+)
+from app.utils.batch_rows import read_request_rows, JSONL, CSV
 
 legal_aid_bp = Blueprint('legal_aid', __name__)
 legal_aid_service = LegalAidService()
 
+# Largest radius / result count a client may ask for
+MAX_RADIUS_KM = 500
+MAX_RESULTS = 50
+DEFAULT_SUGGESTIONS = 8
+# Most villages accepted by /find-legal-aid/batch in one request
+BATCH_MAX_ROWS = int(os.environ.get('LEGAL_AID_BATCH_MAX_ROWS', '5000'))
+
+# Columns of the CSV mapping: one line per village and nearest office
+BATCH_CSV_COLUMNS = (
+    'index', 'name', 'pincode', 'lat', 'lng', 'resolvedBy', 'rank', 'officeName', 'officeDistrict',
+    'officeState', 'officePhone', 'officeAddress', 'distanceKm', 'mapsLink', 'error'
+)
+
+
+def _optional_number(data, key, low, high):
+    """data[key] as a float within [low, high], None if absent; ValueError if invalid"""
+    value = data.get(key)
+    if value is None or value == '':
+        return None
+    number = float(value)
+    if not low <= number <= high:
+        raise ValueError(f'{key} must be between {low} and {high}')
+    return number
+
 
 @legal_aid_bp.route('/find-legal-aid', methods=['POST'])
 def find_legal_aid():
@@ -20,9 +52,13 @@ def find_legal_aid():
         "district": "Lucknow",      # Optional
         "pincode": "226001",        # Optional
         "userLat": 26.8467,         # Optional - user's latitude
-        "userLng": 80.9462          # Optional - user's longitude
+        "userLng": 80.9462,         # Optional - user's longitude
+        "radiusKm": 50,             # Optional - only offices within this distance
+        "limit": 10                 # Optional - number of offices (default 10)
     }
     
+    With only userLat/userLng, the nearest offices are returned.
+    
     Response:
     {
         "success": true,
@@ -50,8 +86,17 @@ def find_legal_aid():
         
         district = data.get('district', '').strip() if data.get('district') else None
         pincode = data.get('pincode', '').strip() if data.get('pincode') else None
-        user_lat = data.get('userLat')
-        user_lng = data.get('userLng')
+        try:
+            user_lat = _optional_number(data, 'userLat', -90, 90)
+            user_lng = _optional_number(data, 'userLng', -180, 180)
+            radius_km = _optional_number(data, 'radiusKm', 0, MAX_RADIUS_KM)
+            limit = _optional_number(data, 'limit', 1, MAX_RESULTS)
+        except (TypeError, ValueError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'message': 'Invalid location, radius or limit'
+            }), 400
         
         # Legacy support: if 'query' is provided, determine if it's district or pincode
         if not district and not pincode:
@@ -62,7 +107,8 @@ def find_legal_aid():
                 else:
                     district = query
         
-        if not district and not pincode and not (user_lat and user_lng):
+        has_location = user_lat is not None and user_lng is not None
+        if not district and not pincode and not has_location:
             return jsonify({
                 'success': False,
                 'error': 'Query is required',
@@ -73,8 +119,10 @@ def find_legal_aid():
         result = legal_aid_service.find_offices(
             district=district,
             pincode=pincode,
-            user_lat=user_lat,
-            user_lng=user_lng
+            user_lat=user_lat if has_location else None,
+            user_lng=user_lng if has_location else None,
+            radius_km=radius_km,
+            limit=int(limit) if limit else DEFAULT_RESULT_LIMIT
         )
         
         return jsonify(result)
@@ -85,3 +133,112 @@ def find_legal_aid():
             'error': str(e),
             'message': 'Error finding legal aid offices.'
         }), 500
+
+
+@legal_aid_bp.route('/legal-aid/suggest', methods=['GET'])
+def suggest_legal_aid():
+    """
+    Type-ahead for the legal aid finder, answered from a prefix trie in memory
+    
+    Query: ?q=pat&limit=8  (q in English or Hindi; limit up to 10)
+    
+    Response:
+    {
+        "success": true,
+        "query": "pat",
+        "suggestions": [
+            {"type": "district", "query": "Patna", "district": "Patna", "districtHi": "पटना",
+             "state": "Bihar", "name": "...", "nameHi": "...", "matched": "Patna"},
+            {"type": "state", "query": "Bihar", "state": "Bihar", "stateHi": "बिहार",
+             "offices": 24, "matched": "Bihar"}
+        ]
+    }
+    
+    Pass a suggestion's "query" as "district" to /find-legal-aid.
+    """
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', DEFAULT_SUGGESTIONS, type=int)
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+    
+    response = jsonify({
+        'success': True,
+        'query': query,
+        'suggestions': legal_aid_service.suggest(query, limit)
+    })
+    # The office table changes rarely; let browsers reuse answers while the user types
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response
+
+
+def _batch_csv_lines(result):
+    """CSV lines for one village: one per nearest office, or one carrying the error"""
+    base = {key: result.get(key, '') for key in ('index', 'name', 'pincode', 'lat', 'lng', 'resolvedBy')}
+    if not result['success']:
+        yield {**base, 'error': result['error']}
+        return
+    for rank, office in enumerate(result['offices'], 1):
+        yield {
+            **base,
+            'rank': rank,
+            'officeName': office['name'],
+            'officeDistrict': office['district'],
+            'officeState': office['state'],
+            'officePhone': office['phone'],
+            'officeAddress': office['address'],
+            'distanceKm': office['distance'],
+            'mapsLink': office['mapsLink']
+        }
+
+
+@legal_aid_bp.route('/find-legal-aid/batch', methods=['POST'])
+def find_legal_aid_batch():
+    """
+    Nearest legal aid offices for a list of villages (outreach planning)
+    
+    Request: rows of {name, lat, lng} or {name, pincode} as a 'rows' file
+             upload (.csv or .jsonl), a CSV / JSON Lines body, or a JSON body
+             {"rows": [...]}; pincodes are resolved offline only
+    Query:   format=csv (default) or format=jsonl, k=1..5 nearest offices per village
+    Response: csv   - one line per village and office (rank 1 = nearest), or
+                      one line with the error for villages that couldn't be located
+              jsonl - one line per village ({index, name, success, resolvedBy, lat,
+                      lng, offices: [...]} or {index, name, success, error, message})
+    """
+    output = (request.args.get('format') or request.form.get('format') or CSV).lower()
+    if output not in (CSV, JSONL):
+        return jsonify({
+            'success': False,
+            'error': 'Unsupported output format',
+            'message': 'format केवल csv या jsonl हो सकता है'
+        }), 400
+    k = request.args.get('k', 1, type=int)
+    k = max(1, min(k, MAX_BATCH_NEAREST))
+    
+    rows, error = read_request_rows(request, BATCH_MAX_ROWS)
+    if error:
+        return jsonify(error), 400
+    
+    results = legal_aid_service.find_nearest_batch(rows, k=k)
+    headers = {'X-Total-Rows': str(len(rows))}
+    
+    if output == JSONL:
+        def generate_jsonl():
+            for result in results:
+                yield json.dumps(result, ensure_ascii=False) + '\n'
+        
+        return Response(stream_with_context(generate_jsonl()), mimetype='application/x-ndjson', headers=headers)
+    
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=BATCH_CSV_COLUMNS, extrasaction='ignore')
+        # BOM so Excel opens Hindi names as UTF-8
+        buffer.write('\ufeff')
+        writer.writeheader()
+        for result in results:
+            writer.writerows(_batch_csv_lines(result))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    headers['Content-Disposition'] = 'attachment; filename=nearest-legal-aid.csv'
+    return Response(stream_with_context(generate_csv()), mimetype='text/csv', headers=headers)
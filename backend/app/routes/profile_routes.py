@@ -3,6 +3,8 @@ User Profile Routes – Progress, Documents, Analytics for the logged-in user.
 """
 
 import base64
+import os
+from io import BytesIO
 from flask import Blueprint, request, jsonify, Response
 from app.services.auth_service import AuthService
 from app.services.user_activity_service import UserActivityService
@@ -25,6 +27,14 @@ def _get_user_email():
     return None
 
 
+def _stored_file_bytes(doc):
+    """File payload of a stored document: raw BSON binary, or base64 for older uploads."""
+    data = doc.get("file_data")
+    if isinstance(data, bytes):
+        return data
+    return base64.b64decode(data)
+
+
 # ── Progress ──
 @profile_bp.route("/profile/progress", methods=["GET"])
 def get_progress():
@@ -78,22 +88,26 @@ def upload_document():
     if file.mimetype not in ALLOWED_MIMES:
         return jsonify({"success": False, "error": "केवल JPG, PNG या PDF फाइल अपलोड करें"}), 400
 
-    file_bytes = file.read()
-    if len(file_bytes) > MAX_FILE_SIZE:
+    # Check the size on the (possibly disk-spooled) stream before reading anything
+    file.stream.seek(0, os.SEEK_END)
+    file_size = file.stream.tell()
+    file.stream.seek(0)
+    if file_size > MAX_FILE_SIZE:
         return jsonify({"success": False, "error": "फाइल 10MB से बड़ी है"}), 400
 
-    file_b64 = base64.b64encode(file_bytes).decode("utf-8")
+    # Stored as raw BSON binary: one in-memory copy, no base64 inflation
+    file_bytes = file.read()
     doc_name = request.form.get("name", file.filename)
     doc_type = request.form.get("type", "Document")
 
-    size_kb = len(file_bytes) / 1024
+    size_kb = file_size / 1024
     size_str = f"{size_kb:.0f} KB" if size_kb < 1024 else f"{size_kb / 1024:.1f} MB"
 
     doc_id = UserActivityService.save_document(
         email, doc_name, doc_type,
         size=size_str,
         source="upload",
-        file_data=file_b64,
+        file_data=file_bytes,
         file_mime=file.mimetype,
     )
     if doc_id:
@@ -112,7 +126,7 @@ def download_document(doc_id):
     if not doc or not doc.get("file_data"):
         return jsonify({"success": False, "error": "File not found"}), 404
 
-    file_bytes = base64.b64decode(doc["file_data"])
+    file_bytes = _stored_file_bytes(doc)
     mime = doc.get("file_mime", "application/octet-stream")
     filename = doc.get("name", "document")
 
@@ -149,16 +163,15 @@ def analyze_document(doc_id):
     # If we have file_data, run OCR to extract text
     elif doc.get("file_data"):
         try:
-            import io
             from werkzeug.datastructures import FileStorage
             from app.services.document_service import DocumentService
 
-            file_bytes = base64.b64decode(doc["file_data"])
+            file_bytes = _stored_file_bytes(doc)
             mime = doc.get("file_mime", "application/octet-stream")
             fname = doc.get("name", "document")
 
-            # Create a file-like object for OCR service
-            file_stream = io.BytesIO(file_bytes)
+            # Create a file-like object for OCR service (BytesIO shares the bytes, no copy)
+            file_stream = BytesIO(file_bytes)
             file_obj = FileStorage(stream=file_stream, filename=fname, content_type=mime)
 
             doc_service = DocumentService()
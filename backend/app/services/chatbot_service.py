@@ -6,6 +6,8 @@ Guides users through issue reporting and document generation
 import json
 from enum import Enum
 
+from app.utils.transliteration import transliterate
+
 
 class IssueCategory(Enum):
     """Legal issue categories"""
@@ -334,8 +336,9 @@ class ChatbotService:
             ]
         }
         
-        # Convert input to lowercase for matching
+        # Convert input to lowercase for matching; Hinglish words also match their Hindi keywords
         input_lower = selected_category.lower()
+        input_lower += ' ' + transliterate(input_lower)
         
         # Try to find best match
         max_matches = 0
@@ -0,0 +1,144 @@
+"""
+DLSA Directory Store
+District Legal Services Authority offices kept in MongoDB as versioned
+snapshots, so a phone number or timing can change without a deploy.
+- dlsa_offices: one document per office, tagged with the snapshot version it
+  belongs to and its position in the directory
+- data_versions: {_id: 'dlsa_offices', version} names the live snapshot;
+  publish() writes a complete new snapshot before moving the pointer, so a
+  reader never sees a half-written directory
+- The bundled app/data/dlsa_offices.json seeds the first snapshot and is the
+  directory whenever MongoDB is unavailable or empty
+Manage with: python manage_dlsa_directory.py seed|export|publish
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+
+from pymongo import ReturnDocument
+
+from app.utils.snapshot_poller import VERSIONS_COLLECTION
+
+logger = logging.getLogger(__name__)
+
+DLSA_DATA_PATH = os.environ.get(
+    'DLSA_DATA_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'dlsa_offices.json')
+)
+
+DLSA_COLLECTION = 'dlsa_offices'
+DLSA_VERSION_ID = 'dlsa_offices'
+# Older snapshots kept after a publish, for workers still loading the previous one
+DLSA_SNAPSHOTS_KEPT = 2
+
+DLSA_REQUIRED_FIELDS = ('name', 'address', 'district', 'state', 'pincode', 'phone', 'lat', 'lng')
+
+
+def load_bundled_offices(path=DLSA_DATA_PATH):
+    """Offices from the bundled JSON file, in directory order"""
+    with open(path, encoding='utf-8') as f:
+        return validate_offices(json.load(f))
+
+
+def validate_offices(offices):
+    """The offices if every one has the fields search needs, else ValueError"""
+    if not isinstance(offices, list) or not offices:
+        raise ValueError("DLSA directory must be a non-empty list of offices")
+    for position, office in enumerate(offices):
+        missing = [name for name in DLSA_REQUIRED_FIELDS if office.get(name) in (None, '')]
+        if missing:
+            raise ValueError(f"Office {position} ({office.get('name', '?')}) is missing {', '.join(missing)}")
+        if not (-90 <= float(office['lat']) <= 90 and -180 <= float(office['lng']) <= 180):
+            raise ValueError(f"Office {position} ({office['name']}) has invalid coordinates")
+    return offices
+
+
+class DlsaDirectoryStore:
+    """Versioned DLSA office snapshots in MongoDB"""
+
+    def __init__(self, offices=None, versions=None, use_mongo=True):
+        # Collections may be injected (tests); otherwise they are looked up on first use
+        self._offices = offices
+        self._versions = versions
+        self._checked = offices is not None or not use_mongo
+        self._lock = threading.Lock()
+
+    def _get_collections(self):
+        with self._lock:
+            if self._checked:
+                return self._offices, self._versions
+            self._checked = True
+        try:
+            from app.config.mongodb import get_db
+            db = get_db()
+            if db is not None:
+                offices = db[DLSA_COLLECTION]
+                offices.create_index([('version', 1), ('order', 1)])
+                self._offices, self._versions = offices, db[VERSIONS_COLLECTION]
+        except Exception as e:
+            logger.warning("MongoDB not available for the DLSA directory, using bundled data: %s", e)
+        return self._offices, self._versions
+
+    def available(self):
+        return self._get_collections()[0] is not None
+
+    def current_version(self):
+        """Version of the live snapshot, or None (no MongoDB, nothing published, read failed)"""
+        _, versions = self._get_collections()
+        if versions is None:
+            return None
+        try:
+            doc = versions.find_one({'_id': DLSA_VERSION_ID}, {'version': 1})
+        except Exception as e:
+            logger.warning("Could not read the DLSA directory version: %s", e)
+            return None
+        return doc.get('version') if doc else None
+
+    def load(self):
+        """(version, offices) of the live snapshot, or (None, None) if there is none"""
+        version = self.current_version()
+        if version is None:
+            return None, None
+        offices_collection, _ = self._get_collections()
+        cursor = offices_collection.find({'version': version}, {'_id': 0, 'version': 0}).sort('order', 1)
+        offices = []
+        for doc in cursor:
+            doc.pop('order', None)
+            offices.append(doc)
+        return version, validate_offices(offices)
+
+    def publish(self, offices):
+        """Store offices as a new snapshot and make it live; returns its version"""
+        validate_offices(offices)
+        offices_collection, versions = self._get_collections()
+        if offices_collection is None:
+            raise RuntimeError("MongoDB not available")
+
+        # Reserve a version number first, so concurrent publishers never share one
+        counter = versions.find_one_and_update(
+            {'_id': DLSA_VERSION_ID}, {'$inc': {'latest': 1}},
+            upsert=True, return_document=ReturnDocument.AFTER
+        )
+        version = counter['latest']
+        offices_collection.insert_many([
+            {**{k: v for k, v in office.items() if k != '_id'}, 'version': version, 'order': position}
+            for position, office in enumerate(offices)
+        ])
+        # Only move forward: a slower publisher of an older version must not win
+        versions.update_one(
+            {'_id': DLSA_VERSION_ID, 'version': {'$not': {'$gte': version}}},
+            {'$set': {'version': version, 'offices': len(offices), 'updatedAt': datetime.utcnow()}}
+        )
+        offices_collection.delete_many({'version': {'$lte': version - DLSA_SNAPSHOTS_KEPT - 1}})
+        logger.info("Published DLSA directory version %d (%d offices)", version, len(offices))
+        return version
+
+    def seed(self, path=DLSA_DATA_PATH):
+        """Publish the bundled offices unless a snapshot exists; (version, seeded)"""
+        version = self.current_version()
+        if version is not None:
+            return version, False
+        return self.publish(load_bundled_offices(path)), True
@@ -6,19 +6,21 @@ Legal Document Scanner Service
 """
 
 import os
-import re
 import base64
+import hashlib
+import threading
+import unicodedata
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 from io import BytesIO
 
-# Try to import pytesseract for offline OCR (optional)
-try:
-    import pytesseract
-    from PIL import Image
-    PYTESSERACT_AVAILABLE = True
-except ImportError:
-    PYTESSERACT_AVAILABLE = False
+from app.services.ocr_router import get_ocr_router, tesseract_ocr, QUOTA_STATUS_CODES
+from app.utils.entity_extractor import extract_entities
+from app.utils.keyword_automaton import KeywordAutomaton
+from app.utils.lru_cache import LRUCache
+from app.utils.name_index import WORD_SEPARATOR_RE
+from app.utils.upload_spool import SpooledUpload
 
 # Try to import Google Generative AI
 try:
@@ -28,6 +30,42 @@ except ImportError:
     GENAI_AVAILABLE = False
 
 
+# Label for the resume hint keywords inside the classification automaton
+RESUME_HINTS = '_resume_hints'
+
+# Gemini simplification runs in the background: requests wait at most this long
+# before answering with the rule-based summary (the AI result still lands in the cache)
+AI_SIMPLIFY_DEADLINE = float(os.environ.get('AI_SIMPLIFY_DEADLINE', '4'))
+# How long the SSE stream keeps waiting to push the AI upgrade
+AI_UPGRADE_DEADLINE = float(os.environ.get('AI_UPGRADE_DEADLINE', '30'))
+# Only this much of the document is sent to Gemini, so only this much is keyed
+AI_PROMPT_CHARS = 3000
+
+# Process-wide: every DocumentService instance shares summaries and in-flight calls
+_ai_summary_cache = LRUCache(maxsize=512, ttl=7 * 24 * 3600)
+_ai_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='gemini')
+_ai_inflight = {}
+_ai_inflight_lock = threading.Lock()
+# Documents analyzed at once by analyze_batch (OCR/Gemini calls are I/O bound)
+BATCH_MAX_WORKERS = int(os.environ.get('DOCUMENT_BATCH_WORKERS', '4'))
+
+
+def summary_key(text, doc_type):
+    """
+    Cache key for an AI summary: hash of doc type + normalized prompt text.
+    Case, whitespace and punctuation noise from OCR don't change the key,
+    so re-scans of the same notice hit the cache.
+    """
+    normalized = unicodedata.normalize('NFC', text[:AI_PROMPT_CHARS]).casefold()
+    normalized = WORD_SEPARATOR_RE.sub(' ', normalized).strip()
+    return hashlib.sha256(f'{doc_type}\n{normalized}'.encode('utf-8')).hexdigest()
+
+
+def get_cached_summary(key):
+    """AI summary for a summaryKey, or None if it hasn't landed (yet)"""
+    return _ai_summary_cache.get(key)
+
+
 class DocumentService:
     """Service for analyzing legal documents with real OCR and AI"""
     
@@ -86,6 +124,15 @@ class DocumentService:
                 'urgency': 'low'
             }
         }
+        
+        # Resume hints checked before the regular document types
+        self.resume_keywords = ['skills', 'experience', 'education', 'objective', 'summary', 'qualification', 
+                                'कौशल', 'अनुभव', 'शिक्षा', 'योग्यता', 'b.tech', 'b.e', 'mba', 'b.sc']
+        
+        # One automaton over every keyword (Hindi + English) scores all types in a single pass
+        keywords_by_label = {doc_type: config['keywords'] for doc_type, config in self.doc_patterns.items()}
+        keywords_by_label[RESUME_HINTS] = self.resume_keywords
+        self.keyword_automaton = KeywordAutomaton(keywords_by_label)
 
     def analyze_document(self, file):
         """
@@ -95,123 +142,189 @@ class DocumentService:
         3. Simplify text to Hindi
         4. Extract key points and dates
         """
+        for stage, payload in self.analyze_document_stages(file):
+            if stage in ('done', 'error'):
+                return payload
+
+    def analyze_document_stages(self, file, stream=False):
+        """
+        Same analysis as analyze_document, yielded stage by stage as (stage, payload)
+        so callers can show urgent facts before the slow simplification finishes:
+        ocr -> classification -> key_info -> simplified -> done (or error at any point)
+        With stream=True the rule-based summary comes first and a second
+        'simplified' event carries the AI version once it lands.
+        """
         try:
             # Step 1: Extract text using OCR
             ocr_result = self._extract_text_ocr(file)
             
             if not ocr_result['success']:
-                return {
+                yield 'error', {
                     'success': False,
                     'error': ocr_result.get('error', 'OCR failed'),
                     'message': 'दस्तावेज़ से टेक्स्ट नहीं निकाल पाए। कृपया साफ़ फोटो अपलोड करें।'
                 }
+                return
             
             extracted_text = ocr_result['text']
             
             if len(extracted_text.strip()) < 20:
-                return {
+                yield 'error', {
                     'success': False,
                     'error': 'Insufficient text extracted',
                     'message': 'दस्तावेज़ से पर्याप्त टेक्स्ट नहीं मिला। कृपया अच्छी क्वालिटी की फोटो अपलोड करें।'
                 }
+                return
+            
+            data = {
+                'extractedText': extracted_text[:2000] + ('...' if len(extracted_text) > 2000 else ''),
+                'ocrMethod': ocr_result.get('method', 'Unknown'),
+                'wordCount': len(extracted_text.split())
+            }
+            yield 'ocr', dict(data)
             
             # Step 2: Classify document type
-            doc_type = self._classify_document(extracted_text)
+            classification = self._score_document(extracted_text)
+            doc_type = classification['type']
+            stage_data = {
+                'documentType': doc_type,
+                'documentTypeName': self.doc_patterns.get(doc_type, {}).get('name', 'सामान्य दस्तावेज़'),
+                'urgencyLevel': self.doc_patterns.get(doc_type, {}).get('urgency', 'normal'),
+                'typeScores': classification['scores'],
+                'typeConfidence': classification['confidence'],
+                # Step 5: Generate recommended actions
+                'recommendedActions': self._get_recommended_actions(doc_type)
+            }
+            data.update(stage_data)
+            yield 'classification', stage_data
             
-            # Step 3: Simplify text (AI or rule-based)
-            simplified = self._simplify_text(extracted_text, doc_type)
+            # Single extraction pass shared by the summary, key points and dates
+            entities = extract_entities(extracted_text)
             
             # Step 4: Extract key information
-            key_points = self._extract_key_points(extracted_text, doc_type)
-            dates = self._extract_dates(extracted_text)
+            stage_data = {
+                'keyPoints': self._extract_key_points(extracted_text, doc_type, entities),
+                'importantDates': self._extract_dates(extracted_text, entities)
+            }
+            data.update(stage_data)
+            yield 'key_info', stage_data
             
-            # Step 5: Generate recommended actions
-            actions = self._get_recommended_actions(doc_type)
+            # Step 3: Simplify text (AI or rule-based) - the slowest step goes last.
+            # A stream answers with the rule-based summary at once and upgrades it later.
+            deadline = 0 if stream else AI_SIMPLIFY_DEADLINE
+            simplified = self._simplify_with_source(extracted_text, doc_type, entities, deadline)
+            stage_data = {
+                'simplifiedText': simplified['text'],
+                'simplifiedSource': simplified['source'],
+                'summaryKey': simplified['key'],
+                'aiPending': simplified['future'] is not None
+            }
+            data.update(stage_data)
+            yield 'simplified', stage_data
             
-            return {
+            if stream and simplified['future'] is not None:
+                ai_text = self._wait_for_ai(simplified['future'], AI_UPGRADE_DEADLINE)
+                if ai_text:
+                    stage_data = {
+                        'simplifiedText': ai_text,
+                        'simplifiedSource': 'ai',
+                        'summaryKey': simplified['key'],
+                        'aiPending': False
+                    }
+                    data.update(stage_data)
+                    yield 'simplified', stage_data
+            
+            data['processedAt'] = datetime.now().strftime('%d/%m/%Y %H:%M')
+            yield 'done', {
                 'success': True,
-                'data': {
-                    'documentType': doc_type,
-                    'documentTypeName': self.doc_patterns.get(doc_type, {}).get('name', 'सामान्य दस्तावेज़'),
-                    'urgencyLevel': self.doc_patterns.get(doc_type, {}).get('urgency', 'normal'),
-                    'extractedText': extracted_text[:2000] + ('...' if len(extracted_text) > 2000 else ''),
-                    'simplifiedText': simplified,
-                    'keyPoints': key_points,
-                    'importantDates': dates,
-                    'recommendedActions': actions,
-                    'ocrMethod': ocr_result.get('method', 'Unknown'),
-                    'wordCount': len(extracted_text.split()),
-                    'processedAt': datetime.now().strftime('%d/%m/%Y %H:%M')
-                }
+                'data': data
             }
             
         except Exception as e:
-            return {
+            yield 'error', {
                 'success': False,
                 'error': str(e),
                 'message': 'दस्तावेज़ विश्लेषण में त्रुटि हुई। कृपया पुनः प्रयास करें।'
             }
 
+    def analyze_batch(self, files, max_workers=BATCH_MAX_WORKERS):
+        """
+        Analyze many documents concurrently with bounded parallelism.
+        Yields one result per file, in completion order, tagged with its
+        index and filename so clients can match results to uploads.
+        """
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='doc-batch')
+        try:
+            futures = {
+                pool.submit(self.analyze_document, file): (index, file.filename)
+                for index, file in enumerate(files)
+            }
+            for future in as_completed(futures):
+                index, filename = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'success': False, 'error': str(e)}
+                yield {'index': index, 'filename': filename, **result}
+        finally:
+            # Client went away: drop whatever hasn't started yet
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def _extract_text_ocr(self, file):
         """
         Extract text from document using OCR
-        Primary: OCR.space API (free, supports Hindi)
-        Fallback: pytesseract (offline)
+        Engines: OCR.space API (free, supports Hindi) and pytesseract (offline),
+        routed and hedged by OCRRouter
         """
         filename = file.filename.lower()
         is_pdf = filename.endswith('.pdf')
         
         print(f"[OCR DEBUG] Processing file: {filename}, is_pdf: {is_pdf}")
         
-        # Read file content
-        file_content = file.read()
-        file.seek(0)  # Reset file pointer
-        
-        print(f"[OCR DEBUG] File content size: {len(file_content)} bytes")
-        
-        if len(file_content) == 0:
-            return {
-                'success': False,
-                'error': 'File is empty'
-            }
-        
-        # Try OCR.space API first (better Hindi support)
-        ocr_error = None
-        try:
-            print(f"[OCR DEBUG] Calling OCR.space API...")
-            result = self._ocr_space_api(file_content, is_pdf, filename)
-            print(f"[OCR DEBUG] OCR.space result: success={result.get('success')}, error={result.get('error', 'none')}")
-            if result['success']:
-                return result
-            ocr_error = result.get('error', 'Unknown OCR error')
-        except Exception as e:
-            print(f"[OCR DEBUG] OCR.space API exception: {e}")
-            import traceback
-            traceback.print_exc()
-            ocr_error = str(e)
-        
-        # Fallback to pytesseract if available
-        if PYTESSERACT_AVAILABLE and not is_pdf:
-            try:
-                print(f"[OCR DEBUG] Trying pytesseract fallback...")
-                result = self._pytesseract_ocr(file_content)
-                if result['success']:
-                    return result
-            except Exception as e:
-                print(f"[OCR DEBUG] Pytesseract failed: {e}")
+        # Large uploads stay on disk; each OCR engine gets its own handle or path
+        with SpooledUpload(file) as upload:
+            print(f"[OCR DEBUG] File content size: {upload.size} bytes, on_disk: {upload.on_disk}")
+            
+            if upload.size == 0:
+                return {
+                    'success': False,
+                    'error': 'File is empty'
+                }
+            
+            # OCR.space (better Hindi support) and local Tesseract are raced by the router:
+            # the adaptive primary goes first and the other engine is hedged in after its p90
+            result = get_ocr_router().extract(
+                upload.local_source,
+                is_pdf,
+                lambda: self._ocr_space_upload(upload, is_pdf, filename),
+                hold=upload.hold
+            )
+        print(f"[OCR DEBUG] OCR result: success={result.get('success')}, method={result.get('method', 'none')}, error={result.get('error', 'none')}")
+        
+        if result.get('success'):
+            return result
         
         return {
             'success': False,
-            'error': ocr_error or 'All OCR methods failed. Please try with a clearer image.'
+            'error': result.get('error') or 'All OCR methods failed. Please try with a clearer image.'
         }
 
-    def _ocr_space_api(self, file_content, is_pdf=False, filename='image.png'):
+    def _ocr_space_upload(self, upload, is_pdf, filename):
+        """Send a spooled upload to OCR.space through its own file handle"""
+        with upload.open() as handle:
+            return self._ocr_space_api(handle, is_pdf, filename, size=upload.size)
+
+    def _ocr_space_api(self, file_content, is_pdf=False, filename='image.png', size=None):
         """
         OCR using OCR.space API (Free: 25,000 requests/month)
         Supports: Hindi, English, and many other languages
         Uses multipart form upload for better reliability
+        file_content: raw bytes or a binary file handle
         """
-        import io
+        if isinstance(file_content, (bytes, bytearray)):
+            size = len(file_content)
+            file_content = BytesIO(file_content)
+        
         url = 'https://api.ocr.space/parse/image'
         
         # Determine file type and extension
@@ -235,7 +348,7 @@ class DocumentService:
         
         # Use multipart form upload (more reliable than base64)
         files = {
-            'file': (filename, io.BytesIO(file_content), mime)
+            'file': (filename, file_content, mime)
         }
         
         payload = {
@@ -248,10 +361,17 @@ class DocumentService:
             'OCREngine': '1',  # Engine 1 supports more languages
         }
         
-        print(f"[OCR API DEBUG] Sending multipart request: filetype={filetype}, mime={mime}, file_size={len(file_content)} bytes")
+        print(f"[OCR API DEBUG] Sending multipart request: filetype={filetype}, mime={mime}, file_size={size} bytes")
         
         response = requests.post(url, files=files, data=payload, timeout=60)
         print(f"[OCR API DEBUG] Response status: {response.status_code}")
+        if response.status_code in QUOTA_STATUS_CODES:
+            # Rate/quota limit: the body is a plain-text message, not JSON
+            return {
+                'success': False,
+                'error': response.text.strip() or f'HTTP {response.status_code}',
+                'statusCode': response.status_code
+            }
         data = response.json()
         print(f"[OCR API DEBUG] Response data: OCRExitCode={data.get('OCRExitCode')}, IsErrored={data.get('IsErroredOnProcessing')}, ErrorMsg={data.get('ErrorMessage', 'none')}")
         
@@ -296,70 +416,110 @@ class DocumentService:
         Offline OCR using pytesseract
         Requires: Tesseract-OCR installed on system
         """
-        if not PYTESSERACT_AVAILABLE:
-            return {'success': False, 'error': 'Pytesseract not available'}
-        
-        try:
-            # Open image
-            image = Image.open(BytesIO(file_content))
-            
-            # OCR with Hindi + English
-            text = pytesseract.image_to_string(image, lang='hin+eng')
-            
-            return {
-                'success': True,
-                'text': text.strip(),
-                'method': 'Pytesseract (Offline)'
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
+        return tesseract_ocr(file_content)
 
     def _classify_document(self, text):
         """Classify document type based on content keywords with minimum threshold"""
-        text_lower = text.lower()
-        
-        # First, check if it's a resume
-        resume_keywords = ['skills', 'experience', 'education', 'objective', 'summary', 'qualification', 
-                          'कौशल', 'अनुभव', 'शिक्षा', 'योग्यता', 'b.tech', 'b.e', 'mba', 'b.sc']
-        resume_score = sum(1 for keyword in resume_keywords if keyword in text_lower)
-        
-        if resume_score >= 3:  # At least 3 resume-related keywords
-            return 'resume'
-        
-        scores = {}
-        for doc_type, config in self.doc_patterns.items():
-            score = sum(1 for keyword in config['keywords'] if keyword.lower() in text_lower)
-            scores[doc_type] = score
+        return self._score_document(text)['type']
+
+    def _score_document(self, text):
+        """
+        Score every document type in one pass over the text.
+        Returns the chosen type, per-type keyword scores and a 0-1 confidence.
+        """
+        scores = self.keyword_automaton.score(text)
+        resume_score = scores.pop(RESUME_HINTS)
         
         # Get highest scoring type with minimum threshold
         max_score = max(scores.values()) if scores else 0
         
-        # Require at least 2 matching keywords for classification
-        if max_score >= 2:
-            return max(scores, key=scores.get)
+        if resume_score >= 3:  # At least 3 resume-related keywords
+            doc_type = 'resume'
+        elif max_score >= 2:  # Require at least 2 matching keywords for classification
+            doc_type = max(scores, key=scores.get)
+        else:
+            doc_type = 'general'
+        
+        # Share of all keyword hits that went to the chosen type
+        total = sum(scores.values())
+        if doc_type == 'resume':
+            confidence = min(1.0, resume_score / 5)
+        elif doc_type == 'general' or total == 0:
+            confidence = 0.0
+        else:
+            confidence = scores[doc_type] / total
         
-        return 'general'
+        return {
+            'type': doc_type,
+            'scores': scores,
+            'confidence': round(confidence, 2)
+        }
 
-    def _simplify_text(self, text, doc_type):
+    def _simplify_text(self, text, doc_type, entities=None):
         """
         Simplify legal text to simple Hindi
-        Primary: Google Gemini API
+        Primary: Google Gemini API (memoized, bounded by AI_SIMPLIFY_DEADLINE)
         Fallback: Rule-based simplification
         """
-        # Try AI simplification first
+        return self._simplify_with_source(text, doc_type, entities, AI_SIMPLIFY_DEADLINE)['text']
+
+    def _simplify_with_source(self, text, doc_type, entities=None, deadline=AI_SIMPLIFY_DEADLINE):
+        """
+        Simplify with a strict deadline on the AI call.
+        Returns {'text', 'source': 'ai'|'rules', 'key', 'future'}; 'future' is set
+        while the AI summary is still being generated in the background.
+        """
+        key = summary_key(text, doc_type)
+        
         if self.gemini_model:
-            try:
-                simplified = self._ai_simplify(text, doc_type)
-                if simplified:
-                    return simplified
-            except Exception as e:
-                print(f"Gemini API failed: {e}")
+            cached = _ai_summary_cache.get(key)
+            if cached:
+                return {'text': cached, 'source': 'ai', 'key': key, 'future': None}
+            
+            future = self._ai_summary_future(key, text, doc_type)
+            simplified = self._wait_for_ai(future, deadline)
+            if simplified:
+                return {'text': simplified, 'source': 'ai', 'key': key, 'future': None}
+            if future.done():
+                future = None  # AI failed outright - nothing to upgrade to
+        else:
+            future = None
         
         # Fallback to rule-based simplification
-        return self._rule_based_simplify(text, doc_type)
+        return {
+            'text': self._rule_based_simplify(text, doc_type, entities),
+            'source': 'rules',
+            'key': key,
+            'future': future
+        }
+
+    def _ai_summary_future(self, key, text, doc_type):
+        """Start (or join) the background Gemini call for this summary key"""
+        with _ai_inflight_lock:
+            future = _ai_inflight.get(key)
+            if future is None:
+                future = _ai_executor.submit(self._ai_simplify_and_cache, key, text, doc_type)
+                _ai_inflight[key] = future
+            return future
+
+    def _ai_simplify_and_cache(self, key, text, doc_type):
+        try:
+            simplified = self._ai_simplify(text, doc_type)
+            if simplified:
+                _ai_summary_cache.set(key, simplified)
+            return simplified
+        except Exception as e:
+            print(f"Gemini API failed: {e}")
+            return None
+        finally:
+            with _ai_inflight_lock:
+                _ai_inflight.pop(key, None)
+
+    def _wait_for_ai(self, future, timeout):
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return None
 
     def _ai_simplify(self, text, doc_type):
         """Use Google Gemini to simplify text"""
@@ -397,15 +557,13 @@ Format your response as:
         response = self.gemini_model.generate_content(prompt)
         return response.text
 
-    def _rule_based_simplify(self, text, doc_type):
+    def _rule_based_simplify(self, text, doc_type, entities=None):
         """
         Rule-based text simplification that actually uses the extracted content.
         Creates a summary based on REAL data found in the document.
         """
-        import re
-        
         # Extract actual information from the text
-        extracted_info = self._extract_all_info(text)
+        extracted_info = entities if entities is not None else self._extract_all_info(text)
         
         # Build a summary based on actual content
         summary_parts = []
@@ -448,9 +606,10 @@ Format your response as:
             summary_parts.append(f"• राशि: {', '.join(['₹' + a for a in amounts_list])}")
             info_found = True
         
-        # Case/Reference numbers
-        if extracted_info.get('case_numbers'):
-            summary_parts.append(f"• संदर्भ/केस नंबर: {', '.join(extracted_info['case_numbers'][:2])}")
+        # Case/Reference/FIR numbers
+        case_numbers = extracted_info.get('case_numbers', []) + extracted_info.get('fir_numbers', [])
+        if case_numbers:
+            summary_parts.append(f"• संदर्भ/केस नंबर: {', '.join(case_numbers[:2])}")
             info_found = True
         
         # Phone numbers
@@ -542,127 +701,26 @@ Format your response as:
         return '\n'.join(summary_parts)
     
     def _extract_all_info(self, text):
-        """Extract all possible information from text"""
-        import re
-        
-        info = {
-            'names': [],
-            'dates': [],
-            'amounts': [],
-            'case_numbers': [],
-            'phones': [],
-            'emails': [],
-            'addresses': [],
-            'skills': [],
-            'education': [],
-            'experience': [],
-            'is_resume': False
-        }
-        
-        # Detect if it's a resume - require multiple resume-related keywords
-        resume_keywords = ['resume', 'cv', 'curriculum vitae', 'objective', 'experience', 
-                          'education', 'skills', 'qualifications', 'career',
-                          'रिज़्यूमे', 'अनुभव', 'शिक्षा', 'योग्यता']
-        text_lower = text.lower()
-        resume_keyword_count = sum(1 for kw in resume_keywords if kw in text_lower)
-        # Require at least 3 resume keywords for detection
-        if resume_keyword_count >= 3:
-            info['is_resume'] = True
-        
-        # Extract dates with better validation
-        date_patterns = [
-            r'\b(?:0?[1-9]|[12][0-9]|3[01])[/\-](?:0?[1-9]|1[0-2])[/\-]\d{2,4}\b',  # DD/MM/YYYY with validation
-            r'\b\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{2,4}\b',
-            r'\b\d{1,2}\s+(?:जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+\d{2,4}\b',
-        ]
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if match not in info['dates'] and len(info['dates']) < 5:
-                    info['dates'].append(match)
-        
-        # Extract amounts
-        amount_patterns = [
-            r'(?:rs\.?|₹|inr)\s*([0-9,]+(?:\.[0-9]+)?)',
-            r'([0-9,]+(?:\.[0-9]+)?)\s*(?:rupees|रुपये)',
-        ]
-        for pattern in amount_patterns:
-            info['amounts'].extend(re.findall(pattern, text, re.IGNORECASE))
-        
-        # Extract phone numbers
-        phone_pattern = r'\b(?:\+91[\-\s]?)?[6-9]\d{9}\b'
-        info['phones'] = re.findall(phone_pattern, text)
-        
-        # Extract email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        info['emails'] = re.findall(email_pattern, text)
-        
-        # Extract case/reference numbers
-        case_patterns = [
-            r'(?:case\s*no|ref\s*no|file\s*no|केस\s*नं)[.:]*\s*([A-Z0-9/\-]+)',
-            r'(?:fir\s*no|एफआईआर)[.:]*\s*([0-9/\-]+)',
-        ]
-        for pattern in case_patterns:
-            info['case_numbers'].extend(re.findall(pattern, text, re.IGNORECASE))
-        
-        # Extract names (capitalized words that look like names)
-        # Look for patterns like "Name: John Doe" or common name indicators
-        name_patterns = [
-            r'(?:name|नाम|applicant|complainant|petitioner|respondent)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})',
-            r'(?:mr\.|ms\.|mrs\.|shri|smt\.?|श्री|श्रीमती)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})',
-        ]
-        for pattern in name_patterns:
-            info['names'].extend(re.findall(pattern, text, re.IGNORECASE))
-        
-        # For resumes - extract skills
-        if info['is_resume']:
-            skill_section = re.search(r'(?:skills|technical\s*skills|कौशल)[:\s]*([^\n]+(?:\n[^\n]+){0,5})', text, re.IGNORECASE)
-            if skill_section:
-                skills_text = skill_section.group(1)
-                # Split by common delimiters
-                skills = re.split(r'[,;•\n|]', skills_text)
-                info['skills'] = [s.strip() for s in skills if s.strip() and len(s.strip()) < 30][:10]
-            
-            # Extract education
-            edu_pattern = r'(?:b\.?tech|m\.?tech|b\.?e|m\.?e|b\.?sc|m\.?sc|b\.?a|m\.?a|b\.?com|m\.?com|mba|bba|ph\.?d|12th|10th|graduation|post.?graduation)'
-            info['education'] = list(set(re.findall(edu_pattern, text, re.IGNORECASE)))[:5]
-            
-            # Extract years of experience
-            exp_pattern = r'(\d+\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp))'
-            info['experience'] = re.findall(exp_pattern, text, re.IGNORECASE)[:3]
-        
-        # Extract addresses (look for PIN codes and surrounding text)
-        address_pattern = r'[A-Za-z0-9,.\s\-]+(?:pin|पिन)?[:\s]*\d{6}'
-        info['addresses'] = re.findall(address_pattern, text, re.IGNORECASE)[:2]
-        
-        return info
+        """Extract all possible information from text (precompiled scans, see entity_extractor)"""
+        return extract_entities(text)
 
-    def _extract_key_points(self, text, doc_type):
+    def _extract_key_points(self, text, doc_type, entities=None):
         """Extract key points from the document"""
-        key_points = []
+        if entities is None:
+            entities = extract_entities(text)
         
-        # Look for common patterns
-        patterns = {
-            'case_number': r'(?:case\s*no|केस\s*नं|प्रकरण\s*क्रमांक)[.:]*\s*([A-Z0-9/\-]+)',
-            'section': r'(?:धारा|section|u/s)\s*([0-9]+(?:\s*[,/]\s*[0-9]+)*)',
-            'amount': r'(?:रु|rs|₹|rupees)[.:]*\s*([0-9,]+)',
-            'plot': r'(?:खसरा|plot|प्लॉट|खाता)\s*(?:नं|no|नंबर)?[.:]*\s*([0-9/\-]+)',
-            'fir_no': r'(?:fir\s*no|एफआईआर)[.:]*\s*([0-9/\-]+)',
-        }
+        key_points = []
         
-        for pattern_name, pattern in patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if pattern_name == 'case_number':
-                    key_points.append(f"केस नंबर: {matches[0]}")
-                elif pattern_name == 'section':
-                    key_points.append(f"धारा: {matches[0]}")
-                elif pattern_name == 'amount':
-                    key_points.append(f"राशि: ₹{matches[0]}")
-                elif pattern_name == 'plot':
-                    key_points.append(f"खसरा/प्लॉट नंबर: {matches[0]}")
-                elif pattern_name == 'fir_no':
-                    key_points.append(f"FIR नंबर: {matches[0]}")
+        if entities['case_numbers']:
+            key_points.append(f"केस नंबर: {entities['case_numbers'][0]}")
+        if entities['sections']:
+            key_points.append(f"धारा: {entities['sections'][0]}")
+        if entities['amounts']:
+            key_points.append(f"राशि: ₹{entities['amounts'][0]}")
+        if entities['plot_numbers']:
+            key_points.append(f"खसरा/प्लॉट नंबर: {entities['plot_numbers'][0]}")
+        if entities['fir_numbers']:
+            key_points.append(f"FIR नंबर: {entities['fir_numbers'][0]}")
         
         # Add type-specific points
         type_points = {
@@ -679,36 +737,18 @@ Format your response as:
         
         return key_points[:6]  # Max 6 points
 
-    def _extract_dates(self, text):
+    def _extract_dates(self, text, entities=None):
         """Extract important dates from text with validation"""
-        dates = []
-        
-        # Common date patterns - with proper day/month validation
-        date_patterns = [
-            # DD/MM/YYYY or DD-MM-YYYY (validates day 1-31, month 1-12)
-            r'\b(?:0?[1-9]|[12][0-9]|3[01])[/-](?:0?[1-9]|1[0-2])[/-](?:\d{4}|\d{2})\b',
-            # Named months: 1-31 MonthName YYYY
-            r'\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{2,4}\b',
-            # Named months in Hindi
-            r'\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+\d{2,4}\b',
-        ]
+        if entities is None:
+            entities = extract_entities(text)
         
-        found_dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Avoid duplicates
-                if match not in found_dates and len(found_dates) < 5:
-                    found_dates.append(match)
-        
-        # Format dates
-        for date in found_dates:
-            dates.append({
+        return [
+            {
                 'date': date,
                 'description': 'दस्तावेज़ में उल्लेखित तिथि'
-            })
-        
-        return dates
+            }
+            for date in entities['dates']
+        ]
 
     def _get_recommended_actions(self, doc_type):
         """Get recommended actions based on document type"""
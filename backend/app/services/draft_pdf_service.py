@@ -0,0 +1,244 @@
+"""
+Draft PDF Service
+Renders generated letters as A4 PDFs on the server, so users on low-end
+phones download a ready-to-print file instead of printing from the browser.
+- The Devanagari font is located and subset once per process (Devanagari +
+  Latin ranges, with the OpenType layout tables that form conjuncts and matras)
+- Every word is measured once and its width cached across documents, so line
+  breaking is linear (fpdf2's multi_cell re-measures the growing line per character)
+- Only text with Devanagari goes through HarfBuzz; Latin lines use plain widths
+- Finished PDFs are cached by a hash of the letter, so repeat downloads are free
+Requires fpdf2 (+ uharfbuzz for Devanagari shaping) and a Devanagari TTF:
+set DRAFT_PDF_FONT, or install fonts-noto-core / fonts-lohit-deva.
+"""
+
+import os
+import re
+import hashlib
+import logging
+import tempfile
+import threading
+
+from app.utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# fpdf2 is optional: without it the PDF endpoint reports 503 and the browser prints instead
+try:
+    from fpdf import FPDF
+    FPDF_AVAILABLE = True
+except ImportError:
+    FPDF_AVAILABLE = False
+
+# HarfBuzz shaping (used by fpdf2); without it Devanagari matras render detached
+try:
+    import uharfbuzz  # noqa: F401
+    SHAPING_AVAILABLE = True
+except ImportError:
+    SHAPING_AVAILABLE = False
+
+
+# Searched in order when DRAFT_PDF_FONT isn't set
+FONT_CANDIDATES = (
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fonts', 'NotoSansDevanagari-Regular.ttf'),
+    '/usr/share/fonts/truetype/noto/NotoSansDevanagari-Regular.ttf',
+    '/usr/share/fonts/opentype/noto/NotoSansDevanagari-Regular.ttf',
+    '/usr/share/fonts/noto/NotoSansDevanagari-Regular.ttf',
+    '/usr/share/fonts/google-noto/NotoSansDevanagari-Regular.ttf',
+    '/usr/share/fonts/truetype/lohit-devanagari/Lohit-Devanagari.ttf',
+    '/usr/share/fonts/truetype/freefont/FreeSans.ttf',
+    'C:\\Windows\\Fonts\\Nirmala.ttf',
+    'C:\\Windows\\Fonts\\mangal.ttf',
+)
+
+# Code points kept in the per-process font subset: Latin, Devanagari (+ extended),
+# punctuation, ₹, ZWJ/ZWNJ and the dotted circle HarfBuzz uses for stray matras
+_SUBSET_UNICODES = [
+    *range(0x20, 0x7F), *range(0xA0, 0x100), *range(0x900, 0x980), *range(0xA8E0, 0xA900),
+    *range(0x2000, 0x2070), 0x20B9, 0x25CC,
+]
+
+# Text that needs shaping (conjuncts, matras); everything else is laid out without it
+_COMPLEX_SCRIPT_RE = re.compile('[\u0900-\u097f\ua8e0-\ua8ff]')
+
+PDF_CACHE_SIZE = int(os.environ.get('DRAFT_PDF_CACHE_SIZE', '128'))
+PDF_STREAM_CHUNK = 64 * 1024
+
+FONT_FAMILY = 'draft'
+FONT_SIZE = 12
+LINE_HEIGHT = 7  # mm
+PAGE_MARGIN = 20  # mm
+
+
+def find_font(font_path=None):
+    """First readable Devanagari font: font_path, DRAFT_PDF_FONT, then FONT_CANDIDATES"""
+    configured = font_path or os.environ.get('DRAFT_PDF_FONT')
+    for path in ((configured,) if configured else FONT_CANDIDATES):
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def subset_font(path):
+    """
+    Path of a copy of the font cut down to _SUBSET_UNICODES (layout tables kept),
+    so each document parses and embeds a smaller font. The copy is keyed by the
+    source file's size/mtime and shared by every worker process; on any
+    failure the original font is used.
+    """
+    try:
+        from fontTools import subset
+
+        stat = os.stat(path)
+        digest = hashlib.sha1(f'{path}:{stat.st_size}:{stat.st_mtime_ns}'.encode('utf-8')).hexdigest()[:16]
+        target = os.path.join(tempfile.gettempdir(), f'draft-pdf-font-{digest}.ttf')
+        if not os.path.exists(target):
+            options = subset.Options()
+            options.layout_features = ['*']
+            options.name_IDs = ['*']
+            options.glyph_names = True
+            options.notdef_outline = True
+            font = subset.load_font(path, options)
+            subsetter = subset.Subsetter(options)
+            subsetter.populate(unicodes=_SUBSET_UNICODES)
+            subsetter.subset(font)
+            # Written under a private name, then renamed: workers never see half a font
+            partial = f'{target}.{os.getpid()}.tmp'
+            subset.save_font(font, partial, options)
+            os.replace(partial, target)
+        return target
+    except Exception as e:
+        logger.warning("Could not subset PDF font %s, embedding it whole: %s", path, e)
+        return path
+
+
+def draft_pdf_key(draft, language='hindi'):
+    """Cache key / ETag for a letter's PDF (exact text: line breaks matter here)"""
+    return hashlib.sha256(f'{language}\n{draft}'.encode('utf-8')).hexdigest()
+
+
+class DraftPDFService:
+    """Renders draft letters to PDF with a shared font, word-width and output cache"""
+
+    def __init__(self, font_path=None, cache_size=PDF_CACHE_SIZE):
+        self._font_path = font_path
+        self._font = None
+        self._font_checked = False
+        self._lock = threading.Lock()
+        self._pdf_cache = LRUCache(maxsize=cache_size)
+        # (word -> width in mm) at FONT_SIZE, shared by every document
+        self._word_widths = LRUCache(maxsize=50000)
+        self.renders = 0
+
+    def _get_font(self):
+        """Locate and subset the font on first use; None if there is no usable font"""
+        with self._lock:
+            if not self._font_checked:
+                self._font_checked = True
+                path = find_font(self._font_path)
+                if path is None:
+                    logger.warning("No Devanagari font found for PDF export; set DRAFT_PDF_FONT")
+                else:
+                    if not SHAPING_AVAILABLE:
+                        logger.warning("uharfbuzz not installed, Devanagari in PDFs will not be shaped")
+                    self._font = subset_font(path)
+            return self._font
+
+    def available(self):
+        return FPDF_AVAILABLE and self._get_font() is not None
+
+    def render(self, draft, language='hindi'):
+        """
+        (key, PDF bytes) for a letter; identical letters are rendered once.
+        Raises RuntimeError if fpdf2 or a font is missing.
+        """
+        key = draft_pdf_key(draft, language)
+        pdf = self._pdf_cache.get(key)
+        if pdf is None:
+            if not self.available():
+                raise RuntimeError('PDF export is not available on this server')
+            pdf = self._render(draft, language)
+            self._pdf_cache.set(key, pdf)
+        return key, pdf
+
+    def stream(self, pdf):
+        """Yield the PDF in chunks for a streamed response"""
+        view = memoryview(pdf)
+        for start in range(0, len(view), PDF_STREAM_CHUNK):
+            yield bytes(view[start:start + PDF_STREAM_CHUNK])
+
+    def _render(self, draft, language):
+        pdf = FPDF(format='A4')
+        pdf.set_margins(PAGE_MARGIN, PAGE_MARGIN, PAGE_MARGIN)
+        pdf.set_auto_page_break(True, margin=PAGE_MARGIN)
+        pdf.set_creator('Legal Saathi')
+        pdf.set_lang('hi' if language == 'hindi' else 'en')
+        pdf.add_font(FONT_FAMILY, '', self._get_font())
+        pdf.add_page()
+        pdf.set_font(FONT_FAMILY, size=FONT_SIZE)
+
+        for line in self._layout(pdf, draft, pdf.epw):
+            self._set_shaping(pdf, line)
+            pdf.cell(w=pdf.epw, h=LINE_HEIGHT, text=line, new_x='LMARGIN', new_y='NEXT')
+
+        output = bytes(pdf.output())
+        # Renders run on request threads; += on an attribute is not atomic
+        with self._lock:
+            self.renders += 1
+        return output
+
+    def _layout(self, pdf, draft, width):
+        """Greedy line breaking on cached word widths; yields the text of each line"""
+        space = self._width(pdf, ' ')
+        for paragraph in draft.replace('\r\n', '\n').split('\n'):
+            line = []
+            line_width = 0.0
+            for word in paragraph.split(' '):
+                word_width = self._width(pdf, word)
+                if word_width > width:
+                    # A single word wider than the page (long URL, blank line): break it anywhere
+                    if line:
+                        yield ' '.join(line)
+                    *pieces, word = self._split_word(pdf, word, width)
+                    yield from pieces
+                    line, line_width = [word], self._width(pdf, word)
+                elif line and line_width + space + word_width > width:
+                    yield ' '.join(line)
+                    line, line_width = [word], word_width
+                else:
+                    line_width += word_width + (space if line else 0.0)
+                    line.append(word)
+            yield ' '.join(line)
+
+    def _split_word(self, pdf, word, width):
+        pieces = ['']
+        for char in word:
+            if pieces[-1] and self._width(pdf, pieces[-1] + char) > width:
+                pieces.append('')
+            pieces[-1] += char
+        return pieces
+
+    def _width(self, pdf, word):
+        width = self._word_widths.get(word)
+        if width is None:
+            self._set_shaping(pdf, word)
+            width = pdf.get_string_width(word)
+            self._word_widths.set(word, width)
+        return width
+
+    def _set_shaping(self, pdf, text):
+        shaped = SHAPING_AVAILABLE and _COMPLEX_SCRIPT_RE.search(text) is not None
+        if shaped != bool(pdf.text_shaping):
+            pdf.set_text_shaping(shaped)
+
+    def get_stats(self):
+        with self._lock:
+            renders = self.renders
+        return {
+            'available': self.available(),
+            'font': self._font,
+            'shaping': SHAPING_AVAILABLE,
+            'renders': renders,
+            'pdfCache': self._pdf_cache.stats(),
+            'wordWidths': self._word_widths.stats()
+        }
@@ -4,7 +4,14 @@ Handles generating complaint letters and legal drafts in Hindi
 """
 
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 import os
+import re
+import time
+
+from app.services.draft_templates import get_template
+from app.utils.result_cache import TieredCache, cache_key
+from app.utils.transliteration import transliterate
 
 try:
     from dotenv import load_dotenv
@@ -18,27 +25,37 @@ except ImportError:
     OpenAI = None
 
 
+# One deadline for the whole generate_draft call; past it the template letter is returned
+AI_DRAFT_DEADLINE = float(os.environ.get('AI_DRAFT_DEADLINE', '20'))
+
+# AI letters shorter than this are treated as failures
+AI_DRAFT_MIN_CHARS = 100
+AI_DRAFT_REQUEST = {'model': 'gpt-4o-mini', 'temperature': 0.25, 'max_tokens': 2000, 'timeout': AI_DRAFT_DEADLINE}
+
+# Process-wide pool for OpenAI drafting calls (I/O bound)
+_ai_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='draft-ai')
+
+# Rows drafted at once by generate_batch, and each row's own AI deadline.
+# Workers beyond the AI pool size would only queue, so the default stays below it.
+BATCH_MAX_WORKERS = int(os.environ.get('DRAFT_BATCH_WORKERS', '4'))
+BATCH_ROW_DEADLINE = float(os.environ.get('DRAFT_BATCH_ROW_DEADLINE', str(AI_DRAFT_DEADLINE)))
+
+# Process-wide caches of AI results (memory + Mongo). Template output is cheap
+# and is never cached, so an AI outage doesn't pin template letters in the cache.
+DRAFT_CACHE_TTL = int(os.environ.get('DRAFT_CACHE_TTL', str(24 * 3600)))
+_result_caches = {
+    name: TieredCache(name, collection_name='draft_cache', maxsize=256, ttl=DRAFT_CACHE_TTL)
+    for name in ('draft', 'enhance', 'rewrite')
+}
+
+# Streamed template letters are sent one paragraph per event
+_PARAGRAPH_SPLIT_RE = re.compile(r'(?<=\n\n)')
+
+
 class DraftService:
     """Service for generating legal drafts and complaint letters"""
     
     def __init__(self):
-        # Draft templates for different issue types
-        self.templates = {
-            'land_dispute': self._generate_land_dispute_draft,
-            'property_dispute': self._generate_land_dispute_draft,  # Same template
-            'family_dispute': self._generate_family_dispute_draft,
-            'domestic_violence': self._generate_domestic_violence_draft,
-            'consumer_complaint': self._generate_consumer_complaint_draft,
-            'employment_issue': self._generate_employment_draft,
-            'police_complaint': self._generate_police_complaint_draft,
-            'court_affidavit': self._generate_court_affidavit_draft,
-            'rti_application': self._generate_rti_draft,
-            'pension_issue': self._generate_pension_draft,
-            'caste_certificate': self._generate_certificate_draft,
-            'ration_card': self._generate_ration_card_draft,
-            'other': self._generate_general_draft
-        }
-        
         self.current_date = datetime.now().strftime('%d/%m/%Y')
 
         self.issue_labels = {
@@ -139,56 +156,211 @@ class DraftService:
             except Exception:
                 self.ai_client = None
     
-    def generate_draft(self, issue_type, details, language='hindi', sender_info=None, recipient=None, subject_line=None):
+    def generate_draft(self, issue_type, details, language='hindi', sender_info=None, recipient=None, subject_line=None,
+                       use_cache=True, deadline=None):
         """
         Generate a complaint letter based on issue type and details.
         Uses AI (OpenAI) when available for professional quality Hindi/English.
-        Falls back to templates when AI is unavailable.
+        Falls back to templates when AI is unavailable, fails or misses the deadline
+        (seconds, AI_DRAFT_DEADLINE by default).
+        The AI call runs in the background while the template letter is rendered.
+        AI letters are cached by input; use_cache=False forces a fresh one.
+        """
+        return self.generate_drafts(issue_type, details, [language], sender_info, recipient, subject_line,
+                                    use_cache, deadline)[language]
+
+    def generate_drafts(self, issue_type, details, languages, sender_info=None, recipient=None, subject_line=None,
+                        use_cache=True, deadline=None):
+        """
+        Generate the same letter in several languages at once, e.g. Hindi for the
+        local office and an English copy for district/state authorities.
+        All AI letters are requested concurrently under one deadline; the Hinglish
+        cleanup and the sender/recipient slot values are computed once and shared
+        by every language's template. Returns {language: result}.
         """
+        started = time.monotonic()
+        deadline = AI_DRAFT_DEADLINE if deadline is None else deadline
         sender_info = sender_info or {}
         recipient = recipient or {}
         subject_line = subject_line or ''
 
-        # Always get template result for tips/submitTo metadata
-        template_func = self.templates.get(issue_type, self._generate_general_draft)
-
-        # Clean up the details text (Hinglish → Hindi conversion) for template use
-        cleaned_details = details
-        try:
-            converted = self._rewrite_with_builtin(details)
-            conv = converted.get('rewritten', '')
-            if conv and len(conv) > 10:
-                cleaned_details = conv
-        except Exception:
-            pass
-
-        template_result = template_func(cleaned_details, language)
-
-        # Try AI-powered draft generation first
+        results = {}
+        keys = {}
+        ai_futures = {}
         if self.ai_client:
-            try:
-                ai_draft = self._generate_draft_with_ai(
+            for language in languages:
+                keys[language] = self._draft_cache_key(issue_type, details, language, sender_info, recipient,
+                                                       subject_line)
+                cached = _result_caches['draft'].get(keys[language]) if use_cache else None
+                if cached is not None:
+                    results[language] = {**cached, 'cached': True}
+                    continue
+                # Start the slow AI calls first so the template work overlaps them
+                ai_futures[language] = _ai_executor.submit(
+                    self._generate_draft_with_ai,
                     issue_type, details, language,
                     sender_info, recipient, subject_line
                 )
+
+        pending = [language for language in languages if language not in results]
+        if not pending:
+            return results
+
+        # Compiled templates: tips/submitTo come from their precomputed metadata, and the
+        # fallback slot values are computed once while the AI calls run
+        values = self._template_values(self._clean_details(details), sender_info, recipient, subject_line)
+        for language in pending:
+            template = get_template(issue_type, language)
+
+            ai_future = ai_futures.get(language)
+            if ai_future is not None:
+                ai_draft = self._wait_for_ai_draft(
+                    ai_future, deadline - (time.monotonic() - started),
+                    on_late=self._late_ai_draft_handler(keys[language], template, started)
+                )
                 if ai_draft:
-                    # Use AI draft text but keep template's tips/submitTo
-                    template_result['draft'] = ai_draft
-                    return template_result
+                    results[language] = self._cache_ai_draft(keys[language], template, ai_draft,
+                                                             time.monotonic() - started)
+                    continue
+
+            # Fallback: the template letter, with sender/recipient slots filled
+            template_result = template.result(values)
+            template_result['draftSource'] = 'template'
+            results[language] = template_result
+
+        return {language: results[language] for language in languages}
+
+    def generate_batch(self, rows, max_workers=BATCH_MAX_WORKERS, deadline=BATCH_ROW_DEADLINE):
+        """
+        Draft many letters concurrently with bounded parallelism.
+        rows: (index, generate_draft kwargs) pairs. Every worker shares this
+        service's OpenAI client (one HTTP connection pool), and each row gets
+        its own AI deadline, measured from when a worker picks it up.
+        Yields one result per row in completion order, tagged with its index.
+        """
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='draft-batch')
+        try:
+            futures = {
+                pool.submit(self.generate_draft, deadline=deadline, **params): (index, params)
+                for index, params in rows
+            }
+            for future in as_completed(futures):
+                index, params = futures[future]
+                row = {'index': index, 'issueType': params['issue_type'], 'language': params['language']}
+                try:
+                    row.update(success=True, data=future.result())
+                except Exception as e:
+                    row.update(success=False, error=str(e), message='पत्र बनाने में त्रुटि हुई। कृपया पुनः प्रयास करें।')
+                yield row
+        finally:
+            # Client went away: drop whatever hasn't started yet
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def generate_draft_stream(self, issue_type, details, language='hindi', sender_info=None, recipient=None,
+                              subject_line=None, use_cache=True):
+        """
+        Generate a draft as a stream of (event, payload) pairs for SSE.
+        'delta' events carry the letter text as it is written ({text, source});
+        'reset' means the partial AI letter is discarded and the template follows;
+        'done' carries the full result (draft, tips, submitTo, enclosures, ...).
+        """
+        started = time.monotonic()
+        sender_info = sender_info or {}
+        recipient = recipient or {}
+        subject_line = subject_line or ''
+        template = get_template(issue_type, language)
+
+        if self.ai_client:
+            key = self._draft_cache_key(issue_type, details, language, sender_info, recipient, subject_line)
+            cached = _result_caches['draft'].get(key) if use_cache else None
+            if cached is not None:
+                for text in _PARAGRAPH_SPLIT_RE.split(cached['draft']):
+                    if text:
+                        yield 'delta', {'text': text, 'source': 'ai'}
+                yield 'done', {**cached, 'cached': True}
+                return
+
+            parts = []
+            try:
+                for text in self._stream_draft_with_ai(issue_type, details, language,
+                                                       sender_info, recipient, subject_line):
+                    parts.append(text)
+                    yield 'delta', {'text': text, 'source': 'ai'}
+                ai_draft = ''.join(parts).strip()
+                if len(ai_draft) >= AI_DRAFT_MIN_CHARS:
+                    yield 'done', self._cache_ai_draft(key, template, ai_draft, time.monotonic() - started)
+                    return
+                print("AI draft stream too short, falling back to templates")
             except Exception as e:
-                print(f"AI draft generation failed, falling back to templates: {e}")
-
-        # Fallback: use template + fill personal info
-        if sender_info or recipient or subject_line:
-            template_result['draft'] = self._fill_personal_info(
-                template_result.get('draft', ''),
-                sender_info,
-                recipient,
-                subject_line,
-                language
-            )
-        
-        return template_result
+                print(f"AI draft stream failed, falling back to templates: {e}")
+            if parts:
+                yield 'reset', {'source': 'template'}
+
+        # Template fallback, streamed paragraph by paragraph like the AI letter
+        template_result = self._render_template(template, details, sender_info, recipient, subject_line)
+        template_result['draftSource'] = 'template'
+        for text in _PARAGRAPH_SPLIT_RE.split(template_result['draft']):
+            if text:
+                yield 'delta', {'text': text, 'source': 'template'}
+        yield 'done', template_result
+
+    def _draft_cache_key(self, issue_type, details, language, sender_info, recipient, subject_line):
+        """Cache key for an AI letter; the date is included because it is printed in the letter."""
+        return cache_key('draft', issue_type=issue_type, language=language, details=details,
+                         sender=sender_info, recipient=recipient, subject=subject_line, date=self.current_date)
+
+    def get_cache_stats(self):
+        """Hit ratios and latency saved for the generate/enhance/rewrite caches."""
+        return {name: cache.stats() for name, cache in _result_caches.items()}
+
+    def _render_template(self, template, details, sender_info, recipient, subject_line):
+        """Template letter for the details, after Hinglish → Hindi cleanup."""
+        return template.result(self._template_values(self._clean_details(details), sender_info, recipient,
+                                                     subject_line))
+
+    def _clean_details(self, details):
+        """Details with Hinglish converted to Hindi, or unchanged if the cleanup gives too little."""
+        try:
+            converted = self._rewrite_with_builtin(details).get('rewritten', '')
+            if converted and len(converted) > 10:
+                return converted
+        except Exception:
+            pass
+        return details
+
+    def _wait_for_ai_draft(self, future, timeout, on_late=None):
+        """
+        AI draft text, or None if the call failed or is still running at the deadline.
+        A call still queued at the deadline is dropped; one already running cannot be
+        stopped, so on_late(future) is called once it finishes.
+        """
+        try:
+            return future.result(timeout=max(timeout, 0))
+        except FutureTimeoutError:
+            if not future.cancel() and on_late is not None:
+                future.add_done_callback(on_late)
+            print("AI draft generation missed its deadline, using template")
+        except Exception as e:
+            print(f"AI draft generation failed, falling back to templates: {e}")
+        return None
+
+    def _cache_ai_draft(self, key, template, ai_draft, latency):
+        """Result for an AI letter (template's tips/submitTo kept), stored in the draft cache."""
+        result = template.metadata()
+        result['draft'] = ai_draft
+        result['draftSource'] = 'ai'
+        _result_caches['draft'].set(key, result, latency)
+        return result
+
+    def _late_ai_draft_handler(self, key, template, started):
+        """Done-callback caching an AI letter that missed its deadline, so it is paid for once."""
+        def cache_late_draft(future):
+            if future.cancelled() or future.exception() is not None:
+                return
+            ai_draft = future.result()
+            if ai_draft:
+                self._cache_ai_draft(key, template, ai_draft, time.monotonic() - started)
+        return cache_late_draft
 
     def _generate_draft_with_ai(self, issue_type, details, language, sender_info, recipient, subject_line):
         """Use OpenAI to generate a complete, professional complaint letter.
@@ -197,6 +369,29 @@ class DraftService:
         everything into polished formal Hindi/English like ChatGPT quality.
         Returns the draft text string, or None on failure.
         """
+        completion = self.ai_client.chat.completions.create(
+            messages=self._draft_messages(issue_type, details, language, sender_info, recipient, subject_line),
+            **AI_DRAFT_REQUEST
+        )
+
+        result = (completion.choices[0].message.content or '').strip()
+        if not result or len(result) < AI_DRAFT_MIN_CHARS:
+            return None
+        return result
+
+    def _stream_draft_with_ai(self, issue_type, details, language, sender_info, recipient, subject_line):
+        """Same letter as _generate_draft_with_ai, yielded as text chunks while it is written."""
+        stream = self.ai_client.chat.completions.create(
+            messages=self._draft_messages(issue_type, details, language, sender_info, recipient, subject_line),
+            stream=True,
+            **AI_DRAFT_REQUEST
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _draft_messages(self, issue_type, details, language, sender_info, recipient, subject_line):
+        """System + user prompt for the AI letter writer."""
         issue_label = self.issue_labels.get(issue_type, self.issue_labels['other'])
         label_hi = issue_label.get('hindi', 'शिकायत')
         label_en = issue_label.get('english', 'Complaint')
@@ -283,33 +478,16 @@ class DraftService:
                 'अब पूरा औपचारिक शिकायत पत्र लिखें। कोई खाली जगह नहीं। कोई placeholder नहीं। सीधे प्रिंट योग्य।'
             )
 
-        completion = self.ai_client.chat.completions.create(
-            model='gpt-4o-mini',
-            temperature=0.25,
-            max_tokens=2000,
-            messages=[
-                {'role': 'system', 'content': system_prompt},
-                {'role': 'user', 'content': user_prompt}
-            ]
-        )
-
-        result = (completion.choices[0].message.content or '').strip()
-        if not result or len(result) < 100:
-            return None
-        return result
+        return [
+            {'role': 'system', 'content': system_prompt},
+            {'role': 'user', 'content': user_prompt}
+        ]
 
-    def _fill_personal_info(self, draft_text, sender, recipient, subject_line, language):
-        """Replace blanks and placeholder lines in draft with actual sender/recipient data."""
-        import re
-        
-        text = draft_text
+    def _template_values(self, details, sender, recipient, subject_line):
+        """Slot values for a draft template from the sender/recipient/subject inputs."""
         sender = sender or {}
-        name = sender.get('name', '').strip()
-        father = sender.get('fatherName', '').strip()
         address = sender.get('address', '').strip()
-        phone = sender.get('phone', '').strip()
         district = sender.get('district', '').strip()
-        state = sender.get('state', '').strip()
         
         # recipient can be a string or a dict
         if isinstance(recipient, dict):
@@ -322,136 +500,27 @@ class DraftService:
             rec_name = ''
             rec_office = ''
         
-        blank = r'_________________________+'
-        
-        def _replace(pattern, value, txt, count=0):
-            """Safe regex replace that avoids backreference issues in value."""
-            return re.sub(pattern + blank, lambda m: m.group(1) + value, txt, count=count)
-        
-        def _replace_line(pattern, value, txt, count=1):
-            """Replace entire match (not just blank part)."""
-            return re.sub(pattern, lambda m: m.group(1) + value, txt, count=count)
-        
-        # --- Replace recipient header ---
-        if rec_name:
-            text = re.sub(
-                r'(सेवा में,\s*\n)([^\n]+)',
-                lambda m: m.group(1) + rec_name + ',',
-                text, count=1
-            )
-            text = re.sub(
-                r'(To,\s*\n)([^\n]+)',
-                lambda m: m.group(1) + rec_name + ',',
-                text, count=1
-            )
-        
-        if rec_office:
-            lines = text.split('\n')
-            found_header = False
-            for i, line in enumerate(lines):
-                stripped = line.strip().rstrip(',')
-                if stripped in ['सेवा में', 'To']:
-                    found_header = True
-                    continue
-                if found_header and i > 0:
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1].strip().rstrip(',')
-                        if next_line and not next_line.startswith('जिला') and not next_line.startswith('District'):
-                            lines[i + 1] = rec_office + ','
-                    break
-            text = '\n'.join(lines)
-        
-        # --- Replace subject line ---
-        if subject_line:
-            text = _replace_line(r'(विषय:\s*)(.+)', subject_line, text)
-            text = _replace_line(r'(Subject:\s*)(.+)', subject_line, text)
-        
-        # --- Replace sender details ---
-        # IMPORTANT: Process specific patterns BEFORE generic "नाम:" to avoid
-        # filling "पिता का नाम:" or "आरोपी का नाम:" with sender's name.
-        # Also, skip "आरोपी/Accused/गवाह/Witness" sections entirely.
-        
-        # Identify lines that belong to accused/witness sections (should NOT be filled)
-        skip_keywords = {'आरोपी', 'Accused', 'गवाह', 'Witness', 'प्रतिवादी', 'Defendant'}
-        safe_keywords = {'आवेदक', 'Applicant', 'प्रार्थी', 'Petitioner', 'शिकायतकर्ता', 'Complainant'}
-        
-        def _is_in_skip_section(text_str, match_start):
-            """Check if the match position falls inside an accused/witness section."""
-            preceding = text_str[:match_start]
-            last_safe_pos = -1
-            last_skip_pos = -1
-            for kw in safe_keywords:
-                pos = preceding.rfind(kw)
-                if pos > last_safe_pos:
-                    last_safe_pos = pos
-            for kw in skip_keywords:
-                pos = preceding.rfind(kw)
-                if pos > last_skip_pos:
-                    last_skip_pos = pos
-            # If the last relevant header is a skip keyword, we're in a skip section
-            return last_skip_pos > last_safe_pos
-        
-        def _safe_replace(pattern, value, txt):
-            """Replace blanks but skip matches inside accused/witness sections."""
-            full_pattern = pattern + blank
-            result = txt
-            for m in reversed(list(re.finditer(full_pattern, txt, flags=re.MULTILINE))):
-                if not _is_in_skip_section(txt, m.start()):
-                    result = result[:m.start()] + m.group(1) + value + result[m.end():]
-            return result
-        
-        if father:
-            text = _safe_replace(r'(पिता/पति का नाम:\s*)', father, text)
-            text = _safe_replace(r'(पिता का नाम:\s*)', father, text)
-            text = _safe_replace(r"(Father's/Husband's Name:\s*)", father, text)
-            text = _safe_replace(r"(Father's Name:\s*)", father, text)
-            text = _safe_replace(r'(Husband Name:\s*)', father, text)
-            text = _safe_replace(r'(पति का नाम:\s*)', father, text)
-        
-        if name:
-            text = _safe_replace(r'((?:^|• )नाम:\s*)', name, text)
-            text = _safe_replace(r'((?:^|• )Name:\s*)', name, text)
-        
-        if address:
-            text = _safe_replace(r'((?:^|• )पता:\s*)', address, text)
-            text = _safe_replace(r'((?:^|• )Address:\s*)', address, text)
-        
-        if phone:
-            text = _replace(r'(मोबाइल नंबर:\s*)', phone, text)
-            text = _replace(r'(फोन:\s*)', phone, text)
-            text = _replace(r'(Phone No\.?:\s*)', phone, text)
-        
-        if district:
-            text = _replace(r'(जिला:\s*)', district, text)
-            text = _replace(r'(District:\s*)', district, text)
-            text = text.replace('[जिले का नाम]', district)
-            text = text.replace('[जिला]', district)
-        
-        if state:
-            text = _replace(r'(राज्य:\s*)', state, text)
-            text = _replace(r'(State:\s*)', state, text)
-        
-        if address:
-            text = _replace(r'(ग्राम/शहर:\s*)', address, text)
-            text = _replace(r'(ग्राम/मोहल्ला:\s*)', address, text)
-            text = _replace(r'(Village/Town:\s*)', address, text)
-            text = _replace(r'(Village/Locality:\s*)', address, text)
-        
-        place = district or address
-        if place:
-            text = _replace(r'(स्थान:\s*)', place, text)
-            text = _replace(r'(Place:\s*)', place, text)
-        
-        if rec_office:
-            text = _replace(r'(थाना:\s*)', rec_office, text)
-            text = _replace(r'(Police Station:\s*)', rec_office, text)
-        
-        return text
+        return {
+            'date': self.current_date,
+            'details': details,
+            # Recipient and office slots cover a whole header line
+            'recipient': rec_name + ',' if rec_name else '',
+            'office': rec_office + ',' if rec_office else '',
+            'subject': subject_line or '',
+            'name': sender.get('name', '').strip(),
+            'father': sender.get('fatherName', '').strip(),
+            'address': address,
+            'phone': sender.get('phone', '').strip(),
+            'district': district,
+            'state': sender.get('state', '').strip(),
+            'place': district or address,
+            'station': rec_office,
+        }
 
-    def enhance_details(self, issue_type, raw_details, language='hindi'):
+    def enhance_details(self, issue_type, raw_details, language='hindi', use_cache=True):
         """Generate complete formal complaint/application from user's simple description.
         
-        Uses OpenAI if available, otherwise uses built-in smart templates.
+        Uses OpenAI if available (cached by input), otherwise uses built-in smart templates.
         Always produces a complete formatted complaint letter.
         """
         details = (raw_details or '').strip()
@@ -465,8 +534,16 @@ class DraftService:
 
         # Try OpenAI first if available
         if self.ai_client:
+            key = cache_key('enhance', issue_type=issue_type, language=language, details=details,
+                            date=self.current_date)
+            cached = _result_caches['enhance'].get(key) if use_cache else None
+            if cached is not None:
+                return {**cached, 'cached': True}
+            started = time.monotonic()
             try:
-                return self._enhance_with_openai(issue_type, details, language)
+                result = self._enhance_with_openai(issue_type, details, language)
+                _result_caches['enhance'].set(key, result, time.monotonic() - started)
+                return result
             except Exception:
                 pass  # Fall through to built-in generator
 
@@ -719,16 +796,18 @@ Place: _______________________________"""
         formatted += '\n\nDue to this problem, I and my family have been facing severe hardship and mental distress. Multiple attempts were made to resolve this matter at the local level, but no resolution could be achieved. Therefore, I am compelled to bring this complaint before your esteemed office for appropriate action.'
         return formatted
 
-    def rewrite_problem(self, problem):
+    def rewrite_problem(self, problem, use_cache=True):
         """Rewrite user's messy complaint text into clear, professional Hindi.
         
         Uses OpenAI if API key is configured, otherwise uses built-in formatting.
         
         Args:
             problem: Raw user text (can be messy, informal, mixed language)
+            use_cache: False skips the cached AI rewrite and stores a fresh one
             
         Returns:
             dict with 'rewritten' key containing improved Hindi text
+            ('cached': True when served from the cache)
         """
         problem = (problem or '').strip()
         if not problem:
@@ -736,10 +815,17 @@ Place: _______________________________"""
         if len(problem) < 10:
             raise ValueError('कृपया अपनी समस्या थोड़ा विस्तार से लिखें (कम से कम कुछ शब्द)')
 
-        # Try OpenAI first
+        # Try OpenAI first (cached by normalized text)
         if self.ai_client:
+            key = cache_key('rewrite', problem=problem)
+            cached = _result_caches['rewrite'].get(key) if use_cache else None
+            if cached is not None:
+                return {**cached, 'cached': True}
+            started = time.monotonic()
             try:
-                return self._rewrite_with_openai(problem)
+                result = self._rewrite_with_openai(problem)
+                _result_caches['rewrite'].set(key, result, time.monotonic() - started)
+                return result
             except Exception as e:
                 print(f"OpenAI rewrite failed: {e}")
                 # Fall through to built-in rewriter
@@ -802,223 +888,8 @@ Place: _______________________________"""
         """
         text = problem.strip()
 
-        # --- Hinglish to Hindi word mapping (common legal/complaint words) ---
-        hinglish_map = {
-            # Pronouns & common words
-            'mere': 'मेरे', 'mera': 'मेरा', 'meri': 'मेरी', 'mujhe': 'मुझे',
-            'mujhse': 'मुझसे', 'mai': 'मैं', 'main': 'मैं', 'maine': 'मैंने',
-            'hum': 'हम', 'humne': 'हमने', 'humara': 'हमारा', 'humare': 'हमारे',
-            'hamari': 'हमारी', 'hamare': 'हमारे', 'hamara': 'हमारा',
-            'uska': 'उसका', 'uski': 'उसकी', 'uske': 'उसके', 'unka': 'उनका',
-            'unki': 'उनकी', 'unke': 'उनके', 'usne': 'उसने', 'unhone': 'उन्होंने',
-            'wo': 'वो', 'woh': 'वह', 'ye': 'यह', 'yeh': 'यह',
-            'koi': 'कोई', 'kisi': 'किसी', 'kisne': 'किसने',
-            'apna': 'अपना', 'apni': 'अपनी', 'apne': 'अपने',
-
-            # Verbs
-            'hai': 'है', 'hain': 'हैं', 'tha': 'था', 'thi': 'थी', 'the': 'थे',
-            'ho': 'हो', 'hua': 'हुआ', 'hui': 'हुई', 'hue': 'हुए',
-            'gaya': 'गया', 'gayi': 'गई', 'gai': 'गई', 'gaye': 'गए',
-            'kiya': 'किया', 'kiye': 'किए', 'ki': 'की', 'ka': 'का', 'ke': 'के',
-            'kar': 'कर', 'karna': 'करना', 'karte': 'करते', 'karti': 'करती',
-            'karke': 'करके', 'karenge': 'करेंगे',
-            'diya': 'दिया', 'diye': 'दिए', 'di': 'दी', 'de': 'दे', 'dena': 'देना',
-            'liya': 'लिया', 'liye': 'लिए', 'li': 'ली', 'le': 'ले', 'lena': 'लेना',
-            'lekr': 'लेकर', 'lekar': 'लेकर', 'leker': 'लेकर',
-            'chahiye': 'चाहिए', 'chaiye': 'चाहिए', 'chahie': 'चाहिए',
-            'chahta': 'चाहता', 'chahti': 'चाहती', 'chahte': 'चाहते',
-            'sakta': 'सकता', 'sakti': 'सकती', 'sakte': 'सकते',
-            'pata': 'पता', 'maloom': 'मालूम', 'malum': 'मालूम',
-            'kharch': 'खर्च', 'kharcha': 'खर्चा', 'kharche': 'खर्चे',
-            'kitna': 'कितना', 'kitni': 'कितनी', 'kitne': 'कितने',
-            'jitna': 'जितना', 'jitni': 'जितनी', 'jitne': 'जितने',
-            'utna': 'उतना', 'utni': 'उतनी', 'utne': 'उतने',
-            'sabhi': 'सभी', 'sab': 'सब',
-            'poora': 'पूरा', 'pura': 'पूरा', 'puri': 'पूरी', 'pure': 'पूरे',
-            'sahi': 'सही', 'galat': 'गलत',
-            'zaroor': 'ज़रूर', 'jaroor': 'ज़रूर', 'zaruri': 'ज़रूरी',
-            'pehle': 'पहले', 'pahle': 'पहले',
-            'baad': 'बाद', 'iske': 'इसके', 'uske': 'उसके',
-            'kuch': 'कुछ', 'kuchh': 'कुछ',
-            'jaise': 'जैसे', 'waise': 'वैसे',
-            'tarah': 'तरह', 'prakar': 'प्रकार',
-            'raha': 'रहा', 'rahi': 'रही', 'rahe': 'रहे',
-            'rhe': 'रहे', 'rha': 'रहा', 'rhi': 'रही',
-            'aaya': 'आया', 'aayi': 'आई', 'aaye': 'आए',
-            'aae': 'आए', 'aai': 'आई',
-            'chale': 'चले', 'chala': 'चला', 'chali': 'चली',
-            'bola': 'बोला', 'boli': 'बोली', 'bole': 'बोले', 'bolte': 'बोलते',
-            'bulaya': 'बुलाया', 'bulayi': 'बुलाई', 'bulaye': 'बुलाए',
-            'bulana': 'बुलाना', 'bulata': 'बुलाता', 'bulati': 'बुलाती',
-            'maara': 'मारा', 'maari': 'मारी', 'maar': 'मार',
-            'marta': 'मारता', 'marti': 'मारती', 'marte': 'मारते',
-            'toda': 'तोड़ा', 'todi': 'तोड़ी', 'tod': 'तोड़', 'todke': 'तोड़कर',
-            'todta': 'तोड़ता', 'todti': 'तोड़ती',
-            'dekha': 'देखा', 'dekhi': 'देखी', 'dekhe': 'देखे',
-            'dekhta': 'देखता', 'dekhti': 'देखती',
-            'suna': 'सुना', 'suni': 'सुनी', 'sunwai': 'सुनवाई',
-            'sunta': 'सुनता', 'sunti': 'सुनती', 'sunte': 'सुनते',
-            'bataya': 'बताया', 'bataye': 'बताए',
-            'batata': 'बताता', 'batati': 'बताती',
-            'bhaga': 'भागा', 'bhag': 'भाग', 'bhaag': 'भाग',
-            'bhagta': 'भागता', 'bhagti': 'भागती',
-            'farar': 'फरार',
-            'maang': 'माँग', 'maanga': 'माँगा', 'maangi': 'माँगी',
-            'maangta': 'माँगता', 'maangti': 'माँगती',
-            'rok': 'रोक', 'roka': 'रोका', 'roki': 'रोकी',
-            'rokta': 'रोकता', 'rokti': 'रोकती',
-            'kabza': 'कब्ज़ा', 'kabja': 'कब्ज़ा',
-            'deta': 'देता', 'deti': 'देती', 'dete': 'देते',
-            'leta': 'लेता', 'leti': 'लेती', 'lete': 'लेते',
-            'karta': 'करता', 'karate': 'करते',
-            'aata': 'आता', 'aati': 'आती', 'aate': 'आते',
-            'jaata': 'जाता', 'jaati': 'जाती', 'jaate': 'जाते',
-            'jata': 'जाता', 'jati': 'जाती', 'jate': 'जाते',
-            'rehta': 'रहता', 'rehti': 'रहती', 'rehte': 'रहते',
-            'nikla': 'निकला', 'nikli': 'निकली', 'nikle': 'निकले',
-            'nikal': 'निकाल', 'nikalta': 'निकालता', 'nikalti': 'निकालती',
-            'nikala': 'निकाला', 'nikali': 'निकाली',
-            'peeta': 'पीटता', 'peeti': 'पीटती',
-            'khata': 'खाता', 'khati': 'खाती', 'khate': 'खाते',
-            'peeta_hai': 'पीटता है',
-            'lagta': 'लगता', 'lagti': 'लगती', 'lagte': 'लगते',
-            'milta': 'मिलता', 'milti': 'मिलती', 'milte': 'मिलते',
-            'mila': 'मिला', 'mili': 'मिली', 'mile': 'मिले',
-            'chalta': 'चलता', 'chalti': 'चलती', 'chalte': 'चलते',
-            'puchha': 'पूछा', 'puchhi': 'पूछी', 'puchhe': 'पूछे',
-            'puchta': 'पूछता', 'puchti': 'पूछती',
-            'bechta': 'बेचता', 'bechti': 'बेचती',
-            'becha': 'बेचा', 'bechi': 'बेची',
-
-            # Time & place
-            'kal': 'कल', 'aaj': 'आज', 'parso': 'परसों',
-            'raat': 'रात', 'rat': 'रात', 'din': 'दिन', 'subah': 'सुबह',
-            'sham': 'शाम', 'dopahar': 'दोपहर',
-            'baje': 'बजे', 'baj': 'बज',
-            'ghar': 'घर', 'dukaan': 'दुकान', 'kheti': 'खेती',
-            'gaon': 'गाँव', 'gaav': 'गाँव', 'shehar': 'शहर',
-            'bazaar': 'बाज़ार', 'bazar': 'बाज़ार',
-            'thana': 'थाना', 'thaane': 'थाने',
-            'office': 'कार्यालय',
-            'andar': 'अंदर', 'bahar': 'बाहर',
-            'pichhe': 'पीछे', 'peeche': 'पीछे',
-            'aage': 'आगे', 'upar': 'ऊपर', 'neeche': 'नीचे',
-            'paas': 'पास', 'door': 'दूर',
-            'yahan': 'यहाँ', 'wahan': 'वहाँ',
-            'jagah': 'जगह', 'taraf': 'तरफ़', 'saamne': 'सामने',
-            'kamra': 'कमरा', 'kamre': 'कमरे', 'makaan': 'मकान',
-            'rasta': 'रास्ता', 'raasta': 'रास्ता',
-            'nadi': 'नदी', 'nala': 'नाला', 'khet': 'खेत',
-
-            # People
-            'padosi': 'पड़ोसी', 'padoshi': 'पड़ोसी',
-            'log': 'लोग', 'aadmi': 'आदमी', 'vyakti': 'व्यक्ति',
-            'ladka': 'लड़का', 'ladki': 'लड़की',
-            'pati': 'पति', 'patni': 'पत्नी',
-            'beta': 'बेटा', 'beti': 'बेटी',
-            'bhai': 'भाई', 'behen': 'बहन',
-            'papa': 'पिताजी', 'maa': 'माँ', 'baap': 'पिता',
-            'sasur': 'ससुर', 'saas': 'सास',
-            'patwari': 'पटवारी', 'pradhan': 'प्रधान',
-            'police': 'पुलिस', 'daroga': 'दरोगा',
-
-            # Legal & complaint words
-            'chori': 'चोरी', 'loot': 'लूट', 'dhamki': 'धमकी',
-            'dhamkaya': 'धमकाया', 'dhamka': 'धमका',
-            'gaali': 'गाली', 'gali': 'गाली',
-            'marpeet': 'मारपीट', 'maar': 'मार', 'peet': 'पीट',
-            'zameen': 'ज़मीन', 'zamiin': 'ज़मीन', 'jamin': 'ज़मीन',
-            'deewar': 'दीवार', 'diwar': 'दीवार',
-            'tala': 'ताला', 'taala': 'ताला',
-            'paise': 'पैसे', 'paisa': 'पैसा', 'rupaiye': 'रुपये', 'rupaye': 'रुपये',
-            'cash': 'नकद राशि',
-            'kagzaat': 'कागज़ात', 'kagjat': 'कागज़ात',
-            'ration': 'राशन', 'card': 'कार्ड',
-            'bijli': 'बिजली', 'paani': 'पानी', 'sadak': 'सड़क',
-            'shikayat': 'शिकायत', 'avedan': 'आवेदन',
-            'nuksaan': 'नुकसान', 'nuksan': 'नुकसान',
-
-            # Connectors
-            'aur': 'और', 'ya': 'या', 'lekin': 'लेकिन', 'par': 'पर',
-            'mein': 'में', 'me': 'में', 'se': 'से', 'ko': 'को', 'ne': 'ने',
-            'pe': 'पर', 'tak': 'तक', 'bhi': 'भी',
-            'phir': 'फिर', 'uske baad': 'उसके बाद',
-            'isliye': 'इसलिए', 'kyunki': 'क्योंकि',
-            'kuch': 'कुछ', 'bahut': 'बहुत', 'bohot': 'बहुत',
-            'lagbhag': 'लगभग', 'lagbhar': 'लगभग',
-            'sirf': 'सिर्फ', 'bilkul': 'बिलकुल',
-            'baar': 'बार', 'ek': 'एक', 'do': 'दो', 'teen': 'तीन',
-            'chaar': 'चार', 'paanch': 'पाँच',
-
-            # Misc
-            'nahi': 'नहीं', 'nhi': 'नहीं', 'na': 'ना',
-            'haan': 'हाँ', 'ji': 'जी',
-            'kab': 'कब', 'kahan': 'कहाँ', 'kaise': 'कैसे',
-            'kyon': 'क्यों', 'kya': 'क्या', 'kitna': 'कितना',
-            'abhi': 'अभी', 'jab': 'जब', 'tab': 'तब',
-            'wapas': 'वापस', 'dobara': 'दोबारा',
-            'saath': 'साथ', 'sath': 'साथ',
-            'roz': 'रोज़', 'roj': 'रोज़', 'rozana': 'रोज़ाना',
-            'hamesha': 'हमेशा', 'hamesa': 'हमेशा',
-            'bachcha': 'बच्चा', 'bachchi': 'बच्ची',
-            'bachche': 'बच्चे', 'bachcho': 'बच्चों', 'bacho': 'बच्चों',
-            'khaana': 'खाना', 'khana': 'खाना',
-            'peena': 'पीना', 'pina': 'पीना',
-            'jaankari': 'जानकारी', 'jankari': 'जानकारी',
-            'saman': 'सामान', 'samaan': 'सामान',
-            'kapda': 'कपड़ा', 'kapde': 'कपड़े',
-            'zewar': 'ज़ेवर', 'jewar': 'ज़ेवर', 'zever': 'ज़ेवर',
-            'makan': 'मकान', 'gadi': 'गाड़ी', 'gaadi': 'गाड़ी',
-            'cycle': 'साइकिल', 'mobile': 'मोबाइल', 'phone': 'फ़ोन',
-            'kaam': 'काम', 'naukri': 'नौकरी',
-            'padhai': 'पढ़ाई', 'padhna': 'पढ़ना',
-            'bimaari': 'बीमारी', 'bimari': 'बीमारी',
-            'ilaaj': 'इलाज', 'ilaj': 'इलाज',
-            'hospital': 'अस्पताल', 'aspatal': 'अस्पताल',
-            'school': 'स्कूल', 'skool': 'स्कूल',
-            'sarkaar': 'सरकार', 'sarkar': 'सरकार',
-            'afsar': 'अफ़सर', 'adhikari': 'अधिकारी',
-            'madat': 'मदद', 'sahayata': 'सहायता',
-            'suraksha': 'सुरक्षा', 'nyay': 'न्याय', 'insaaf': 'इंसाफ़',
-            'kanoon': 'कानून', 'kaanoon': 'कानून',
-            'haq': 'हक़', 'adhikar': 'अधिकार',
-            'jaan': 'जान', 'khatra': 'ख़तरा', 'khatara': 'ख़तरा',
-            'darr': 'डर', 'dar': 'डर',
-            'takleef': 'तकलीफ़', 'taklif': 'तकलीफ़',
-            'pareshaan': 'परेशान', 'pareshan': 'परेशान',
-            'mushkil': 'मुश्किल',
-            'majboor': 'मजबूर', 'majbur': 'मजबूर',
-            'galat': 'गलत', 'sahi': 'सही',
-            'saboot': 'सबूत', 'gawah': 'गवाह',
-            'dahej': 'दहेज', 'dahez': 'दहेज',
-            'sharab': 'शराब', 'nashe': 'नशे', 'nasha': 'नशा',
-            'hinsa': 'हिंसा', 'atyachaar': 'अत्याचार',
-            'bigha': 'बीघा',
-            'lakh': 'लाख', 'hazar': 'हज़ार', 'hazaar': 'हज़ार',
-        }
-
-        # Convert Hinglish words to Hindi
-        words = text.split()
-        converted = []
-        for word in words:
-            # Strip punctuation for lookup, preserve it after
-            clean = word.strip('.,;:!?।|')
-            trail = word[len(clean):] if len(word) > len(clean) else ''
-            lookup = clean.lower()
-            if lookup in hinglish_map:
-                converted.append(hinglish_map[lookup] + trail)
-            else:
-                # Check for number+word combos like "1lakh"
-                import re
-                m = re.match(r'^(\d+)(lakh|hazar|hazaar|rupaiye|rupaye)$', lookup)
-                if m:
-                    num = m.group(1)
-                    unit = hinglish_map.get(m.group(2), m.group(2))
-                    converted.append(f'{num} {unit}{trail}')
-                else:
-                    converted.append(word)
-
-        hindi_text = ' '.join(converted)
+        # Convert Hinglish words to Hindi (table and tokenizer are built once at import)
+        hindi_text = transliterate(text)
 
         # Split into sentences
         sentences = []
@@ -1041,954 +912,3 @@ Place: _______________________________"""
             rewritten += '।'
 
         return {'rewritten': rewritten}
-    
-    def _generate_land_dispute_draft(self, details, language='hindi'):
-        """Generate land dispute complaint letter"""
-        
-        if language == 'english':
-            draft = f"""To,
-The District Magistrate/Sub-Divisional Officer,
-District Office,
-District: _________________________
-
-Date: {self.current_date}
-
-Subject: Complaint Regarding Land Dispute / Illegal Occupation
-
-Respected Sir/Madam,
-
-Applicant Details:
-• Name: _________________________
-• Address: _________________________
-
-I hereby bring to your notice the following land dispute:
-
-Description of Problem:
-{details}
-
-Details of My Land:
-• Khesra Number/Plot No: _________________________
-• Khata Number/Account No: _________________________
-• Area/Size: _________________________ (Bigha/Hectare)
-• Village/Locality: _________________________
-
-I respectfully request you to take appropriate action on my complaint and secure my property rights.
-
-Enclosures:
-1. Certified copy of Khesra-Khatauni (Land records)
-2. Land Map/Sketch
-3. Identity Proof
-4. Other relevant documents
-
-Thanking you,
-
-Yours faithfully,
-Name: _________________________
-Phone No.: _________________________
-Address: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'Attach certified copies of land records (Khesra-Khatauni)',
-                    'Get a copy of your petition when submitting',
-                    'Keep the receipt of submission for future reference',
-                    'Also file copy with Tehsildar (Revenue Officer)',
-                    'Consider mediation through Gram Panchayat first'
-                ],
-                'submitTo': [
-                    'District Magistrate Office',
-                    'Tehsildar/Revenue Officer',
-                    'Sub-Divisional Officer',
-                    'Revenue Department'
-                ]
-            }
-        
-        else:  # Hindi version
-            draft = f"""सेवा में,
-श्रीमान जिलाधिकारी/उप-जिलाधिकारी महोदय,
-जिला कार्यालय,
-जिला: _________________________
-
-दिनांक: {self.current_date}
-
-विषय: भूमि विवाद/अवैध कब्ज़े के संबंध में शिकायत
-
-महोदय,
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पता: _________________________
-
-मैं आपके संज्ञान में निम्नलिखित भूमि विवाद लाना चाहता/चाहती हूँ:
-
-समस्या का विवरण:
-{details}
-
-मेरी ज़मीन का विवरण:
-• खसरा नंबर: _________________________
-• खाता नंबर: _________________________
-• क्षेत्रफल: _________________________ (बीघा/हेक्टेयर)
-• ग्राम/मोहल्ला: _________________________
-
-अतः श्रीमान से विनम्र निवेदन है कि मेरी शिकायत पर उचित कार्यवाही करते हुए मुझे न्याय दिलाने की कृपा करें।
-
-संलग्नक:
-1. खसरा-खतौनी की प्रमाणित प्रति
-2. भूमि का नक्शा
-3. पहचान पत्र की प्रति
-4. अन्य संबंधित दस्तावेज़
-
-धन्यवाद सहित,
-
-भवदीय,
-नाम: _________________________
-मोबाइल नंबर: _________________________
-पता: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'खसरा-खतौनी की प्रमाणित प्रति अवश्य संलग्न करें',
-                    'शिकायत की 2 प्रतियां बनाएं - एक अपने पास रखें',
-                    'जमा करते समय रसीद अवश्य लें',
-                    'तहसीलदार कार्यालय में भी प्रति जमा करें',
-                    'पहले ग्राम पंचायत से सुलह-समझौते की कोशिश करें'
-                ],
-                'submitTo': [
-                    'जिलाधिकारी कार्यालय',
-                    'तहसीलदार कार्यालय',
-                    'उप-जिलाधिकारी कार्यालय',
-                    'राजस्व विभाग'
-                ]
-            }
-    
-    def _generate_family_dispute_draft(self, details, language='hindi'):
-        """Generate family dispute application"""
-        
-        if language == 'english':
-            draft = f"""To,
-The Hon'ble Judge,
-Family Court,
-District: _________________________
-
-Date: {self.current_date}
-
-Subject: Application for Resolution of Family Dispute
-
-Respected Sir/Madam,
-
-Applicant Details:
-• Name: _________________________
-• Father/Husband Name: _________________________
-• Address: _________________________
-
-I hereby submit the following family dispute for resolution:
-
-Description of Problem:
-{details}
-
-Family Details:
-• Date of Marriage: _________________________
-• Number of Children: _________________________
-• Current Situation: _________________________
-
-Prayer/Relief Sought:
-I humbly request you to hear my case and pass appropriate orders for resolution of this family matter.
-
-Enclosures:
-1. Marriage Certificate
-2. Identity Proof
-3. Proof of Residence
-4. Other relevant documents
-
-Yours faithfully,
-Petitioner's Signature
-Name: _________________________
-Phone No.: _________________________
-Address: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'First try Family Counselling Centre for mediation',
-                    'Marriage certificate must be attached',
-                    'Women Helpline: 181 (available 24/7)',
-                    'Seek free legal aid from District Legal Services Authority (DLSA)',
-                    'Document all incidents with dates and witnesses'
-                ],
-                'submitTo': [
-                    'Family Court',
-                    'Women Commission',
-                    'District Legal Services Authority (DLSA)',
-                    'Family Counselling Centre'
-                ]
-            }
-        
-        else:  # Hindi version
-            draft = f"""सेवा में,
-श्रीमान न्यायाधीश महोदय,
-परिवार न्यायालय,
-जिला: _________________________
-
-दिनांक: {self.current_date}
-
-विषय: पारिवारिक विवाद के संबंध में आवेदन
-
-महोदय,
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पिता/पति का नाम: _________________________
-• पता: _________________________
-
-मैं निम्नलिखित पारिवारिक विवाद के समाधान हेतु आपकी सेवा में उपस्थित हूँ:
-
-समस्या का विवरण:
-{details}
-
-परिवार का विवरण:
-• विवाह की तिथि: _________________________
-• बच्चों की संख्या: _________________________
-• वर्तमान स्थिति: _________________________
-
-प्रार्थना:
-अतः श्रीमान से विनम्र निवेदन है कि मेरे प्रकरण की सुनवाई कर उचित आदेश पारित करने की कृपा करें।
-
-संलग्नक:
-1. विवाह प्रमाण पत्र
-2. पहचान पत्र
-3. निवास प्रमाण
-4. अन्य संबंधित दस्तावेज़
-
-धन्यवाद सहित,
-
-प्रार्थी,
-नाम: _________________________
-मोबाइल नंबर: _________________________
-पता: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'पहले परिवार परामर्श केंद्र से संपर्क करें',
-                    'विवाह प्रमाण पत्र अवश्य संलग्न करें',
-                    'महिला हेल्पलाइन 181 से मार्गदर्शन लें (24 घंटे)',
-                    'मुफ्त कानूनी सहायता के लिए DLSA से संपर्क करें',
-                    'सभी घटनाएं तिथि और गवाहों के साथ दस्तावेज़ करें'
-                ],
-                'submitTo': [
-                    'परिवार न्यायालय',
-                    'महिला आयोग',
-                    'जिला विधिक सेवा प्राधिकरण',
-                    'परिवार परामर्श केंद्र'
-                ]
-            }
-    
-    def _generate_domestic_violence_draft(self, details, language='hindi'):
-        """Generate domestic violence complaint"""
-        
-        if language == 'english':
-            draft = f"""To,
-The Police Officer-in-Charge / Lady Police Officer,
-Police Station: _________________________
-District: _________________________
-
-Date: {self.current_date}
-
-Subject: Complaint of Domestic Violence - IPC Section 498A / Domestic Violence Act 2005
-
-Respected Sir/Madam,
-
-Applicant Details:
-• Name: _________________________
-• Husband Name: _________________________
-• Address: _________________________
-
-I hereby lodge the following complaint:
-
-Details of Incident:
-{details}
-
-Details of Accused:
-• Name: _________________________
-• Relationship: _________________________
-• Address: _________________________
-
-I request you to:
-1. Register my FIR immediately
-2. Initiate appropriate legal action against the accused
-3. Provide me with protection and safety
-
-Enclosures:
-1. Identity Proof
-2. Medical Report (if injured)
-3. Marriage Certificate
-4. Photos/Evidence (if available)
-
-Complaint Lodger,
-Name: _________________________
-Phone No.: _________________________
-Address: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'Call Police (100) or Women Helpline (181) immediately',
-                    'Get medical examination done if injured - report is evidence',
-                    'Get a copy of the registered FIR for records',
-                    'Visit nearest One Stop Centre for support',
-                    'You can file complaint without proof - police will investigate',
-                    'Know your rights under Domestic Violence Act'
-                ],
-                'submitTo': [
-                    'Nearest Police Station',
-                    'Lady Police Station',
-                    'Women Commission',
-                    'One Stop Centre'
-                ],
-                'emergencyContacts': [
-                    {'name': 'Police Emergency', 'number': '100'},
-                    {'name': 'Women Helpline', 'number': '181'},
-                    {'name': 'Women Commission', 'number': '7827-170-170'}
-                ]
-            }
-        
-        else:  # Hindi version
-            draft = f"""सेवा में,
-श्रीमान थानाध्यक्ष/महिला थाना प्रभारी,
-थाना: _________________________
-जिला: _________________________
-
-दिनांक: {self.current_date}
-
-विषय: घरेलू हिंसा की शिकायत - धारा 498A IPC / घरेलू हिंसा अधिनियम 2005
-
-महोदय,
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पति का नाम: _________________________
-• पता: _________________________
-
-मैं निम्नलिखित शिकायत दर्ज करवाना चाहती हूँ:
-
-घटना का विवरण:
-{details}
-
-आरोपी का विवरण:
-• नाम: _________________________
-• संबंध: _________________________
-• पता: _________________________
-
-प्रार्थना:
-1. मेरी FIR दर्ज की जाए
-2. आरोपियों के विरुद्ध कार्यवाही की जाए
-3. मुझे सुरक्षा प्रदान की जाए
-
-संलग्नक:
-1. पहचान पत्र
-2. मेडिकल रिपोर्ट (यदि हो)
-3. विवाह प्रमाण पत्र
-4. फोटो/अन्य प्रमाण
-
-शिकायतकर्ता,
-नाम: _________________________
-मोबाइल नंबर: _________________________
-पता: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'तुरंत 100 या महिला हेल्पलाइन 181 पर कॉल करें',
-                    'चोट लगी हो तो पहले मेडिकल जाँच करवाएं - रिपोर्ट साक्ष्य है',
-                    'FIR की कॉपी अवश्य लें',
-                    'One Stop Centre से मदद लें',
-                    'प्रमाण न हो तो भी शिकायत दर्ज करवाएं - पुलिस अन्वेषण करेगी',
-                    'घरेलू हिंसा अधिनियम के तहत अपने अधिकार जानें'
-                ],
-                'submitTo': [
-                    'नज़दीकी पुलिस थाना',
-                    'महिला थाना',
-                    'महिला आयोग',
-                    'One Stop Centre'
-                ],
-                'emergencyContacts': [
-                    {'name': 'पुलिस', 'number': '100'},
-                    {'name': 'महिला हेल्पलाइन', 'number': '181'},
-                    {'name': 'महिला आयोग', 'number': '7827-170-170'}
-                ]
-            }
-    
-    def _generate_consumer_complaint_draft(self, details, language='hindi'):
-        """Generate consumer complaint"""
-        draft = f"""सेवा में,
-श्रीमान अध्यक्ष,
-जिला उपभोक्ता विवाद निवारण आयोग,
-[जिले का नाम]
-
-दिनांक: {self.current_date}
-
-विषय: उपभोक्ता शिकायत - सेवा में कमी/दोषपूर्ण उत्पाद
-
-महोदय,
-
-मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित उपभोक्ता शिकायत दर्ज करना चाहता/चाहती हूँ:
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पता: _________________________
-
-शिकायत का विवरण:
-{details}
-
-प्रतिवादी (विक्रेता/कंपनी) का विवरण:
-• नाम: [कंपनी/दुकान का नाम]
-• पता: [पता]
-• खरीदारी की तिथि: [तिथि]
-• रसीद/बिल नंबर: [नंबर]
-• भुगतान की राशि: ₹[राशि]
-
-क्षतिपूर्ति की माँग:
-1. रिफंड/बदली: ₹[राशि]
-2. मानसिक क्षतिपूर्ति: ₹[राशि]
-3. वाद व्यय: ₹[राशि]
-
-संलग्नक:
-1. खरीदारी की रसीद/बिल
-2. वारंटी कार्ड
-3. उत्पाद की फोटो
-4. पत्राचार की प्रतियाँ
-
-प्रार्थी,
-नाम: _________________________
-मोबाइल नंबर: _________________________
-ईमेल: _________________________"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'पहले विक्रेता को लिखित शिकायत दें',
-                'consumerhelpline.gov.in पर ऑनलाइन शिकायत करें',
-                'बिल और वारंटी कार्ड अवश्य संलग्न करें',
-                '₹1 लाख तक की शिकायत पर कोई फीस नहीं'
-            ],
-            'submitTo': [
-                'जिला उपभोक्ता फोरम',
-                'National Consumer Helpline (1800-11-4000)',
-                'ई-दाखिल पोर्टल (edaakhil.nic.in)'
-            ]
-        }
-    
-    def _generate_employment_draft(self, details, language='hindi'):
-        """Generate employment related complaint"""
-        draft = f"""सेवा में,
-श्रीमान श्रम आयुक्त/सहायक श्रम आयुक्त,
-श्रम विभाग,
-[जिले का नाम]
-
-दिनांक: {self.current_date}
-
-विषय: वेतन/सेवा संबंधी शिकायत
-
-महोदय,
-
-मैं, नीचे हस्ताक्षरकर्ता, कर्मचारी _________________________ (कंपनी का नाम), निम्नलिखित शिकायत दर्ज करना चाहता/चाहती हूँ:
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पता: _________________________
-
-शिकायत का विवरण:
-{details}
-
-नियोक्ता का विवरण:
-• कंपनी का नाम: [नाम]
-• पता: [पता]
-• कार्य की अवधि: [तिथि से तिथि तक]
-• पद: [पद का नाम]
-• मासिक वेतन: ₹[राशि]
-
-बकाया राशि का विवरण:
-• वेतन बकाया: ₹[राशि]
-• PF बकाया: ₹[राशि]
-• अन्य: ₹[राशि]
-
-संलग्नक:
-1. नियुक्ति पत्र
-2. सैलरी स्लिप
-3. PF स्टेटमेंट
-4. पहचान पत्र
-
-प्रार्थी,
-नाम: _________________________
-मोबाइल नंबर: _________________________"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'नियुक्ति पत्र और सैलरी स्लिप ज़रूरी हैं',
-                'PF शिकायत के लिए EPFO पोर्टल पर जाएं',
-                'श्रम हेल्पलाइन 14434 पर कॉल करें',
-                '90 दिन के अंदर शिकायत करें'
-            ],
-            'submitTo': [
-                'श्रम विभाग कार्यालय',
-                'श्रम न्यायालय',
-                'EPFO कार्यालय (PF संबंधी)'
-            ]
-        }
-    
-    def _generate_police_complaint_draft(self, details, language='hindi'):
-        """Generate police complaint (FIR) in Hindi or English"""
-        
-        if language == 'english':
-            draft = f"""To,
-The Police Officer-in-Charge,
-Police Station: _________________________
-District: _________________________
-
-Date: {self.current_date}
-
-Subject: Application for Registration of First Information Report (FIR)
-
-Respected Sir/Madam,
-
-Applicant Details:
-• Name: _________________________
-• Father's Name: _________________________
-• Address: _________________________
-
-I hereby lodge the following complaint:
-
-Details of Incident:
-{details}
-
-Information about the Incident:
-• Date of Incident: _________________________
-• Time of Incident: _________________________
-• Place of Incident: _________________________
-
-Details of Accused (if known):
-• Name: _________________________
-• Address: _________________________
-• Identification: _________________________
-
-Witnesses (if any):
-1. Name: _________________________, Address: _________________________
-
-I request you to register my FIR and take appropriate legal action against the accused.
-
-Submitted by,
-Name: _________________________
-Phone No.: _________________________
-Address: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'Always obtain a copy of the registered FIR',
-                    'If FIR is not registered, file a complaint with SP/DM',
-                    'Online FIR option is available on state police websites',
-                    'Zero FIR can be filed at any police station',
-                    'Keep all supporting documents and medical reports if injured'
-                ],
-                'submitTo': [
-                    'Nearest Police Station',
-                    'SP Office (if not heard at local station)',
-                    'Online FIR Portal (state police website)',
-                    'National Crime Records Bureau'
-                ]
-            }
-        
-        else:  # Hindi version
-            draft = f"""सेवा में,
-श्रीमान थानाध्यक्ष,
-थाना: _________________________
-जिला: _________________________
-
-दिनांक: {self.current_date}
-
-विषय: प्राथमिकी (FIR) दर्ज करने हेतु प्रार्थना पत्र
-
-महोदय,
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पिता का नाम: _________________________
-• पता: _________________________
-
-मैं निम्नलिखित घटना की शिकायत दर्ज करवाना चाहता/चाहती हूँ:
-
-घटना का विवरण:
-{details}
-
-घटना की जानकारी:
-• घटना की तिथि: _________________________
-• घटना का समय: _________________________
-• घटना का स्थान: _________________________
-
-आरोपी का विवरण (यदि ज्ञात हो):
-• नाम: _________________________
-• पता: _________________________
-• पहचान: _________________________
-
-गवाह (यदि कोई हो):
-1. नाम: _________________________, पता: _________________________
-
-प्रार्थना:
-कृपया मेरी FIR दर्ज कर उचित कार्यवाही करें।
-
-प्रार्थी,
-नाम: _________________________
-मोबाइल नंबर: _________________________
-पता: _________________________"""
-
-            return {
-                'draft': draft,
-                'tips': [
-                    'FIR दर्ज होने पर कॉपी अवश्य लें',
-                    'यदि FIR न लिखी जाए तो SP/DM को शिकायत करें',
-                    'ऑनलाइन FIR: राज्य पुलिस वेबसाइट पर',
-                    'Zero FIR का विकल्प भी उपलब्ध है',
-                    'चोट लगी हो तो मेडिकल रिपोर्ट अवश्य प्राप्त करें'
-                ],
-                'submitTo': [
-                    'नज़दीकी पुलिस थाना',
-                    'SP कार्यालय (यदि थाने में न सुनी जाए)',
-                    'ऑनलाइन FIR पोर्टल',
-                    'राष्ट्रीय अपराध रिकॉर्ड ब्यूरो'
-                ]
-            }
-    
-    def _generate_court_affidavit_draft(self, details, language='hindi'):
-        """Generate court affidavit (शपथ पत्र)"""
-        draft = f"""शपथ पत्र
-(Affidavit)
-
-न्यायालय श्रीमान [न्यायाधीश पद], [न्यायालय का नाम]
-[जिले का नाम], [राज्य]
-
-वाद संख्या: _______________
-[वादी का नाम] ........................ वादी
-बनाम
-[प्रतिवादी का नाम] ........................ प्रतिवादी
-
-दिनांक: {self.current_date}
-
-मैं, नीचे हस्ताक्षरकर्ता, शपथपूर्वक कथन करता/करती हूँ कि:
-
-शपथकर्ता का विवरण:
-• नाम: _________________________
-• पिता/पति का नाम: _________________________
-• आयु: _________________________ वर्ष
-• पता: _________________________
-
-1. मैं उपरोक्त वाद में वादी/प्रतिवादी/साक्षी हूँ और इस मामले से पूर्ण रूप से परिचित हूँ।
-
-2. निम्नलिखित तथ्य मेरी व्यक्तिगत जानकारी में हैं और सत्य हैं:
-
-{details}
-
-3. यह शपथ पत्र स्वेच्छा से बिना किसी दबाव या प्रलोभन के दिया जा रहा है।
-
-4. इस शपथ पत्र की सामग्री मेरी जानकारी और विश्वास के अनुसार सत्य है। इसमें कुछ भी छिपाया नहीं गया है और कोई भाग असत्य नहीं है।
-
-5. मुझे ज्ञात है कि यदि इस शपथ पत्र में कोई बात असत्य पाई गई तो मेरे विरुद्ध भारतीय दण्ड संहिता की धारा 191/199 के अंतर्गत मिथ्या साक्ष्य/मिथ्या शपथ पत्र हेतु कार्यवाही की जा सकती है।
-
-सत्यापन:
-मैं उपरोक्त शपथ पत्र की सामग्री को सत्य एवं सही पाते हुए आज दिनांक _____________ को [स्थान] में सत्यापित करता/करती हूँ।
-
-शपथकर्ता
-
-हस्ताक्षर: _______________________
-नाम: _________________________
-
-_______________________
-(नोटरी/ओथ कमिश्नर की मुहर एवं हस्ताक्षर)
-
-संलग्नक:
-1. पहचान पत्र (आधार/वोटर ID)
-2. पासपोर्ट साइज़ फोटो"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'शपथ पत्र को नोटरी से सत्यापित कराना अनिवार्य है',
-                'नोटरी शुल्क ₹10-50 होता है',
-                '₹10 का स्टांप पेपर पर लिखें',
-                'सभी तथ्य सत्य लिखें - मिथ्या शपथ पत्र अपराध है',
-                'दो प्रतियाँ बनवाएं - एक कोर्ट के लिए, एक अपने पास'
-            ],
-            'submitTo': [
-                'संबंधित न्यायालय',
-                'नोटरी कार्यालय (सत्यापन हेतु)',
-                'ओथ कमिश्नर कार्यालय'
-            ]
-        }
-    
-    def _generate_rti_draft(self, details, language='hindi'):
-        """Generate RTI application"""
-        draft = f"""सेवा में,
-श्रीमान जन सूचना अधिकारी (PIO),
-[विभाग का नाम],
-[कार्यालय का पता]
-
-दिनांक: {self.current_date}
-
-विषय: सूचना का अधिकार अधिनियम, 2005 के तहत सूचना प्राप्ति हेतु आवेदन
-
-महोदय,
-
-सूचना का अधिकार अधिनियम, 2005 की धारा 6(1) के अंतर्गत मैं निम्नलिखित सूचना प्राप्त करना चाहता/चाहती हूँ:
-
-मांगी गई सूचना का विवरण:
-{details}
-
-सूचना का प्रारूप: [प्रिंट/फोटोकॉपी/सॉफ्ट कॉपी]
-
-सूचना की अवधि: [तिथि से तिथि तक]
-
-मैं इस आवेदन के साथ ₹10 (दस रुपये) का शुल्क [पोस्टल ऑर्डर/कोर्ट फीस स्टांप/ऑनलाइन] के माध्यम से जमा कर रहा/रही हूँ।
-
-[यदि BPL हों तो: मैं गरीबी रेखा से नीचे (BPL) श्रेणी में आता/आती हूँ, अतः मुझे शुल्क से छूट प्राप्त है। BPL कार्ड की प्रति संलग्न है।]
-
-आवेदक का विवरण:
-नाम: _________________________
-पता: _________________________
-फोन: _________________________
-ईमेल: _________________________
-
-हस्ताक्षर: _________________________
-नाम: _________________________"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'आवेदन शुल्क ₹10 है (BPL के लिए मुफ्त)',
-                '30 दिनों में जवाब मिलना चाहिए',
-                'जवाब न मिले तो प्रथम अपीलीय अधिकारी को लिखें',
-                'rtionline.gov.in पर ऑनलाइन भी आवेदन कर सकते हैं'
-            ],
-            'submitTo': [
-                'संबंधित विभाग का PIO कार्यालय',
-                'rtionline.gov.in (केंद्र सरकार के लिए)',
-                'राज्य RTI पोर्टल (राज्य सरकार के लिए)'
-            ]
-        }
-    
-    def _generate_pension_draft(self, details, language='hindi'):
-        """Generate pension related application"""
-        draft = f"""सेवा में,
-श्रीमान जिला समाज कल्याण अधिकारी/पेंशन अधिकारी,
-[जिले का नाम]
-
-दिनांक: {self.current_date}
-
-विषय: वृद्धावस्था/विधवा/विकलांग पेंशन हेतु आवेदन/शिकायत
-
-महोदय,
-
-मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित निवेदन करता/करती हूँ:
-
-आवेदक का विवरण:
-• नाम: _________________________
-• आयु: _________________________ वर्ष
-• पता: _________________________
-
-विवरण:
-{details}
-
-व्यक्तिगत जानकारी:
-• जन्म तिथि: [तिथि]
-• आधार नंबर: [नंबर]
-• बैंक खाता: [खाता नंबर]
-• IFSC कोड: [कोड]
-
-संलग्नक:
-1. आधार कार्ड
-2. आयु प्रमाण पत्र
-3. आय प्रमाण पत्र
-4. बैंक पासबुक की प्रति
-5. फोटो
-
-प्रार्थी,
-नाम: _________________________
-मोबाइल नंबर: _________________________"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'आयु प्रमाण के लिए जन्म प्रमाण पत्र/आधार दें',
-                'बैंक खाता आधार से लिंक होना चाहिए',
-                'आवेदन जमा करने की रसीद लें',
-                'ऑनलाइन आवेदन भी कर सकते हैं'
-            ],
-            'submitTo': [
-                'समाज कल्याण विभाग',
-                'ब्लॉक/तहसील कार्यालय',
-                'CSC केंद्र (ऑनलाइन आवेदन)'
-            ]
-        }
-    
-    def _generate_certificate_draft(self, details, language='hindi'):
-        """Generate certificate application"""
-        draft = f"""सेवा में,
-श्रीमान तहसीलदार/उप-जिलाधिकारी,
-तहसील कार्यालय,
-[तहसील का नाम], [जिले का नाम]
-
-दिनांक: {self.current_date}
-
-विषय: जाति/आय/निवास प्रमाण पत्र हेतु आवेदन
-
-महोदय,
-
-मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित प्रमाण पत्र प्राप्त करना चाहता/चाहती हूँ:
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पिता का नाम: _________________________
-• पता: _________________________
-
-विवरण:
-{details}
-
-व्यक्तिगत जानकारी:
-• जन्म तिथि: [तिथि]
-• जाति: [जाति]
-• पिता का व्यवसाय: [व्यवसाय]
-• वार्षिक आय: ₹[राशि]
-
-संलग्नक:
-1. आधार कार्ड
-2. राशन कार्ड
-3. पहचान पत्र
-4. पुराना प्रमाण पत्र (यदि हो)
-5. फोटो
-
-प्रार्थी,
-नाम: _________________________
-मोबाइल नंबर: _________________________"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'ऑनलाइन आवेदन करें - तेज़ और आसान',
-                'सभी दस्तावेज़ों की स्व-प्रमाणित प्रति दें',
-                'CSC केंद्र से भी बनवा सकते हैं',
-                '15-30 दिनों में प्रमाण पत्र मिलना चाहिए'
-            ],
-            'submitTo': [
-                'तहसील कार्यालय',
-                'CSC/जन सेवा केंद्र',
-                'ई-डिस्ट्रिक्ट पोर्टल (ऑनलाइन)'
-            ]
-        }
-    
-    def _generate_ration_card_draft(self, details, language='hindi'):
-        """Generate ration card application"""
-        draft = f"""सेवा में,
-श्रीमान जिला आपूर्ति अधिकारी,
-खाद्य एवं रसद विभाग,
-[जिले का नाम]
-
-दिनांक: {self.current_date}
-
-विषय: नया राशन कार्ड/राशन कार्ड में संशोधन हेतु आवेदन
-
-महोदय,
-
-मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित निवेदन करता/करती हूँ:
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पता: _________________________
-
-विवरण:
-{details}
-
-परिवार की जानकारी:
-• परिवार के मुखिया का नाम: [नाम]
-• कुल सदस्य: [संख्या]
-• वार्षिक आय: ₹[राशि]
-
-परिवार के सदस्यों का विवरण:
-1. [नाम] - [संबंध] - [आयु]
-2. [नाम] - [संबंध] - [आयु]
-
-संलग्नक:
-1. आधार कार्ड (सभी सदस्यों के)
-2. आय प्रमाण पत्र
-3. निवास प्रमाण
-4. पासपोर्ट साइज़ फोटो
-
-प्रार्थी,
-नाम: _________________________
-मोबाइल नंबर: _________________________"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'सभी सदस्यों के आधार कार्ड ज़रूरी हैं',
-                'ऑनलाइन आवेदन करें - nfsa.gov.in',
-                'फोटो और बायोमेट्रिक के लिए बुलाया जाएगा',
-                'e-Ration Card ऐप से स्टेटस चेक करें'
-            ],
-            'submitTo': [
-                'खाद्य एवं रसद विभाग',
-                'CSC/जन सेवा केंद्र',
-                'nfsa.gov.in (ऑनलाइन)'
-            ]
-        }
-    
-    def _generate_general_draft(self, details, language='hindi'):
-        """Generate general complaint letter"""
-        draft = f"""सेवा में,
-श्रीमान [अधिकारी का पद],
-[विभाग/कार्यालय का नाम],
-[पता]
-
-दिनांक: {self.current_date}
-
-विषय: शिकायत/आवेदन
-
-महोदय,
-
-सविनय निवेदन है कि मैं, नीचे हस्ताक्षरकर्ता, आपके संज्ञान में निम्नलिखित विषय लाना चाहता/चाहती हूँ:
-
-आवेदक का विवरण:
-• नाम: _________________________
-• पता: _________________________
-
-विवरण:
-{details}
-
-अतः श्रीमान से विनम्र निवेदन है कि मेरी समस्या पर उचित कार्यवाही करने की कृपा करें।
-
-संलग्नक:
-1. पहचान पत्र
-2. संबंधित दस्तावेज़
-
-धन्यवाद सहित,
-
-भवदीय,
-नाम: _________________________
-मोबाइल नंबर: _________________________
-पता: _________________________
-ईमेल: _________________________"""
-
-        return {
-            'draft': draft,
-            'tips': [
-                'शिकायत की 2 प्रतियां बनाएं',
-                'जमा करते समय रसीद अवश्य लें',
-                'संबंधित दस्तावेज़ संलग्न करें',
-                'जिला विधिक सेवा से मार्गदर्शन लें'
-            ],
-            'submitTo': [
-                'संबंधित विभाग/कार्यालय',
-                'जिलाधिकारी कार्यालय',
-                'लोकायुक्त (यदि भ्रष्टाचार संबंधी हो)'
-            ]
-        }
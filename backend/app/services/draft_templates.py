@@ -0,0 +1,1037 @@
+"""
+Draft Templates
+Complaint/application letter templates per issue type and language.
+- Each template is compiled once at import into literal text and named slots
+- Slots are written {name} (empty -> blank line for the user to fill) or
+  {name:default text}; defaults may contain slots themselves
+- Blanks inside accused/witness sections are plain underscores, not slots,
+  so they are never filled with the applicant's details
+- Rendering is a single join over the segments, and the output depends only
+  on the slot values, so rendered drafts can be cached
+"""
+
+import re
+from types import MappingProxyType
+
+
+BLANK = '_________________________'
+
+# Slots filled by DraftService._template_values
+SLOT_NAMES = frozenset({
+    'date', 'details', 'recipient', 'office', 'subject',
+    'name', 'father', 'address', 'phone', 'district', 'state', 'place', 'station',
+})
+
+# Issue types that share another issue type's template
+ISSUE_TEMPLATE_ALIASES = {'property_dispute': 'land_dispute'}
+
+_TEMPLATE_SOURCES = {
+    'land_dispute': {
+        'english': {
+            'text': """To,
+{recipient:The District Magistrate/Sub-Divisional Officer,}
+District Office,
+District: {district}
+
+Date: {date}
+
+Subject: {subject:Complaint Regarding Land Dispute / Illegal Occupation}
+
+Respected Sir/Madam,
+
+Applicant Details:
+• Name: {name}
+• Address: {address}
+
+I hereby bring to your notice the following land dispute:
+
+Description of Problem:
+{details}
+
+Details of My Land:
+• Khesra Number/Plot No: _________________________
+• Khata Number/Account No: _________________________
+• Area/Size: _________________________ (Bigha/Hectare)
+• Village/Locality: {address}
+
+I respectfully request you to take appropriate action on my complaint and secure my property rights.
+
+Enclosures:
+1. Certified copy of Khesra-Khatauni (Land records)
+2. Land Map/Sketch
+3. Identity Proof
+4. Other relevant documents
+
+Thanking you,
+
+Yours faithfully,
+Name: {name}
+Phone No.: {phone}
+Address: {address}""",
+            'tips': [
+                'Attach certified copies of land records (Khesra-Khatauni)',
+                'Get a copy of your petition when submitting',
+                'Keep the receipt of submission for future reference',
+                'Also file copy with Tehsildar (Revenue Officer)',
+                'Consider mediation through Gram Panchayat first',
+            ],
+            'submitTo': [
+                'District Magistrate Office',
+                'Tehsildar/Revenue Officer',
+                'Sub-Divisional Officer',
+                'Revenue Department',
+            ],
+        },
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान जिलाधिकारी/उप-जिलाधिकारी महोदय,}
+जिला कार्यालय,
+जिला: {district}
+
+दिनांक: {date}
+
+विषय: {subject:भूमि विवाद/अवैध कब्ज़े के संबंध में शिकायत}
+
+महोदय,
+
+आवेदक का विवरण:
+• नाम: {name}
+• पता: {address}
+
+मैं आपके संज्ञान में निम्नलिखित भूमि विवाद लाना चाहता/चाहती हूँ:
+
+समस्या का विवरण:
+{details}
+
+मेरी ज़मीन का विवरण:
+• खसरा नंबर: _________________________
+• खाता नंबर: _________________________
+• क्षेत्रफल: _________________________ (बीघा/हेक्टेयर)
+• ग्राम/मोहल्ला: {address}
+
+अतः श्रीमान से विनम्र निवेदन है कि मेरी शिकायत पर उचित कार्यवाही करते हुए मुझे न्याय दिलाने की कृपा करें।
+
+संलग्नक:
+1. खसरा-खतौनी की प्रमाणित प्रति
+2. भूमि का नक्शा
+3. पहचान पत्र की प्रति
+4. अन्य संबंधित दस्तावेज़
+
+धन्यवाद सहित,
+
+भवदीय,
+नाम: {name}
+मोबाइल नंबर: {phone}
+पता: {address}""",
+            'tips': [
+                'खसरा-खतौनी की प्रमाणित प्रति अवश्य संलग्न करें',
+                'शिकायत की 2 प्रतियां बनाएं - एक अपने पास रखें',
+                'जमा करते समय रसीद अवश्य लें',
+                'तहसीलदार कार्यालय में भी प्रति जमा करें',
+                'पहले ग्राम पंचायत से सुलह-समझौते की कोशिश करें',
+            ],
+            'submitTo': [
+                'जिलाधिकारी कार्यालय',
+                'तहसीलदार कार्यालय',
+                'उप-जिलाधिकारी कार्यालय',
+                'राजस्व विभाग',
+            ],
+        },
+    },
+    'family_dispute': {
+        'english': {
+            'text': """To,
+{recipient:The Hon'ble Judge,}
+{office:Family Court,}
+District: {district}
+
+Date: {date}
+
+Subject: {subject:Application for Resolution of Family Dispute}
+
+Respected Sir/Madam,
+
+Applicant Details:
+• Name: {name}
+• Father/Husband Name: {father}
+• Address: {address}
+
+I hereby submit the following family dispute for resolution:
+
+Description of Problem:
+{details}
+
+Family Details:
+• Date of Marriage: _________________________
+• Number of Children: _________________________
+• Current Situation: _________________________
+
+Prayer/Relief Sought:
+I humbly request you to hear my case and pass appropriate orders for resolution of this family matter.
+
+Enclosures:
+1. Marriage Certificate
+2. Identity Proof
+3. Proof of Residence
+4. Other relevant documents
+
+Yours faithfully,
+Petitioner's Signature
+Name: {name}
+Phone No.: {phone}
+Address: {address}""",
+            'tips': [
+                'First try Family Counselling Centre for mediation',
+                'Marriage certificate must be attached',
+                'Women Helpline: 181 (available 24/7)',
+                'Seek free legal aid from District Legal Services Authority (DLSA)',
+                'Document all incidents with dates and witnesses',
+            ],
+            'submitTo': [
+                'Family Court',
+                'Women Commission',
+                'District Legal Services Authority (DLSA)',
+                'Family Counselling Centre',
+            ],
+        },
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान न्यायाधीश महोदय,}
+{office:परिवार न्यायालय,}
+जिला: {district}
+
+दिनांक: {date}
+
+विषय: {subject:पारिवारिक विवाद के संबंध में आवेदन}
+
+महोदय,
+
+आवेदक का विवरण:
+• नाम: {name}
+• पिता/पति का नाम: {father}
+• पता: {address}
+
+मैं निम्नलिखित पारिवारिक विवाद के समाधान हेतु आपकी सेवा में उपस्थित हूँ:
+
+समस्या का विवरण:
+{details}
+
+परिवार का विवरण:
+• विवाह की तिथि: _________________________
+• बच्चों की संख्या: _________________________
+• वर्तमान स्थिति: _________________________
+
+प्रार्थना:
+अतः श्रीमान से विनम्र निवेदन है कि मेरे प्रकरण की सुनवाई कर उचित आदेश पारित करने की कृपा करें।
+
+संलग्नक:
+1. विवाह प्रमाण पत्र
+2. पहचान पत्र
+3. निवास प्रमाण
+4. अन्य संबंधित दस्तावेज़
+
+धन्यवाद सहित,
+
+प्रार्थी,
+नाम: {name}
+मोबाइल नंबर: {phone}
+पता: {address}""",
+            'tips': [
+                'पहले परिवार परामर्श केंद्र से संपर्क करें',
+                'विवाह प्रमाण पत्र अवश्य संलग्न करें',
+                'महिला हेल्पलाइन 181 से मार्गदर्शन लें (24 घंटे)',
+                'मुफ्त कानूनी सहायता के लिए DLSA से संपर्क करें',
+                'सभी घटनाएं तिथि और गवाहों के साथ दस्तावेज़ करें',
+            ],
+            'submitTo': [
+                'परिवार न्यायालय',
+                'महिला आयोग',
+                'जिला विधिक सेवा प्राधिकरण',
+                'परिवार परामर्श केंद्र',
+            ],
+        },
+    },
+    'domestic_violence': {
+        'english': {
+            'text': """To,
+{recipient:The Police Officer-in-Charge / Lady Police Officer,}
+{office:Police Station: {station}}
+District: {district}
+
+Date: {date}
+
+Subject: {subject:Complaint of Domestic Violence - IPC Section 498A / Domestic Violence Act 2005}
+
+Respected Sir/Madam,
+
+Applicant Details:
+• Name: {name}
+• Husband Name: {father}
+• Address: {address}
+
+I hereby lodge the following complaint:
+
+Details of Incident:
+{details}
+
+Details of Accused:
+• Name: _________________________
+• Relationship: _________________________
+• Address: _________________________
+
+I request you to:
+1. Register my FIR immediately
+2. Initiate appropriate legal action against the accused
+3. Provide me with protection and safety
+
+Enclosures:
+1. Identity Proof
+2. Medical Report (if injured)
+3. Marriage Certificate
+4. Photos/Evidence (if available)
+
+Complaint Lodger,
+Name: _________________________
+Phone No.: {phone}
+Address: _________________________""",
+            'tips': [
+                'Call Police (100) or Women Helpline (181) immediately',
+                'Get medical examination done if injured - report is evidence',
+                'Get a copy of the registered FIR for records',
+                'Visit nearest One Stop Centre for support',
+                'You can file complaint without proof - police will investigate',
+                'Know your rights under Domestic Violence Act',
+            ],
+            'submitTo': [
+                'Nearest Police Station',
+                'Lady Police Station',
+                'Women Commission',
+                'One Stop Centre',
+            ],
+            'emergencyContacts': [
+                {'name': 'Police Emergency', 'number': '100'},
+                {'name': 'Women Helpline', 'number': '181'},
+                {'name': 'Women Commission', 'number': '7827-170-170'},
+            ],
+        },
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान थानाध्यक्ष/महिला थाना प्रभारी,}
+{office:थाना: {station}}
+जिला: {district}
+
+दिनांक: {date}
+
+विषय: {subject:घरेलू हिंसा की शिकायत - धारा 498A IPC / घरेलू हिंसा अधिनियम 2005}
+
+महोदय,
+
+आवेदक का विवरण:
+• नाम: {name}
+• पति का नाम: {father}
+• पता: {address}
+
+मैं निम्नलिखित शिकायत दर्ज करवाना चाहती हूँ:
+
+घटना का विवरण:
+{details}
+
+आरोपी का विवरण:
+• नाम: _________________________
+• संबंध: _________________________
+• पता: _________________________
+
+प्रार्थना:
+1. मेरी FIR दर्ज की जाए
+2. आरोपियों के विरुद्ध कार्यवाही की जाए
+3. मुझे सुरक्षा प्रदान की जाए
+
+संलग्नक:
+1. पहचान पत्र
+2. मेडिकल रिपोर्ट (यदि हो)
+3. विवाह प्रमाण पत्र
+4. फोटो/अन्य प्रमाण
+
+शिकायतकर्ता,
+नाम: {name}
+मोबाइल नंबर: {phone}
+पता: {address}""",
+            'tips': [
+                'तुरंत 100 या महिला हेल्पलाइन 181 पर कॉल करें',
+                'चोट लगी हो तो पहले मेडिकल जाँच करवाएं - रिपोर्ट साक्ष्य है',
+                'FIR की कॉपी अवश्य लें',
+                'One Stop Centre से मदद लें',
+                'प्रमाण न हो तो भी शिकायत दर्ज करवाएं - पुलिस अन्वेषण करेगी',
+                'घरेलू हिंसा अधिनियम के तहत अपने अधिकार जानें',
+            ],
+            'submitTo': [
+                'नज़दीकी पुलिस थाना',
+                'महिला थाना',
+                'महिला आयोग',
+                'One Stop Centre',
+            ],
+            'emergencyContacts': [
+                {'name': 'पुलिस', 'number': '100'},
+                {'name': 'महिला हेल्पलाइन', 'number': '181'},
+                {'name': 'महिला आयोग', 'number': '7827-170-170'},
+            ],
+        },
+    },
+    'consumer_complaint': {
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान अध्यक्ष,}
+जिला उपभोक्ता विवाद निवारण आयोग,
+{district:[जिले का नाम]}
+
+दिनांक: {date}
+
+विषय: {subject:उपभोक्ता शिकायत - सेवा में कमी/दोषपूर्ण उत्पाद}
+
+महोदय,
+
+मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित उपभोक्ता शिकायत दर्ज करना चाहता/चाहती हूँ:
+
+आवेदक का विवरण:
+• नाम: {name}
+• पता: {address}
+
+शिकायत का विवरण:
+{details}
+
+प्रतिवादी (विक्रेता/कंपनी) का विवरण:
+• नाम: [कंपनी/दुकान का नाम]
+• पता: [पता]
+• खरीदारी की तिथि: [तिथि]
+• रसीद/बिल नंबर: [नंबर]
+• भुगतान की राशि: ₹[राशि]
+
+क्षतिपूर्ति की माँग:
+1. रिफंड/बदली: ₹[राशि]
+2. मानसिक क्षतिपूर्ति: ₹[राशि]
+3. वाद व्यय: ₹[राशि]
+
+संलग्नक:
+1. खरीदारी की रसीद/बिल
+2. वारंटी कार्ड
+3. उत्पाद की फोटो
+4. पत्राचार की प्रतियाँ
+
+प्रार्थी,
+नाम: {name}
+मोबाइल नंबर: {phone}
+ईमेल: _________________________""",
+            'tips': [
+                'पहले विक्रेता को लिखित शिकायत दें',
+                'consumerhelpline.gov.in पर ऑनलाइन शिकायत करें',
+                'बिल और वारंटी कार्ड अवश्य संलग्न करें',
+                '₹1 लाख तक की शिकायत पर कोई फीस नहीं',
+            ],
+            'submitTo': [
+                'जिला उपभोक्ता फोरम',
+                'National Consumer Helpline (1800-11-4000)',
+                'ई-दाखिल पोर्टल (edaakhil.nic.in)',
+            ],
+        },
+    },
+    'employment_issue': {
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान श्रम आयुक्त/सहायक श्रम आयुक्त,}
+{office:श्रम विभाग,}
+{district:[जिले का नाम]}
+
+दिनांक: {date}
+
+विषय: {subject:वेतन/सेवा संबंधी शिकायत}
+
+महोदय,
+
+मैं, नीचे हस्ताक्षरकर्ता, कर्मचारी _________________________ (कंपनी का नाम), निम्नलिखित शिकायत दर्ज करना चाहता/चाहती हूँ:
+
+आवेदक का विवरण:
+• नाम: {name}
+• पता: {address}
+
+शिकायत का विवरण:
+{details}
+
+नियोक्ता का विवरण:
+• कंपनी का नाम: [नाम]
+• पता: [पता]
+• कार्य की अवधि: [तिथि से तिथि तक]
+• पद: [पद का नाम]
+• मासिक वेतन: ₹[राशि]
+
+बकाया राशि का विवरण:
+• वेतन बकाया: ₹[राशि]
+• PF बकाया: ₹[राशि]
+• अन्य: ₹[राशि]
+
+संलग्नक:
+1. नियुक्ति पत्र
+2. सैलरी स्लिप
+3. PF स्टेटमेंट
+4. पहचान पत्र
+
+प्रार्थी,
+नाम: {name}
+मोबाइल नंबर: {phone}""",
+            'tips': [
+                'नियुक्ति पत्र और सैलरी स्लिप ज़रूरी हैं',
+                'PF शिकायत के लिए EPFO पोर्टल पर जाएं',
+                'श्रम हेल्पलाइन 14434 पर कॉल करें',
+                '90 दिन के अंदर शिकायत करें',
+            ],
+            'submitTo': [
+                'श्रम विभाग कार्यालय',
+                'श्रम न्यायालय',
+                'EPFO कार्यालय (PF संबंधी)',
+            ],
+        },
+    },
+    'police_complaint': {
+        'english': {
+            'text': """To,
+{recipient:The Police Officer-in-Charge,}
+{office:Police Station: {station}}
+District: {district}
+
+Date: {date}
+
+Subject: {subject:Application for Registration of First Information Report (FIR)}
+
+Respected Sir/Madam,
+
+Applicant Details:
+• Name: {name}
+• Father's Name: {father}
+• Address: {address}
+
+I hereby lodge the following complaint:
+
+Details of Incident:
+{details}
+
+Information about the Incident:
+• Date of Incident: _________________________
+• Time of Incident: _________________________
+• Place of Incident: _________________________
+
+Details of Accused (if known):
+• Name: _________________________
+• Address: _________________________
+• Identification: _________________________
+
+Witnesses (if any):
+1. Name: _________________________, Address: _________________________
+
+I request you to register my FIR and take appropriate legal action against the accused.
+
+Submitted by,
+Name: _________________________
+Phone No.: {phone}
+Address: _________________________""",
+            'tips': [
+                'Always obtain a copy of the registered FIR',
+                'If FIR is not registered, file a complaint with SP/DM',
+                'Online FIR option is available on state police websites',
+                'Zero FIR can be filed at any police station',
+                'Keep all supporting documents and medical reports if injured',
+            ],
+            'submitTo': [
+                'Nearest Police Station',
+                'SP Office (if not heard at local station)',
+                'Online FIR Portal (state police website)',
+                'National Crime Records Bureau',
+            ],
+        },
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान थानाध्यक्ष,}
+{office:थाना: {station}}
+जिला: {district}
+
+दिनांक: {date}
+
+विषय: {subject:प्राथमिकी (FIR) दर्ज करने हेतु प्रार्थना पत्र}
+
+महोदय,
+
+आवेदक का विवरण:
+• नाम: {name}
+• पिता का नाम: {father}
+• पता: {address}
+
+मैं निम्नलिखित घटना की शिकायत दर्ज करवाना चाहता/चाहती हूँ:
+
+घटना का विवरण:
+{details}
+
+घटना की जानकारी:
+• घटना की तिथि: _________________________
+• घटना का समय: _________________________
+• घटना का स्थान: {place}
+
+आरोपी का विवरण (यदि ज्ञात हो):
+• नाम: _________________________
+• पता: _________________________
+• पहचान: _________________________
+
+गवाह (यदि कोई हो):
+1. नाम: _________________________, पता: _________________________
+
+प्रार्थना:
+कृपया मेरी FIR दर्ज कर उचित कार्यवाही करें।
+
+प्रार्थी,
+नाम: {name}
+मोबाइल नंबर: {phone}
+पता: {address}""",
+            'tips': [
+                'FIR दर्ज होने पर कॉपी अवश्य लें',
+                'यदि FIR न लिखी जाए तो SP/DM को शिकायत करें',
+                'ऑनलाइन FIR: राज्य पुलिस वेबसाइट पर',
+                'Zero FIR का विकल्प भी उपलब्ध है',
+                'चोट लगी हो तो मेडिकल रिपोर्ट अवश्य प्राप्त करें',
+            ],
+            'submitTo': [
+                'नज़दीकी पुलिस थाना',
+                'SP कार्यालय (यदि थाने में न सुनी जाए)',
+                'ऑनलाइन FIR पोर्टल',
+                'राष्ट्रीय अपराध रिकॉर्ड ब्यूरो',
+            ],
+        },
+    },
+    'court_affidavit': {
+        'hindi': {
+            'text': """शपथ पत्र
+(Affidavit)
+
+न्यायालय श्रीमान [न्यायाधीश पद], [न्यायालय का नाम]
+{district:[जिले का नाम]}, [राज्य]
+
+वाद संख्या: _______________
+[वादी का नाम] ........................ वादी
+बनाम
+[प्रतिवादी का नाम] ........................ प्रतिवादी
+
+दिनांक: {date}
+
+मैं, नीचे हस्ताक्षरकर्ता, शपथपूर्वक कथन करता/करती हूँ कि:
+
+शपथकर्ता का विवरण:
+• नाम: _________________________
+• पिता/पति का नाम: _________________________
+• आयु: _________________________ वर्ष
+• पता: _________________________
+
+1. मैं उपरोक्त वाद में वादी/प्रतिवादी/साक्षी हूँ और इस मामले से पूर्ण रूप से परिचित हूँ।
+
+2. निम्नलिखित तथ्य मेरी व्यक्तिगत जानकारी में हैं और सत्य हैं:
+
+{details}
+
+3. यह शपथ पत्र स्वेच्छा से बिना किसी दबाव या प्रलोभन के दिया जा रहा है।
+
+4. इस शपथ पत्र की सामग्री मेरी जानकारी और विश्वास के अनुसार सत्य है। इसमें कुछ भी छिपाया नहीं गया है और कोई भाग असत्य नहीं है।
+
+5. मुझे ज्ञात है कि यदि इस शपथ पत्र में कोई बात असत्य पाई गई तो मेरे विरुद्ध भारतीय दण्ड संहिता की धारा 191/199 के अंतर्गत मिथ्या साक्ष्य/मिथ्या शपथ पत्र हेतु कार्यवाही की जा सकती है।
+
+सत्यापन:
+मैं उपरोक्त शपथ पत्र की सामग्री को सत्य एवं सही पाते हुए आज दिनांक _____________ को [स्थान] में सत्यापित करता/करती हूँ।
+
+शपथकर्ता
+
+हस्ताक्षर: _______________________
+नाम: _________________________
+
+_______________________
+(नोटरी/ओथ कमिश्नर की मुहर एवं हस्ताक्षर)
+
+संलग्नक:
+1. पहचान पत्र (आधार/वोटर ID)
+2. पासपोर्ट साइज़ फोटो""",
+            'tips': [
+                'शपथ पत्र को नोटरी से सत्यापित कराना अनिवार्य है',
+                'नोटरी शुल्क ₹10-50 होता है',
+                '₹10 का स्टांप पेपर पर लिखें',
+                'सभी तथ्य सत्य लिखें - मिथ्या शपथ पत्र अपराध है',
+                'दो प्रतियाँ बनवाएं - एक कोर्ट के लिए, एक अपने पास',
+            ],
+            'submitTo': [
+                'संबंधित न्यायालय',
+                'नोटरी कार्यालय (सत्यापन हेतु)',
+                'ओथ कमिश्नर कार्यालय',
+            ],
+        },
+    },
+    'rti_application': {
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान जन सूचना अधिकारी (PIO),}
+{office:[विभाग का नाम],}
+[कार्यालय का पता]
+
+दिनांक: {date}
+
+विषय: {subject:सूचना का अधिकार अधिनियम, 2005 के तहत सूचना प्राप्ति हेतु आवेदन}
+
+महोदय,
+
+सूचना का अधिकार अधिनियम, 2005 की धारा 6(1) के अंतर्गत मैं निम्नलिखित सूचना प्राप्त करना चाहता/चाहती हूँ:
+
+मांगी गई सूचना का विवरण:
+{details}
+
+सूचना का प्रारूप: [प्रिंट/फोटोकॉपी/सॉफ्ट कॉपी]
+
+सूचना की अवधि: [तिथि से तिथि तक]
+
+मैं इस आवेदन के साथ ₹10 (दस रुपये) का शुल्क [पोस्टल ऑर्डर/कोर्ट फीस स्टांप/ऑनलाइन] के माध्यम से जमा कर रहा/रही हूँ।
+
+[यदि BPL हों तो: मैं गरीबी रेखा से नीचे (BPL) श्रेणी में आता/आती हूँ, अतः मुझे शुल्क से छूट प्राप्त है। BPL कार्ड की प्रति संलग्न है।]
+
+आवेदक का विवरण:
+नाम: {name}
+पता: {address}
+फोन: {phone}
+ईमेल: _________________________
+
+हस्ताक्षर: _________________________
+नाम: {name}""",
+            'tips': [
+                'आवेदन शुल्क ₹10 है (BPL के लिए मुफ्त)',
+                '30 दिनों में जवाब मिलना चाहिए',
+                'जवाब न मिले तो प्रथम अपीलीय अधिकारी को लिखें',
+                'rtionline.gov.in पर ऑनलाइन भी आवेदन कर सकते हैं',
+            ],
+            'submitTo': [
+                'संबंधित विभाग का PIO कार्यालय',
+                'rtionline.gov.in (केंद्र सरकार के लिए)',
+                'राज्य RTI पोर्टल (राज्य सरकार के लिए)',
+            ],
+        },
+    },
+    'pension_issue': {
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान जिला समाज कल्याण अधिकारी/पेंशन अधिकारी,}
+{office:{district:[जिले का नाम]}}
+
+दिनांक: {date}
+
+विषय: {subject:वृद्धावस्था/विधवा/विकलांग पेंशन हेतु आवेदन/शिकायत}
+
+महोदय,
+
+मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित निवेदन करता/करती हूँ:
+
+आवेदक का विवरण:
+• नाम: {name}
+• आयु: _________________________ वर्ष
+• पता: {address}
+
+विवरण:
+{details}
+
+व्यक्तिगत जानकारी:
+• जन्म तिथि: [तिथि]
+• आधार नंबर: [नंबर]
+• बैंक खाता: [खाता नंबर]
+• IFSC कोड: [कोड]
+
+संलग्नक:
+1. आधार कार्ड
+2. आयु प्रमाण पत्र
+3. आय प्रमाण पत्र
+4. बैंक पासबुक की प्रति
+5. फोटो
+
+प्रार्थी,
+नाम: {name}
+मोबाइल नंबर: {phone}""",
+            'tips': [
+                'आयु प्रमाण के लिए जन्म प्रमाण पत्र/आधार दें',
+                'बैंक खाता आधार से लिंक होना चाहिए',
+                'आवेदन जमा करने की रसीद लें',
+                'ऑनलाइन आवेदन भी कर सकते हैं',
+            ],
+            'submitTo': [
+                'समाज कल्याण विभाग',
+                'ब्लॉक/तहसील कार्यालय',
+                'CSC केंद्र (ऑनलाइन आवेदन)',
+            ],
+        },
+    },
+    'caste_certificate': {
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान तहसीलदार/उप-जिलाधिकारी,}
+{office:तहसील कार्यालय,}
+[तहसील का नाम], {district:[जिले का नाम]}
+
+दिनांक: {date}
+
+विषय: {subject:जाति/आय/निवास प्रमाण पत्र हेतु आवेदन}
+
+महोदय,
+
+मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित प्रमाण पत्र प्राप्त करना चाहता/चाहती हूँ:
+
+आवेदक का विवरण:
+• नाम: {name}
+• पिता का नाम: {father}
+• पता: {address}
+
+विवरण:
+{details}
+
+व्यक्तिगत जानकारी:
+• जन्म तिथि: [तिथि]
+• जाति: [जाति]
+• पिता का व्यवसाय: [व्यवसाय]
+• वार्षिक आय: ₹[राशि]
+
+संलग्नक:
+1. आधार कार्ड
+2. राशन कार्ड
+3. पहचान पत्र
+4. पुराना प्रमाण पत्र (यदि हो)
+5. फोटो
+
+प्रार्थी,
+नाम: {name}
+मोबाइल नंबर: {phone}""",
+            'tips': [
+                'ऑनलाइन आवेदन करें - तेज़ और आसान',
+                'सभी दस्तावेज़ों की स्व-प्रमाणित प्रति दें',
+                'CSC केंद्र से भी बनवा सकते हैं',
+                '15-30 दिनों में प्रमाण पत्र मिलना चाहिए',
+            ],
+            'submitTo': [
+                'तहसील कार्यालय',
+                'CSC/जन सेवा केंद्र',
+                'ई-डिस्ट्रिक्ट पोर्टल (ऑनलाइन)',
+            ],
+        },
+    },
+    'ration_card': {
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान जिला आपूर्ति अधिकारी,}
+{office:खाद्य एवं रसद विभाग,}
+{district:[जिले का नाम]}
+
+दिनांक: {date}
+
+विषय: {subject:नया राशन कार्ड/राशन कार्ड में संशोधन हेतु आवेदन}
+
+महोदय,
+
+मैं, नीचे हस्ताक्षरकर्ता, निम्नलिखित निवेदन करता/करती हूँ:
+
+आवेदक का विवरण:
+• नाम: {name}
+• पता: {address}
+
+विवरण:
+{details}
+
+परिवार की जानकारी:
+• परिवार के मुखिया का नाम: [नाम]
+• कुल सदस्य: [संख्या]
+• वार्षिक आय: ₹[राशि]
+
+परिवार के सदस्यों का विवरण:
+1. [नाम] - [संबंध] - [आयु]
+2. [नाम] - [संबंध] - [आयु]
+
+संलग्नक:
+1. आधार कार्ड (सभी सदस्यों के)
+2. आय प्रमाण पत्र
+3. निवास प्रमाण
+4. पासपोर्ट साइज़ फोटो
+
+प्रार्थी,
+नाम: {name}
+मोबाइल नंबर: {phone}""",
+            'tips': [
+                'सभी सदस्यों के आधार कार्ड ज़रूरी हैं',
+                'ऑनलाइन आवेदन करें - nfsa.gov.in',
+                'फोटो और बायोमेट्रिक के लिए बुलाया जाएगा',
+                'e-Ration Card ऐप से स्टेटस चेक करें',
+            ],
+            'submitTo': [
+                'खाद्य एवं रसद विभाग',
+                'CSC/जन सेवा केंद्र',
+                'nfsa.gov.in (ऑनलाइन)',
+            ],
+        },
+    },
+    'other': {
+        'hindi': {
+            'text': """सेवा में,
+{recipient:श्रीमान [अधिकारी का पद],}
+{office:[विभाग/कार्यालय का नाम],}
+[पता]
+
+दिनांक: {date}
+
+विषय: {subject:शिकायत/आवेदन}
+
+महोदय,
+
+सविनय निवेदन है कि मैं, नीचे हस्ताक्षरकर्ता, आपके संज्ञान में निम्नलिखित विषय लाना चाहता/चाहती हूँ:
+
+आवेदक का विवरण:
+• नाम: {name}
+• पता: {address}
+
+विवरण:
+{details}
+
+अतः श्रीमान से विनम्र निवेदन है कि मेरी समस्या पर उचित कार्यवाही करने की कृपा करें।
+
+संलग्नक:
+1. पहचान पत्र
+2. संबंधित दस्तावेज़
+
+धन्यवाद सहित,
+
+भवदीय,
+नाम: {name}
+मोबाइल नंबर: {phone}
+पता: {address}
+ईमेल: _________________________""",
+            'tips': [
+                'शिकायत की 2 प्रतियां बनाएं',
+                'जमा करते समय रसीद अवश्य लें',
+                'संबंधित दस्तावेज़ संलग्न करें',
+                'जिला विधिक सेवा से मार्गदर्शन लें',
+            ],
+            'submitTo': [
+                'संबंधित विभाग/कार्यालय',
+                'जिलाधिकारी कार्यालय',
+                'लोकायुक्त (यदि भ्रष्टाचार संबंधी हो)',
+            ],
+        },
+    },
+}
+
+
+_SLOT_TOKEN_RE = re.compile(r'\{(\w+)(:?)|\}')
+# Numbered list under the "Enclosures:" / "संलग्नक:" heading
+_ENCLOSURES_RE = re.compile(r'^(?:Enclosures|संलग्नक):[ \t]*\n((?:\d+\.[^\n]*(?:\n|$))+)', re.MULTILINE)
+_LIST_ITEM_RE = re.compile(r'^\d+\.\s*(.+?)\s*$', re.MULTILINE)
+
+
+def _compile(text, pos=0, nested=False):
+    """Split text into literal strings and (slot, default segments) pairs"""
+    segments = []
+    while True:
+        m = _SLOT_TOKEN_RE.search(text, pos)
+        if not m:
+            if nested:
+                raise ValueError('Unclosed template slot')
+            if pos < len(text):
+                segments.append(text[pos:])
+            return tuple(segments), len(text)
+        if m.start() > pos:
+            segments.append(text[pos:m.start()])
+        if m.group(0) == '}':
+            if not nested:
+                raise ValueError(f'Unmatched "}}" at offset {m.start()}')
+            return tuple(segments), m.end()
+        slot = m.group(1)
+        if slot not in SLOT_NAMES:
+            raise ValueError(f'Unknown template slot: {slot}')
+        if m.group(2):
+            default, pos = _compile(text, m.end(), nested=True)
+        elif text.startswith('}', m.end()):
+            default, pos = (BLANK,), m.end() + 1
+        else:
+            raise ValueError(f'Malformed template slot: {slot}')
+        segments.append((slot, default))
+
+
+def _render(segments, values, out):
+    for segment in segments:
+        if segment.__class__ is str:
+            out.append(segment)
+        else:
+            value = values.get(segment[0])
+            if value:
+                out.append(value)
+            else:
+                _render(segment[1], values, out)
+
+
+def _slot_names(segments):
+    names = set()
+    for segment in segments:
+        if segment.__class__ is not str:
+            names.add(segment[0])
+            names |= _slot_names(segment[1])
+    return names
+
+
+class DraftTemplate:
+    """One letter template (issue type + language) compiled into text and named slots"""
+
+    def __init__(self, issue_type, language, text, tips, submit_to, **extra):
+        self.issue_type = issue_type
+        self.language = language
+        self.segments, _ = _compile(text)
+        self.slots = frozenset(_slot_names(self.segments))
+        self.tips = tuple(tips)
+        self.submit_to = tuple(submit_to)
+        enclosures = _ENCLOSURES_RE.search(text)
+        self.enclosures = tuple(_LIST_ITEM_RE.findall(enclosures.group(1))) if enclosures else ()
+        self.extra = extra
+
+    def render(self, values):
+        """Letter text with every slot replaced from values (missing/empty -> default)"""
+        out = []
+        _render(self.segments, values, out)
+        return ''.join(out)
+
+    def metadata(self):
+        """Tips, submitTo, enclosures and any extra keys, as a fresh response dict"""
+        result = {'tips': list(self.tips), 'submitTo': list(self.submit_to), 'enclosures': list(self.enclosures)}
+        for key, value in self.extra.items():
+            result[key] = [dict(item) if isinstance(item, dict) else item for item in value]
+        return result
+
+    def result(self, values):
+        """The same response shape the template generators have always returned"""
+        result = {'draft': self.render(values)}
+        result.update(self.metadata())
+        return result
+
+
+def _load_templates():
+    templates = {}
+    for issue_type, languages in _TEMPLATE_SOURCES.items():
+        for language, source in languages.items():
+            source = dict(source)
+            templates[(issue_type, language)] = DraftTemplate(
+                issue_type, language, source.pop('text'), source.pop('tips'), source.pop('submitTo'), **source
+            )
+    return MappingProxyType(templates)
+
+
+# (issue_type, language) -> DraftTemplate; English falls back to Hindi where
+# the letter is only written in Hindi
+DRAFT_TEMPLATES = _load_templates()
+
+
+def get_template(issue_type, language='hindi'):
+    """Template for an issue type; unknown types get the general complaint"""
+    issue_type = ISSUE_TEMPLATE_ALIASES.get(issue_type, issue_type)
+    if issue_type not in _TEMPLATE_SOURCES:
+        issue_type = 'other'
+    if language == 'english' and (issue_type, 'english') in DRAFT_TEMPLATES:
+        return DRAFT_TEMPLATES[(issue_type, 'english')]
+    return DRAFT_TEMPLATES[(issue_type, 'hindi')]
+
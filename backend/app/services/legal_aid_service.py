@@ -1,21 +1,313 @@
 """
 Legal Aid Service
 Fetches REAL legal aid office data using official government sources
-- India Post API for pincode validation
-- Official NALSA/SLSA data for legal aid offices
+- Bundled India Post pincode directory (offline, binary search); the India
+  Post API is only called for pincodes missing from it
+- API answers are cached in memory + MongoDB (failures briefly, so invalid
+  pincodes don't time out on every search) and concurrent misses share one call
+- Official NALSA/SLSA data for legal aid offices, kept in MongoDB as versioned
+  snapshots (bundled JSON when MongoDB is unavailable); search structures are
+  built in memory and rebuilt in the background when the version changes
+- KD-tree over office coordinates for nearest/radius search from GPS alone
+- Matched offices are ranked by distance in one vectorized call (CoordinateTable)
+- District/state names (English, Devanagari, old names like Banaras/Allahabad)
+  are normalized into hash maps at startup, with a BK-tree for typos ("Varansi");
+  office responses are formatted once, so a search copies them and adds distance
+- Prefix trie over the same names (and office names) for type-ahead suggestions
+- Batch lookup for many villages: pincodes resolved offline only, nearest
+  offices for all of them from one distance matrix
 """
-import math
+import os
+import copy
+import time
+import logging
+import threading
+from datetime import datetime
+from concurrent.futures import Future
+
 import requests
 
+from app.services.dlsa_directory import DlsaDirectoryStore, load_bundled_offices
+from app.utils.name_index import NameIndex, normalize_name
+from app.utils.pincode_table import get_pincode_table, is_valid_pincode
+from app.utils.prefix_trie import PrefixTrie
+from app.utils.result_cache import TieredCache
+from app.utils.snapshot_poller import SnapshotPoller
+from app.utils.spatial_index import SpatialIndex, CoordinateTable
+
+logger = logging.getLogger(__name__)
+
+# Offices returned by one search
+DEFAULT_RESULT_LIMIT = 10
+# Type-ahead suggestions returned for one prefix
+MAX_SUGGESTIONS = 10
+# Nearest offices reported per village by find_nearest_batch
+MAX_BATCH_NEAREST = 5
+
+# Seconds between checks of the DLSA directory version in MongoDB (0 disables)
+DLSA_REFRESH_INTERVAL = int(os.environ.get('DLSA_REFRESH_INTERVAL', '60'))
+DLSA_SOURCE_MONGO = 'mongodb'
+DLSA_SOURCE_BUNDLED = 'bundled'
+
+# Other names people search a district by: old/colonial names, HQ towns, other spellings
+# (including the India Post directory's, e.g. "Purbi Champaran")
+DISTRICT_ALIASES = {
+    'Varanasi': ('Banaras', 'Benares', 'Kashi', 'बनारस', 'काशी'),
+    'Prayagraj': ('Allahabad', 'Ilahabad', 'इलाहाबाद'),
+    'Kanpur': ('Kanpur Nagar', 'Cawnpore'),
+    'Lucknow': ('Lakhnau',),
+    'Gautam Buddha Nagar': ('Noida', 'Greater Noida', 'नोएडा', 'ग्रेटर नोएडा'),
+    'Gurugram': ('Gurgaon', 'गुड़गांव', 'गुरुग्राम'),
+    'Saran': ('Chhapra', 'Chapra', 'छपरा'),
+    'Vaishali': ('Hajipur', 'हाजीपुर'),
+    'Nalanda': ('Bihar Sharif', 'Biharsharif', 'बिहार शरीफ'),
+    'Rohtas': ('Sasaram', 'सासाराम'),
+    'East Champaran': ('Purbi Champaran', 'Purvi Champaran', 'Motihari', 'मोतिहारी'),
+    'West Champaran': ('Paschim Champaran', 'Pashchim Champaran', 'Bettiah', 'बेतिया'),
+    'Purnia': ('Purnea',),
+    'Muzaffarpur': ('Mujaffarpur',),
+    'Mumbai': ('Bombay', 'Mumbai City', 'बम्बई', 'बंबई'),
+    'Chennai': ('Madras', 'मद्रास'),
+    'Kolkata': ('Calcutta', 'कलकत्ता'),
+    'Bengaluru': ('Bangalore', 'Bengaluru Urban', 'बैंगलोर', 'बंगलौर'),
+    'Ahmedabad': ('Ahmadabad',),
+    'Central Delhi': ('Tis Hazari',),
+    'South Delhi': ('Saket',),
+    'East Delhi': ('Karkardooma',),
+    'West Delhi': ('Dwarka',),
+    'North Delhi': ('Rohini',),
+}
+
+STATE_ALIASES = {
+    'Bihar': ('बिहार',),
+    'Uttar Pradesh': ('UP', 'उत्तर प्रदेश'),
+    'Delhi': ('New Delhi', 'NCT of Delhi', 'दिल्ली', 'नई दिल्ली'),
+    'Maharashtra': ('महाराष्ट्र',),
+    'Rajasthan': ('राजस्थान',),
+    'Madhya Pradesh': ('MP', 'मध्य प्रदेश'),
+    'West Bengal': ('पश्चिम बंगाल', 'बंगाल'),
+    'Tamil Nadu': ('तमिलनाडु', 'तमिल नाडु'),
+    'Karnataka': ('कर्नाटक',),
+    'Gujarat': ('गुजरात',),
+    'Telangana': ('तेलंगाना',),
+    'Jharkhand': ('झारखंड', 'झारखण्ड'),
+    'Chandigarh': ('चंडीगढ़',),
+    'Haryana': ('हरियाणा',),
+}
+
+# Words every office name shares; suggestions index office names from their other words
+_GENERIC_NAME_WORDS = frozenset(normalize_name('District Legal Services Authority जिला विधिक सेवा प्राधिकरण').split())
+
+PINCODE_SOURCE_OFFLINE = 'India Post Pincode Directory (offline)'
+PINCODE_SOURCE_API = 'India Post Official API'
+
+# India Post API answers for pincodes not in the bundled table: found pincodes
+# are kept long, failures (unknown pincode, timeout) only briefly
+PINCODE_API_CACHE_TTL = int(os.environ.get('PINCODE_API_CACHE_TTL', str(30 * 24 * 3600)))
+PINCODE_API_NEGATIVE_TTL = int(os.environ.get('PINCODE_API_NEGATIVE_TTL', '600'))
+
+# Process-wide: every LegalAidService instance shares cached and in-flight lookups
+_pincode_api_cache = TieredCache('pincode', maxsize=4096, ttl=PINCODE_API_CACHE_TTL)
+_pincode_inflight = {}
+_pincode_inflight_lock = threading.Lock()
+_pincode_counters = {'apiCalls': 0, 'negativeHits': 0, 'coalesced': 0}
+
+
+def get_pincode_cache_stats():
+    """Offline table size and India Post API cache counters (for /api/health)"""
+    with _pincode_inflight_lock:
+        counters = dict(_pincode_counters, inFlight=len(_pincode_inflight))
+    return {
+        'offlinePincodes': len(get_pincode_table()),
+        **counters,
+        **_pincode_api_cache.stats(),
+        'ttlSeconds': PINCODE_API_CACHE_TTL,
+        'negativeTtlSeconds': PINCODE_API_NEGATIVE_TTL
+    }
+
+
+class OfficeDirectory:
+    """
+    Search structures over one version of the DLSA directory. Built in full
+    before it is used and never modified afterwards, so a search keeps the
+    directory it started with while a newer version is swapped in.
+    Query results are positions in offices.
+    """
+
+    def __init__(self, offices, version=None, source=DLSA_SOURCE_BUNDLED, known_districts=frozenset()):
+        self.offices = offices
+        self.version = version
+        self.source = source
+        self.loaded_at = datetime.utcnow()
+        points = [(office['lat'], office['lng']) for office in offices]
+        self.spatial_index = SpatialIndex(points)
+        self.coordinates = CoordinateTable(points)
+        # Normalized names -> office positions, so matching a district is a hash lookup
+        self.district_index = NameIndex(self._district_names())
+        self.state_index = NameIndex(self._state_names())
+        # Real districts we have no office for ("Raipur") must not typo-match ours ("Jaipur")
+        self.known_districts = known_districts
+        self.offices_by_pincode_prefix = {}
+        for index, office in enumerate(offices):
+            self.offices_by_pincode_prefix.setdefault(office['pincode'][:3], []).append(index)
+        # Responses are formatted once; a search copies them and adds the distance
+        self._responses = [self._format_office(office) for office in offices]
+        self._suggestions, self.suggestion_trie = self._build_suggestions()
+
+    def _district_names(self):
+        """(name, office position) pairs: English and Hindi district name, aliases"""
+        for index, office in enumerate(self.offices):
+            yield office['district'], index
+            yield office.get('districtHi', ''), index
+            for alias in DISTRICT_ALIASES.get(office['district'], ()):
+                yield alias, index
+
+    def _state_names(self):
+        for index, office in enumerate(self.offices):
+            yield office['state'], index
+            for alias in STATE_ALIASES.get(office['state'], ()):
+                yield alias, index
+
+    def match_district(self, district, state=None):
+        """
+        Office positions for a typed district (or state) name: an exact or alias
+        hit, else a partial name ("Muzaff", "Patna City"), else the closest typo
+        ("Varansi") unless the name is another real district. With state (from
+        a pincode), only offices in that state count.
+        """
+        matching = self.district_index.exact(district) or self.state_index.exact(district)
+        if not matching:
+            matching = sorted(set(self.district_index.containing(district, both_ways=True)) |
+                              set(self.state_index.containing(district)))
+        if not matching and normalize_name(district) not in self.known_districts:
+            matching = self.district_index.fuzzy(district) or self.state_index.fuzzy(district)
+        if state:
+            in_state = set(self.state_index.exact(state))
+            matching = [index for index in matching if index in in_state]
+        return list(matching)
+
+    def rank_offices(self, lat, lng, indices, limit, radius_km):
+        """
+        (distance_km, position) pairs, nearest first: among the offices at indices
+        (vectorized), or among all offices via the spatial index when indices is None.
+        """
+        if indices is not None:
+            return self.coordinates.nearest(lat, lng, limit or len(indices), indices=indices, max_km=radius_km)
+        if radius_km is not None and limit is None:
+            return self.spatial_index.within(lat, lng, radius_km)
+        return self.spatial_index.nearest(lat, lng, limit or DEFAULT_RESULT_LIMIT, max_km=radius_km)
+
+    def suggest(self, query, limit=MAX_SUGGESTIONS):
+        """
+        Type-ahead: offices (by district, alias or office name) and states with
+        a name word starting with query, in English or Hindi. Each suggestion's
+        'query' is what to search for; 'matched' is the name that matched.
+        """
+        prefix = normalize_name(query)
+        if not prefix:
+            return []
+        return [dict(self._suggestions[item_id], matched=name)
+                for item_id, name in self.suggestion_trie.complete(prefix, limit)]
+
+    def _build_suggestions(self):
+        """(suggestions, trie): one suggestion per office and per state, keyed by each of their name words"""
+        suggestions = []
+        entries = []
+
+        def add(item_id, name, kind, skip_generic=False):
+            key = normalize_name(name)
+            words = key.split()
+            for position, word in enumerate(words):
+                if skip_generic and word in _GENERIC_NAME_WORDS:
+                    continue
+                # Whole-name matches first, then shorter names, then by kind (district, alias, office, state)
+                rank = (position > 0, len(key), kind, key)
+                entries.append((' '.join(words[position:]), rank, item_id, name))
+
+        for index, office in enumerate(self.offices):
+            suggestions.append({
+                'type': 'district',
+                'query': office['district'],
+                'district': office['district'],
+                'districtHi': office.get('districtHi', office['district']),
+                'state': office['state'],
+                'name': office['name'],
+                'nameHi': office.get('nameHi', office['name'])
+            })
+            for name in (office['district'], office.get('districtHi', '')):
+                add(index, name, 0)
+            for alias in DISTRICT_ALIASES.get(office['district'], ()):
+                add(index, alias, 1)
+            for name in (office['name'], office.get('nameHi', '')):
+                add(index, name, 2, skip_generic=True)
+
+        states = {}
+        for office in self.offices:
+            states[office['state']] = states.get(office['state'], 0) + 1
+        for state, count in states.items():
+            aliases = STATE_ALIASES.get(state, ())
+            item_id = len(suggestions)
+            suggestions.append({
+                'type': 'state',
+                'query': state,
+                'state': state,
+                'stateHi': next((alias for alias in aliases if not alias.isascii()), state),
+                'offices': count
+            })
+            for name in (state, *aliases):
+                add(item_id, name, 3)
+
+        return suggestions, PrefixTrie(entries, top_k=MAX_SUGGESTIONS)
+
+    def office_response(self, index, distance=None):
+        """Copy of the office's precomputed response; distance (km) is added when known"""
+        response = dict(self._responses[index])
+        if distance is not None:
+            response['distance'] = round(distance, 1)
+            response['distanceText'] = f"{response['distance']} km"
+        return response
+
+    def _format_office(self, office):
+        """Format office data for response"""
+        formatted = {
+            'name': office['name'],
+            'nameHi': office.get('nameHi', office['name']),
+            'address': office['address'],
+            'addressHi': office.get('addressHi', office['address']),
+            'district': office['district'],
+            'districtHi': office.get('districtHi', office['district']),
+            'state': office['state'],
+            'pincode': office['pincode'],
+            'phone': office['phone'],
+            'email': office.get('email', ''),
+            'timings': office.get('timings', 'Mon-Sat: 10:00 AM - 5:00 PM'),
+            'lat': office['lat'],
+            'lng': office['lng'],
+            'verified': office.get('verified', True),
+            'source': office.get('source', 'NALSA Official Records'),
+            'mapsLink': f"https://www.google.com/maps/search/?api=1&query={office['lat']},{office['lng']}"
+        }
+        
+        return formatted
+
 
 class LegalAidService:
     """Service for finding legal aid offices with REAL DATA"""
     
-    def __init__(self):
+    def __init__(self, store=None, refresh_interval=DLSA_REFRESH_INTERVAL):
+        self.pincode_table = get_pincode_table()
+        self._known_districts = frozenset(normalize_name(name) for name, _ in self.pincode_table.places)
+        
         # VERIFIED DLSA (District Legal Services Authority) data
         # Source: Official NALSA website (nalsa.gov.in) and State Legal Services Authority websites
-        
-        self.offices = self._get_verified_dlsa_data()
+        # Served from memory: the live MongoDB snapshot (else the bundled file),
+        # rebuilt in the background when its version changes
+        self.directory_store = store if store is not None else DlsaDirectoryStore()
+        self.directory = self._load_directory()
+        self._directory_poller = None
+        if refresh_interval and self.directory_store.available():
+            self._directory_poller = SnapshotPoller('dlsa-directory', self.refresh_directory,
+                                                    refresh_interval).start()
         
         # State Legal Services Authority contact info (official data)
         self.slsa_data = {
@@ -173,927 +465,103 @@ class LegalAidService:
             }
         }
 
-    def _get_verified_dlsa_data(self):
+    @property
+    def offices(self):
+        return self.directory.offices
+
+    def _build_directory(self, offices, version, source):
+        return OfficeDirectory(offices, version, source, known_districts=self._known_districts)
+
+    def _load_directory(self):
+        """Directory from the live MongoDB snapshot, or the bundled offices if there is none"""
+        try:
+            version, offices = self.directory_store.load()
+        except Exception as e:
+            logger.warning("Could not load the DLSA directory from MongoDB, using bundled data: %s", e)
+            version = offices = None
+        if offices:
+            return self._build_directory(offices, version, DLSA_SOURCE_MONGO)
+        return self._build_directory(load_bundled_offices(), None, DLSA_SOURCE_BUNDLED)
+
+    def refresh_directory(self):
         """
-        VERIFIED DLSA office data from official sources
-        Source: NALSA (nalsa.gov.in), eCourts (ecourts.gov.in), State SLSA websites
+        Rebuild the directory if MongoDB has a different snapshot version; True if
+        a new one was swapped in. Runs on the poller thread, off the request path.
         """
-        return [
-            # =====================
-            # BIHAR - All 38 Districts
-            # Source: Bihar SLSA (biharslsa.org)
-            # =====================
-            {
-                'name': 'District Legal Services Authority, Patna',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, पटना',
-                'address': 'District Court Complex, Gardanibagh, Patna - 800001',
-                'addressHi': 'जिला न्यायालय परिसर, गर्दनीबाग, पटना - 800001',
-                'district': 'Patna',
-                'districtHi': 'पटना',
-                'state': 'Bihar',
-                'pincode': '800001',
-                'phone': '0612-2504400',
-                'email': 'dlsapatna@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.6093,
-                'lng': 85.1236,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Gaya',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, गया',
-                'address': 'District Court Complex, Gaya - 823001',
-                'addressHi': 'जिला न्यायालय परिसर, गया - 823001',
-                'district': 'Gaya',
-                'districtHi': 'गया',
-                'state': 'Bihar',
-                'pincode': '823001',
-                'phone': '0631-2220101',
-                'email': 'dlsagaya@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 24.7955,
-                'lng': 85.0002,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Muzaffarpur',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, मुज़फ़्फ़रपुर',
-                'address': 'District Court Complex, Muzaffarpur - 842001',
-                'addressHi': 'जिला न्यायालय परिसर, मुज़फ़्फ़रपुर - 842001',
-                'district': 'Muzaffarpur',
-                'districtHi': 'मुज़फ़्फ़रपुर',
-                'state': 'Bihar',
-                'pincode': '842001',
-                'phone': '0621-2240200',
-                'email': 'dlsamzp@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.1209,
-                'lng': 85.3647,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Bhagalpur',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, भागलपुर',
-                'address': 'District Court Complex, Bhagalpur - 812001',
-                'addressHi': 'जिला न्यायालय परिसर, भागलपुर - 812001',
-                'district': 'Bhagalpur',
-                'districtHi': 'भागलपुर',
-                'state': 'Bihar',
-                'pincode': '812001',
-                'phone': '0641-2400200',
-                'email': 'dlsabhagalpur@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.2425,
-                'lng': 86.9842,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Purnia',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, पूर्णिया',
-                'address': 'District Court Complex, Purnia - 854301',
-                'addressHi': 'जिला न्यायालय परिसर, पूर्णिया - 854301',
-                'district': 'Purnia',
-                'districtHi': 'पूर्णिया',
-                'state': 'Bihar',
-                'pincode': '854301',
-                'phone': '06454-242300',
-                'email': 'dlsapurnia@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.7749,
-                'lng': 87.4690,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Darbhanga',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, दरभंगा',
-                'address': 'District Court Complex, Darbhanga - 846004',
-                'addressHi': 'जिला न्यायालय परिसर, दरभंगा - 846004',
-                'district': 'Darbhanga',
-                'districtHi': 'दरभंगा',
-                'state': 'Bihar',
-                'pincode': '846004',
-                'phone': '06272-222300',
-                'email': 'dlsadarbhanga@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.1542,
-                'lng': 85.8918,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Begusarai',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, बेगूसराय',
-                'address': 'District Court Complex, Begusarai - 851101',
-                'addressHi': 'जिला न्यायालय परिसर, बेगूसराय - 851101',
-                'district': 'Begusarai',
-                'districtHi': 'बेगूसराय',
-                'state': 'Bihar',
-                'pincode': '851101',
-                'phone': '06243-222200',
-                'email': 'dlsabegusarai@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.4182,
-                'lng': 86.1272,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Samastipur',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, समस्तीपुर',
-                'address': 'District Court Complex, Samastipur - 848101',
-                'addressHi': 'जिला न्यायालय परिसर, समस्तीपुर - 848101',
-                'district': 'Samastipur',
-                'districtHi': 'समस्तीपुर',
-                'state': 'Bihar',
-                'pincode': '848101',
-                'phone': '06274-222100',
-                'email': 'dlsasamastipur@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.8629,
-                'lng': 85.7840,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Saran (Chapra)',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, सारण (छपरा)',
-                'address': 'District Court Complex, Chapra - 841301',
-                'addressHi': 'जिला न्यायालय परिसर, छपरा - 841301',
-                'district': 'Saran',
-                'districtHi': 'सारण',
-                'state': 'Bihar',
-                'pincode': '841301',
-                'phone': '06152-222400',
-                'email': 'dlsasaran@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.7804,
-                'lng': 84.7499,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Vaishali (Hajipur)',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, वैशाली (हाजीपुर)',
-                'address': 'District Court Complex, Hajipur - 844101',
-                'addressHi': 'जिला न्यायालय परिसर, हाजीपुर - 844101',
-                'district': 'Vaishali',
-                'districtHi': 'वैशाली',
-                'state': 'Bihar',
-                'pincode': '844101',
-                'phone': '06224-222500',
-                'email': 'dlsavaishali@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.6857,
-                'lng': 85.2135,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Nalanda (Bihar Sharif)',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, नालंदा (बिहार शरीफ)',
-                'address': 'District Court Complex, Bihar Sharif - 803101',
-                'addressHi': 'जिला न्यायालय परिसर, बिहार शरीफ - 803101',
-                'district': 'Nalanda',
-                'districtHi': 'नालंदा',
-                'state': 'Bihar',
-                'pincode': '803101',
-                'phone': '06112-222600',
-                'email': 'dlsanalanda@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.1965,
-                'lng': 85.5230,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Rohtas (Sasaram)',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, रोहतास (सासाराम)',
-                'address': 'District Court Complex, Sasaram - 821115',
-                'addressHi': 'जिला न्यायालय परिसर, सासाराम - 821115',
-                'district': 'Rohtas',
-                'districtHi': 'रोहतास',
-                'state': 'Bihar',
-                'pincode': '821115',
-                'phone': '06184-222700',
-                'email': 'dlsarohtas@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 24.9531,
-                'lng': 84.0311,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Katihar',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, कटिहार',
-                'address': 'District Court Complex, Katihar - 854105',
-                'addressHi': 'जिला न्यायालय परिसर, कटिहार - 854105',
-                'district': 'Katihar',
-                'districtHi': 'कटिहार',
-                'state': 'Bihar',
-                'pincode': '854105',
-                'phone': '06452-232800',
-                'email': 'dlsakatihar@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.5310,
-                'lng': 87.5775,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, East Champaran (Motihari)',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, पूर्वी चंपारण (मोतिहारी)',
-                'address': 'District Court Complex, Motihari - 845401',
-                'addressHi': 'जिला न्यायालय परिसर, मोतिहारी - 845401',
-                'district': 'East Champaran',
-                'districtHi': 'पूर्वी चंपारण',
-                'state': 'Bihar',
-                'pincode': '845401',
-                'phone': '06252-232400',
-                'email': 'dlsaeastchamparan@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.6470,
-                'lng': 84.9155,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, West Champaran (Bettiah)',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, पश्चिमी चंपारण (बेतिया)',
-                'address': 'District Court Complex, Bettiah - 845438',
-                'addressHi': 'जिला न्यायालय परिसर, बेतिया - 845438',
-                'district': 'West Champaran',
-                'districtHi': 'पश्चिमी चंपारण',
-                'state': 'Bihar',
-                'pincode': '845438',
-                'phone': '06254-232500',
-                'email': 'dlsawestchamparan@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.8025,
-                'lng': 84.5037,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Sitamarhi',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, सीतामढ़ी',
-                'address': 'District Court Complex, Sitamarhi - 843302',
-                'addressHi': 'जिला न्यायालय परिसर, सीतामढ़ी - 843302',
-                'district': 'Sitamarhi',
-                'districtHi': 'सीतामढ़ी',
-                'state': 'Bihar',
-                'pincode': '843302',
-                'phone': '06226-222900',
-                'email': 'dlsasitamarhi@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.5883,
-                'lng': 85.4788,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Madhubani',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, मधुबनी',
-                'address': 'District Court Complex, Madhubani - 847211',
-                'addressHi': 'जिला न्यायालय परिसर, मधुबनी - 847211',
-                'district': 'Madhubani',
-                'districtHi': 'मधुबनी',
-                'state': 'Bihar',
-                'pincode': '847211',
-                'phone': '06276-222100',
-                'email': 'dlsamadhubani@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.3548,
-                'lng': 86.0715,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Munger',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, मुंगेर',
-                'address': 'District Court Complex, Munger - 811201',
-                'addressHi': 'जिला न्यायालय परिसर, मुंगेर - 811201',
-                'district': 'Munger',
-                'districtHi': 'मुंगेर',
-                'state': 'Bihar',
-                'pincode': '811201',
-                'phone': '06344-222200',
-                'email': 'dlsamunger@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.3742,
-                'lng': 86.4734,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Saharsa',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, सहरसा',
-                'address': 'District Court Complex, Saharsa - 852201',
-                'addressHi': 'जिला न्यायालय परिसर, सहरसा - 852201',
-                'district': 'Saharsa',
-                'districtHi': 'सहरसा',
-                'state': 'Bihar',
-                'pincode': '852201',
-                'phone': '06478-222300',
-                'email': 'dlsasaharsa@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.8811,
-                'lng': 86.5912,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Araria',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, अररिया',
-                'address': 'District Court Complex, Araria - 854311',
-                'addressHi': 'जिला न्यायालय परिसर, अररिया - 854311',
-                'district': 'Araria',
-                'districtHi': 'अररिया',
-                'state': 'Bihar',
-                'pincode': '854311',
-                'phone': '06453-222400',
-                'email': 'dlsaararia@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.1494,
-                'lng': 87.5145,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Kishanganj',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, किशनगंज',
-                'address': 'District Court Complex, Kishanganj - 855107',
-                'addressHi': 'जिला न्यायालय परिसर, किशनगंज - 855107',
-                'district': 'Kishanganj',
-                'districtHi': 'किशनगंज',
-                'state': 'Bihar',
-                'pincode': '855107',
-                'phone': '06456-222500',
-                'email': 'dlsakishanganj@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.1028,
-                'lng': 87.9323,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Supaul',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, सुपौल',
-                'address': 'District Court Complex, Supaul - 852131',
-                'addressHi': 'जिला न्यायालय परिसर, सुपौल - 852131',
-                'district': 'Supaul',
-                'districtHi': 'सुपौल',
-                'state': 'Bihar',
-                'pincode': '852131',
-                'phone': '06473-222600',
-                'email': 'dlsasupaul@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.1239,
-                'lng': 86.5967,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Madhepura',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, मधेपुरा',
-                'address': 'District Court Complex, Madhepura - 852113',
-                'addressHi': 'जिला न्यायालय परिसर, मधेपुरा - 852113',
-                'district': 'Madhepura',
-                'districtHi': 'मधेपुरा',
-                'state': 'Bihar',
-                'pincode': '852113',
-                'phone': '06476-222700',
-                'email': 'dlsamadhepura@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.9230,
-                'lng': 86.7931,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Khagaria',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, खगड़िया',
-                'address': 'District Court Complex, Khagaria - 851204',
-                'addressHi': 'जिला न्यायालय परिसर, खगड़िया - 851204',
-                'district': 'Khagaria',
-                'districtHi': 'खगड़िया',
-                'state': 'Bihar',
-                'pincode': '851204',
-                'phone': '06244-222800',
-                'email': 'dlsakhagaria@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.5021,
-                'lng': 86.4664,
-                'verified': True,
-                'source': 'Bihar SLSA Official Website'
-            },
-            
-            # =====================
-            # UTTAR PRADESH - Major Districts
-            # Source: UP SLSA (upslsa.up.gov.in)
-            # =====================
-            {
-                'name': 'District Legal Services Authority, Lucknow',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, लखनऊ',
-                'address': 'District Court Complex, Hussainganj, Lucknow - 226001',
-                'addressHi': 'जिला न्यायालय परिसर, हुसैनगंज, लखनऊ - 226001',
-                'district': 'Lucknow',
-                'districtHi': 'लखनऊ',
-                'state': 'Uttar Pradesh',
-                'pincode': '226001',
-                'phone': '0522-2627552',
-                'email': 'dlsalucknow@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.8393,
-                'lng': 80.9231,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Varanasi',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, वाराणसी',
-                'address': 'District Court Complex, Sigra, Varanasi - 221002',
-                'addressHi': 'जिला न्यायालय परिसर, सिगरा, वाराणसी - 221002',
-                'district': 'Varanasi',
-                'districtHi': 'वाराणसी',
-                'state': 'Uttar Pradesh',
-                'pincode': '221002',
-                'phone': '0542-2501665',
-                'email': 'dlsavaranasi@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.3176,
-                'lng': 82.9739,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Kanpur Nagar',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, कानपुर नगर',
-                'address': 'District Court Complex, Kanpur - 208001',
-                'addressHi': 'जिला न्यायालय परिसर, कानपुर - 208001',
-                'district': 'Kanpur',
-                'districtHi': 'कानपुर',
-                'state': 'Uttar Pradesh',
-                'pincode': '208001',
-                'phone': '0512-2304567',
-                'email': 'dlsakanpur@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.4499,
-                'lng': 80.3319,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Prayagraj',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, प्रयागराज',
-                'address': 'District Court Complex, Civil Lines, Prayagraj - 211001',
-                'addressHi': 'जिला न्यायालय परिसर, सिविल लाइंस, प्रयागराज - 211001',
-                'district': 'Prayagraj',
-                'districtHi': 'प्रयागराज',
-                'state': 'Uttar Pradesh',
-                'pincode': '211001',
-                'phone': '0532-2627373',
-                'email': 'dlsaprayagraj@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 25.4358,
-                'lng': 81.8463,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Agra',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, आगरा',
-                'address': 'District Court Complex, Agra - 282001',
-                'addressHi': 'जिला न्यायालय परिसर, आगरा - 282001',
-                'district': 'Agra',
-                'districtHi': 'आगरा',
-                'state': 'Uttar Pradesh',
-                'pincode': '282001',
-                'phone': '0562-2520456',
-                'email': 'dlsaagra@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 27.1767,
-                'lng': 78.0081,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Gorakhpur',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, गोरखपुर',
-                'address': 'District Court Complex, Gorakhpur - 273001',
-                'addressHi': 'जिला न्यायालय परिसर, गोरखपुर - 273001',
-                'district': 'Gorakhpur',
-                'districtHi': 'गोरखपुर',
-                'state': 'Uttar Pradesh',
-                'pincode': '273001',
-                'phone': '0551-2334567',
-                'email': 'dlsagorakhpur@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.7606,
-                'lng': 83.3732,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Ghaziabad',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, गाज़ियाबाद',
-                'address': 'District Court Complex, Ghaziabad - 201001',
-                'addressHi': 'जिला न्यायालय परिसर, गाज़ियाबाद - 201001',
-                'district': 'Ghaziabad',
-                'districtHi': 'गाज़ियाबाद',
-                'state': 'Uttar Pradesh',
-                'pincode': '201001',
-                'phone': '0120-2820123',
-                'email': 'dlsaghaziabad@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.6692,
-                'lng': 77.4538,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Gautam Buddha Nagar (Noida)',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, गौतम बुद्ध नगर (नोएडा)',
-                'address': 'District Court Complex, Sector 49, Noida - 201301',
-                'addressHi': 'जिला न्यायालय परिसर, सेक्टर 49, नोएडा - 201301',
-                'district': 'Gautam Buddha Nagar',
-                'districtHi': 'गौतम बुद्ध नगर',
-                'state': 'Uttar Pradesh',
-                'pincode': '201301',
-                'phone': '0120-2567890',
-                'email': 'dlsagbn@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.5355,
-                'lng': 77.3910,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Meerut',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, मेरठ',
-                'address': 'District Court Complex, Meerut - 250001',
-                'addressHi': 'जिला न्यायालय परिसर, मेरठ - 250001',
-                'district': 'Meerut',
-                'districtHi': 'मेरठ',
-                'state': 'Uttar Pradesh',
-                'pincode': '250001',
-                'phone': '0121-2660123',
-                'email': 'dlsameerut@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.9845,
-                'lng': 77.7064,
-                'verified': True,
-                'source': 'UP SLSA Official Website'
-            },
-            
-            # =====================
-            # DELHI - All Districts
-            # Source: DSLSA (dslsa.org)
-            # =====================
-            {
-                'name': 'District Legal Services Authority (Central), Tis Hazari',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण (मध्य), तीस हजारी',
-                'address': 'Tis Hazari Court Complex, Delhi - 110054',
-                'addressHi': 'तीस हजारी न्यायालय परिसर, दिल्ली - 110054',
-                'district': 'Central Delhi',
-                'districtHi': 'मध्य दिल्ली',
-                'state': 'Delhi',
-                'pincode': '110054',
-                'phone': '011-23968471',
-                'email': 'dlsacentral@delhicourts.nic.in',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.6639,
-                'lng': 77.2090,
-                'verified': True,
-                'source': 'DSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority (South), Saket',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण (दक्षिण), साकेत',
-                'address': 'Saket Court Complex, New Delhi - 110017',
-                'addressHi': 'साकेत न्यायालय परिसर, नई दिल्ली - 110017',
-                'district': 'South Delhi',
-                'districtHi': 'दक्षिण दिल्ली',
-                'state': 'Delhi',
-                'pincode': '110017',
-                'phone': '011-26857829',
-                'email': 'dlsasouth@delhicourts.nic.in',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.5268,
-                'lng': 77.2208,
-                'verified': True,
-                'source': 'DSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority (East), Karkardooma',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण (पूर्व), करकरडूमा',
-                'address': 'Karkardooma Court Complex, Delhi - 110032',
-                'addressHi': 'करकरडूमा न्यायालय परिसर, दिल्ली - 110032',
-                'district': 'East Delhi',
-                'districtHi': 'पूर्वी दिल्ली',
-                'state': 'Delhi',
-                'pincode': '110032',
-                'phone': '011-22824380',
-                'email': 'dlsaeast@delhicourts.nic.in',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.6519,
-                'lng': 77.3037,
-                'verified': True,
-                'source': 'DSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority (West), Dwarka',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण (पश्चिम), द्वारका',
-                'address': 'Dwarka Court Complex, Sector 10, Dwarka, Delhi - 110075',
-                'addressHi': 'द्वारका न्यायालय परिसर, सेक्टर 10, द्वारका, दिल्ली - 110075',
-                'district': 'West Delhi',
-                'districtHi': 'पश्चिमी दिल्ली',
-                'state': 'Delhi',
-                'pincode': '110075',
-                'phone': '011-25081265',
-                'email': 'dlsawest@delhicourts.nic.in',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.5853,
-                'lng': 77.0386,
-                'verified': True,
-                'source': 'DSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority (North), Rohini',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण (उत्तर), रोहिणी',
-                'address': 'Rohini Court Complex, Delhi - 110085',
-                'addressHi': 'रोहिणी न्यायालय परिसर, दिल्ली - 110085',
-                'district': 'North Delhi',
-                'districtHi': 'उत्तरी दिल्ली',
-                'state': 'Delhi',
-                'pincode': '110085',
-                'phone': '011-27562146',
-                'email': 'dlsanorth@delhicourts.nic.in',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.7406,
-                'lng': 77.1063,
-                'verified': True,
-                'source': 'DSLSA Official Website'
-            },
-            
-            # =====================
-            # MAHARASHTRA - Major Districts
-            # Source: MahaLSA (mahalsa.gov.in)
-            # =====================
-            {
-                'name': 'District Legal Services Authority, Mumbai City',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, मुंबई शहर',
-                'address': 'Mumbai City Civil Court, Fort, Mumbai - 400001',
-                'addressHi': 'मुंबई सिटी सिविल कोर्ट, फोर्ट, मुंबई - 400001',
-                'district': 'Mumbai',
-                'districtHi': 'मुंबई',
-                'state': 'Maharashtra',
-                'pincode': '400001',
-                'phone': '022-22623872',
-                'email': 'dlsamumbaicity@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 18.9322,
-                'lng': 72.8347,
-                'verified': True,
-                'source': 'MahaLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Pune',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, पुणे',
-                'address': 'District Court Complex, Shivajinagar, Pune - 411005',
-                'addressHi': 'जिला न्यायालय परिसर, शिवाजीनगर, पुणे - 411005',
-                'district': 'Pune',
-                'districtHi': 'पुणे',
-                'state': 'Maharashtra',
-                'pincode': '411005',
-                'phone': '020-25538340',
-                'email': 'dlsapune@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 18.5204,
-                'lng': 73.8567,
-                'verified': True,
-                'source': 'MahaLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Nagpur',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, नागपुर',
-                'address': 'District Court Complex, Civil Lines, Nagpur - 440001',
-                'addressHi': 'जिला न्यायालय परिसर, सिविल लाइंस, नागपुर - 440001',
-                'district': 'Nagpur',
-                'districtHi': 'नागपुर',
-                'state': 'Maharashtra',
-                'pincode': '440001',
-                'phone': '0712-2551001',
-                'email': 'dlsanagpur@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 21.1458,
-                'lng': 79.0882,
-                'verified': True,
-                'source': 'MahaLSA Official Website'
-            },
-            
-            # =====================
-            # RAJASTHAN - Major Districts
-            # Source: RSLSA (rlsa.gov.in)
-            # =====================
-            {
-                'name': 'District Legal Services Authority, Jaipur',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, जयपुर',
-                'address': 'District Court Complex, Jaipur - 302001',
-                'addressHi': 'जिला न्यायालय परिसर, जयपुर - 302001',
-                'district': 'Jaipur',
-                'districtHi': 'जयपुर',
-                'state': 'Rajasthan',
-                'pincode': '302001',
-                'phone': '0141-2227602',
-                'email': 'dlsajaipur@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.9124,
-                'lng': 75.7873,
-                'verified': True,
-                'source': 'RSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Jodhpur',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, जोधपुर',
-                'address': 'District Court Complex, Jodhpur - 342001',
-                'addressHi': 'जिला न्यायालय परिसर, जोधपुर - 342001',
-                'district': 'Jodhpur',
-                'districtHi': 'जोधपुर',
-                'state': 'Rajasthan',
-                'pincode': '342001',
-                'phone': '0291-2651801',
-                'email': 'dlsajodhpur@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 26.2389,
-                'lng': 73.0243,
-                'verified': True,
-                'source': 'RSLSA Official Website'
-            },
-            
-            # =====================
-            # OTHER MAJOR CITIES
-            # =====================
-            {
-                'name': 'District Legal Services Authority, Bhopal',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, भोपाल',
-                'address': 'District Court Complex, Bhopal - 462001',
-                'addressHi': 'जिला न्यायालय परिसर, भोपाल - 462001',
-                'district': 'Bhopal',
-                'districtHi': 'भोपाल',
-                'state': 'Madhya Pradesh',
-                'pincode': '462001',
-                'phone': '0755-2551001',
-                'email': 'dlsabhopal@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 23.2599,
-                'lng': 77.4126,
-                'verified': True,
-                'source': 'MPSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Kolkata',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, कोलकाता',
-                'address': 'District Court Complex, Alipore, Kolkata - 700027',
-                'addressHi': 'जिला न्यायालय परिसर, अलीपुर, कोलकाता - 700027',
-                'district': 'Kolkata',
-                'districtHi': 'कोलकाता',
-                'state': 'West Bengal',
-                'pincode': '700027',
-                'phone': '033-24791632',
-                'email': 'dlsasouth24pgs@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 22.5358,
-                'lng': 88.3367,
-                'verified': True,
-                'source': 'WBSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Chennai',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, चेन्नई',
-                'address': 'High Court Buildings, Chennai - 600104',
-                'addressHi': 'उच्च न्यायालय भवन, चेन्नई - 600104',
-                'district': 'Chennai',
-                'districtHi': 'चेन्नई',
-                'state': 'Tamil Nadu',
-                'pincode': '600104',
-                'phone': '044-25341764',
-                'email': 'dlsachennai@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 13.0827,
-                'lng': 80.2707,
-                'verified': True,
-                'source': 'TNSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Bengaluru',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, बेंगलुरु',
-                'address': 'District Court Complex, Mayo Hall, Bengaluru - 560001',
-                'addressHi': 'जिला न्यायालय परिसर, मेयो हॉल, बेंगलुरु - 560001',
-                'district': 'Bengaluru',
-                'districtHi': 'बेंगलुरु',
-                'state': 'Karnataka',
-                'pincode': '560001',
-                'phone': '080-22867642',
-                'email': 'dlsabengaluru@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 12.9716,
-                'lng': 77.5946,
-                'verified': True,
-                'source': 'KSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Ahmedabad',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, अहमदाबाद',
-                'address': 'District Court Complex, Bhadra, Ahmedabad - 380001',
-                'addressHi': 'जिला न्यायालय परिसर, भद्र, अहमदाबाद - 380001',
-                'district': 'Ahmedabad',
-                'districtHi': 'अहमदाबाद',
-                'state': 'Gujarat',
-                'pincode': '380001',
-                'phone': '079-25503823',
-                'email': 'dlsaahmedabad@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 23.0225,
-                'lng': 72.5714,
-                'verified': True,
-                'source': 'GUJSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Hyderabad',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, हैदराबाद',
-                'address': 'City Civil Court Complex, Hyderabad - 500066',
-                'addressHi': 'सिटी सिविल कोर्ट परिसर, हैदराबाद - 500066',
-                'district': 'Hyderabad',
-                'districtHi': 'हैदराबाद',
-                'state': 'Telangana',
-                'pincode': '500066',
-                'phone': '040-23298233',
-                'email': 'dlsahyderabad@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 17.3850,
-                'lng': 78.4867,
-                'verified': True,
-                'source': 'TSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Ranchi',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, रांची',
-                'address': 'District Court Complex, Ranchi - 834001',
-                'addressHi': 'जिला न्यायालय परिसर, रांची - 834001',
-                'district': 'Ranchi',
-                'districtHi': 'रांची',
-                'state': 'Jharkhand',
-                'pincode': '834001',
-                'phone': '0651-2211001',
-                'email': 'dlsaranchi@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 23.3441,
-                'lng': 85.3096,
-                'verified': True,
-                'source': 'JHALSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Chandigarh',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, चंडीगढ़',
-                'address': 'District Court Complex, Sector 43, Chandigarh - 160043',
-                'addressHi': 'जिला न्यायालय परिसर, सेक्टर 43, चंडीगढ़ - 160043',
-                'district': 'Chandigarh',
-                'districtHi': 'चंडीगढ़',
-                'state': 'Chandigarh',
-                'pincode': '160043',
-                'phone': '0172-2700443',
-                'email': 'dlsachandigarh@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 30.7333,
-                'lng': 76.7794,
-                'verified': True,
-                'source': 'CSLSA Official Website'
-            },
-            {
-                'name': 'District Legal Services Authority, Gurugram',
-                'nameHi': 'जिला विधिक सेवा प्राधिकरण, गुरुग्राम',
-                'address': 'District Court Complex, Gurugram - 122001',
-                'addressHi': 'जिला न्यायालय परिसर, गुरुग्राम - 122001',
-                'district': 'Gurugram',
-                'districtHi': 'गुरुग्राम',
-                'state': 'Haryana',
-                'pincode': '122001',
-                'phone': '0124-2322001',
-                'email': 'dlsagurugram@gmail.com',
-                'timings': 'Mon-Sat: 10:00 AM - 5:00 PM',
-                'lat': 28.4595,
-                'lng': 77.0266,
-                'verified': True,
-                'source': 'HSLSA Official Website'
-            },
-        ]
+        version = self.directory_store.current_version()
+        if version is None or version == self.directory.version:
+            return False
+        version, offices = self.directory_store.load()
+        if not offices:
+            return False
+        directory = self._build_directory(offices, version, DLSA_SOURCE_MONGO)
+        # One reference assignment: a search sees the old or the new directory, never a mix
+        self.directory = directory
+        logger.info("DLSA directory version %s loaded (%d offices)", version, len(offices))
+        return True
+
+    def directory_info(self):
+        """Version and size of the directory in use (for /api/health)"""
+        directory = self.directory
+        return {
+            'version': directory.version,
+            'source': directory.source,
+            'offices': len(directory.offices),
+            'loadedAt': directory.loaded_at.isoformat() + 'Z',
+            'polling': self._directory_poller is not None
+        }
 
     def get_location_from_pincode(self, pincode):
+        """
+        District, state and approximate lat/lng for a pincode, from the bundled
+        India Post directory; unknown pincodes fall back to the (cached) India Post API.
+        """
+        pincode = str(pincode).strip()
+        if not is_valid_pincode(pincode):
+            return {'success': False, 'error': 'Invalid pincode format'}
+
+        location = self.pincode_table.lookup(pincode)
+        if location is not None:
+            return {'success': True, **location, 'source': PINCODE_SOURCE_OFFLINE}
+        return self._cached_pincode_location(pincode)
+
+    def _cached_pincode_location(self, pincode):
+        """India Post API answer from the cache; concurrent misses for a pincode share one call"""
+        key = f'pincode:{pincode}'
+        cached = _pincode_api_cache.get(key)
+        if cached is not None:
+            if not cached.get('success'):
+                with _pincode_inflight_lock:
+                    _pincode_counters['negativeHits'] += 1
+            return cached
+
+        with _pincode_inflight_lock:
+            future = _pincode_inflight.get(pincode)
+            leader = future is None
+            if leader:
+                future = Future()
+                _pincode_inflight[pincode] = future
+                _pincode_counters['apiCalls'] += 1
+            else:
+                _pincode_counters['coalesced'] += 1
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            start = time.monotonic()
+            result = self._fetch_pincode_location(pincode)
+            ttl = PINCODE_API_CACHE_TTL if result.get('success') else PINCODE_API_NEGATIVE_TTL
+            _pincode_api_cache.set(key, result, latency=time.monotonic() - start, ttl=ttl)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _pincode_inflight_lock:
+                _pincode_inflight.pop(pincode, None)
+
+    def _fetch_pincode_location(self, pincode):
         """
         Fetch location details from India Post API (Official Government API)
         API: https://api.postalpincode.in/pincode/{pincode}
@@ -1117,6 +585,7 @@ class LegalAidService:
                             'region': po.get('Region', ''),
                             'division': po.get('Division', ''),
                             'pincode': pincode,
+                            'source': PINCODE_SOURCE_API,
                             'postOffices': [
                                 {
                                     'name': p.get('Name'),
@@ -1133,32 +602,89 @@ class LegalAidService:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
-    def _haversine_distance(self, lat1, lng1, lat2, lng2):
-        """Calculate distance between two points using Haversine formula"""
-        R = 6371  # Earth's radius in km
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
-        
-        a = (math.sin(delta_lat/2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng/2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        return round(R * c, 1)
+    def find_nearest_offices(self, lat, lng, limit=DEFAULT_RESULT_LIMIT, radius_km=None):
+        """
+        Formatted offices closest to a GPS position, nearest first, with
+        distance/distanceText. With radius_km, only offices inside the radius
+        (all of them if limit is None).
+        """
+        directory = self.directory
+        return [directory.office_response(index, distance)
+                for distance, index in directory.rank_offices(lat, lng, None, limit, radius_km)]
 
-    def find_offices(self, district=None, pincode=None, user_lat=None, user_lng=None):
+    def find_nearest_batch(self, rows, k=1):
+        """
+        Nearest k offices for many places at once (e.g. the villages of a block).
+        Each row has a name and lat/lng or a pincode; pincodes are resolved from
+        the offline table only, so a batch never waits on the India Post API.
+        Returns one result per row, in order: {index, name, resolvedBy, lat, lng,
+        offices: [office response + distance]} or {index, name, error, message}.
+        """
+        directory = self.directory
+        results = []
+        located = []  # (result position, lat, lng)
+        for index, row in enumerate(rows):
+            row = row or {}
+            result = {'index': index, 'name': str(row.get('name') or row.get('village') or '')}
+            location, error = self._batch_location(row)
+            if error:
+                result.update(success=False, **error)
+            else:
+                result.update(success=True, **location)
+                located.append((len(results), location['lat'], location['lng']))
+            results.append(result)
+
+        if located:
+            nearest = directory.coordinates.nearest_many([lat for _, lat, _ in located],
+                                                         [lng for _, _, lng in located], k)
+            for (position, _, _), ranked in zip(located, nearest):
+                results[position]['offices'] = [directory.office_response(index, distance)
+                                                for distance, index in ranked]
+        return results
+
+    def _batch_location(self, row):
+        """({resolvedBy, lat, lng, pincode[, district, state]}, None) for a batch row, or (None, error)"""
+        lat = row.get('lat', row.get('latitude'))
+        lng = row.get('lng', row.get('lon', row.get('longitude')))
+        pincode = str(row.get('pincode') or '').strip()
+        if lat not in (None, '') or lng not in (None, ''):
+            try:
+                lat, lng = float(lat), float(lng)
+            except (TypeError, ValueError):
+                lat = lng = None
+            if lat is None or not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                return None, {'error': 'Invalid coordinates', 'message': 'अक्षांश/देशांतर सही नहीं है'}
+            return {'resolvedBy': 'coordinates', 'lat': lat, 'lng': lng, 'pincode': pincode}, None
+
+        if not pincode:
+            return None, {'error': 'No location', 'message': 'lat/lng या पिनकोड दें'}
+        location = self.pincode_table.lookup(pincode)
+        if location is None:
+            return None, {'error': 'Unknown pincode', 'message': 'यह पिनकोड हमारी सूची में नहीं है'}
+        if location['lat'] is None:
+            return None, {'error': 'No coordinates for pincode', 'message': 'इस पिनकोड का स्थान उपलब्ध नहीं है'}
+        return {'resolvedBy': 'pincode', **location}, None
+
+    def find_offices(self, district=None, pincode=None, user_lat=None, user_lng=None, radius_km=None,
+                     limit=DEFAULT_RESULT_LIMIT):
         """
         Find legal aid offices based on district, pincode, or coordinates
-        Uses India Post API for pincode validation
+        Pincodes resolve through the offline India Post directory. With
+        coordinates and no district/pincode match, the nearest offices (within
+        radius_km, if given) are returned from the spatial index; without
+        coordinates, matches are ordered by distance from the pincode's centre.
+        A district taken from the pincode is only matched within the pincode's
+        state, since district names repeat across states (Aurangabad).
         """
-        matching_offices = []
+        # Positions in directory.offices; offices are only formatted once ranked and cut to limit
+        directory = self.directory
+        matching = []
         search_lat = user_lat
         search_lng = user_lng
         pincode_location = None
+        district_state = None
         
-        # If pincode provided, validate and get location from India Post API
+        # If pincode provided, resolve it (offline table, then India Post API)
         if pincode:
             pincode_location = self.get_location_from_pincode(pincode)
             
@@ -1166,54 +692,33 @@ class LegalAidService:
                 # Use the district from pincode API if not provided
                 if not district:
                     district = pincode_location.get('district')
+                    district_state = pincode_location.get('state')
         
         # Search by district name
         if district:
-            district_lower = district.lower().strip()
-            
-            for office in self.offices:
-                office_district = office['district'].lower()
-                office_district_hi = office.get('districtHi', '').lower()
-                office_state = office['state'].lower()
-                
-                # Match district name
-                if (district_lower in office_district or
-                    office_district in district_lower or
-                    district_lower in office_district_hi or
-                    district_lower in office_state):
-                    matching_offices.append(office.copy())
+            matching = directory.match_district(district, district_state)
         
         # If pincode matches any office pincode prefix
-        if pincode and not matching_offices:
-            pincode_prefix = pincode[:3]
-            for office in self.offices:
-                if office['pincode'][:3] == pincode_prefix:
-                    matching_offices.append(office.copy())
+        if pincode and not matching:
+            matching = list(directory.offices_by_pincode_prefix.get(pincode[:3], ()))
         
         # If still no matches and we have state info from pincode
-        if not matching_offices and pincode_location and pincode_location.get('success'):
-            state = pincode_location.get('state', '').lower()
-            for office in self.offices:
-                if state in office['state'].lower():
-                    matching_offices.append(office.copy())
-        
-        # Calculate distances if user coordinates available
-        if search_lat and search_lng:
-            for office in matching_offices:
-                distance = self._haversine_distance(
-                    search_lat, search_lng,
-                    office['lat'], office['lng']
-                )
-                office['distance'] = distance
-                office['distanceText'] = f"{distance} km"
-            
-            # Sort by distance
-            matching_offices.sort(key=lambda x: x.get('distance', 9999))
+        if not matching and pincode_location and pincode_location.get('success'):
+            state = pincode_location.get('state', '')
+            matching = list(directory.state_index.exact(state) or directory.state_index.containing(state))
         
-        # Format response
-        formatted_offices = []
-        for office in matching_offices[:10]:
-            formatted_offices.append(self._format_office(office))
+        if search_lat is not None and search_lng is not None:
+            # Rank matches by distance; with coordinates only, or if nothing matched
+            # (within the radius), the nearest offices come from the spatial index
+            ranked = directory.rank_offices(search_lat, search_lng, matching, limit, radius_km) if matching else []
+            if not ranked:
+                ranked = directory.rank_offices(search_lat, search_lng, None, limit, radius_km)
+            formatted_offices = [directory.office_response(index, distance) for distance, index in ranked]
+        elif matching and pincode_location and pincode_location.get('lat') is not None:
+            ranked = directory.rank_offices(pincode_location['lat'], pincode_location['lng'], matching, limit, None)
+            formatted_offices = [directory.office_response(index, distance) for distance, index in ranked]
+        else:
+            formatted_offices = [directory.office_response(index) for index in matching[:limit]]
         
         # If no offices found, return NALSA info with SLSA contact
         if not formatted_offices:
@@ -1225,7 +730,8 @@ class LegalAidService:
                 'district': district,
                 'pincode': pincode,
                 'userLat': user_lat,
-                'userLng': user_lng
+                'userLng': user_lng,
+                'radiusKm': radius_km
             },
             'totalResults': len(formatted_offices),
             'offices': formatted_offices,
@@ -1237,42 +743,19 @@ class LegalAidService:
             }
         }
         
-        # Add pincode location info if fetched from API
+        # Add pincode location info
         if pincode_location and pincode_location.get('success'):
             response['pincodeInfo'] = {
                 'district': pincode_location.get('district'),
                 'state': pincode_location.get('state'),
-                'source': 'India Post Official API'
+                'source': pincode_location.get('source', PINCODE_SOURCE_API)
             }
         
         return response
 
-    def _format_office(self, office):
-        """Format office data for response"""
-        formatted = {
-            'name': office['name'],
-            'nameHi': office.get('nameHi', office['name']),
-            'address': office['address'],
-            'addressHi': office.get('addressHi', office['address']),
-            'district': office['district'],
-            'districtHi': office.get('districtHi', office['district']),
-            'state': office['state'],
-            'pincode': office['pincode'],
-            'phone': office['phone'],
-            'email': office.get('email', ''),
-            'timings': office.get('timings', 'Mon-Sat: 10:00 AM - 5:00 PM'),
-            'lat': office['lat'],
-            'lng': office['lng'],
-            'verified': office.get('verified', True),
-            'source': office.get('source', 'NALSA Official Records'),
-            'mapsLink': f"https://www.google.com/maps/search/?api=1&query={office['lat']},{office['lng']}"
-        }
-        
-        if 'distance' in office:
-            formatted['distance'] = office['distance']
-            formatted['distanceText'] = office['distanceText']
-        
-        return formatted
+    def suggest(self, query, limit=MAX_SUGGESTIONS):
+        """Type-ahead suggestions from the current directory (see OfficeDirectory.suggest)"""
+        return self.directory.suggest(query, limit)
 
     def _get_not_found_response(self, district, pincode, pincode_location):
         """Return response when no specific DLSA found"""
@@ -1344,7 +827,7 @@ class LegalAidService:
             response['pincodeInfo'] = {
                 'district': pincode_location.get('district'),
                 'state': pincode_location.get('state'),
-                'source': 'India Post Official API',
+                'source': pincode_location.get('source', PINCODE_SOURCE_API),
                 'note': 'Your pincode is valid. Please call 15100 for DLSA in this area.'
             }
         
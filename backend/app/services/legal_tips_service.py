@@ -7,6 +7,8 @@ Provides credible, actionable legal tips for common situations
 from datetime import datetime
 import json
 
+from app.utils.transliteration import transliterate_word
+
 
 class LegalTipsService:
     """
@@ -836,12 +838,29 @@ class LegalTipsService:
         "tenant_rights": ["tenant", "rent", "kiraya", "landlord", "किराया", "मकान", "किरायेदार"],
     }
 
+    # Hinglish/English function words; transliterated (से, को, है) they appear in
+    # nearly every tip, so they are neither expanded nor required to match
+    SEARCH_STOPWORDS = frozenset({
+        "hai", "hain", "aur", "par", "mein", "liye", "bhi", "nahi", "nhi", "kya", "kaise",
+        "kab", "tha", "thi", "the", "and", "for", "how", "what", "with",
+    })
+    SEARCH_MIN_WORD_LENGTH = 3
+
+    def _is_content_word(self, word):
+        return len(word) >= self.SEARCH_MIN_WORD_LENGTH and word not in self.SEARCH_STOPWORDS
+
     def _expand_keywords(self, keyword):
         """Expand a keyword with its Hindi transliteration equivalents"""
         expanded = {keyword}
         lower = keyword.lower()
+        if not self._is_content_word(lower):
+            return expanded
         if lower in self.TRANSLITERATION_MAP:
             expanded.add(self.TRANSLITERATION_MAP[lower])
+        # General Hinglish vocabulary shared with the draft rewriter
+        hindi = transliterate_word(lower)
+        if hindi:
+            expanded.add(hindi)
         # Also check if the keyword is Hindi and find its Roman equivalent
         for roman, hindi in self.TRANSLITERATION_MAP.items():
             if lower == hindi or lower == roman:
@@ -858,9 +877,11 @@ class LegalTipsService:
         # Split into individual words for multi-word search
         words = keyword.split()
 
-        # Expand each word with transliteration equivalents
+        # Expand each content word with transliteration equivalents; a query of
+        # function words only is matched as typed
+        content_words = [word for word in words if self._is_content_word(word)] or words
         expanded_per_word = []
-        for word in words:
+        for word in content_words:
             expanded_per_word.append(self._expand_keywords(word))
 
         # Check if any word maps to a specific category
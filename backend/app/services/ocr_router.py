@@ -0,0 +1,319 @@
+"""
+OCR Router
+Chooses between OCR.space (cloud) and local Tesseract (hin+eng) per request.
+- Local Tesseract runs in a process pool so it never blocks the web worker's GIL
+- Latency/success of each engine is tracked with an EWMA; the cheaper engine
+  (adjusted for OCR.space's better Hindi quality) becomes the primary
+- If the primary hasn't answered within its observed p90 latency, a hedged
+  request goes to the other engine and whichever succeeds first wins
+- OCR.space quota is counted per month and rate-limit errors trigger a cooldown
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from io import BytesIO
+
+logger = logging.getLogger(__name__)
+
+# Try to import pytesseract for offline OCR (optional)
+try:
+    import pytesseract
+    from PIL import Image
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+
+CLOUD = 'cloud'
+LOCAL = 'local'
+
+# OCR.space free tier: 25,000 requests/month
+OCR_SPACE_MONTHLY_QUOTA = int(os.environ.get('OCR_SPACE_MONTHLY_QUOTA', '25000'))
+OCR_LOCAL_WORKERS = int(os.environ.get('OCR_LOCAL_WORKERS', str(min(2, os.cpu_count() or 1))))
+
+EWMA_ALPHA = 0.2
+# Cloud OCR reads Hindi better, so it stays primary until it is this much costlier
+CLOUD_PREFERENCE = 1.5
+# Hedge delay used until an engine has enough samples for a p90
+DEFAULT_HEDGE_DELAY = {CLOUD: 8.0, LOCAL: 6.0}
+MIN_SAMPLES_FOR_P90 = 10
+QUOTA_COOLDOWN_SECONDS = 3600
+OCR_DEADLINE_SECONDS = 65
+# OCR.space answers rate/quota limits with HTTP 403/429 and "You may only perform this
+# action upto maximum N number of times within S seconds"; other errors (e.g. "File size
+# exceeds the maximum permissible file size limit") concern one upload only
+QUOTA_STATUS_CODES = (403, 429)
+_QUOTA_ERROR_RE = re.compile(r'perform this action up ?to maximum \d+|too many requests|rate limit')
+
+
+def tesseract_ocr(source):
+    """
+    Offline OCR using pytesseract (runs inside a pool worker process)
+    source: path of a spooled upload, or the raw bytes of a small one
+    Requires: Tesseract-OCR installed on system
+    """
+    if not PYTESSERACT_AVAILABLE:
+        return {'success': False, 'error': 'Pytesseract not available'}
+
+    try:
+        image = Image.open(source if isinstance(source, str) else BytesIO(source))
+        text = pytesseract.image_to_string(image, lang='hin+eng')
+        return {
+            'success': True,
+            'text': text.strip(),
+            'method': 'Pytesseract (Offline)'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+
+class EngineStats:
+    """Rolling latency/success statistics for one OCR engine"""
+
+    def __init__(self, name, window=50):
+        self.name = name
+        self.latencies = deque(maxlen=window)
+        self.ewma_latency = None
+        self.ewma_success = 1.0
+        self.calls = 0
+        self.failures = 0
+
+    def record(self, latency, ok):
+        self.calls += 1
+        if not ok:
+            self.failures += 1
+        self.latencies.append(latency)
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += EWMA_ALPHA * (latency - self.ewma_latency)
+        self.ewma_success += EWMA_ALPHA * ((1.0 if ok else 0.0) - self.ewma_success)
+
+    def p90(self):
+        if len(self.latencies) < MIN_SAMPLES_FOR_P90:
+            return DEFAULT_HEDGE_DELAY[self.name]
+        ordered = sorted(self.latencies)
+        return ordered[int(0.9 * (len(ordered) - 1))]
+
+    def expected_cost(self):
+        """Expected seconds to a successful result"""
+        latency = self.ewma_latency if self.ewma_latency is not None else DEFAULT_HEDGE_DELAY[self.name]
+        return latency / max(self.ewma_success, 0.05)
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'failures': self.failures,
+            'ewmaLatency': round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            'ewmaSuccess': round(self.ewma_success, 3),
+            'p90': round(self.p90(), 3)
+        }
+
+
+class OCRRouter:
+    """Adaptive, hedged OCR across OCR.space and a local Tesseract pool"""
+
+    def __init__(self, local_workers=OCR_LOCAL_WORKERS, monthly_quota=OCR_SPACE_MONTHLY_QUOTA,
+                 local_ocr=tesseract_ocr, local_available=PYTESSERACT_AVAILABLE):
+        # local_ocr must be a picklable module-level function (it runs in the process pool)
+        self.local_ocr = local_ocr
+        self.local_available = local_available and local_workers > 0
+        self.local_workers = local_workers
+        self.monthly_quota = monthly_quota
+        self.stats = {CLOUD: EngineStats(CLOUD), LOCAL: EngineStats(LOCAL)}
+
+        self._lock = threading.Lock()
+        self._cloud_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ocr-cloud')
+        self._local_pool = None
+
+        self._quota_month = datetime.now().strftime('%Y-%m')
+        self._quota_used = 0
+        self._cloud_blocked_until = 0.0
+
+    # ── quota ──
+    def _roll_quota_month(self):
+        month = datetime.now().strftime('%Y-%m')
+        if month != self._quota_month:
+            self._quota_month = month
+            self._quota_used = 0
+
+    def cloud_quota_available(self):
+        with self._lock:
+            self._roll_quota_month()
+            if time.monotonic() < self._cloud_blocked_until:
+                return False
+            return self._quota_used < self.monthly_quota
+
+    def _note_cloud_result(self, result):
+        with self._lock:
+            self._roll_quota_month()
+            self._quota_used += 1
+            if not result.get('success') and _is_quota_error(result):
+                logger.warning("OCR.space quota/rate limit hit, preferring local OCR for %ss", QUOTA_COOLDOWN_SECONDS)
+                self._cloud_blocked_until = time.monotonic() + QUOTA_COOLDOWN_SECONDS
+
+    # ── engine selection ──
+    def primary_engine(self):
+        cloud_ok = self.cloud_quota_available()
+        if not self.local_available:
+            return CLOUD
+        if not cloud_ok:
+            return LOCAL
+        cloud_cost = self.stats[CLOUD].expected_cost()
+        local_cost = self.stats[LOCAL].expected_cost()
+        return CLOUD if cloud_cost <= local_cost * CLOUD_PREFERENCE else LOCAL
+
+    def _get_local_pool(self):
+        with self._lock:
+            if self._local_pool is None:
+                self._local_pool = ProcessPoolExecutor(max_workers=self.local_workers)
+            return self._local_pool
+
+    def _submit(self, engine, cloud_call, local_source, hold):
+        started = time.monotonic()
+        release = hold() if hold is not None else None
+        if engine == CLOUD:
+            future = self._cloud_pool.submit(_safe_call, cloud_call)
+        else:
+            future = self._get_local_pool().submit(self.local_ocr, local_source())
+
+        def _record(done):
+            try:
+                if done.cancelled():
+                    return
+                try:
+                    result = done.result()
+                except Exception as e:
+                    result = {'success': False, 'error': str(e)}
+                if engine == CLOUD:
+                    self._note_cloud_result(result)
+                with self._lock:
+                    self.stats[engine].record(time.monotonic() - started, _is_usable(result))
+            finally:
+                if release is not None:
+                    release()
+
+        future.add_done_callback(_record)
+        return future
+
+    # ── main entry ──
+    def extract(self, local_source, is_pdf, cloud_call, hold=None):
+        """
+        Run OCR and return the first usable result.
+        local_source: zero-arg callable giving the worker input (file path or bytes);
+                      only called if the local engine is actually used.
+        cloud_call: zero-arg callable performing the OCR.space request.
+        hold: optional zero-arg callable called before each engine is started; it
+              returns a release() called once that engine has finished. A hedged
+              loser that is already running keeps going after extract() returns,
+              so the input it reads must stay available until then.
+        Local Tesseract only handles images, so PDFs always go to the cloud.
+        """
+        if is_pdf or not self.local_available:
+            started = time.monotonic()
+            result = _safe_call(cloud_call)
+            self._note_cloud_result(result)
+            with self._lock:
+                self.stats[CLOUD].record(time.monotonic() - started, _is_usable(result))
+            return result
+
+        primary = self.primary_engine()
+        secondary = LOCAL if primary == CLOUD else CLOUD
+        if secondary == CLOUD and not self.cloud_quota_available():
+            secondary = None
+
+        deadline = time.monotonic() + OCR_DEADLINE_SECONDS
+        pending = {self._submit(primary, cloud_call, local_source, hold): primary}
+        errors = []
+
+        # Give the primary until its p90 before hedging
+        done, _ = wait(pending, timeout=self.stats[primary].p90())
+        hedged = False
+        while True:
+            for future in done:
+                engine = pending.pop(future)
+                result = _future_result(future)
+                if _is_usable(result):
+                    result['hedged'] = hedged
+                    # A queued loser is dropped; a running one releases its hold when done
+                    for loser in pending:
+                        loser.cancel()
+                    return result
+                errors.append(result.get('error', f'{engine} OCR failed'))
+
+            if secondary and not hedged:
+                pending[self._submit(secondary, cloud_call, local_source, hold)] = secondary
+                hedged = True
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+        return {
+            'success': False,
+            'error': errors[0] if errors else 'OCR timed out'
+        }
+
+    def get_stats(self):
+        with self._lock:
+            self._roll_quota_month()
+            quota = {
+                'month': self._quota_month,
+                'used': self._quota_used,
+                'limit': self.monthly_quota,
+                'cooldown': max(0.0, round(self._cloud_blocked_until - time.monotonic(), 1))
+            }
+        return {
+            'primary': self.primary_engine(),
+            'localAvailable': self.local_available,
+            'cloudQuota': quota,
+            'engines': {name: stats.to_dict() for name, stats in self.stats.items()}
+        }
+
+
+def _is_quota_error(result):
+    if result.get('statusCode') in QUOTA_STATUS_CODES:
+        return True
+    return _QUOTA_ERROR_RE.search(str(result.get('error', '')).lower()) is not None
+
+
+def _safe_call(func):
+    try:
+        return func()
+    except Exception as e:
+        logger.warning("OCR call failed: %s", e)
+        return {'success': False, 'error': str(e)}
+
+
+def _future_result(future):
+    try:
+        return future.result()
+    except Exception as e:
+        return {'success': False, 'error': str(e)}
+
+
+def _is_usable(result):
+    return bool(result and result.get('success') and result.get('text', '').strip())
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_ocr_router():
+    """Process-wide router so the pool and statistics are shared by every DocumentService"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = OCRRouter()
+        return _router
@@ -3,14 +3,29 @@ Government Scheme Matching Service
 Matches user profile to government schemes using rule-based matching.
 Schemes stored in MongoDB for easy updates without code changes.
 Falls back to built-in schemes if DB is unavailable.
+Active schemes are served from an in-memory snapshot with a version stamp:
+writes here bump the version document and reload at once, and a background
+poll of that document picks up writes made by other workers.
 """
 
+import os
 import logging
+import threading
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from pymongo import ReturnDocument
+
+from app.utils.snapshot_poller import SnapshotPoller, VERSIONS_COLLECTION
 
 logger = logging.getLogger(__name__)
 
+SCHEMES_VERSION_ID = "government_schemes"
+# Seconds between checks of the schemes version document (0 disables)
+SCHEME_REFRESH_INTERVAL = int(os.environ.get("SCHEME_REFRESH_INTERVAL", "30"))
+SCHEME_SOURCE_MONGO = "mongodb"
+SCHEME_SOURCE_BUILTIN = "builtin"
+
 
 @dataclass
 class MatchResult:
@@ -34,6 +49,16 @@ class MatchResult:
     portal_url: str
 
 
+@dataclass(frozen=True)
+class SchemeSnapshot:
+    """Active schemes as of one version; replaced as a whole, never modified"""
+    version: object
+    schemes: tuple
+    listing: tuple  # get_all_schemes() entries, built once
+    source: str
+    loaded_at: datetime = field(default_factory=datetime.utcnow)
+
+
 # ────────────────────────────────────────────────────────────────
 #  Comprehensive built-in schemes database (real Indian schemes)
 # ────────────────────────────────────────────────────────────────
@@ -530,10 +555,22 @@ BUILTIN_SCHEMES = [
 class SchemeMatchingService:
     """Service for matching users to government schemes with MongoDB storage"""
 
-    def __init__(self):
+    def __init__(self, collection=None, versions=None, refresh_interval=SCHEME_REFRESH_INTERVAL):
         self._db_available = False
         self._collection = None
-        self._try_connect_db()
+        self._versions = None
+        if collection is not None:
+            # Injected collections (tests)
+            self._collection, self._versions = collection, versions
+            self._db_available = True
+        else:
+            self._try_connect_db()
+        self._reload_lock = threading.Lock()
+        self._snapshot = None
+        self._reload_snapshot()
+        self._poller = None
+        if refresh_interval and self._db_available:
+            self._poller = SnapshotPoller("schemes", self.refresh_if_changed, refresh_interval).start()
 
     def _try_connect_db(self):
         """Try to connect to MongoDB schemes collection"""
@@ -542,11 +579,88 @@ class SchemeMatchingService:
             db = get_db()
             if db is not None:
                 self._collection = db["government_schemes"]
+                self._versions = db[VERSIONS_COLLECTION]
                 self._db_available = True
                 logger.info("Scheme service connected to MongoDB")
         except Exception as e:
             logger.warning("MongoDB not available for schemes, using built-in data: %s", e)
 
+    # ────────────────────────────────
+    #  In-memory snapshot
+    # ────────────────────────────────
+
+    def _read_version(self):
+        """Current version stamp, or None if no write has bumped it yet (or it can't be read)"""
+        try:
+            doc = self._versions.find_one({"_id": SCHEMES_VERSION_ID}, {"version": 1})
+        except Exception as e:
+            logger.warning("Could not read the schemes version: %s", e)
+            return None
+        return doc.get("version") if doc else None
+
+    def _bump_version(self):
+        """Mark the schemes as changed for every worker; returns the new version"""
+        doc = self._versions.find_one_and_update(
+            {"_id": SCHEMES_VERSION_ID},
+            {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow().isoformat()}},
+            upsert=True, return_document=ReturnDocument.AFTER,
+        )
+        return doc["version"]
+
+    def _reload_snapshot(self):
+        """Read the active schemes into a new snapshot and swap it in"""
+        with self._reload_lock:
+            # The built-in fallback carries no version (None), so it is never taken
+            # for the database's current state; refresh_if_changed retries it
+            version, schemes, source = None, BUILTIN_SCHEMES, SCHEME_SOURCE_BUILTIN
+            if self._db_available:
+                # Version first: a write landing meanwhile bumps it again and is reloaded next
+                db_version = self._read_version()
+                try:
+                    db_schemes = list(self._collection.find({"active": {"$ne": False}}, {"_id": 0}))
+                    if db_schemes:
+                        version, schemes, source = db_version, db_schemes, SCHEME_SOURCE_MONGO
+                except Exception as e:
+                    logger.warning("Error reading schemes from MongoDB: %s", e)
+                    if self._snapshot is not None:
+                        return self._snapshot
+            self._snapshot = SchemeSnapshot(
+                version=version,
+                schemes=tuple(schemes),
+                listing=tuple(self._listing_entry(scheme) for scheme in schemes),
+                source=source,
+            )
+            return self._snapshot
+
+    def refresh_if_changed(self):
+        """
+        Reload if another worker changed the schemes, or while the built-in
+        fallback is served although MongoDB is configured (startup read failed,
+        or nothing seeded yet); runs on the poller thread. True if reloaded.
+        """
+        if self._db_available and self._snapshot.source == SCHEME_SOURCE_BUILTIN:
+            return self._reload_snapshot().source == SCHEME_SOURCE_MONGO
+        version = self._read_version()
+        if version is None or version == self._snapshot.version:
+            return False
+        self._reload_snapshot()
+        return True
+
+    def _schemes_changed(self):
+        self._bump_version()
+        self._reload_snapshot()
+
+    def snapshot_info(self):
+        """Version and size of the schemes in use (for /api/health)"""
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version,
+            "source": snapshot.source,
+            "schemes": len(snapshot.schemes),
+            "loadedAt": snapshot.loaded_at.isoformat() + "Z",
+            "polling": self._poller is not None,
+        }
+
     # ────────────────────────────────
     #  Seed / CRUD operations
     # ────────────────────────────────
@@ -565,6 +679,7 @@ class SchemeMatchingService:
                 upsert=True,
             )
             count += 1
+        self._schemes_changed()
         return {"seeded": count, "message": f"Seeded {count} schemes into MongoDB"}
 
     def add_scheme(self, scheme_data):
@@ -591,6 +706,7 @@ class SchemeMatchingService:
         scheme_data.setdefault("match_rules", {})
 
         self._collection.insert_one(scheme_data)
+        self._schemes_changed()
         return scheme_data["id"], None
 
     def update_scheme(self, scheme_id, updates):
@@ -605,6 +721,7 @@ class SchemeMatchingService:
         result = self._collection.update_one({"id": scheme_id}, {"$set": updates})
         if result.matched_count == 0:
             return False, "Scheme not found"
+        self._schemes_changed()
         return True, None
 
     def delete_scheme(self, scheme_id):
@@ -614,6 +731,7 @@ class SchemeMatchingService:
         result = self._collection.update_one({"id": scheme_id}, {"$set": {"active": False}})
         if result.matched_count == 0:
             return False, "Scheme not found"
+        self._schemes_changed()
         return True, None
 
     # ────────────────────────────────
@@ -621,39 +739,31 @@ class SchemeMatchingService:
     # ────────────────────────────────
 
     def _get_all_scheme_data(self):
-        """Get all active schemes – from MongoDB if available, else built-in"""
-        if self._db_available:
-            try:
-                cursor = self._collection.find({"active": {"$ne": False}}, {"_id": 0})
-                db_schemes = list(cursor)
-                if db_schemes:
-                    return db_schemes
-            except Exception as e:
-                logger.warning("Error reading schemes from MongoDB: %s", e)
-        return BUILTIN_SCHEMES
+        """All active schemes from the in-memory snapshot (MongoDB, else built-in)"""
+        return self._snapshot.schemes
 
     def get_all_schemes(self):
         """Get all schemes for browsing"""
-        schemes = self._get_all_scheme_data()
-        return [
-            {
-                "id": s.get("id"),
-                "name": s.get("name"),
-                "name_hi": s.get("name_hi", ""),
-                "description": s.get("description"),
-                "description_hi": s.get("description_hi", ""),
-                "eligibility": s.get("eligibility"),
-                "eligibility_hi": s.get("eligibility_hi", ""),
-                "category": s.get("category", "general"),
-                "ministry": s.get("ministry", ""),
-                "portal_url": s.get("portal_url", ""),
-                "next_steps": s.get("next_steps", []),
-                "next_steps_hi": s.get("next_steps_hi", []),
-                "documents": s.get("documents", []),
-                "documents_hi": s.get("documents_hi", []),
-            }
-            for s in schemes
-        ]
+        return [dict(entry) for entry in self._snapshot.listing]
+
+    def _listing_entry(self, scheme):
+        """Browsing view of a scheme (get_all_schemes)"""
+        return {
+            "id": scheme.get("id"),
+            "name": scheme.get("name"),
+            "name_hi": scheme.get("name_hi", ""),
+            "description": scheme.get("description"),
+            "description_hi": scheme.get("description_hi", ""),
+            "eligibility": scheme.get("eligibility"),
+            "eligibility_hi": scheme.get("eligibility_hi", ""),
+            "category": scheme.get("category", "general"),
+            "ministry": scheme.get("ministry", ""),
+            "portal_url": scheme.get("portal_url", ""),
+            "next_steps": scheme.get("next_steps", []),
+            "next_steps_hi": scheme.get("next_steps_hi", []),
+            "documents": scheme.get("documents", []),
+            "documents_hi": scheme.get("documents_hi", []),
+        }
 
     def get_scheme_count(self):
         """Get count of active schemes"""
@@ -0,0 +1,171 @@
+"""
+Bulk request utilities
+Used by endpoints that take many rows at once (e.g. NGO caseworkers
+uploading a spreadsheet of cases) and stream many results back.
+- parse_rows: JSON Lines or CSV text -> list of dicts, one per row;
+  CSV columns like "senderInfo.name" become nested {"senderInfo": {"name": ...}}
+- read_request_rows: the rows of a bulk request, from a file upload, a raw
+  JSONL/CSV body or a JSON body {"rows": [...]}
+- stream_zip: yields a zip archive piece by piece as its entries are produced
+"""
+
+import io
+import csv
+import json
+import zipfile
+
+
+JSONL = 'jsonl'
+CSV = 'csv'
+
+_JSONL_TYPES = ('application/x-ndjson', 'application/jsonl', 'application/x-jsonlines', 'application/json-seq')
+_CSV_TYPES = ('text/csv', 'application/csv', 'application/vnd.ms-excel')
+
+
+def detect_format(filename='', content_type=''):
+    """'jsonl' or 'csv' from an upload's extension or content type, else None"""
+    extension = (filename or '').rsplit('.', 1)[-1].lower() if '.' in (filename or '') else ''
+    content_type = (content_type or '').split(';', 1)[0].strip().lower()
+    if extension in ('jsonl', 'ndjson') or content_type in _JSONL_TYPES:
+        return JSONL
+    if extension == 'csv' or content_type in _CSV_TYPES:
+        return CSV
+    return None
+
+
+def _nest_columns(row):
+    """{'senderInfo.name': 'x'} -> {'senderInfo': {'name': 'x'}}; blank cells are dropped"""
+    nested = {}
+    for column, value in row.items():
+        if column is None:
+            continue
+        value = (value or '').strip()
+        column = column.strip()
+        if not column or not value:
+            continue
+        if '.' in column:
+            parent, child = column.split('.', 1)
+            group = nested.setdefault(parent, {})
+            if isinstance(group, dict):
+                group[child] = value
+        else:
+            nested[column] = value
+    return nested
+
+
+def parse_rows(text, fmt, limit=None):
+    """
+    Rows of a JSONL or CSV document as a list of dicts, reading at most
+    limit rows. JSONL lines that aren't JSON objects are kept as None so
+    callers can report them by index. Raises ValueError for unreadable input.
+    """
+    text = text.lstrip('\ufeff')  # Excel writes a BOM in front of UTF-8 CSV
+    rows = []
+    if fmt == JSONL:
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            rows.append(row if isinstance(row, dict) else None)
+            if len(rows) == limit:
+                break
+    elif fmt == CSV:
+        try:
+            for row in csv.DictReader(io.StringIO(text)):
+                nested = _nest_columns(row)
+                if not nested:
+                    continue
+                rows.append(nested)
+                if len(rows) == limit:
+                    break
+        except csv.Error as e:
+            raise ValueError(f'Invalid CSV: {e}')
+    else:
+        raise ValueError(f'Unsupported format: {fmt}')
+    return rows
+
+
+def _row_error(error, message):
+    return None, {'success': False, 'error': error, 'message': message}
+
+
+def read_request_rows(request, limit, field='rows'):
+    """
+    Rows of a bulk request: an uploaded file in `field` (.jsonl/.csv), a raw
+    JSON Lines or CSV body, or a JSON body {"rows": [...]} (or a bare list).
+    Returns (list of row dicts / None for unreadable rows, None) or
+    (None, error dict) when nothing usable was sent or there are over limit rows.
+    """
+    upload = request.files.get(field)
+    if upload and upload.filename:
+        fmt = detect_format(upload.filename, upload.mimetype)
+        raw = upload.read()
+    elif request.is_json:
+        data = request.get_json(silent=True)
+        rows = data.get('rows') if isinstance(data, dict) else data
+        if not isinstance(rows, list) or not rows:
+            return _row_error('No rows provided', 'कृपया एक या अधिक पंक्तियाँ भेजें')
+        if len(rows) > limit:
+            return _row_error('Too many rows', f'एक बार में अधिकतम {limit} पंक्तियाँ भेजें')
+        return [row if isinstance(row, dict) else None for row in rows], None
+    else:
+        fmt = detect_format(content_type=request.mimetype)
+        raw = request.get_data()
+
+    if fmt is None:
+        return _row_error('Unsupported format', 'कृपया JSONL या CSV फ़ाइल भेजें')
+    try:
+        # One row past the limit is enough to reject the request
+        rows = parse_rows(raw.decode('utf-8-sig'), fmt, limit=limit + 1)
+    except UnicodeDecodeError:
+        return _row_error('File must be UTF-8 encoded', 'कृपया फ़ाइल UTF-8 में सेव करके भेजें')
+    except ValueError as e:
+        return _row_error(str(e), 'फ़ाइल पढ़ी नहीं जा सकी। कृपया सही JSONL या CSV भेजें।')
+    if not rows:
+        return _row_error('No rows provided', 'कृपया एक या अधिक पंक्तियाँ भेजें')
+    if len(rows) > limit:
+        return _row_error('Too many rows', f'एक बार में अधिकतम {limit} पंक्तियाँ भेजें')
+    return rows, None
+
+
+class _ZipBuffer:
+    """Write-only, unseekable sink: zipfile then writes sizes after each entry"""
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(entries):
+    """
+    Yield a deflated zip of (name, text) entries; each entry's bytes are
+    yielded as soon as it is added, so the archive is never held whole.
+    """
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, text in entries:
+            archive.writestr(name, text.encode('utf-8'))
+            data = buffer.drain()
+            if data:
+                yield data
+    # Central directory
+    yield buffer.drain()
@@ -0,0 +1,156 @@
+"""
+Entity Extraction Engine
+Precompiled extraction of legal entities from OCR text.
+- Every pattern is compiled once at import time
+- Each entity kind gets its own finditer() walk: entities often sit inside
+  one another (a date or PIN inside "Case No CS/801103/12-03-2024", a phone
+  in an address line) and one combined alternation never returns
+  overlapping matches
+- Addresses are anchored on the PIN code and read backwards from it,
+  so long OCR texts never trigger the old O(n^2) address scan
+"""
+
+import re
+
+
+# Each entry: (bucket in the result, patterns). A pattern may expose the
+# interesting part of the match as the named group 'value'; otherwise the
+# whole match is used. Buckets with several patterns are merged in text order.
+_ENTITY_PATTERNS = (
+    ('case_numbers', (
+        r'(?:case\s*no|ref\s*no|file\s*no|केस\s*नं|प्रकरण\s*क्रमांक)[.:]*\s*(?P<value>[A-Z0-9/\-]+)',
+    )),
+    ('fir_numbers', (
+        r'(?:fir\s*no|एफआईआर)[.:]*\s*(?P<value>[0-9][0-9/\-]*)',
+    )),
+    ('sections', (
+        r'(?:धारा|section|u/s)\s*(?P<value>[0-9]+(?:\s*[,/]\s*[0-9]+)*)',
+    )),
+    ('plot_numbers', (
+        r'(?:खसरा|plot|प्लॉट|खाता)\s*(?:नंबर|नं|no)?[.:]*\s*(?P<value>[0-9][0-9/\-]*)',
+    )),
+    ('names', (
+        r'(?:(?:name|नाम|applicant|complainant|petitioner|respondent)[:\s]+'
+        r'|(?:mr\.|ms\.|mrs\.|shri|smt\.?|श्रीमती|श्री)\s+)'
+        r'(?P<value>(?-i:[A-Z][a-z]+(?:[ \t]+(?!(?:Shri|Smt|Mr|Mrs|Ms)\b)[A-Z][a-z]+){0,2}))',
+    )),
+    ('amounts', (
+        r'(?:rs\.?|inr|₹|रु\.?|rupees)[.:]*\s*(?P<value>[0-9][0-9,]*(?:\.[0-9]+)?)',
+        r'(?P<value>[0-9][0-9,]*(?:\.[0-9]+)?)\s*(?:rupees|रुपये)',
+    )),
+    ('dates', (
+        r'\b(?:0?[1-9]|[12][0-9]|3[01])[/\-](?:0?[1-9]|1[0-2])[/\-](?:\d{4}|\d{2})\b'
+        r'|\b(?:0?[1-9]|[12][0-9]|3[01])\s+'
+        r'(?:january|february|march|april|may|june|july|august|september|october|november|december'
+        r'|जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+\d{2,4}\b',
+    )),
+    ('phones', (
+        r'(?:\+91[\-\s]?)?\b[6-9]\d{9}\b',
+    )),
+    ('emails', (
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
+    )),
+    ('pincodes', (
+        r'(?:(?:pin\s*code|pincode|pin|पिन\s*कोड|पिन)[:\s\-]*)?(?P<value>\b[1-9]\d{5}\b)',
+    )),
+)
+
+ENTITY_RES = tuple(
+    (bucket, tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns))
+    for bucket, patterns in _ENTITY_PATTERNS
+)
+
+MAX_DATES = 5
+MAX_ADDRESSES = 2
+# How far back from a PIN code we look for the rest of the address line
+ADDRESS_LOOKBACK = 100
+_ADDRESS_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789,.- \t'
+)
+
+RESUME_KEYWORDS = (
+    'resume', 'cv', 'curriculum vitae', 'objective', 'experience',
+    'education', 'skills', 'qualifications', 'career',
+    'रिज़्यूमे', 'अनुभव', 'शिक्षा', 'योग्यता',
+)
+SKILL_SECTION_RE = re.compile(r'(?:skills|technical\s*skills|कौशल)[:\s]*([^\n]+(?:\n[^\n]+){0,5})', re.IGNORECASE)
+SKILL_SPLIT_RE = re.compile(r'[,;•\n|]')
+EDUCATION_RE = re.compile(
+    r'(?:b\.?tech|m\.?tech|b\.?e|m\.?e|b\.?sc|m\.?sc|b\.?a|m\.?a|b\.?com|m\.?com|mba|bba|ph\.?d|12th|10th'
+    r'|graduation|post.?graduation)',
+    re.IGNORECASE,
+)
+EXPERIENCE_RE = re.compile(r'(\d+\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp))', re.IGNORECASE)
+
+
+def _empty_result():
+    return {
+        'names': [],
+        'dates': [],
+        'amounts': [],
+        'sections': [],
+        'case_numbers': [],
+        'fir_numbers': [],
+        'plot_numbers': [],
+        'phones': [],
+        'emails': [],
+        'pincodes': [],
+        'addresses': [],
+        'skills': [],
+        'education': [],
+        'experience': [],
+        'is_resume': False,
+    }
+
+
+def _address_before(text, start, end):
+    """Read the address line backwards from a PIN code match"""
+    stop = max(0, start - ADDRESS_LOOKBACK)
+    i = start
+    while i > stop and text[i - 1] in _ADDRESS_CHARS:
+        i -= 1
+    return text[i:end].strip(' \t,.-')
+
+
+def extract_entities(text):
+    """
+    Extract every entity type from text, one precompiled scan per type.
+    Returns a dict of lists (in order of appearance) plus resume details.
+    """
+    info = _empty_result()
+    if not text:
+        return info
+
+    for bucket, patterns in ENTITY_RES:
+        matches = [match for pattern in patterns for match in pattern.finditer(text)]
+        if len(patterns) > 1:
+            matches.sort(key=lambda match: match.start())
+        for match in matches:
+            value = match.group('value') if 'value' in match.re.groupindex else match.group()
+
+            if bucket == 'pincodes' and len(info['addresses']) < MAX_ADDRESSES:
+                address = _address_before(text, match.start(), match.end())
+                if address:
+                    info['addresses'].append(address)
+
+            info[bucket].append(value)
+
+    info['dates'] = list(dict.fromkeys(info['dates']))[:MAX_DATES]
+
+    text_lower = text.lower()
+    if sum(1 for kw in RESUME_KEYWORDS if kw in text_lower) >= 3:
+        info['is_resume'] = True
+        _extract_resume_details(text, info)
+
+    return info
+
+
+def _extract_resume_details(text, info):
+    """Skills, education and experience - only run for resumes"""
+    skill_section = SKILL_SECTION_RE.search(text)
+    if skill_section:
+        skills = SKILL_SPLIT_RE.split(skill_section.group(1))
+        info['skills'] = [s.strip() for s in skills if s.strip() and len(s.strip()) < 30][:10]
+
+    info['education'] = list(dict.fromkeys(EDUCATION_RE.findall(text)))[:5]
+    info['experience'] = EXPERIENCE_RE.findall(text)[:3]
@@ -3,6 +3,7 @@ Helper utilities for the application
 """
 
 import os
+import json
 from werkzeug.utils import secure_filename
 
 # Allowed file extensions
@@ -11,6 +12,12 @@ ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'pdf', 'doc', 'docx'}
 # Maximum file size (16 MB)
 MAX_FILE_SIZE = 16 * 1024 * 1024
 
+# Headers for streamed SSE responses (no caching, no proxy buffering)
+SSE_HEADERS = {
+    'Cache-Control': 'no-cache',
+    'X-Accel-Buffering': 'no'
+}
+
 
 def allowed_file(filename):
     """
@@ -116,3 +123,11 @@ def generate_unique_filename(original_filename):
     ext = get_file_extension(original_filename)
     unique_id = str(uuid.uuid4())[:8]
     return f"{unique_id}.{ext}" if ext else unique_id
+
+
+def format_sse(event, data):
+    """
+    Format one Server-Sent Event (text/event-stream) with a JSON payload
+    """
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
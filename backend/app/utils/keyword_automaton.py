@@ -0,0 +1,104 @@
+"""
+Keyword Automaton
+Aho-Corasick multi-pattern matcher used to score text against labelled
+keyword lists (document types, resume hints, ...) in one linear pass.
+- Built once from {label: [keywords]}; Hindi and English keywords mix freely
+- Matching is case-insensitive and counts each distinct keyword once,
+  which is the same scoring rule as the old `keyword in text` loops
+"""
+
+from collections import deque
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over labelled keywords"""
+
+    def __init__(self, keywords_by_label):
+        self.labels = list(keywords_by_label)
+        self.keywords = []
+        # keyword index -> labels the keyword counts towards
+        self._keyword_labels = []
+
+        index_of = {}
+        for label, keywords in keywords_by_label.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                if keyword not in index_of:
+                    index_of[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self._keyword_labels.append([])
+                labels = self._keyword_labels[index_of[keyword]]
+                if label not in labels:
+                    labels.append(label)
+
+        self._build()
+
+    def _build(self):
+        goto = [{}]
+        output = [set()]
+
+        for idx, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append(set())
+                state = nxt
+            output[state].add(idx)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt] |= output[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(sorted(o)) for o in output]
+
+    def find(self, text):
+        """Return the set of keyword indices present in text"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        root = goto[0]
+
+        found = set()
+        state = 0
+        for ch in text.lower():
+            if state == 0:
+                state = root.get(ch, 0)
+            else:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def score(self, text):
+        """Return {label: number of distinct keywords of that label found in text}"""
+        scores = dict.fromkeys(self.labels, 0)
+        for idx in self.find(text):
+            for label in self._keyword_labels[idx]:
+                scores[label] += 1
+        return scores
+
+    def matches(self, text):
+        """Return {label: [matched keywords]} - handy for explaining a score"""
+        matched = {label: [] for label in self.labels}
+        for idx in sorted(self.find(text)):
+            for label in self._keyword_labels[idx]:
+                matched[label].append(self.keywords[idx])
+        return matched
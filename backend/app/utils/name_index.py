@@ -0,0 +1,172 @@
+"""
+Name Index
+Exact and typo-tolerant lookup of place names typed in English or Devanagari.
+- normalize_name: case-folded, punctuation and ZWJ/ZWNJ dropped, Latin
+  accents, nukta and chandrabindu folded, so "मुजफ्फरपुर" and "मुज़फ़्फ़रपुर"
+  (or "Bengaluru" and "BENGALURU.") key the same
+- BKTree: metric tree over Levenshtein distance; a fuzzy lookup only visits
+  branches that can hold a name within the allowed distance
+- NameIndex: {normalized name: ids} for hash lookups, the same names in a
+  BK-tree for "Varansi"-style typos, and a substring scan over the
+  pre-normalized names for partial input
+"""
+
+import re
+import unicodedata
+
+# Runs of punctuation/whitespace between words, for English and Devanagari text.
+# \W alone would also split words at Devanagari vowel signs (they aren't alphanumeric)
+WORD_SEPARATOR_RE = re.compile('[^\\w\u0900-\u0963\u0966-\u097f]+|_+')
+_LATIN_ACCENT_RE = re.compile('[\u0300-\u036f]')
+_NUKTA = '\u093c'
+_CHANDRABINDU = '\u0901'
+_ANUSVARA = '\u0902'
+_ZERO_WIDTH_RE = re.compile('[\u200c\u200d]')
+
+
+def normalize_name(text):
+    """Canonical form of a place name used as the index key"""
+    text = unicodedata.normalize('NFD', text or '')
+    text = _LATIN_ACCENT_RE.sub('', text).replace(_NUKTA, '').replace(_CHANDRABINDU, _ANUSVARA)
+    text = _ZERO_WIDTH_RE.sub('', text)
+    return ' '.join(WORD_SEPARATOR_RE.sub(' ', unicodedata.normalize('NFC', text).casefold()).split())
+
+
+def levenshtein(a, b):
+    """
+    Edit distance, bit-parallel (Myers/Hyyrö): one pass over a with the
+    columns of the DP table for b packed into an int, instead of len(a) * len(b) cells.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    peq = {}
+    for i, ch in enumerate(b):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    full = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    pv, mv, score = full, 0, len(b)
+    for ch in a:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv & full
+    return score
+
+
+def typo_tolerance(name):
+    """Edits allowed when fuzzy-matching a name of this length"""
+    length = len(name)
+    if length < 4:
+        return 0
+    if length <= 8:
+        return 1
+    return 2
+
+
+class BKTree:
+    """Burkhard-Keller tree of strings under Levenshtein distance"""
+
+    def __init__(self, words=()):
+        self._root = None  # [word, {distance: child}]
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        if self._root is None:
+            self._root = [word, {}]
+            self.size = 1
+            return
+        node = self._root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word, max_distance):
+        """(distance, word) pairs within max_distance, closest first"""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= max_distance:
+                found.append((distance, node_word))
+            # Triangle inequality: only children at distance +- max_distance can match
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        return sorted(found)
+
+
+class NameIndex:
+    """Normalized names mapped to ids, with exact, substring and fuzzy lookup"""
+
+    def __init__(self, names):
+        # names: iterable of (name, id); several names may share an id and vice versa
+        ids = {}
+        for name, item_id in names:
+            key = normalize_name(name)
+            if key:
+                ids.setdefault(key, set()).add(item_id)
+        self._ids = {key: tuple(sorted(found)) for key, found in ids.items()}
+        self._tree = BKTree(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def exact(self, name):
+        """Ids whose name normalizes to the same key"""
+        return self._ids.get(normalize_name(name), ())
+
+    def containing(self, name, both_ways=False):
+        """
+        Ids of names containing the query; with both_ways, also of names that
+        appear in the query as whole words ("Patna" in "Patna City", not "Kashi"
+        in "Kashipur").
+        """
+        key = normalize_name(name)
+        if not key:
+            return ()
+        padded = f' {key} '
+        found = set()
+        for indexed, ids in self._ids.items():
+            if key in indexed or (both_ways and f' {indexed} ' in padded):
+                found.update(ids)
+        return tuple(sorted(found))
+
+    def fuzzy(self, name, max_distance=None):
+        """Ids of the closest names within max_distance edits (default: typo_tolerance)"""
+        key = normalize_name(name)
+        if max_distance is None:
+            max_distance = typo_tolerance(key)
+        if not key or max_distance <= 0:
+            return ()
+        matches = self._tree.search(key, max_distance)
+        if not matches:
+            return ()
+        best = matches[0][0]
+        return tuple(sorted({i for distance, word in matches if distance == best for i in self._ids[word]}))
@@ -0,0 +1,111 @@
+"""
+Offline pincode directory
+Every Indian pincode mapped to its district, state and an approximate centre,
+bundled as app/data/pincodes.csv.gz (built by build_pincode_table.py from the
+India Post directory), so resolving a pincode needs no network call.
+- The file is read once into sorted parallel arrays (~19.5k pincodes, a few
+  hundred KB); lookup() is a binary search
+- District/state pairs are stored once and referenced by id
+- is_valid_pincode: 6 digits, not starting with 0
+"""
+
+import os
+import re
+import csv
+import gzip
+import math
+import bisect
+import logging
+import threading
+from array import array
+
+logger = logging.getLogger(__name__)
+
+PINCODE_TABLE_PATH = os.environ.get(
+    'PINCODE_TABLE_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'pincodes.csv.gz')
+)
+
+PINCODE_TABLE_COLUMNS = ('pincode', 'district', 'state', 'lat', 'lng')
+
+_PINCODE_RE = re.compile(r'^[1-9][0-9]{5}$')
+
+
+def is_valid_pincode(pincode):
+    return isinstance(pincode, str) and _PINCODE_RE.match(pincode) is not None
+
+
+class PincodeTable:
+    """Read-only pincode -> (district, state, lat, lng) table with binary-search lookup"""
+
+    def __init__(self, rows=()):
+        # rows: (pincode, district, state, lat, lng); lat/lng may be None
+        self.places = []  # (district, state), referenced by id
+        place_ids = {}
+        self._pincodes = array('I')
+        self._place_ids = array('H')
+        self._lat = array('f')  # NaN when the pincode has no coordinates
+        self._lng = array('f')
+
+        for pincode, district, state, lat, lng in sorted(rows, key=lambda row: int(row[0])):
+            code = int(pincode)
+            if self._pincodes and self._pincodes[-1] == code:
+                continue
+            place = (district, state)
+            if place not in place_ids:
+                place_ids[place] = len(self.places)
+                self.places.append(place)
+            self._pincodes.append(code)
+            self._place_ids.append(place_ids[place])
+            self._lat.append(math.nan if lat is None else lat)
+            self._lng.append(math.nan if lng is None else lng)
+
+    @classmethod
+    def load(cls, path=PINCODE_TABLE_PATH):
+        """Table from a gzipped CSV with PINCODE_TABLE_COLUMNS (header row first)"""
+        with gzip.open(path, 'rt', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            return cls(
+                (pincode, district, state, float(lat) if lat else None, float(lng) if lng else None)
+                for pincode, district, state, lat, lng in reader
+            )
+
+    def __len__(self):
+        return len(self._pincodes)
+
+    def lookup(self, pincode):
+        """{pincode, district, state, lat, lng} for a known pincode, else None"""
+        if not is_valid_pincode(pincode):
+            return None
+        code = int(pincode)
+        i = bisect.bisect_left(self._pincodes, code)
+        if i == len(self._pincodes) or self._pincodes[i] != code:
+            return None
+        district, state = self.places[self._place_ids[i]]
+        lat, lng = self._lat[i], self._lng[i]
+        return {
+            'pincode': pincode,
+            'district': district,
+            'state': state,
+            'lat': None if math.isnan(lat) else round(lat, 4),
+            'lng': None if math.isnan(lng) else round(lng, 4)
+        }
+
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def get_pincode_table():
+    """Process-wide table, loaded on first use; empty if the bundled file is missing"""
+    global _table
+    with _table_lock:
+        if _table is None:
+            try:
+                _table = PincodeTable.load()
+                logger.info("Loaded %d pincodes from %s", len(_table), PINCODE_TABLE_PATH)
+            except (OSError, ValueError, csv.Error) as e:
+                logger.warning("Offline pincode table unavailable (%s), using India Post API only", e)
+                _table = PincodeTable()
+        return _table
@@ -0,0 +1,53 @@
+"""
+Prefix Trie
+Type-ahead completion over a fixed set of names.
+- Built once from (key, rank, item_id, value) entries; lower rank is better
+- Every node keeps its best top_k completions (one per item_id), computed
+  bottom-up at build time, so complete() is a walk of len(prefix) steps
+  and a slice, however many names share the prefix
+"""
+
+
+class PrefixTrie:
+    """Static trie with precomputed top-k completions per node"""
+
+    def __init__(self, entries, top_k=10):
+        self.top_k = top_k
+        self.size = 0
+        self._root = ({}, [])  # (children by character, [(rank, item_id, value)])
+        for key, rank, item_id, value in entries:
+            node = self._root
+            for ch in key:
+                node = node[0].setdefault(ch, ({}, []))
+            node[1].append((rank, item_id, value))
+            self.size += 1
+        self._collect_best()
+
+    def _collect_best(self):
+        # Post-order without recursion: children are finished before their parent
+        order = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node[0].values())
+        for children, best in reversed(order):
+            candidates = best + [entry for child in children.values() for entry in child[1]]
+            candidates.sort(key=lambda entry: entry[0])
+            seen = set()
+            best.clear()
+            for rank, item_id, value in candidates:
+                if item_id not in seen:
+                    seen.add(item_id)
+                    best.append((rank, item_id, value))
+                    if len(best) == self.top_k:
+                        break
+
+    def complete(self, prefix, limit=None):
+        """Up to limit (item_id, value) pairs for keys starting with prefix, best first"""
+        node = self._root
+        for ch in prefix:
+            node = node[0].get(ch)
+            if node is None:
+                return []
+        return [(item_id, value) for _, item_id, value in node[1][:limit or self.top_k]]
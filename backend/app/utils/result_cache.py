@@ -0,0 +1,169 @@
+"""
+Two-tier result cache
+In-process LRU in front of a MongoDB collection with per-document expiry,
+for results that are slow or costly to recompute (AI drafts, lookups, ...).
+- cache_key: deterministic key over normalized input fields
+- TieredCache: get/set across both tiers; a Mongo hit is promoted to memory
+- Each entry remembers how long it took to compute, so stats() can report
+  the latency saved by hits as well as hit ratios per tier
+"""
+
+import copy
+import json
+import hashlib
+import logging
+import threading
+import unicodedata
+from datetime import datetime, timedelta
+
+from app.utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def normalize_text(text):
+    """NFC-normalize and collapse whitespace, so re-typed text keys the same"""
+    return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+
+def _normalize_field(value):
+    if isinstance(value, str):
+        return normalize_text(value)
+    if isinstance(value, dict):
+        # Empty fields are dropped, so {} and {'name': ''} key the same
+        normalized = {k: _normalize_field(v) for k, v in value.items()}
+        return {k: v for k, v in sorted(normalized.items()) if v not in ('', None, {}, [])}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_field(v) for v in value]
+    return value
+
+
+def cache_key(namespace, **fields):
+    """Deterministic key: namespace + sha256 of the normalized fields"""
+    payload = json.dumps(_normalize_field(fields), sort_keys=True, ensure_ascii=False)
+    return f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class TieredCache:
+    """LRU (tier 1) + MongoDB (tier 2) cache for JSON-like values"""
+
+    def __init__(self, namespace, collection_name='result_cache', maxsize=512, ttl=24 * 3600,
+                 collection=None, use_mongo=True):
+        self.namespace = namespace
+        self.collection_name = collection_name
+        self.ttl = ttl
+        self._memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        # collection may be injected (tests); otherwise it is looked up on first use
+        self._collection = collection
+        self._collection_checked = collection is not None or not use_mongo
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.mongo_hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+
+    def _get_collection(self):
+        with self._lock:
+            if self._collection_checked:
+                return self._collection
+            self._collection_checked = True
+        try:
+            from app.config.mongodb import get_db
+            db = get_db()
+            if db is not None:
+                collection = db[self.collection_name]
+                # Documents are removed by Mongo once expiresAt has passed
+                collection.create_index('expiresAt', expireAfterSeconds=0)
+                self._collection = collection
+        except Exception as e:
+            logger.warning("MongoDB not available for %s cache, using memory only: %s", self.namespace, e)
+        return self._collection
+
+    def get(self, key):
+        """Cached value (a private copy) or None"""
+        entry = self._memory.get(key, _MISSING)
+        if entry is not _MISSING:
+            self._record_hit('memory', entry['latency'])
+            return copy.deepcopy(entry['value'])
+
+        entry = self._mongo_get(key)
+        if entry is not None:
+            # Only for what is left of the entry's own lifetime (a short negative
+            # entry written by another worker must not live for the default ttl)
+            remaining = entry.pop('ttl')
+            self._memory.set(key, entry, ttl=remaining)
+            self._record_hit('mongo', entry['latency'])
+            return copy.deepcopy(entry['value'])
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value, latency=0.0, ttl=None):
+        """Store value in both tiers; latency = seconds it took to compute, ttl overrides the default"""
+        ttl = self.ttl if ttl is None else ttl
+        entry = {'value': copy.deepcopy(value), 'latency': latency}
+        self._memory.set(key, entry, ttl=ttl)
+        collection = self._get_collection()
+        if collection is None:
+            return
+        now = datetime.utcnow()
+        try:
+            collection.replace_one({'_id': key}, {
+                '_id': key,
+                'namespace': self.namespace,
+                'value': entry['value'],
+                'latency': latency,
+                'createdAt': now,
+                'expiresAt': now + timedelta(seconds=ttl)
+            }, upsert=True)
+        except Exception as e:
+            logger.warning("Could not write %s cache entry to MongoDB: %s", self.namespace, e)
+
+    def _mongo_get(self, key):
+        collection = self._get_collection()
+        if collection is None:
+            return None
+        try:
+            # The TTL monitor runs about once a minute, so expiry is checked here too
+            now = datetime.utcnow()
+            doc = collection.find_one({'_id': key, 'expiresAt': {'$gt': now}})
+        except Exception as e:
+            logger.warning("Could not read %s cache entry from MongoDB: %s", self.namespace, e)
+            return None
+        if doc is None:
+            return None
+        return {
+            'value': doc['value'],
+            'latency': doc.get('latency', 0.0),
+            'ttl': max((doc['expiresAt'] - now).total_seconds(), 0.0)
+        }
+
+    def _record_hit(self, tier, latency):
+        with self._lock:
+            if tier == 'memory':
+                self.memory_hits += 1
+            else:
+                self.mongo_hits += 1
+            self.latency_saved += latency
+
+    def clear(self):
+        """Drop the in-memory tier (Mongo entries expire on their own)"""
+        self._memory.clear()
+
+    def stats(self):
+        with self._lock:
+            hits = self.memory_hits + self.mongo_hits
+            lookups = hits + self.misses
+            return {
+                'memoryHits': self.memory_hits,
+                'mongoHits': self.mongo_hits,
+                'misses': self.misses,
+                'hitRatio': round(hits / lookups, 3) if lookups else 0.0,
+                'latencySavedSeconds': round(self.latency_saved, 3),
+                'avgLatencySavedMs': round(self.latency_saved / hits * 1000, 1) if hits else 0.0,
+                'memorySize': len(self._memory),
+                'mongo': self._collection is not None
+            }
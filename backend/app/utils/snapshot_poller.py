@@ -0,0 +1,46 @@
+"""
+Snapshot Poller
+Keeps a process-local snapshot of MongoDB-backed data fresh without putting
+the database on the request path.
+- A daemon thread calls refresh() every interval seconds; refresh() is
+  expected to compare a cheap version stamp and rebuild only when it changed
+- Errors are logged and the current snapshot stays in place until the next tick
+- VERSIONS_COLLECTION: one {_id: <dataset>, version} document per dataset,
+  bumped by writers; reading it is the cheap check
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_COLLECTION = 'data_versions'
+
+
+class SnapshotPoller:
+    """Background thread calling refresh() periodically until stop()"""
+
+    def __init__(self, name, refresh, interval):
+        self.name = name
+        self.interval = interval
+        self._refresh = refresh
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f'{self.name}-poller', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._refresh()
+            except Exception as e:
+                logger.warning("Refreshing %s snapshot failed, keeping the current one: %s", self.name, e)
@@ -0,0 +1,240 @@
+"""
+Spatial index over points on the Earth's surface
+Points are stored as 3D unit vectors in a KD-tree. Straight-line (chord)
+distance between unit vectors grows monotonically with great-circle distance,
+so nearest-neighbour and radius queries are exact, with no special cases near
+the poles or the antimeridian.
+- SpatialIndex(points): built once from (lat, lng) pairs
+- nearest(lat, lng, k, max_km): the k closest points as (distance_km, index)
+- within(lat, lng, radius_km): every point inside the radius, closest first
+- CoordinateTable: the same points as contiguous NumPy arrays, for ranking a
+  candidate subset with one vectorized Haversine call and argpartition, or the
+  nearest points of many query positions at once (nearest_many)
+- haversine_km: great-circle distance between two coordinates
+"""
+
+import math
+import heapq
+
+# NumPy is optional: without it CoordinateTable ranks candidates with a scalar loop
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+EARTH_RADIUS_KM = 6371.0
+# Query rows per distance matrix in nearest_many (bounds memory to rows x points floats)
+NEAREST_MANY_CHUNK = 2048
+
+
+def to_unit_vector(lat, lng):
+    lat = math.radians(lat)
+    lng = math.radians(lng)
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lng), cos_lat * math.sin(lng), math.sin(lat))
+
+
+def chord_sq_to_km(chord_sq):
+    """Great-circle distance for a squared chord length on the unit sphere"""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(chord_sq) / 2))
+
+
+def km_to_chord_sq(km):
+    """Squared unit-sphere chord length for a great-circle distance"""
+    return (2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)) ** 2
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance between two coordinates (Haversine formula)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lng = math.radians(lng2 - lng1)
+
+    a = (math.sin(delta_lat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+class SpatialIndex:
+    """Static KD-tree over (lat, lng) points; query results refer to points by position"""
+
+    def __init__(self, points):
+        self.size = len(points)
+        self._vectors = [to_unit_vector(lat, lng) for lat, lng in points]
+        # Implicit tree: the node of range [lo, hi) is at its middle, split on axis depth % 3
+        self._order = list(range(self.size))
+        self._build(0, self.size, 0)
+
+    def _build(self, lo, hi, axis):
+        if hi - lo <= 1:
+            return
+        vectors = self._vectors
+        self._order[lo:hi] = sorted(self._order[lo:hi], key=lambda i: vectors[i][axis])
+        mid = (lo + hi) // 2
+        next_axis = (axis + 1) % 3
+        self._build(lo, mid, next_axis)
+        self._build(mid + 1, hi, next_axis)
+
+    def nearest(self, lat, lng, k=1, max_km=None):
+        """Up to k (distance_km, index) pairs, closest first, optionally within max_km"""
+        if k <= 0 or not self.size:
+            return []
+        limit = km_to_chord_sq(max_km) if max_km is not None else math.inf
+        best = []  # max-heap of (-chord_sq, index)
+        self._nearest(to_unit_vector(lat, lng), 0, self.size, 0, k, limit, best)
+        return sorted((chord_sq_to_km(-neg), index) for neg, index in best)
+
+    def _nearest(self, query, lo, hi, axis, k, limit, best):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        index = self._order[mid]
+        vector = self._vectors[index]
+        dist = (query[0] - vector[0]) ** 2 + (query[1] - vector[1]) ** 2 + (query[2] - vector[2]) ** 2
+        if dist <= limit:
+            if len(best) < k:
+                heapq.heappush(best, (-dist, index))
+            elif dist < -best[0][0]:
+                heapq.heapreplace(best, (-dist, index))
+
+        diff = query[axis] - vector[axis]
+        next_axis = (axis + 1) % 3
+        if diff < 0:
+            near, far = (lo, mid), (mid + 1, hi)
+        else:
+            near, far = (mid + 1, hi), (lo, mid)
+        self._nearest(query, near[0], near[1], next_axis, k, limit, best)
+        # The far side can only help if the splitting plane is closer than the current bound
+        bound = -best[0][0] if len(best) == k else limit
+        if diff * diff <= bound:
+            self._nearest(query, far[0], far[1], next_axis, k, limit, best)
+
+    def within(self, lat, lng, radius_km):
+        """All (distance_km, index) pairs within radius_km, closest first"""
+        if not self.size:
+            return []
+        found = []
+        self._within(to_unit_vector(lat, lng), 0, self.size, 0, km_to_chord_sq(radius_km), found)
+        return sorted((chord_sq_to_km(dist), index) for dist, index in found)
+
+    def _within(self, query, lo, hi, axis, limit, found):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        index = self._order[mid]
+        vector = self._vectors[index]
+        dist = (query[0] - vector[0]) ** 2 + (query[1] - vector[1]) ** 2 + (query[2] - vector[2]) ** 2
+        if dist <= limit:
+            found.append((dist, index))
+
+        diff = query[axis] - vector[axis]
+        next_axis = (axis + 1) % 3
+        if diff < 0 or diff * diff <= limit:
+            self._within(query, lo, mid, next_axis, limit, found)
+        if diff >= 0 or diff * diff <= limit:
+            self._within(query, mid + 1, hi, next_axis, limit, found)
+
+
+class CoordinateTable:
+    """
+    (lat, lng) points stored as contiguous arrays with radians and cos(lat)
+    precomputed, so distances to any subset of them take one vectorized call.
+    """
+
+    def __init__(self, points):
+        self.size = len(points)
+        if NUMPY_AVAILABLE:
+            coords = np.radians(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+            self._lat = np.ascontiguousarray(coords[:, 0])
+            self._lng = np.ascontiguousarray(coords[:, 1])
+            self._cos_lat = np.cos(self._lat)
+            # Unit vectors (3 x points) for nearest_many: ranking is a matrix product
+            self._vectors = np.stack((self._cos_lat * np.cos(self._lng),
+                                      self._cos_lat * np.sin(self._lng),
+                                      np.sin(self._lat)))
+        else:
+            self._lat = [math.radians(lat) for lat, _ in points]
+            self._lng = [math.radians(lng) for _, lng in points]
+            self._cos_lat = [math.cos(lat) for lat in self._lat]
+
+    def distances(self, lat, lng, indices=None):
+        """Great-circle km from (lat, lng) to every point, or to the points at indices"""
+        lat = math.radians(lat)
+        lng = math.radians(lng)
+        cos_q = math.cos(lat)
+        if not NUMPY_AVAILABLE:
+            positions = range(self.size) if indices is None else indices
+            return [self._scalar_distance(lat, lng, cos_q, i) for i in positions]
+
+        if indices is None:
+            lat2, lng2, cos2 = self._lat, self._lng, self._cos_lat
+        else:
+            lat2, lng2, cos2 = self._lat[indices], self._lng[indices], self._cos_lat[indices]
+        a = np.sin((lat2 - lat) * 0.5) ** 2 + cos_q * cos2 * np.sin((lng2 - lng) * 0.5) ** 2
+        return (2 * EARTH_RADIUS_KM) * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    def _scalar_distance(self, lat, lng, cos_q, i):
+        a = (math.sin((self._lat[i] - lat) * 0.5) ** 2 +
+             cos_q * self._cos_lat[i] * math.sin((self._lng[i] - lng) * 0.5) ** 2)
+        return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+    def nearest(self, lat, lng, k, indices=None, max_km=None):
+        """Up to k (distance_km, index) pairs among indices (default: all points), closest first"""
+        if k <= 0:
+            return []
+        if not NUMPY_AVAILABLE:
+            positions = range(self.size) if indices is None else indices
+            pairs = zip(self.distances(lat, lng, positions), positions)
+            if max_km is not None:
+                pairs = [(d, i) for d, i in pairs if d <= max_km]
+            return heapq.nsmallest(k, pairs)
+
+        positions = np.arange(self.size) if indices is None else np.asarray(indices, dtype=np.intp)
+        if not positions.size:
+            return []
+        dist = self.distances(lat, lng, positions)
+        if max_km is not None:
+            keep = dist <= max_km
+            dist, positions = dist[keep], positions[keep]
+        # Only the k smallest are ordered; the rest of the candidates are never sorted
+        if k < dist.size:
+            top = np.argpartition(dist, k - 1)[:k]
+        else:
+            top = np.arange(dist.size)
+        top = top[np.argsort(dist[top], kind='stable')]
+        return list(zip(dist[top].tolist(), positions[top].tolist()))
+
+    def nearest_many(self, lats, lngs, k=1):
+        """
+        For each (lat, lng) query, its k nearest points as (distance_km, index)
+        pairs, closest first. Per chunk of queries, one matrix product of unit
+        vectors ranks every point (a larger dot product is a shorter great-circle
+        distance); only the k picked per query are converted to km.
+        """
+        k = min(k, self.size)
+        if k <= 0:
+            return [[] for _ in lats]
+        if not NUMPY_AVAILABLE:
+            return [self.nearest(lat, lng, k) for lat, lng in zip(lats, lngs)]
+
+        query_lat = np.radians(np.asarray(lats, dtype=np.float64))
+        query_lng = np.radians(np.asarray(lngs, dtype=np.float64))
+        cos_lat = np.cos(query_lat)
+        queries = np.column_stack((cos_lat * np.cos(query_lng), cos_lat * np.sin(query_lng), np.sin(query_lat)))
+        results = []
+        for start in range(0, len(queries), NEAREST_MANY_CHUNK):
+            neg_dot = -(queries[start:start + NEAREST_MANY_CHUNK] @ self._vectors)
+            if k < self.size:
+                top = np.argpartition(neg_dot, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(self.size), neg_dot.shape)
+            top_neg = np.take_along_axis(neg_dot, top, axis=1)
+            order = np.argsort(top_neg, axis=1, kind='stable')
+            top = np.take_along_axis(top, order, axis=1)
+            # Chord length is sqrt(2 - 2 dot); great-circle km from that
+            chord = np.sqrt(np.maximum(2.0 + 2.0 * np.take_along_axis(top_neg, order, axis=1), 0.0))
+            dist = (2 * EARTH_RADIUS_KM) * np.arcsin(np.minimum(chord * 0.5, 1.0))
+            results.extend(list(zip(d, i)) for d, i in zip(dist.tolist(), top.tolist()))
+        return results
@@ -0,0 +1,242 @@
+"""
+Hinglish Transliteration
+Converts common Romanised Hindi (Hinglish) words to Devanagari.
+- The word table is built once at import and frozen (read-only)
+- Tokens are split into word and punctuation by one precompiled pattern;
+  number+unit tokens like "1lakh" become "1 लाख"
+- Per-word conversions are memoised, so repeated vocabulary costs one
+  dict lookup; used by drafts, tips search and chatbot matching
+"""
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# Common legal/complaint words, one Hinglish token per key ("uske baad" is
+# converted word by word)
+HINGLISH_MAP = MappingProxyType({
+    # Pronouns & common words
+    'mere': 'मेरे', 'mera': 'मेरा', 'meri': 'मेरी', 'mujhe': 'मुझे',
+    'mujhse': 'मुझसे', 'mai': 'मैं', 'main': 'मैं', 'maine': 'मैंने',
+    'hum': 'हम', 'humne': 'हमने', 'humara': 'हमारा', 'humare': 'हमारे',
+    'hamari': 'हमारी', 'hamare': 'हमारे', 'hamara': 'हमारा',
+    'uska': 'उसका', 'uski': 'उसकी', 'uske': 'उसके', 'unka': 'उनका',
+    'unki': 'उनकी', 'unke': 'उनके', 'usne': 'उसने', 'unhone': 'उन्होंने',
+    'wo': 'वो', 'woh': 'वह', 'ye': 'यह', 'yeh': 'यह',
+    'koi': 'कोई', 'kisi': 'किसी', 'kisne': 'किसने',
+    'apna': 'अपना', 'apni': 'अपनी', 'apne': 'अपने',
+
+    # Verbs
+    'hai': 'है', 'hain': 'हैं', 'tha': 'था', 'thi': 'थी', 'the': 'थे',
+    'ho': 'हो', 'hua': 'हुआ', 'hui': 'हुई', 'hue': 'हुए',
+    'gaya': 'गया', 'gayi': 'गई', 'gai': 'गई', 'gaye': 'गए',
+    'kiya': 'किया', 'kiye': 'किए', 'ki': 'की', 'ka': 'का', 'ke': 'के',
+    'kar': 'कर', 'karna': 'करना', 'karte': 'करते', 'karti': 'करती',
+    'karke': 'करके', 'karenge': 'करेंगे',
+    'diya': 'दिया', 'diye': 'दिए', 'di': 'दी', 'de': 'दे', 'dena': 'देना',
+    'liya': 'लिया', 'liye': 'लिए', 'li': 'ली', 'le': 'ले', 'lena': 'लेना',
+    'lekr': 'लेकर', 'lekar': 'लेकर', 'leker': 'लेकर',
+    'chahiye': 'चाहिए', 'chaiye': 'चाहिए', 'chahie': 'चाहिए',
+    'chahta': 'चाहता', 'chahti': 'चाहती', 'chahte': 'चाहते',
+    'sakta': 'सकता', 'sakti': 'सकती', 'sakte': 'सकते',
+    'pata': 'पता', 'maloom': 'मालूम', 'malum': 'मालूम',
+    'kharch': 'खर्च', 'kharcha': 'खर्चा', 'kharche': 'खर्चे',
+    'kitna': 'कितना', 'kitni': 'कितनी', 'kitne': 'कितने',
+    'jitna': 'जितना', 'jitni': 'जितनी', 'jitne': 'जितने',
+    'utna': 'उतना', 'utni': 'उतनी', 'utne': 'उतने',
+    'sabhi': 'सभी', 'sab': 'सब',
+    'poora': 'पूरा', 'pura': 'पूरा', 'puri': 'पूरी', 'pure': 'पूरे',
+    'sahi': 'सही', 'galat': 'गलत',
+    'zaroor': 'ज़रूर', 'jaroor': 'ज़रूर', 'zaruri': 'ज़रूरी',
+    'pehle': 'पहले', 'pahle': 'पहले',
+    'baad': 'बाद', 'iske': 'इसके',
+    'kuch': 'कुछ', 'kuchh': 'कुछ',
+    'jaise': 'जैसे', 'waise': 'वैसे',
+    'tarah': 'तरह', 'prakar': 'प्रकार',
+    'raha': 'रहा', 'rahi': 'रही', 'rahe': 'रहे',
+    'rhe': 'रहे', 'rha': 'रहा', 'rhi': 'रही',
+    'aaya': 'आया', 'aayi': 'आई', 'aaye': 'आए',
+    'aae': 'आए', 'aai': 'आई',
+    'chale': 'चले', 'chala': 'चला', 'chali': 'चली',
+    'bola': 'बोला', 'boli': 'बोली', 'bole': 'बोले', 'bolte': 'बोलते',
+    'bulaya': 'बुलाया', 'bulayi': 'बुलाई', 'bulaye': 'बुलाए',
+    'bulana': 'बुलाना', 'bulata': 'बुलाता', 'bulati': 'बुलाती',
+    'maara': 'मारा', 'maari': 'मारी', 'maar': 'मार',
+    'marta': 'मारता', 'marti': 'मारती', 'marte': 'मारते',
+    'toda': 'तोड़ा', 'todi': 'तोड़ी', 'tod': 'तोड़', 'todke': 'तोड़कर',
+    'todta': 'तोड़ता', 'todti': 'तोड़ती',
+    'dekha': 'देखा', 'dekhi': 'देखी', 'dekhe': 'देखे',
+    'dekhta': 'देखता', 'dekhti': 'देखती',
+    'suna': 'सुना', 'suni': 'सुनी', 'sunwai': 'सुनवाई',
+    'sunta': 'सुनता', 'sunti': 'सुनती', 'sunte': 'सुनते',
+    'bataya': 'बताया', 'bataye': 'बताए',
+    'batata': 'बताता', 'batati': 'बताती',
+    'bhaga': 'भागा', 'bhag': 'भाग', 'bhaag': 'भाग',
+    'bhagta': 'भागता', 'bhagti': 'भागती',
+    'farar': 'फरार',
+    'maang': 'माँग', 'maanga': 'माँगा', 'maangi': 'माँगी',
+    'maangta': 'माँगता', 'maangti': 'माँगती',
+    'rok': 'रोक', 'roka': 'रोका', 'roki': 'रोकी',
+    'rokta': 'रोकता', 'rokti': 'रोकती',
+    'kabza': 'कब्ज़ा', 'kabja': 'कब्ज़ा',
+    'deta': 'देता', 'deti': 'देती', 'dete': 'देते',
+    'leta': 'लेता', 'leti': 'लेती', 'lete': 'लेते',
+    'karta': 'करता', 'karate': 'करते',
+    'aata': 'आता', 'aati': 'आती', 'aate': 'आते',
+    'jaata': 'जाता', 'jaati': 'जाती', 'jaate': 'जाते',
+    'jata': 'जाता', 'jati': 'जाती', 'jate': 'जाते',
+    'rehta': 'रहता', 'rehti': 'रहती', 'rehte': 'रहते',
+    'nikla': 'निकला', 'nikli': 'निकली', 'nikle': 'निकले',
+    'nikal': 'निकाल', 'nikalta': 'निकालता', 'nikalti': 'निकालती',
+    'nikala': 'निकाला', 'nikali': 'निकाली',
+    'peeta': 'पीटता', 'peeti': 'पीटती',
+    'khata': 'खाता', 'khati': 'खाती', 'khate': 'खाते',
+    'peeta_hai': 'पीटता है',
+    'lagta': 'लगता', 'lagti': 'लगती', 'lagte': 'लगते',
+    'milta': 'मिलता', 'milti': 'मिलती', 'milte': 'मिलते',
+    'mila': 'मिला', 'mili': 'मिली', 'mile': 'मिले',
+    'chalta': 'चलता', 'chalti': 'चलती', 'chalte': 'चलते',
+    'puchha': 'पूछा', 'puchhi': 'पूछी', 'puchhe': 'पूछे',
+    'puchta': 'पूछता', 'puchti': 'पूछती',
+    'bechta': 'बेचता', 'bechti': 'बेचती',
+    'becha': 'बेचा', 'bechi': 'बेची',
+
+    # Time & place
+    'kal': 'कल', 'aaj': 'आज', 'parso': 'परसों',
+    'raat': 'रात', 'rat': 'रात', 'din': 'दिन', 'subah': 'सुबह',
+    'sham': 'शाम', 'dopahar': 'दोपहर',
+    'baje': 'बजे', 'baj': 'बज',
+    'ghar': 'घर', 'dukaan': 'दुकान', 'kheti': 'खेती',
+    'gaon': 'गाँव', 'gaav': 'गाँव', 'shehar': 'शहर',
+    'bazaar': 'बाज़ार', 'bazar': 'बाज़ार',
+    'thana': 'थाना', 'thaane': 'थाने',
+    'office': 'कार्यालय',
+    'andar': 'अंदर', 'bahar': 'बाहर',
+    'pichhe': 'पीछे', 'peeche': 'पीछे',
+    'aage': 'आगे', 'upar': 'ऊपर', 'neeche': 'नीचे',
+    'paas': 'पास', 'door': 'दूर',
+    'yahan': 'यहाँ', 'wahan': 'वहाँ',
+    'jagah': 'जगह', 'taraf': 'तरफ़', 'saamne': 'सामने',
+    'kamra': 'कमरा', 'kamre': 'कमरे', 'makaan': 'मकान',
+    'rasta': 'रास्ता', 'raasta': 'रास्ता',
+    'nadi': 'नदी', 'nala': 'नाला', 'khet': 'खेत',
+
+    # People
+    'padosi': 'पड़ोसी', 'padoshi': 'पड़ोसी',
+    'log': 'लोग', 'aadmi': 'आदमी', 'vyakti': 'व्यक्ति',
+    'ladka': 'लड़का', 'ladki': 'लड़की',
+    'pati': 'पति', 'patni': 'पत्नी',
+    'beta': 'बेटा', 'beti': 'बेटी',
+    'bhai': 'भाई', 'behen': 'बहन',
+    'papa': 'पिताजी', 'maa': 'माँ', 'baap': 'पिता',
+    'sasur': 'ससुर', 'saas': 'सास',
+    'patwari': 'पटवारी', 'pradhan': 'प्रधान',
+    'police': 'पुलिस', 'daroga': 'दरोगा',
+
+    # Legal & complaint words
+    'chori': 'चोरी', 'loot': 'लूट', 'dhamki': 'धमकी',
+    'dhamkaya': 'धमकाया', 'dhamka': 'धमका',
+    'gaali': 'गाली', 'gali': 'गाली',
+    'marpeet': 'मारपीट', 'peet': 'पीट',
+    'zameen': 'ज़मीन', 'zamiin': 'ज़मीन', 'jamin': 'ज़मीन',
+    'deewar': 'दीवार', 'diwar': 'दीवार',
+    'tala': 'ताला', 'taala': 'ताला',
+    'paise': 'पैसे', 'paisa': 'पैसा', 'rupaiye': 'रुपये', 'rupaye': 'रुपये',
+    'cash': 'नकद राशि',
+    'kagzaat': 'कागज़ात', 'kagjat': 'कागज़ात',
+    'ration': 'राशन', 'card': 'कार्ड',
+    'bijli': 'बिजली', 'paani': 'पानी', 'sadak': 'सड़क',
+    'shikayat': 'शिकायत', 'avedan': 'आवेदन',
+    'nuksaan': 'नुकसान', 'nuksan': 'नुकसान',
+
+    # Connectors
+    'aur': 'और', 'ya': 'या', 'lekin': 'लेकिन', 'par': 'पर',
+    'mein': 'में', 'me': 'में', 'se': 'से', 'ko': 'को', 'ne': 'ने',
+    'pe': 'पर', 'tak': 'तक', 'bhi': 'भी',
+    'phir': 'फिर',
+    'isliye': 'इसलिए', 'kyunki': 'क्योंकि',
+    'bahut': 'बहुत', 'bohot': 'बहुत',
+    'lagbhag': 'लगभग', 'lagbhar': 'लगभग',
+    'sirf': 'सिर्फ', 'bilkul': 'बिलकुल',
+    'baar': 'बार', 'ek': 'एक', 'do': 'दो', 'teen': 'तीन',
+    'chaar': 'चार', 'paanch': 'पाँच',
+
+    # Misc
+    'nahi': 'नहीं', 'nhi': 'नहीं', 'na': 'ना',
+    'haan': 'हाँ', 'ji': 'जी',
+    'kab': 'कब', 'kahan': 'कहाँ', 'kaise': 'कैसे',
+    'kyon': 'क्यों', 'kya': 'क्या',
+    'abhi': 'अभी', 'jab': 'जब', 'tab': 'तब',
+    'wapas': 'वापस', 'dobara': 'दोबारा',
+    'saath': 'साथ', 'sath': 'साथ',
+    'roz': 'रोज़', 'roj': 'रोज़', 'rozana': 'रोज़ाना',
+    'hamesha': 'हमेशा', 'hamesa': 'हमेशा',
+    'bachcha': 'बच्चा', 'bachchi': 'बच्ची',
+    'bachche': 'बच्चे', 'bachcho': 'बच्चों', 'bacho': 'बच्चों',
+    'khaana': 'खाना', 'khana': 'खाना',
+    'peena': 'पीना', 'pina': 'पीना',
+    'jaankari': 'जानकारी', 'jankari': 'जानकारी',
+    'saman': 'सामान', 'samaan': 'सामान',
+    'kapda': 'कपड़ा', 'kapde': 'कपड़े',
+    'zewar': 'ज़ेवर', 'jewar': 'ज़ेवर', 'zever': 'ज़ेवर',
+    'makan': 'मकान', 'gadi': 'गाड़ी', 'gaadi': 'गाड़ी',
+    'cycle': 'साइकिल', 'mobile': 'मोबाइल', 'phone': 'फ़ोन',
+    'kaam': 'काम', 'naukri': 'नौकरी',
+    'padhai': 'पढ़ाई', 'padhna': 'पढ़ना',
+    'bimaari': 'बीमारी', 'bimari': 'बीमारी',
+    'ilaaj': 'इलाज', 'ilaj': 'इलाज',
+    'hospital': 'अस्पताल', 'aspatal': 'अस्पताल',
+    'school': 'स्कूल', 'skool': 'स्कूल',
+    'sarkaar': 'सरकार', 'sarkar': 'सरकार',
+    'afsar': 'अफ़सर', 'adhikari': 'अधिकारी',
+    'madad': 'मदद', 'madat': 'मदद', 'sahayata': 'सहायता',
+    'suraksha': 'सुरक्षा', 'nyay': 'न्याय', 'insaaf': 'इंसाफ़',
+    'kanoon': 'कानून', 'kaanoon': 'कानून',
+    'haq': 'हक़', 'adhikar': 'अधिकार',
+    'jaan': 'जान', 'khatra': 'ख़तरा', 'khatara': 'ख़तरा',
+    'darr': 'डर', 'dar': 'डर',
+    'takleef': 'तकलीफ़', 'taklif': 'तकलीफ़',
+    'pareshaan': 'परेशान', 'pareshan': 'परेशान',
+    'mushkil': 'मुश्किल',
+    'majboor': 'मजबूर', 'majbur': 'मजबूर',
+    'saboot': 'सबूत', 'gawah': 'गवाह',
+    'dahej': 'दहेज', 'dahez': 'दहेज',
+    'sharab': 'शराब', 'nashe': 'नशे', 'nasha': 'नशा',
+    'hinsa': 'हिंसा', 'atyachaar': 'अत्याचार',
+    'bigha': 'बीघा',
+    'lakh': 'लाख', 'hazar': 'हज़ार', 'hazaar': 'हज़ार',
+})
+
+# Punctuation that may wrap a word; kept around the converted word
+_TOKEN_RE = re.compile(r'([.,;:!?।|]*)(.*?)([.,;:!?।|]*)', re.DOTALL)
+_NUMBER_UNIT_RE = re.compile(r'(\d+)(lakh|hazar|hazaar|rupaiye|rupaye)')
+
+
+def transliterate_word(word):
+    """Devanagari form of one Hinglish word, or None if it is not in the table"""
+    lookup = word.lower()
+    hindi = HINGLISH_MAP.get(lookup)
+    if hindi is not None:
+        return hindi
+    m = _NUMBER_UNIT_RE.fullmatch(lookup)
+    if m:
+        return f'{m.group(1)} {HINGLISH_MAP.get(m.group(2), m.group(2))}'
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _convert_token(token):
+    lead, word, trail = _TOKEN_RE.fullmatch(token).groups()
+    hindi = transliterate_word(word)
+    if hindi is None:
+        return token
+    return lead + hindi + trail
+
+
+def transliterate(text):
+    """
+    Convert every known Hinglish word in text to Devanagari.
+    Whitespace is normalised to single spaces; unknown words are kept as-is.
+    """
+    return ' '.join(map(_convert_token, text.split()))
@@ -0,0 +1,214 @@
+"""
+Upload spooling utilities
+Keeps large uploads on disk and hands them to OCR by path/handle, so a
+request holds at most one in-memory copy of the file.
+- SpooledRequest: Flask request class that writes big multipart files
+  straight into named temp files (small ones stay in memory)
+- SpooledUpload: wraps an uploaded file and gives each consumer its own
+  handle (cloud OCR) or a path (local OCR worker) without re-reading it;
+  hold() keeps the file until a consumer that outlives the request is done
+- unpack_zip_upload: expands a zip of documents into spooled FileStorages
+"""
+
+import os
+import uuid
+import shutil
+import zipfile
+import tempfile
+import threading
+from io import BytesIO
+
+from flask import Request, current_app
+from werkzeug.datastructures import FileStorage
+
+
+# Uploads larger than this are kept on disk instead of in memory
+SPOOL_THRESHOLD = int(os.environ.get('UPLOAD_SPOOL_THRESHOLD', str(512 * 1024)))
+_COPY_CHUNK = 64 * 1024
+
+
+def allow_large_upload(max_bytes):
+    """Decorator: raise MAX_CONTENT_LENGTH for one view (e.g. batch uploads)"""
+    def decorator(view):
+        view.max_content_length = max_bytes
+        return view
+    return decorator
+
+
+class SpooledRequest(Request):
+    """Request whose multipart files above SPOOL_THRESHOLD go to named temp files"""
+
+    @property
+    def max_content_length(self):
+        """MAX_CONTENT_LENGTH, unless the matched view was marked with allow_large_upload"""
+        if not current_app:
+            return None
+        view = current_app.view_functions.get(self.endpoint) if self.endpoint else None
+        return getattr(view, 'max_content_length', current_app.config['MAX_CONTENT_LENGTH'])
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if total_content_length is None or total_content_length > SPOOL_THRESHOLD:
+            # Named so OCR workers can open the file by path; deleted when the request closes it
+            return tempfile.NamedTemporaryFile('w+b', suffix='.upload')
+        return BytesIO()
+
+
+def _stream_size(stream):
+    position = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(position)
+    return size
+
+
+def _private_link(path):
+    """A second name for a spooled file: a hard link, or a copy where links aren't supported"""
+    link = f'{path}.{uuid.uuid4().hex[:12]}'
+    try:
+        os.link(path, link)
+    except OSError:
+        shutil.copyfile(path, link)
+    return link
+
+
+class SpooledUpload:
+    """
+    One uploaded file, readable by several consumers without extra copies.
+    Small files are held as a single bytes object; large files live on disk
+    and every consumer opens its own handle on the same path.
+    """
+
+    def __init__(self, file, threshold=SPOOL_THRESHOLD):
+        self.filename = file.filename or 'document'
+        self._data = None
+        self._path = None
+        self._owned_path = None
+        # The creator's reference (dropped by close()) plus one per hold()
+        self._holds = 1
+        self._closed = False
+        self._lock = threading.Lock()
+
+        stream = getattr(file, 'stream', file)
+        stream.seek(0)
+        self.size = _stream_size(stream)
+
+        name = getattr(stream, 'name', None)
+        if isinstance(name, str) and os.path.isfile(name):
+            # Already spooled to a named file by SpooledRequest - reuse it
+            stream.flush()
+            self._path = name
+        elif isinstance(stream, BytesIO):
+            # Already in memory: getvalue() shares the buffer of an unmodified BytesIO
+            self._data = stream.getvalue()
+        elif self.size > threshold:
+            with tempfile.NamedTemporaryFile('wb', suffix='.upload', delete=False) as spool:
+                shutil.copyfileobj(stream, spool, _COPY_CHUNK)
+            self._path = self._owned_path = spool.name
+            stream.seek(0)
+        else:
+            self._data = stream.read()
+            stream.seek(0)
+
+    @property
+    def on_disk(self):
+        return self._path is not None
+
+    def open(self):
+        """A fresh binary handle positioned at the start of the file"""
+        if self._path is not None:
+            return open(self._path, 'rb')
+        return BytesIO(self._data)
+
+    def local_source(self):
+        """What a process-pool worker should receive: a path, or the bytes for small files"""
+        return self._path if self._path is not None else self._data
+
+    def hold(self):
+        """
+        Keep the file readable, even past close(), until the returned release()
+        is called - for a consumer that may still be running when the request ends
+        (a hedged OCR engine that lost the race). A file borrowed from the request
+        or a zip member is linked to a private name first, since its owner deletes
+        it when the request closes.
+        """
+        with self._lock:
+            if self._path is not None and self._owned_path is None:
+                self._path = self._owned_path = _private_link(self._path)
+            self._holds += 1
+
+        released = threading.Event()
+
+        def release():
+            if not released.is_set():
+                released.set()
+                self._release()
+        return release
+
+    def _release(self):
+        with self._lock:
+            self._holds -= 1
+            if self._holds or not self._owned_path:
+                return
+            path, self._owned_path = self._owned_path, None
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def unpack_zip_upload(file, allowed_extensions, max_files, max_total_size):
+    """
+    Expand an uploaded zip into FileStorage objects, one per allowed member.
+    Big members are spooled to named temp files, small ones kept in memory.
+    Raises ValueError for invalid archives or ones over the count/size limits.
+    Callers must close() the returned files.
+    """
+    try:
+        archive = zipfile.ZipFile(file.stream)
+    except zipfile.BadZipFile:
+        raise ValueError('Invalid zip file')
+
+    members = []
+    for info in archive.infolist():
+        name = os.path.basename(info.filename)
+        if info.is_dir() or not name or name.startswith('.') or info.filename.startswith('__MACOSX'):
+            continue
+        if name.rsplit('.', 1)[-1].lower() not in allowed_extensions:
+            continue
+        members.append((info, name))
+
+    if len(members) > max_files:
+        raise ValueError(f'Too many files in zip (max {max_files})')
+    # Declared sizes are checked before extracting anything (zip bombs)
+    if sum(info.file_size for info, _ in members) > max_total_size:
+        raise ValueError('Zip contents too large')
+
+    files = []
+    try:
+        for info, name in members:
+            if info.file_size > SPOOL_THRESHOLD:
+                stream = tempfile.NamedTemporaryFile('w+b', suffix='.upload')
+                with archive.open(info) as member:
+                    shutil.copyfileobj(member, stream, _COPY_CHUNK)
+                stream.seek(0)
+            else:
+                stream = BytesIO(archive.read(info))
+            files.append(FileStorage(stream=stream, filename=name))
+    except Exception:
+        for f in files:
+            f.close()
+        raise
+    return files
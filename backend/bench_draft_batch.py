@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark: bulk draft generation vs. one letter at a time
+The OpenAI call is simulated with a fixed latency (default 1.5 s, a typical
+gpt-4o-mini letter); Hinglish cleanup and template rendering are real.
+Run: python bench_draft_batch.py [ai_latency_seconds] [rows]
+"""
+
+import sys
+import time
+
+from app.services import draft_service as draft_module
+from app.services.draft_service import DraftService
+from app.utils.result_cache import TieredCache
+
+ISSUES = ['land_dispute', 'police_complaint', 'pension_issue', 'ration_card', 'domestic_violence']
+DETAILS = 'mere padosi ne meri zameen par kabza kar liya hai aur 50000 rupaye bhi nahi lauta raha case {}'
+LETTER = 'सेवा में,\nश्रीमान जिलाधिकारी महोदय,\n\n' + 'सविनय निवेदन है कि ' * 20
+
+
+def make_service(latency):
+    service = DraftService()
+    service.ai_client = object()
+
+    def fake_ai(*args):
+        time.sleep(latency)
+        return LETTER
+
+    service._generate_draft_with_ai = fake_ai
+    return service
+
+
+def make_rows(count):
+    return [(i, {
+        'issue_type': ISSUES[i % len(ISSUES)],
+        'details': DETAILS.format(i),
+        'language': 'hindi' if i % 2 else 'english',
+        'sender_info': {'name': f'Caseworker client {i}', 'district': 'Patna'},
+        'recipient': {},
+        'subject_line': '',
+        'use_cache': False
+    }) for i in range(count)]
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 1.5
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    for name in list(draft_module._result_caches):
+        draft_module._result_caches[name] = TieredCache(name, use_mongo=False)
+    service = make_service(latency)
+
+    print("=" * 60)
+    print(f"📊 DRAFT BATCH THROUGHPUT ({count} rows, AI latency {latency}s)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    for _, params in make_rows(count):
+        service.generate_draft(**params)
+    sequential = time.perf_counter() - start
+    print(f"sequential       : {sequential:6.2f} s  {count / sequential * 60:7.1f} drafts/min")
+
+    for workers in (2, 4, 8):
+        start = time.perf_counter()
+        results = list(service.generate_batch(make_rows(count), max_workers=workers, deadline=latency * 2))
+        elapsed = time.perf_counter() - start
+        assert len(results) == count and all(r['data']['draftSource'] == 'ai' for r in results)
+        print(f"batch, {workers} workers : {elapsed:6.2f} s  {count / elapsed * 60:7.1f} drafts/min"
+              f"  ({sequential / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Benchmark: draft PDF rendering - fpdf2 multi_cell vs. DraftPDFService
+(cached word widths, per-line shaping, subset font, output cache)
+Needs fpdf2 and a font: set DRAFT_PDF_FONT or install a Devanagari font.
+Run: python bench_draft_pdf.py [letters]
+"""
+
+import sys
+import time
+
+from app.services.draft_pdf_service import DraftPDFService, FPDF_AVAILABLE, SHAPING_AVAILABLE, find_font
+
+HINDI = ('सेवा में,\nश्रीमान जिलाधिकारी महोदय,\nजिला कार्यालय, पटना\n\nदिनांक: 12/05/2024\n\n'
+         'विषय: भूमि विवाद/अवैध कब्ज़े के संबंध में शिकायत\n\nमहोदय,\n\n'
+         + 'सविनय निवेदन है कि मेरे पड़ोसी ने मेरी ज़मीन पर अवैध कब्ज़ा कर लिया है। ' * 12
+         + '\n\nअतः श्रीमान से निवेदन है कि उचित कार्यवाही करें।\n\nभवदीय,\nनाम: रमेश कुमार\n')
+ENGLISH = ('To,\nThe District Magistrate,\nDistrict Office, Patna\n\nDate: 12/05/2024\n\n'
+           'Subject: Complaint Regarding Land Dispute\n\nSir,\n\n'
+           + 'Respectfully I submit that my neighbour has illegally occupied my land. ' * 12
+           + '\n\nKindly take appropriate action.\n\nYours faithfully,\nName: Ramesh Kumar\n')
+
+
+def multi_cell_pdf(font, text):
+    from fpdf import FPDF
+    pdf = FPDF(format='A4')
+    pdf.set_margins(20, 20, 20)
+    pdf.add_font('draft', '', font)
+    if SHAPING_AVAILABLE:
+        pdf.set_text_shaping(True)
+    pdf.add_page()
+    pdf.set_font('draft', size=12)
+    pdf.multi_cell(0, 7, text)
+    return bytes(pdf.output())
+
+
+def timed(func, count):
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    return (time.perf_counter() - start) / count * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    font = find_font()
+    if not FPDF_AVAILABLE or font is None:
+        print("fpdf2 or a PDF font is missing (pip install fpdf2 uharfbuzz; set DRAFT_PDF_FONT)")
+        return
+
+    print("=" * 60)
+    print(f"📊 DRAFT PDF RENDERING ({count} letters each, font {font})")
+    print("=" * 60)
+    for name, letter in (('hindi', HINDI), ('english', ENGLISH)):
+        service = DraftPDFService()
+        start = time.perf_counter()
+        service.render(letter + 'warm-up', name)
+        cold = (time.perf_counter() - start) * 1000
+
+        baseline = timed(lambda i: multi_cell_pdf(font, letter + str(i)), count)
+        warm = timed(lambda i: service.render(letter + str(i), name), count)
+        cached = timed(lambda i: service.render(letter + str(i), name), count)
+        print(f"{name:8} multi_cell {baseline:7.1f} ms | service cold {cold:7.1f} ms, "
+              f"warm {warm:6.1f} ms ({baseline / warm:.1f}x), cached {cached:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark: precompiled entity extraction vs. the old per-pattern scans
+Run: python bench_entity_extraction.py
+"""
+
+import re
+import time
+
+from app.utils.entity_extractor import extract_entities
+
+
+SAMPLE_PAGE = """न्यायालय सिविल जज (जूनियर डिवीजन), पटना
+Case No. CS/245/2023    FIR No. 118/2023 u/s 420, 406 IPC
+Name: Ramesh Kumar   S/o Shri Mohan Lal
+Address: Village Rampur, Post Bihta, District Patna PIN: 801103
+Phone: +91-9876543210  Email: ramesh.kumar@example.com
+यह नोटिस दिनांक 12/05/2023 को जारी किया गया। अगली सुनवाई 3 March 2024 को होगी।
+खसरा नं. 245/3 पर विवाद है। राशि Rs. 1,25,000 तथा 5000 रुपये जुर्माना।
+आप 15 जनवरी 2024 तक जवाब दें अन्यथा एकपक्षीय कार्यवाही की जाएगी।
+The respondent is hereby directed to appear before the court with all documents.
+"""
+
+
+def legacy_extract(text):
+    """The pre-engine implementation: ~20 separate findall passes"""
+    info = {'dates': [], 'amounts': [], 'phones': [], 'emails': [], 'case_numbers': [], 'names': [], 'addresses': []}
+    for pattern in [
+        r'\b(?:0?[1-9]|[12][0-9]|3[01])[/\-](?:0?[1-9]|1[0-2])[/\-]\d{2,4}\b',
+        r'\b\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{2,4}\b',
+        r'\b\d{1,2}\s+(?:जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+\d{2,4}\b',
+    ]:
+        info['dates'].extend(re.findall(pattern, text, re.IGNORECASE))
+    for pattern in [r'(?:rs\.?|₹|inr)\s*([0-9,]+(?:\.[0-9]+)?)', r'([0-9,]+(?:\.[0-9]+)?)\s*(?:rupees|रुपये)']:
+        info['amounts'].extend(re.findall(pattern, text, re.IGNORECASE))
+    info['phones'] = re.findall(r'\b(?:\+91[\-\s]?)?[6-9]\d{9}\b', text)
+    info['emails'] = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    for pattern in [r'(?:case\s*no|ref\s*no|file\s*no|केस\s*नं)[.:]*\s*([A-Z0-9/\-]+)', r'(?:fir\s*no|एफआईआर)[.:]*\s*([0-9/\-]+)']:
+        info['case_numbers'].extend(re.findall(pattern, text, re.IGNORECASE))
+    for pattern in [
+        r'(?:name|नाम|applicant|complainant|petitioner|respondent)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})',
+        r'(?:mr\.|ms\.|mrs\.|shri|smt\.?|श्री|श्रीमती)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})',
+    ]:
+        info['names'].extend(re.findall(pattern, text, re.IGNORECASE))
+    info['addresses'] = re.findall(r'[A-Za-z0-9,.\s\-]+(?:pin|पिन)?[:\s]*\d{6}', text, re.IGNORECASE)[:2]
+    # _extract_key_points and _extract_dates rescanned the same text again
+    for pattern in [
+        r'(?:case\s*no|केस\s*नं|प्रकरण\s*क्रमांक)[.:]*\s*([A-Z0-9/\-]+)',
+        r'(?:धारा|section|u/s)\s*([0-9]+(?:\s*[,/]\s*[0-9]+)*)',
+        r'(?:रु|rs|₹|rupees)[.:]*\s*([0-9,]+)',
+        r'(?:खसरा|plot|प्लॉट|खाता)\s*(?:नं|no|नंबर)?[.:]*\s*([0-9/\-]+)',
+        r'(?:fir\s*no|एफआईआर)[.:]*\s*([0-9/\-]+)',
+        r'\b(?:0?[1-9]|[12][0-9]|3[01])[/-](?:0?[1-9]|1[0-2])[/-](?:\d{4}|\d{2})\b',
+        r'\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{2,4}\b',
+        r'\b(?:0?[1-9]|[12][0-9]|3[01])\s+(?:जनवरी|फरवरी|मार्च|अप्रैल|मई|जून|जुलाई|अगस्त|सितंबर|अक्टूबर|नवंबर|दिसंबर)\s+\d{2,4}\b',
+    ]:
+        re.findall(pattern, text, re.IGNORECASE)
+    return info
+
+
+def bench(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    print("=" * 60)
+    print("📊 ENTITY EXTRACTION BENCHMARK (ms per document)")
+    print("=" * 60)
+    for pages in (1, 5, 20):
+        text = SAMPLE_PAGE * pages
+        repeat = max(5, 200 // pages)
+        legacy_ms = bench(legacy_extract, text, repeat)
+        engine_ms = bench(extract_entities, text, repeat)
+        print(f"{pages:>3} page(s), {len(text):>6} chars: legacy {legacy_ms:8.2f} ms | "
+              f"engine {engine_ms:7.2f} ms | {legacy_ms / engine_ms:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Benchmark: nearest office for a list of villages - one find_offices() call
+per village (KD-tree query + response per row) vs. find_nearest_batch()
+(one matrix product of unit vectors per chunk of located rows); best of 3 runs
+Run: python bench_legal_aid_batch.py [villages]
+"""
+
+import sys
+import time
+import random
+
+from app.services.legal_aid_service import LegalAidService
+
+
+def village_rows(count, seed=1):
+    rng = random.Random(seed)
+    # Rough bounding box of the Indo-Gangetic plain, where most DLSAs are
+    return [{'name': f'Village {i}', 'lat': rng.uniform(22.0, 30.0), 'lng': rng.uniform(75.0, 88.0)}
+            for i in range(count)]
+
+
+def per_row(service, rows, k):
+    return [service.find_offices(user_lat=row['lat'], user_lng=row['lng'], limit=k)['offices'] for row in rows]
+
+
+def batched(service, rows, k):
+    return [result['offices'] for result in service.find_nearest_batch(rows, k)]
+
+
+def timed(func, service, rows, k, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(service, rows, k)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    service = LegalAidService()
+    rows = village_rows(count)
+
+    print("=" * 60)
+    print(f"📊 BATCH NEAREST OFFICE ({count} villages, {len(service.offices)} offices)")
+    print("=" * 60)
+    for k in (1, 3):
+        old, expected = timed(per_row, service, rows, k)
+        new, result = timed(batched, service, rows, k)
+        assert [[o['name'] for o in offices] for offices in result] == \
+               [[o['name'] for o in offices] for offices in expected]
+        print(f"k={k}: per-row {old * 1000:8.1f} ms  batch {new * 1000:8.1f} ms  ({old / new:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmark: ranking matched legal-aid offices by distance - copy each office
+dict, scalar Haversine, full sort (old find_offices) vs. CoordinateTable
+(one vectorized Haversine over candidate indices + argpartition)
+Run: python bench_legal_aid_distances.py [queries]
+"""
+
+import sys
+import time
+import random
+
+from app.utils.spatial_index import CoordinateTable, haversine_km, NUMPY_AVAILABLE
+
+INDIA_LAT = (8.0, 35.0)
+INDIA_LNG = (68.0, 97.0)
+
+
+def random_points(count, rng):
+    return [(rng.uniform(*INDIA_LAT), rng.uniform(*INDIA_LNG)) for _ in range(count)]
+
+
+def copy_and_sort(offices, candidates, lat, lng, k):
+    ranked = []
+    for i in candidates:
+        office = offices[i].copy()
+        office['distance'] = round(haversine_km(lat, lng, office['lat'], office['lng']), 1)
+        ranked.append(office)
+    ranked.sort(key=lambda o: o['distance'])
+    return ranked[:k]
+
+
+def timed(func, queries):
+    start = time.perf_counter()
+    for lat, lng in queries:
+        func(lat, lng)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(7)
+    queries = random_points(count, rng)
+
+    print("=" * 64)
+    print(f"📊 RANK MATCHED OFFICES, k=10 ({count} queries, µs per query, numpy={NUMPY_AVAILABLE})")
+    print("=" * 64)
+    print(f"{'offices':>8} {'matched':>8} {'copy+sort':>10} {'vectorized':>11} {'speedup':>8}")
+    for size in (60, 700, 5000, 50000):
+        points = random_points(size, rng)
+        offices = [{'id': i, 'district': f'D{i}', 'lat': lat, 'lng': lng, 'phone': '15100'}
+                   for i, (lat, lng) in enumerate(points)]
+        table = CoordinateTable(points)
+        for matched in sorted({size, size // 4}):
+            candidates = rng.sample(range(size), matched)
+            for lat, lng in queries[:10]:
+                expected = [o['distance'] for o in copy_and_sort(offices, candidates, lat, lng, 10)]
+                assert [round(d, 1) for d, _ in table.nearest(lat, lng, 10, candidates)] == expected
+
+            baseline = timed(lambda lat, lng: copy_and_sort(offices, candidates, lat, lng, 10), queries)
+            fast = timed(lambda lat, lng: table.nearest(lat, lng, 10, candidates), queries)
+            print(f"{size:>8} {matched:>8} {baseline:>10.1f} {fast:>11.1f} {baseline / fast:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
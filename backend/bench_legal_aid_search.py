@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Benchmark: district search - the old per-request scan (lowercase every
+office's names, bidirectional substring checks, format each match) vs. the
+precomputed name index + preformatted responses
+Run: python bench_legal_aid_search.py [rounds]
+"""
+
+import sys
+import time
+
+from app.services.legal_aid_service import LegalAidService
+
+QUERIES = ['Patna', 'patna', 'पटना', 'Varanasi', 'Bihar', 'Gurugram', 'Muzaffarpur', 'Lucknow',
+           'Chennai', 'Central Delhi']
+# Only the index finds these (alias, old name, typo)
+NEW_ONLY = ['बनारस', 'Allahabad', 'Varansi', 'Gurgaon', 'Begusaray']
+
+
+def old_match(service, district):
+    matching = []
+    district_lower = district.lower().strip()
+    for office in service.offices:
+        office_district = office['district'].lower()
+        office_district_hi = office.get('districtHi', '').lower()
+        office_state = office['state'].lower()
+        if (district_lower in office_district or office_district in district_lower or
+                district_lower in office_district_hi or district_lower in office_state):
+            matching.append(office.copy())
+    return [service.directory._format_office(office) for office in matching[:10]]
+
+
+def new_match(service, district):
+    directory = service.directory
+    return [directory.office_response(index) for index in directory.match_district(district)[:10]]
+
+
+def timed(func, service, queries, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            func(service, query)
+    return (time.perf_counter() - start) / (rounds * len(queries)) * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    service = LegalAidService()
+    for query in QUERIES:
+        assert new_match(service, query) == old_match(service, query), query
+
+    print("=" * 60)
+    print(f"📊 DISTRICT SEARCH ({len(service.offices)} offices, µs per query)")
+    print("=" * 60)
+    old = timed(old_match, service, QUERIES, rounds)
+    new = timed(new_match, service, QUERIES, rounds)
+    print(f"known names      : scan {old:7.1f}  index {new:7.1f}  ({old / new:.1f}x)")
+    fuzzy = timed(new_match, service, NEW_ONLY, rounds // 4)
+    found = sum(bool(old_match(service, q)) for q in NEW_ONLY)
+    print(f"aliases / typos  : index {fuzzy:7.1f}  (old scan found {found}/{len(NEW_ONLY)})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Benchmark: nearest legal-aid office lookup - linear Haversine scan vs. KD-tree
+Office tables are synthetic points over India, from today's table size up
+to all ~700 districts (and beyond, for sub-divisional offices).
+Run: python bench_legal_aid_spatial.py [queries]
+"""
+
+import sys
+import time
+import random
+
+from app.utils.spatial_index import SpatialIndex, haversine_km
+
+INDIA_LAT = (8.0, 35.0)
+INDIA_LNG = (68.0, 97.0)
+
+
+def random_points(count, rng):
+    return [(rng.uniform(*INDIA_LAT), rng.uniform(*INDIA_LNG)) for _ in range(count)]
+
+
+def linear_nearest(points, lat, lng, k):
+    return sorted((haversine_km(lat, lng, p_lat, p_lng), i) for i, (p_lat, p_lng) in enumerate(points))[:k]
+
+
+def timed(func, queries):
+    start = time.perf_counter()
+    for lat, lng in queries:
+        func(lat, lng)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(42)
+    queries = random_points(count, rng)
+
+    print("=" * 72)
+    print(f"📊 NEAREST OFFICE LOOKUP ({count} queries, µs per query)")
+    print("=" * 72)
+    print(f"{'offices':>8} {'build ms':>9} {'linear k=10':>12} {'kd k=10':>9} {'kd r=50km':>10} {'speedup':>8}")
+    for size in (60, 200, 700, 2000, 5000):
+        points = random_points(size, rng)
+        start = time.perf_counter()
+        index = SpatialIndex(points)
+        build = (time.perf_counter() - start) * 1000
+
+        for lat, lng in queries[:20]:
+            assert [i for _, i in index.nearest(lat, lng, 10)] == [i for _, i in linear_nearest(points, lat, lng, 10)]
+
+        linear = timed(lambda lat, lng: linear_nearest(points, lat, lng, 10), queries)
+        knn = timed(lambda lat, lng: index.nearest(lat, lng, 10), queries)
+        radius = timed(lambda lat, lng: index.within(lat, lng, 50), queries)
+        print(f"{size:>8} {build:>9.2f} {linear:>12.1f} {knn:>9.1f} {radius:>10.1f} {linear / knn:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
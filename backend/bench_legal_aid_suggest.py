@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Benchmark: legal-aid type-ahead - prefix trie vs. scanning every name for a
+matching word prefix, and vs. submitting the full search per keystroke
+Run: python bench_legal_aid_suggest.py [rounds]
+"""
+
+import sys
+import time
+
+from app.services.legal_aid_service import LegalAidService, DISTRICT_ALIASES
+from app.utils.name_index import normalize_name
+
+# What a user types, one keystroke at a time
+TYPED = ['Muzaffarpur', 'बनारस', 'Gurgaon', 'East Champaran', 'पटना', 'Tis Hazari']
+PREFIXES = [word[:i] for word in TYPED for i in range(1, len(word) + 1)]
+
+
+def scan_suggest(service, query, limit=8):
+    prefix = normalize_name(query)
+    found = []
+    for office in service.offices:
+        names = [office['district'], office.get('districtHi', ''), office['name'], office.get('nameHi', ''),
+                 office['state'], *DISTRICT_ALIASES.get(office['district'], ())]
+        if any(word.startswith(prefix) for name in names for word in normalize_name(name).split()):
+            found.append(office['district'])
+    return found[:limit]
+
+
+def timed(func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for prefix in PREFIXES:
+            func(prefix)
+    return (time.perf_counter() - start) / (rounds * len(PREFIXES)) * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    service = LegalAidService()
+
+    print("=" * 60)
+    print(f"📊 TYPE-AHEAD ({len(PREFIXES)} keystrokes, {service.directory.suggestion_trie.size} indexed names, µs each)")
+    print("=" * 60)
+    trie = timed(lambda q: service.suggest(q, 8), rounds)
+    scan = timed(lambda q: scan_suggest(service, q), max(1, rounds // 10))
+    search = timed(lambda q: service.find_offices(district=q), max(1, rounds // 10))
+    print(f"prefix trie      : {trie:8.1f}")
+    print(f"name scan        : {scan:8.1f}  ({scan / trie:.0f}x)")
+    print(f"full search      : {search:8.1f}  ({search / trie:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Benchmark: pincode search - India Post API per request vs. the bundled
+offline table (binary search). The API call is simulated with a fixed
+latency (default 0.4 s; the live API is often slower, with a 10 s timeout).
+Run: python bench_pincode_lookup.py [api_latency_seconds] [searches]
+"""
+
+import sys
+import time
+import random
+
+from app.services import legal_aid_service as legal_aid_module
+from app.services.legal_aid_service import LegalAidService
+from app.utils.pincode_table import PincodeTable, PINCODE_TABLE_PATH
+from app.utils.result_cache import TieredCache
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.4
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    start = time.perf_counter()
+    table = PincodeTable.load(PINCODE_TABLE_PATH)
+    load = (time.perf_counter() - start) * 1000
+    pincodes = [f'{table._pincodes[i]:06d}' for i in random.Random(3).choices(range(len(table)), k=count)]
+
+    print("=" * 60)
+    print(f"📊 PINCODE RESOLUTION ({len(table)} pincodes, {len(table.places)} districts)")
+    print("=" * 60)
+    print(f"table load         : {load:8.1f} ms (once per process)")
+
+    start = time.perf_counter()
+    for pincode in pincodes:
+        table.lookup(pincode)
+    print(f"offline lookup     : {(time.perf_counter() - start) / count * 1e6:8.2f} µs")
+
+    service = LegalAidService()
+    start = time.perf_counter()
+    for pincode in pincodes:
+        service.find_offices(pincode=pincode)
+    offline = (time.perf_counter() - start) / count * 1000
+    print(f"find_offices       : {offline:8.3f} ms (offline table)")
+
+    # Previous behaviour: every search resolves its pincode through the API
+    def fake_api(pincode):
+        time.sleep(latency)
+        return table.lookup(pincode) | {'success': True}
+
+    legal_aid_module._pincode_api_cache = TieredCache('pincode', use_mongo=False)
+    service.pincode_table = PincodeTable()
+    service._fetch_pincode_location = fake_api
+    sample = pincodes[:5]
+    start = time.perf_counter()
+    for pincode in sample:
+        legal_aid_module._pincode_api_cache.clear()
+        service.find_offices(pincode=pincode)
+    online = (time.perf_counter() - start) / len(sample) * 1000
+    print(f"find_offices       : {online:8.1f} ms (India Post API, {online / offline:,.0f}x slower)")
+
+    for pincode in sample:
+        service.find_offices(pincode=pincode)
+    start = time.perf_counter()
+    for pincode in sample * 100:
+        service.find_offices(pincode=pincode)
+    cached = (time.perf_counter() - start) / (len(sample) * 100) * 1000
+    print(f"find_offices       : {cached:8.3f} ms (India Post API answer cached)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark: precompiled transliteration engine vs. the old per-call map
+Run: python bench_transliteration.py
+"""
+
+import re
+import time
+
+from app.utils.transliteration import HINGLISH_MAP, transliterate
+
+
+SAMPLE = ('mere ghar me kl chori ho gai rat ke lagbhar 12 baj rhe the 3 log pichhe se tala tod ke '
+          'andar aaye aur mere 1lakh cash lekr chale gaye. police ne FIR nahi likhi aur thane se bhaga diya! ')
+
+
+def legacy_transliterate(text):
+    """The old implementation: table literal rebuilt per call, re.match per unknown word"""
+    hinglish_map = dict(HINGLISH_MAP)
+    converted = []
+    for word in text.split():
+        clean = word.strip('.,;:!?।|')
+        trail = word[len(clean):] if len(word) > len(clean) else ''
+        lookup = clean.lower()
+        if lookup in hinglish_map:
+            converted.append(hinglish_map[lookup] + trail)
+        else:
+            m = re.match(r'^(\d+)(lakh|hazar|hazaar|rupaiye|rupaye)$', lookup)
+            if m:
+                converted.append(f'{m.group(1)} {hinglish_map.get(m.group(2), m.group(2))}{trail}')
+            else:
+                converted.append(word)
+    return ' '.join(converted)
+
+
+def bench(func, text, rounds=2000):
+    func(text)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func(text)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+if __name__ == '__main__':
+    text = (SAMPLE * (2048 // len(SAMPLE) + 1))[:2048]
+    assert transliterate(text) == legacy_transliterate(text)
+    legacy = bench(legacy_transliterate, text)
+    engine = bench(transliterate, text)
+    print(f"input: {len(text)} chars, {len(text.split())} words")
+    print(f"legacy : {legacy:8.1f} us/call")
+    print(f"engine : {engine:8.1f} us/call  ({legacy / engine:.1f}x faster)")
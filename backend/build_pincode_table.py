@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Build the bundled offline pincode table (app/data/pincodes.csv.gz)
+Input is the India Post "All India Pincode Directory" (one row per post
+office) as published on data.gov.in (CSV), or as JSON lines with the same
+fields (e.g. the pins.json.bz2 shipped by the indiapins package); .gz/.bz2
+inputs are decompressed on the fly.
+Each pincode keeps the district/state most of its post offices report and
+the median of their coordinates (points outside India are ignored).
+Run: python build_pincode_table.py <directory.csv|.jsonl[.bz2|.gz]> [output]
+"""
+
+import io
+import bz2
+import csv
+import sys
+import gzip
+import json
+import statistics
+from collections import Counter, defaultdict
+
+from app.utils.pincode_table import PINCODE_TABLE_PATH, PINCODE_TABLE_COLUMNS, PincodeTable, is_valid_pincode
+
+INDIA_LAT = (6.0, 38.0)
+INDIA_LNG = (68.0, 98.0)
+
+# Column names used by the data.gov.in CSV and by the JSON-lines export
+FIELDS = {
+    'pincode': ('pincode', 'Pincode'),
+    'district': ('district', 'District', 'districtname'),
+    'state': ('statename', 'State', 'state'),
+    'lat': ('latitude', 'Latitude'),
+    'lng': ('longitude', 'Longitude'),
+}
+
+
+def open_text(path):
+    if path.endswith('.bz2'):
+        return bz2.open(path, 'rt', encoding='utf-8')
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, encoding='utf-8', newline='')
+
+
+def read_records(path):
+    with open_text(path) as f:
+        if '.json' in path:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def field(record, name):
+    for key in FIELDS[name]:
+        if record.get(key) not in (None, '', 'NA'):
+            return record[key]
+    return None
+
+
+def clean_name(name):
+    """'KUMURAM BHEEM ASIFABAD' -> 'Kumuram Bheem Asifabad' (the API's casing)"""
+    words = str(name).strip().title().split()
+    return ' '.join(w.lower() if i and w in ('And', 'Of') else w for i, w in enumerate(words))
+
+
+def coordinate(value, bounds):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if bounds[0] <= value <= bounds[1] else None
+
+
+def build_rows(records):
+    places = defaultdict(Counter)
+    coords = defaultdict(list)
+    for record in records:
+        pincode = str(field(record, 'pincode') or '').strip()
+        district = field(record, 'district')
+        state = field(record, 'state')
+        if not is_valid_pincode(pincode) or not district or not state:
+            continue
+        places[pincode][(clean_name(district), clean_name(state))] += 1
+        lat = coordinate(field(record, 'lat'), INDIA_LAT)
+        lng = coordinate(field(record, 'lng'), INDIA_LNG)
+        if lat is not None and lng is not None:
+            coords[pincode].append((lat, lng))
+
+    for pincode in sorted(places):
+        (district, state), _ = places[pincode].most_common(1)[0]
+        points = coords.get(pincode)
+        lat = round(statistics.median(p[0] for p in points), 4) if points else None
+        lng = round(statistics.median(p[1] for p in points), 4) if points else None
+        yield pincode, district, state, lat, lng
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    output = sys.argv[2] if len(sys.argv) > 2 else PINCODE_TABLE_PATH
+    rows = list(build_rows(read_records(sys.argv[1])))
+
+    # mtime=0 keeps the output byte-identical for identical input
+    with open(output, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz:
+        with io.TextIOWrapper(gz, encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(PINCODE_TABLE_COLUMNS)
+            for pincode, district, state, lat, lng in rows:
+                writer.writerow((pincode, district, state, '' if lat is None else lat, '' if lng is None else lng))
+
+    table = PincodeTable.load(output)
+    located = sum(1 for row in rows if row[3] is not None)
+    print(f"{output}: {len(table)} pincodes ({located} with coordinates), {len(table.places)} districts")
+
+
+if __name__ == '__main__':
+    main()
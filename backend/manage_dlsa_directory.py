@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Manage the DLSA office directory in MongoDB
+Running services pick up a published version within DLSA_REFRESH_INTERVAL
+seconds, without a deploy or restart.
+Run: python manage_dlsa_directory.py seed               (publish the bundled offices if nothing is published)
+     python manage_dlsa_directory.py export <file.json> (write the live offices, to edit)
+     python manage_dlsa_directory.py publish <file.json> (make the edited offices the live version)
+"""
+
+import sys
+import json
+
+from app.services.dlsa_directory import DlsaDirectoryStore, load_bundled_offices
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command not in ('seed', 'export', 'publish') or (command != 'seed' and len(sys.argv) < 3):
+        print(__doc__)
+        sys.exit(1)
+
+    store = DlsaDirectoryStore()
+    if not store.available():
+        print("MongoDB not available (check MONGODB_URI)")
+        sys.exit(1)
+
+    if command == 'seed':
+        version, seeded = store.seed()
+        print(f"Published bundled offices as version {version}" if seeded else f"Version {version} already live")
+    elif command == 'export':
+        version, offices = store.load()
+        if offices is None:
+            version, offices = 'bundled', load_bundled_offices()
+        with open(sys.argv[2], 'w', encoding='utf-8') as f:
+            json.dump(offices, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"{sys.argv[2]}: {len(offices)} offices (version {version})")
+    else:
+        with open(sys.argv[2], encoding='utf-8') as f:
+            offices = json.load(f)
+        print(f"Published {len(offices)} offices as version {store.publish(offices)}")
+
+
+if __name__ == '__main__':
+    main()
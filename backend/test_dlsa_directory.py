@@ -0,0 +1,153 @@
+"""
+Tests for the versioned DLSA directory in MongoDB and LegalAidService's
+in-memory rebuild (MongoDB is faked)
+"""
+
+import time
+
+import pytest
+
+from app.services.dlsa_directory import DlsaDirectoryStore, load_bundled_offices, validate_offices
+from app.services.legal_aid_service import LegalAidService, DLSA_SOURCE_BUNDLED, DLSA_SOURCE_MONGO
+
+
+def _matches(doc, query):
+    for field, condition in query.items():
+        value = doc.get(field)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+        elif '$lte' in condition:
+            if value is None or value > condition['$lte']:
+                return False
+        elif '$not' in condition:
+            if value is not None and value >= condition['$not']['$gte']:
+                return False
+    return True
+
+
+class FakeCursor(list):
+    def sort(self, field, direction):
+        return FakeCursor(sorted(self, key=lambda doc: doc[field], reverse=direction < 0))
+
+
+class FakeCollection:
+    """Just enough of a pymongo collection for the directory store"""
+
+    def __init__(self):
+        self.docs = []
+        self.reads = 0
+
+    def create_index(self, keys):
+        pass
+
+    def find(self, query, projection):
+        self.reads += 1
+        hidden = {field for field, shown in projection.items() if not shown}
+        return FakeCursor({k: v for k, v in doc.items() if k not in hidden}
+                          for doc in self.docs if _matches(doc, query))
+
+    def find_one(self, query, projection=None):
+        self.reads += 1
+        return next((dict(doc) for doc in self.docs if _matches(doc, query)), None)
+
+    def insert_many(self, docs):
+        self.docs.extend(dict(doc) for doc in docs)
+
+    def delete_many(self, query):
+        self.docs = [doc for doc in self.docs if not _matches(doc, query)]
+
+    def update_one(self, query, update):
+        for doc in self.docs:
+            if _matches(doc, query):
+                doc.update(update['$set'])
+                return
+
+    def find_one_and_update(self, query, update, upsert, return_document):
+        doc = next((doc for doc in self.docs if _matches(doc, query)), None)
+        if doc is None:
+            doc = dict(query)
+            self.docs.append(doc)
+        for field, step in update['$inc'].items():
+            doc[field] = doc.get(field, 0) + step
+        return dict(doc)
+
+
+@pytest.fixture
+def store():
+    return DlsaDirectoryStore(offices=FakeCollection(), versions=FakeCollection())
+
+
+def test_bundled_offices_are_valid():
+    offices = load_bundled_offices()
+    assert len(offices) == 52 and offices[0]['district'] == 'Patna'
+    with pytest.raises(ValueError):
+        validate_offices([{**offices[0], 'phone': ''}])
+    with pytest.raises(ValueError):
+        validate_offices([])
+
+
+def test_publish_keeps_order_and_recent_snapshots(store):
+    assert store.load() == (None, None)
+    version, seeded = store.seed()
+    assert (version, seeded) == (1, True) and store.seed() == (1, False)
+    assert store.load()[1] == load_bundled_offices()
+
+    offices = load_bundled_offices()[:3]
+    for expected in (2, 3, 4):
+        assert store.publish(offices) == expected
+    assert store.load() == (4, offices)
+    # The live snapshot plus the two before it
+    assert {doc['version'] for doc in store._offices.docs} == {2, 3, 4}
+
+
+def test_slower_publisher_cannot_roll_back(store):
+    store.publish(load_bundled_offices())
+    store._versions.docs[0]['version'] = 5
+    assert store.publish(load_bundled_offices()[:1]) == 2
+    assert store.current_version() == 5
+
+
+def test_service_rebuilds_when_version_changes(store):
+    service = LegalAidService(store=store, refresh_interval=0)
+    assert service.directory.source == DLSA_SOURCE_BUNDLED and service.directory.version is None
+
+    offices = load_bundled_offices()
+    offices[0] = {**offices[0], 'phone': '0612-0000000'}
+    store.publish(offices)
+    before = service.directory
+    assert service.refresh_directory() is True
+    assert before.offices[0]['phone'] == '0612-2504400'
+    patna = service.find_offices(district='Patna')['offices'][0]
+    assert patna['phone'] == '0612-0000000'
+    assert service.directory_info()['version'] == 1
+    assert service.directory_info()['source'] == DLSA_SOURCE_MONGO
+
+    # Unchanged version: one version read, no reload
+    reads = store._offices.reads
+    assert service.refresh_directory() is False
+    assert store._offices.reads == reads
+
+
+def test_searches_never_read_mongo(store):
+    store.seed()
+    service = LegalAidService(store=store, refresh_interval=0)
+    assert service.directory.source == DLSA_SOURCE_MONGO
+    reads = store._offices.reads + store._versions.reads
+    service.find_offices(district='Varansi')
+    service.find_offices(user_lat=25.61, user_lng=85.14)
+    service.suggest('pat')
+    service.find_nearest_batch([{'lat': 25.61, 'lng': 85.14}])
+    assert store._offices.reads + store._versions.reads == reads
+
+
+def test_poller_swaps_in_new_version(store):
+    service = LegalAidService(store=store, refresh_interval=0.01)
+    try:
+        store.publish(load_bundled_offices()[:2])
+        deadline = time.monotonic() + 2
+        while service.directory.version != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(service.offices) == 2
+    finally:
+        service._directory_poller.stop(timeout=1)
@@ -0,0 +1,68 @@
+"""
+Tests for the batch document analysis endpoint
+"""
+
+import json
+import zipfile
+from io import BytesIO
+
+from flask import Flask
+
+from app.routes import document_routes
+from app.utils.upload_spool import SpooledRequest
+
+
+TEXTS = {
+    'fir.jpg': "FIR registered at थाना Rampur under धारा 420 IPC by police on 12/05/2024",
+    'notice.png': "LEGAL NOTICE: you are hereby demanded by advocate to pay Rs. 50,000",
+    'land.pdf': "खतौनी खसरा नं. 245 भूमि तहसील राजस्व रिकॉर्ड की प्रति",
+}
+
+
+def make_client(monkeypatch):
+    monkeypatch.setattr(document_routes.document_service, '_extract_text_ocr',
+                        lambda file: {'success': True, 'text': TEXTS[file.filename], 'method': 'test'})
+    app = Flask(__name__)
+    app.request_class = SpooledRequest
+    app.config['MAX_CONTENT_LENGTH'] = 1024
+    app.register_blueprint(document_routes.document_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def make_zip(names):
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name in names:
+            archive.writestr(f'family/{name}', b'image')
+        archive.writestr('family/readme.txt', b'ignored')
+    buffer.seek(0)
+    return buffer
+
+
+def test_batch_streams_one_jsonl_line_per_file(monkeypatch):
+    client = make_client(monkeypatch)
+    response = client.post('/api/analyze-documents/batch', data={
+        'documents': [(BytesIO(b'image'), 'fir.jpg')],
+        'archive': (make_zip(['notice.png', 'land.pdf']), 'family.zip'),
+        # Padding pushes the body past the app-wide limit; the batch view allows more
+        'note': 'x' * 2048,
+    })
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+
+    results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    by_name = {r['filename']: r for r in results}
+    assert sorted(by_name) == ['fir.jpg', 'land.pdf', 'notice.png']
+    assert sorted(r['index'] for r in results) == [0, 1, 2]
+    assert by_name['fir.jpg']['data']['documentType'] == 'fir'
+    assert by_name['notice.png']['data']['documentType'] == 'legal_notice'
+    assert by_name['land.pdf']['data']['documentType'] == 'land_record'
+
+
+def test_batch_rejects_bad_zip(monkeypatch):
+    client = make_client(monkeypatch)
+    response = client.post('/api/analyze-documents/batch', data={
+        'archive': (BytesIO(b'not a zip'), 'family.zip'),
+    })
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Invalid zip file'
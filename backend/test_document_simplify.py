@@ -0,0 +1,77 @@
+"""
+Tests for memoized, deadline-bounded AI simplification in DocumentService
+"""
+
+import time
+import threading
+
+from app.services import document_service
+from app.services.document_service import DocumentService, summary_key, get_cached_summary
+
+
+NOTICE = "LEGAL NOTICE: you are hereby demanded to pay Rs. 50,000 within 15 days."
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeGemini:
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+        self.release = threading.Event()
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        self.release.wait(self.delay)
+        return FakeResponse('📋 AI सारांश')
+
+
+def make_service(delay):
+    document_service._ai_summary_cache.clear()
+    service = DocumentService()
+    service.gemini_model = FakeGemini(delay)
+    return service
+
+
+def test_near_identical_text_shares_key():
+    assert summary_key(NOTICE, 'legal_notice') == summary_key("legal  notice - you are HEREBY demanded to pay Rs 50,000 within 15 days", 'legal_notice')
+    assert summary_key(NOTICE, 'legal_notice') != summary_key(NOTICE, 'fir')
+    assert summary_key(NOTICE, 'legal_notice') != summary_key(NOTICE.replace('50,000', '60,000'), 'legal_notice')
+
+
+def test_hindi_vowel_signs_change_key():
+    # Differ only in matras; both must keep their own AI summary
+    a = summary_key('आपको 15 दिन में मकान खाली करना है', 'legal_notice')
+    b = summary_key('आपके 15 दिन मे मकान खाली करना है', 'legal_notice')
+    assert a != b
+    assert a == summary_key('आपको  15 दिन में, मकान खाली करना है।', 'legal_notice')
+
+
+def test_slow_ai_returns_rules_then_upgrades_cache():
+    service = make_service(delay=5)
+    started = time.monotonic()
+    result = service._simplify_with_source(NOTICE, 'legal_notice', deadline=0.05)
+    assert time.monotonic() - started < 1
+    assert result['source'] == 'rules'
+    assert result['future'] is not None
+
+    service.gemini_model.release.set()
+    assert result['future'].result(timeout=2) == '📋 AI सारांश'
+    assert get_cached_summary(result['key']) == '📋 AI सारांश'
+
+    # Memoized: the same notice again is answered from cache without calling Gemini
+    again = service._simplify_with_source(NOTICE, 'legal_notice', deadline=0)
+    assert again['source'] == 'ai'
+    assert service.gemini_model.calls == 1
+
+
+def test_concurrent_misses_share_one_ai_call():
+    service = make_service(delay=0.2)
+    first = service._simplify_with_source(NOTICE, 'legal_notice', deadline=0)
+    second = service._simplify_with_source(NOTICE, 'legal_notice', deadline=0)
+    assert first['future'] is second['future']
+    first['future'].result(timeout=2)
+    assert service.gemini_model.calls == 1
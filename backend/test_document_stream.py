@@ -0,0 +1,58 @@
+"""
+Tests for the staged SSE document analysis endpoint
+"""
+
+import json
+from io import BytesIO
+
+from flask import Flask
+
+from app.routes import document_routes
+
+
+NOTICE_TEXT = "LEGAL NOTICE - you are hereby demanded by advocate to pay Rs. 50,000 by 12/05/2024 (Case No. 77/2024)"
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+def make_client(monkeypatch, ocr_result):
+    monkeypatch.setattr(document_routes.document_service, '_extract_text_ocr', lambda file: ocr_result)
+    app = Flask(__name__)
+    app.register_blueprint(document_routes.document_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def test_stream_emits_stages_in_order(monkeypatch):
+    client = make_client(monkeypatch, {'success': True, 'text': NOTICE_TEXT, 'method': 'test'})
+    response = client.post('/api/analyze-document/stream',
+                           data={'document': (BytesIO(b'img'), 'notice.jpg')})
+    assert response.mimetype == 'text/event-stream'
+
+    events = parse_sse(response.get_data(as_text=True))
+    assert [name for name, _ in events] == ['ocr', 'classification', 'key_info', 'simplified', 'done']
+    assert events[1][1]['documentType'] == 'legal_notice'
+    assert events[1][1]['urgencyLevel'] == 'high'
+    assert 'केस नंबर: 77/2024' in events[2][1]['keyPoints']
+
+    # The final event carries the same payload /analyze-document returns
+    done = events[-1][1]
+    assert done['success'] is True
+    assert done['data']['simplifiedText'] == events[3][1]['simplifiedText']
+
+
+def test_stream_reports_ocr_failure(monkeypatch):
+    client = make_client(monkeypatch, {'success': False, 'error': 'blurry'})
+    response = client.post('/api/analyze-document/stream',
+                           data={'document': (BytesIO(b'img'), 'notice.jpg')})
+    events = parse_sse(response.get_data(as_text=True))
+    assert events == [('error', {
+        'success': False,
+        'error': 'blurry',
+        'message': 'दस्तावेज़ से टेक्स्ट नहीं निकाल पाए। कृपया साफ़ फोटो अपलोड करें।'
+    })]
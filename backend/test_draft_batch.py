@@ -0,0 +1,158 @@
+"""
+Tests for the bulk draft generation endpoint
+"""
+
+import io
+import json
+import time
+import zipfile
+
+import pytest
+from flask import Flask
+
+from app.routes import draft_routes
+from app.services import draft_service
+from app.utils.result_cache import TieredCache
+
+ROWS = [
+    {'issueType': 'police_complaint', 'details': 'mere ghar me kal raat chori ho gai', 'senderInfo': {'name': 'Sita'}},
+    {'issueType': 'other', 'details': 'short'},
+    {'issueType': 'ration_card', 'details': 'My ration card was cancelled without notice', 'language': 'english'},
+]
+
+CSV_ROWS = (
+    'issueType,details,language,senderInfo.name,senderInfo.district,recipient.office\n'
+    'land_dispute,padosi ne meri zameen par kabza kar liya hai,hindi,Ramesh,Patna,तहसील कार्यालय\n'
+    'pension_issue,Meri vridha pension 6 mahine se nahi aayi hai,english,Kamla,Gaya,\n'
+)
+
+
+@pytest.fixture(autouse=True)
+def memory_only_caches(monkeypatch):
+    """Fresh, Mongo-free draft caches for every test"""
+    for name in list(draft_service._result_caches):
+        monkeypatch.setitem(draft_service._result_caches, name, TieredCache(name, use_mongo=False))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(draft_routes.draft_service, 'ai_client', None)
+    app = Flask(__name__)
+    app.register_blueprint(draft_routes.draft_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def parse_jsonl(response):
+    assert response.mimetype == 'application/x-ndjson'
+    return sorted((json.loads(line) for line in response.get_data(as_text=True).splitlines()),
+                  key=lambda row: row['index'])
+
+
+def test_jsonl_body_streams_one_result_per_row(client):
+    body = '\n'.join(json.dumps(row, ensure_ascii=False) for row in ROWS) + '\nnot json\n'
+    response = client.post('/api/generate-drafts/batch', data=body.encode('utf-8'),
+                           content_type='application/x-ndjson')
+    assert response.headers['X-Total-Rows'] == '4'
+    results = parse_jsonl(response)
+    assert [row['success'] for row in results] == [True, False, True, False]
+    assert '• नाम: Sita' in results[0]['data']['draft']
+    assert results[1]['error'] == 'Details too short'
+    assert results[2]['language'] == 'english' and results[2]['data']['draftSource'] == 'template'
+    assert results[3]['error'] == 'Invalid row'
+
+
+def test_rows_with_wrong_field_types_fail_alone(client):
+    rows = [
+        {**ROWS[0], 'issueType': 42},
+        {**ROWS[0], 'details': ['a', 'list']},
+        {**ROWS[0], 'language': 7},
+        {**ROWS[0], 'senderInfo': 'Sita'},
+        {**ROWS[0], 'issueType': None},
+        'just a string',
+        ROWS[0],
+    ]
+    response = client.post('/api/generate-drafts/batch', json={'rows': rows})
+    assert response.status_code == 200
+    results = parse_jsonl(response)
+    assert [row.get('error') for row in results[:6]] == [
+        'Invalid issueType', 'Invalid details', 'Invalid language', 'Invalid senderInfo',
+        'Issue type is required', 'Invalid row'
+    ]
+    assert results[6]['success'] is True
+
+
+def test_recipient_may_be_a_plain_name(client):
+    response = client.post('/api/generate-draft', json={**ROWS[0], 'recipient': 'थाना प्रभारी'})
+    assert response.status_code == 200
+    assert 'थाना प्रभारी,' in response.get_json()['data']['draft']
+
+    body = 'issueType,details,recipient\npolice_complaint,mere ghar me kal raat chori ho gai,थाना प्रभारी\n'
+    results = parse_jsonl(client.post('/api/generate-drafts/batch', data=body.encode('utf-8'),
+                                      content_type='text/csv'))
+    assert results[0]['success'] is True
+    assert 'थाना प्रभारी,' in results[0]['data']['draft']
+
+
+def test_csv_upload_fills_nested_columns(client):
+    response = client.post('/api/generate-drafts/batch', data={
+        'rows': (io.BytesIO(CSV_ROWS.encode('utf-8-sig')), 'cases.csv')
+    }, content_type='multipart/form-data')
+    results = parse_jsonl(response)
+    assert [row['issueType'] for row in results] == ['land_dispute', 'pension_issue']
+    assert all(row['success'] for row in results)
+    assert '• नाम: Ramesh' in results[0]['data']['draft']
+    assert 'जिला: Patna' in results[0]['data']['draft']
+
+
+def test_zip_output_has_a_letter_per_row_and_a_manifest(client):
+    response = client.post('/api/generate-drafts/batch?format=zip', json={'rows': ROWS})
+    assert response.mimetype == 'application/zip'
+    archive = zipfile.ZipFile(io.BytesIO(response.get_data()))
+    manifest = [json.loads(line) for line in archive.read('results.jsonl').decode('utf-8').splitlines()]
+    assert [row['index'] for row in manifest] == [0, 1, 2]
+    assert manifest[1]['success'] is False and 'file' not in manifest[1]
+    letter = archive.read(manifest[0]['file']).decode('utf-8')
+    assert manifest[0]['file'] == '000_police_complaint_hindi.txt'
+    assert '• नाम: Sita' in letter
+    assert sorted(archive.namelist()) == sorted([manifest[0]['file'], manifest[2]['file'], 'results.jsonl'])
+
+
+def test_too_many_rows_is_rejected(client, monkeypatch):
+    monkeypatch.setattr(draft_routes, 'BATCH_MAX_ROWS', 2)
+    response = client.post('/api/generate-drafts/batch', data=CSV_ROWS * 2, content_type='text/csv')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Too many rows'
+
+
+def test_unsupported_format_is_rejected(client):
+    response = client.post('/api/generate-drafts/batch', data='a\tb', content_type='text/plain')
+    assert response.status_code == 400
+    response = client.post('/api/generate-drafts/batch?format=pdf', json={'rows': ROWS})
+    assert response.status_code == 400
+
+
+def test_each_row_has_its_own_ai_deadline(monkeypatch):
+    service = draft_service.DraftService()
+    service.ai_client = object()
+
+    def slow_ai(issue_type, details, *args):
+        time.sleep(0.6 if 'slow' in details else 0.05)
+        return 'सेवा में,\n' + 'निवेदन है कि ' * 20
+
+    monkeypatch.setattr(service, '_generate_draft_with_ai', slow_ai)
+    rows = [(i, {'issue_type': 'other', 'details': f'{speed} case number {i} with enough detail',
+                 'language': 'hindi'}) for i, speed in enumerate(['fast', 'slow', 'fast', 'fast'])]
+
+    started = time.monotonic()
+    results = {row['index']: row for row in service.generate_batch(rows, max_workers=4, deadline=0.3)}
+    assert time.monotonic() - started < 0.6
+    assert results[1]['data']['draftSource'] == 'template'
+    assert all(results[i]['data']['draftSource'] == 'ai' for i in (0, 2, 3))
+
+
+@pytest.mark.parametrize('value, use_cache', [
+    (True, False), (False, True), ('true', False), ('TRUE', False), ('1', False),
+    ('false', True), ('0', True), ('', True), (None, True),
+])
+def test_bypass_cache_accepts_csv_strings(value, use_cache):
+    assert draft_routes._use_cache({'bypassCache': value}) is use_cache
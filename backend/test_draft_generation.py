@@ -0,0 +1,124 @@
+"""
+Tests for concurrent AI/template drafting in DraftService.generate_draft
+"""
+
+import time
+
+import pytest
+
+from app.services import draft_service
+from app.services.draft_service import DraftService
+from app.services.draft_templates import DraftTemplate
+from app.utils.result_cache import TieredCache
+
+AI_LETTER = 'सेवा में,\nश्रीमान थाना प्रभारी महोदय,\n' + 'AI द्वारा लिखा गया पत्र। ' * 10
+
+
+@pytest.fixture(autouse=True)
+def memory_only_caches(monkeypatch):
+    """Fresh, Mongo-free draft caches for every test"""
+    for name in list(draft_service._result_caches):
+        monkeypatch.setitem(draft_service._result_caches, name, TieredCache(name, use_mongo=False))
+
+
+def make_service(ai_call):
+    service = DraftService()
+    service.ai_client = object()  # any truthy client; the call itself is faked
+    service._generate_draft_with_ai = ai_call
+    return service
+
+
+def test_ai_draft_keeps_template_metadata():
+    service = make_service(lambda *args: AI_LETTER)
+    result = service.generate_draft('police_complaint', 'mere ghar me chori ho gai', 'hindi')
+    assert result['draft'] == AI_LETTER
+    assert result['draftSource'] == 'ai'
+    assert result['tips'] and result['submitTo']
+
+
+def test_slow_ai_misses_deadline_and_template_is_returned(monkeypatch):
+    monkeypatch.setattr(draft_service, 'AI_DRAFT_DEADLINE', 0.2)
+
+    def slow_ai(*args):
+        time.sleep(1)
+        return AI_LETTER
+
+    service = make_service(slow_ai)
+    started = time.monotonic()
+    result = service.generate_draft('police_complaint', 'mere ghar me chori ho gai', 'hindi', {'name': 'Sita'})
+    assert time.monotonic() - started < 0.8
+    assert result['draftSource'] == 'template'
+    assert '• नाम: Sita' in result['draft']
+
+
+def test_late_ai_draft_is_cached_for_the_next_request(monkeypatch):
+    monkeypatch.setattr(draft_service, 'AI_DRAFT_DEADLINE', 0.1)
+    calls = []
+
+    def slow_ai(*args):
+        calls.append(args)
+        time.sleep(0.3)
+        return AI_LETTER
+
+    service = make_service(slow_ai)
+    assert service.generate_draft('police_complaint', 'mere ghar me chori ho gai')['draftSource'] == 'template'
+    key = service._draft_cache_key('police_complaint', 'mere ghar me chori ho gai', 'hindi', {}, {}, '')
+    deadline = time.monotonic() + 2
+    while draft_service._result_caches['draft']._memory.get(key, None) is None and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    result = service.generate_draft('police_complaint', 'mere ghar me chori ho gai')
+    assert len(calls) == 1
+    assert result['draftSource'] == 'ai' and result['draft'] == AI_LETTER and result['cached'] is True
+
+
+def test_cached_results_are_copies_and_ai_wins_skip_the_template(monkeypatch):
+    rendered = []
+    monkeypatch.setattr(DraftTemplate, 'result',
+                        lambda self, values: rendered.append(self) or {})
+    service = make_service(lambda *args: AI_LETTER)
+    first = service.generate_draft('police_complaint', 'mere ghar me chori ho gai')
+    assert 'cached' not in first and rendered == []
+
+    hit = service.generate_draft('police_complaint', 'mere ghar me chori ho gai')
+    assert hit['cached'] is True
+    key = service._draft_cache_key('police_complaint', 'mere ghar me chori ho gai', 'hindi', {}, {}, '')
+    assert 'cached' not in draft_service._result_caches['draft']._memory.get(key, None)['value']
+
+
+def test_ai_failure_falls_back_to_template():
+    def failing_ai(*args):
+        raise RuntimeError('rate limited')
+
+    service = make_service(failing_ai)
+    result = service.generate_draft('rti_application', 'mujhe ration card ki jankari chahiye', 'english')
+    assert result['draftSource'] == 'template'
+    assert 'सूचना का अधिकार' in result['draft']
+
+
+def test_both_languages_are_drafted_concurrently():
+    def ai(issue_type, details, language, *args):
+        time.sleep(0.3)
+        return f'{language}: ' + AI_LETTER
+
+    service = make_service(ai)
+    started = time.monotonic()
+    results = service.generate_drafts('police_complaint', 'mere ghar me chori ho gai', ['hindi', 'english'])
+    assert time.monotonic() - started < 0.55
+    assert list(results) == ['hindi', 'english']
+    assert results['english']['draft'].startswith('english: ')
+    assert results['hindi']['tips'] != results['english']['tips']
+
+
+def test_bilingual_templates_share_cleaned_details(monkeypatch):
+    service = DraftService()
+    service.ai_client = None
+    calls = []
+    cleanup = service._rewrite_with_builtin
+    monkeypatch.setattr(service, '_rewrite_with_builtin', lambda text: calls.append(text) or cleanup(text))
+
+    results = service.generate_drafts('police_complaint', 'mere ghar me chori ho gai', ['english', 'hindi'],
+                                      {'name': 'Sita'})
+    assert len(calls) == 1
+    assert all(r['draftSource'] == 'template' and 'Sita' in r['draft'] for r in results.values())
+    assert 'चोरी' in results['english']['draft'] and 'चोरी' in results['hindi']['draft']
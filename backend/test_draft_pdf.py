@@ -0,0 +1,69 @@
+"""
+Tests for server-side PDF export of drafts
+Rendering tests need fpdf2 and a font (DRAFT_PDF_FONT or a system Devanagari font)
+"""
+
+import pytest
+from flask import Flask
+
+from app.routes import draft_routes
+from app.services.draft_pdf_service import DraftPDFService, FPDF_AVAILABLE, find_font
+
+LETTER = ('सेवा में,\nश्रीमान जिलाधिकारी महोदय,\n\nविषय: भूमि विवाद के संबंध में शिकायत\n\n'
+          + 'Respectfully I submit that my neighbour has occupied my land. ' * 40 + '\n\nभवदीय,\nसीता')
+
+needs_pdf = pytest.mark.skipif(not FPDF_AVAILABLE or find_font() is None, reason='fpdf2 or PDF font not installed')
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(draft_routes.draft_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def test_missing_draft_is_rejected(client):
+    response = client.post('/api/generate-draft/pdf', json={'language': 'hindi'})
+    assert response.status_code == 400
+
+
+def test_unavailable_export_returns_503(client, monkeypatch):
+    monkeypatch.setattr(draft_routes, 'draft_pdf_service', DraftPDFService(font_path='/nonexistent/font.ttf'))
+    response = client.post('/api/generate-draft/pdf', json={'draft': LETTER})
+    assert response.status_code == 503
+
+
+@needs_pdf
+def test_pdf_is_streamed_and_cached_by_draft_hash(client, monkeypatch):
+    service = DraftPDFService()
+    monkeypatch.setattr(draft_routes, 'draft_pdf_service', service)
+
+    response = client.post('/api/generate-draft/pdf', json={'draft': LETTER})
+    assert response.status_code == 200 and response.mimetype == 'application/pdf'
+    assert response.get_data().startswith(b'%PDF')
+    etag = response.headers['ETag']
+
+    again = client.post('/api/generate-draft/pdf', json={'draft': LETTER})
+    assert again.get_data() == response.get_data()
+    assert service.renders == 1
+
+    unchanged = client.post('/api/generate-draft/pdf', json={'draft': LETTER}, headers={'If-None-Match': etag})
+    assert unchanged.status_code == 304
+
+    client.post('/api/generate-draft/pdf', json={'draft': LETTER + '\nनया'})
+    assert service.renders == 2
+
+
+@needs_pdf
+def test_layout_wraps_within_the_page():
+    from fpdf import FPDF
+
+    service = DraftPDFService()
+    pdf = FPDF(format='A4')
+    pdf.add_font('draft', '', service._get_font())
+    pdf.set_font('draft', size=12)
+    lines = list(service._layout(pdf, LETTER + '\n' + '_' * 400, pdf.epw))
+    assert len(lines) > 15
+    assert all(pdf.get_string_width(line) <= pdf.epw + 0.01 for line in lines)
+    assert ''.join(lines).count('_') == 400
+    assert lines[:3] == ['सेवा में,', 'श्रीमान जिलाधिकारी महोदय,', '']
@@ -0,0 +1,115 @@
+"""
+Tests for the SSE draft generation endpoint
+"""
+
+import json
+
+import pytest
+from flask import Flask
+
+from app.routes import draft_routes
+from app.services import draft_service
+from app.utils.result_cache import TieredCache
+
+BODY = {'issueType': 'police_complaint', 'details': 'mere ghar me kal raat chori ho gai', 'language': 'hindi',
+        'senderInfo': {'name': 'Sita'}}
+AI_CHUNKS = ['सेवा में,\n', 'श्रीमान थाना प्रभारी महोदय,\n\n', 'विषय: चोरी की शिकायत\n\n' + 'निवेदन है कि ' * 12]
+
+
+@pytest.fixture(autouse=True)
+def memory_only_caches(monkeypatch):
+    """Fresh, Mongo-free draft caches for every test"""
+    for name in list(draft_service._result_caches):
+        monkeypatch.setitem(draft_service._result_caches, name, TieredCache(name, use_mongo=False))
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(draft_routes.draft_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def post_stream(client, monkeypatch, ai_stream):
+    service = draft_routes.draft_service
+    monkeypatch.setattr(service, 'ai_client', object() if ai_stream else None)
+    monkeypatch.setattr(service, '_stream_draft_with_ai', ai_stream)
+    response = client.post('/api/generate-draft/stream', json=BODY)
+    assert response.mimetype == 'text/event-stream'
+    return parse_sse(response.get_data(as_text=True))
+
+
+def test_ai_letter_is_streamed_then_metadata(client, monkeypatch):
+    events = post_stream(client, monkeypatch, lambda *args: iter(AI_CHUNKS))
+    assert [name for name, _ in events] == ['delta'] * 3 + ['done']
+    assert ''.join(p['text'] for _, p in events[:-1]) == ''.join(AI_CHUNKS)
+    done = events[-1][1]
+    assert done['success'] is True and done['language'] == 'hindi'
+    assert done['data']['draftSource'] == 'ai'
+    assert done['data']['tips'] and done['data']['submitTo']
+    assert 'enclosures' in done['data']
+
+
+def test_template_fallback_is_streamed_the_same_way(client, monkeypatch):
+    events = post_stream(client, monkeypatch, None)
+    names = [name for name, _ in events]
+    assert names[-1] == 'done' and set(names[:-1]) == {'delta'} and len(names) > 3
+    done = events[-1][1]['data']
+    assert done['draftSource'] == 'template'
+    assert ''.join(p['text'] for _, p in events[:-1]) == done['draft']
+    assert '• नाम: Sita' in done['draft']
+
+
+def test_ai_failure_mid_stream_resets_to_template(client, monkeypatch):
+    def broken_stream(*args):
+        yield AI_CHUNKS[0]
+        raise RuntimeError('connection reset')
+
+    events = post_stream(client, monkeypatch, broken_stream)
+    names = [name for name, _ in events]
+    assert names[:2] == ['delta', 'reset']
+    assert events[-1][1]['data']['draftSource'] == 'template'
+
+
+def test_invalid_request_is_rejected_before_streaming(client):
+    response = client.post('/api/generate-draft/stream', json={'issueType': 'other', 'details': 'short'})
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Details too short'
+
+
+def test_cached_letter_is_streamed_without_ai(client, monkeypatch):
+    post_stream(client, monkeypatch, lambda *args: iter(AI_CHUNKS))
+
+    def no_ai(*args):
+        raise AssertionError('AI should not be called on a cache hit')
+
+    events = post_stream(client, monkeypatch, no_ai)
+    done = events[-1][1]['data']
+    assert done['cached'] is True and done['draftSource'] == 'ai'
+    assert ''.join(p['text'] for _, p in events[:-1]) == done['draft']
+
+
+def test_language_list_is_rejected_for_streaming(client):
+    response = client.post('/api/generate-draft/stream', json={**BODY, 'language': ['hindi', 'english']})
+    assert response.status_code == 400
+
+
+def test_language_list_returns_both_letters(client, monkeypatch):
+    monkeypatch.setattr(draft_routes.draft_service, 'ai_client', None)
+    response = client.post('/api/generate-draft', json={**BODY, 'language': ['Hindi', 'english', 'hindi']})
+    body = response.get_json()
+    assert body['language'] == ['hindi', 'english']
+    assert set(body['data']) == {'hindi', 'english'}
+    assert body['data']['english']['draftSource'] == 'template'
+
+    response = client.post('/api/generate-draft', json={**BODY, 'language': ['english']})
+    assert response.get_json()['language'] == 'english'
+    assert 'draft' in response.get_json()['data']
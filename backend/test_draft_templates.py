@@ -0,0 +1,88 @@
+"""
+Tests for the compiled draft templates and slot rendering
+"""
+
+import pytest
+
+from app.services.draft_service import DraftService
+from app.services.draft_templates import BLANK, DRAFT_TEMPLATES, DraftTemplate, get_template
+
+SENDER = {'name': 'Ramesh Kumar', 'fatherName': 'Mohan Lal', 'address': 'Village Rampur',
+          'phone': '9876543210', 'district': 'Patna', 'state': 'Bihar'}
+
+
+def render(issue_type, language='hindi', sender=None, recipient=None, subject=None, details='details'):
+    service = DraftService()
+    values = service._template_values(details, sender, recipient, subject)
+    return get_template(issue_type, language).render(values)
+
+
+def test_slots_and_defaults():
+    template = DraftTemplate('x', 'hindi', 'To,\n{recipient:The Officer,}\n{office:{district:[जिला]}}\nName: {name}', [], [])
+    assert template.slots == {'recipient', 'office', 'district', 'name'}
+    assert template.render({}) == f'To,\nThe Officer,\n[जिला]\nName: {BLANK}'
+    assert template.render({'district': 'Patna', 'name': 'Sita'}) == 'To,\nThe Officer,\nPatna\nName: Sita'
+    assert template.render({'office': 'Collectorate,', 'district': 'Patna'}) == 'To,\nThe Officer,\nCollectorate,\nName: ' + BLANK
+
+
+@pytest.mark.parametrize('text', ['{unknown}', '{name', 'a } b', '{name:x'])
+def test_malformed_templates_are_rejected(text):
+    with pytest.raises(ValueError):
+        DraftTemplate('x', 'hindi', text, [], [])
+
+
+def test_accused_and_witness_blanks_are_not_slots():
+    text = render('police_complaint', sender=SENDER, recipient={'name': 'SHO Bihta', 'office': 'Bihta'},
+                  subject='Theft at my house')
+    applicant, accused = text.split('आरोपी', 1)
+    assert '• नाम: Ramesh Kumar' in applicant
+    assert '• पिता का नाम: Mohan Lal' in applicant
+    assert '• पता: Village Rampur' in applicant
+    assert '• घटना का स्थान: Patna' in applicant
+    accused, closing = accused.split('प्रार्थी')
+    assert 'Ramesh Kumar' not in accused
+    assert accused.count(BLANK) == 5  # accused name/address/identity, witness name/address
+    assert 'नाम: Ramesh Kumar' in closing and 'मोबाइल नंबर: 9876543210' in closing
+    assert text.startswith('सेवा में,\nSHO Bihta,\nBihta,\n')
+    assert 'विषय: Theft at my house' in text
+
+
+def test_section_rule_does_not_depend_on_details():
+    # The old filler looked for the last आरोपी/गवाह header before each blank,
+    # details included, so details like these left the closing name blank
+    text = render('land_dispute', sender=SENDER, details='आरोपी ने धमकी दी, गवाह मौजूद थे')
+    closing = text.split('भवदीय,')[1]
+    assert 'नाम: Ramesh Kumar' in closing and 'पता: Village Rampur' in closing
+    assert '• ग्राम/मोहल्ला: Village Rampur' in text
+    # Accused blanks stay blank whatever the details say
+    text = render('police_complaint', sender=SENDER, details='आवेदक प्रार्थी शिकायतकर्ता')
+    assert text.split('आरोपी का विवरण')[1].split('प्रार्थी,')[0].count(BLANK) == 5
+
+
+@pytest.mark.parametrize('language', ['hindi', 'english'])
+@pytest.mark.parametrize('issue_type', ['land_dispute', 'domestic_violence', 'police_complaint', 'rti_application'])
+def test_templates_get_sender_name(issue_type, language):
+    assert 'Ramesh Kumar' in render(issue_type, language, sender=SENDER, recipient='District Magistrate')
+
+
+def test_missing_values_leave_blanks():
+    text = render('land_dispute', sender={'name': 'Sita'})
+    assert '• नाम: Sita' in text
+    assert f'• पता: {BLANK}' in text
+
+
+def test_language_and_issue_fallbacks():
+    assert get_template('property_dispute', 'english') is DRAFT_TEMPLATES[('land_dispute', 'english')]
+    assert get_template('consumer_complaint', 'english') is DRAFT_TEMPLATES[('consumer_complaint', 'hindi')]
+    assert get_template('no_such_issue', 'hindi') is DRAFT_TEMPLATES[('other', 'hindi')]
+
+
+def test_generate_draft_template_fallback():
+    service = DraftService()
+    service.ai_client = None
+    result = service.generate_draft('domestic_violence', 'pati ne maarpeet ki', 'english', SENDER)
+    assert result['draft'].count('Ramesh Kumar') >= 1
+    assert result['tips'] and result['submitTo'] and result['emergencyContacts']
+    # Metadata lists are fresh copies, not the compiled template's
+    result['tips'].append('x')
+    assert 'x' not in get_template('domestic_violence', 'english').tips
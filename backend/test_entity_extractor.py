@@ -0,0 +1,78 @@
+"""
+Tests for the precompiled entity extraction engine
+"""
+
+from app.utils.entity_extractor import extract_entities
+from app.services.document_service import DocumentService
+
+
+NOTICE = """LEGAL NOTICE
+Case No. CR/123/2023  FIR No: 45/2023 u/s 420, 406 IPC
+Name: Ramesh Kumar   Shri Suresh Yadav
+Date 12/05/2023 and 3 March 2024 and 15 जनवरी 2024 and again 12/05/2023
+Pay Rs. 50,000 within 15 days; 2,500 rupees fine.
+Phone +91-9876543210, email advocate.sharma@gmail.com
+Address: House 12, Gandhi Nagar, Patna PIN: 800001
+खसरा नं. 123/4
+"""
+
+
+def test_all_entity_types():
+    """Every entity type comes out of one call, in order of appearance"""
+    info = extract_entities(NOTICE)
+    assert info['case_numbers'] == ['CR/123/2023']
+    assert info['fir_numbers'] == ['45/2023']
+    assert info['sections'] == ['420, 406']
+    assert info['names'] == ['Ramesh Kumar', 'Suresh Yadav']
+    assert info['dates'] == ['12/05/2023', '3 March 2024', '15 जनवरी 2024']
+    assert info['amounts'] == ['50,000', '2,500']
+    assert info['phones'] == ['+91-9876543210']
+    assert info['emails'] == ['advocate.sharma@gmail.com']
+    assert info['pincodes'] == ['800001']
+    assert info['addresses'] == ['House 12, Gandhi Nagar, Patna PIN: 800001']
+    assert info['plot_numbers'] == ['123/4']
+    assert info['is_resume'] is False
+
+
+def test_phone_is_not_a_pincode():
+    info = extract_entities("Call 9876543210 today")
+    assert info['phones'] == ['9876543210']
+    assert info['pincodes'] == []
+
+
+def test_resume_details():
+    info = extract_entities("Resume\nObjective: job\nSkills: Python, Excel\nEducation: B.Tech\n3 years of experience")
+    assert info['is_resume'] is True
+    assert 'Python' in info['skills']
+    assert info['experience'] == ['3 years of experience']
+
+
+def test_document_service_uses_engine():
+    service = DocumentService()
+    entities = extract_entities(NOTICE)
+    key_points = service._extract_key_points(NOTICE, 'legal_notice', entities)
+    assert key_points[:3] == ['केस नंबर: CR/123/2023', 'धारा: 420, 406', 'राशि: ₹50,000']
+    dates = service._extract_dates(NOTICE)
+    assert [d['date'] for d in dates] == entities['dates']
+
+
+def test_dates_inside_other_entities_are_found():
+    # As the per-type scans did: the date inside a case/FIR number still counts
+    info = extract_entities("Case No 12/03/2024 and FIR No 5/6/2023 dated 1 May 2024")
+    assert info['case_numbers'] == ['12/03/2024']
+    assert info['fir_numbers'] == ['5/6/2023']
+    assert info['dates'] == ['12/03/2024', '5/6/2023', '1 May 2024']
+
+
+def test_entities_inside_other_entities_are_found():
+    info = extract_entities("Case No. 801103/2023, Ref No 9876543210-A, Name: Ramesh Plot no 5")
+    assert info['case_numbers'] == ['801103/2023', '9876543210-A']
+    assert info['pincodes'] == ['801103']
+    assert info['phones'] == ['9876543210']
+    assert info['names'] == ['Ramesh Plot']
+    assert info['plot_numbers'] == ['5']
+
+
+def test_case_numbers_need_no_digit():
+    # Same pattern as the old per-type scan: file references may be letters only
+    assert extract_entities("File No. ABC-XYZ pending")['case_numbers'] == ['ABC-XYZ']
@@ -0,0 +1,41 @@
+"""
+Tests for the Aho-Corasick keyword automaton and document classification
+"""
+
+import random
+
+from app.utils.keyword_automaton import KeywordAutomaton
+from app.services.document_service import DocumentService
+
+
+def naive_scores(keywords_by_label, text):
+    """The old substring-scan scoring rule"""
+    text_lower = text.lower()
+    return {
+        label: sum(1 for kw in dict.fromkeys(k.lower() for k in keywords) if kw in text_lower)
+        for label, keywords in keywords_by_label.items()
+    }
+
+
+def test_matches_substring_scan():
+    """Overlapping and nested keywords score exactly like `keyword in text`"""
+    keywords = {
+        'a': ['he', 'she', 'his', 'hers', 'fir', 'first information report', 'IPC'],
+        'b': ['धारा', 'थाना', 'hers'],
+    }
+    automaton = KeywordAutomaton(keywords)
+    alphabet = list('hersifto pcनधाराथ') + ['धारा', 'first information report', 'IPC']
+    rng = random.Random(7)
+    for _ in range(2000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert automaton.score(text) == naive_scores(keywords, text), text
+
+
+def test_classification_scores_and_confidence():
+    service = DocumentService()
+    result = service._score_document("FIR registered at थाना Rampur under धारा 420 IPC by police")
+    assert result['type'] == 'fir'
+    assert result['scores']['fir'] == 5
+    assert 0 < result['confidence'] <= 1
+    assert service._classify_document("hello world") == 'general'
+    assert service._classify_document("Skills: Python\nExperience: 2 years\nEducation: B.Tech") == 'resume'
@@ -0,0 +1,157 @@
+"""
+Tests for LegalAidService office search (no network: pincode lookups are faked)
+"""
+
+import json
+
+import pytest
+
+from app.services.dlsa_directory import DlsaDirectoryStore
+from app.services.legal_aid_service import LegalAidService, OfficeDirectory
+
+PATNA = (25.61, 85.14)
+
+
+@pytest.fixture(scope='module')
+def service():
+    return LegalAidService(store=DlsaDirectoryStore(use_mongo=False))
+
+
+def test_gps_only_returns_nearest_offices(service):
+    result = service.find_offices(user_lat=PATNA[0], user_lng=PATNA[1])
+    assert result['success'] is True
+    offices = result['offices']
+    assert offices[0]['district'] == 'Patna'
+    assert len(offices) == 10
+    assert [o['distance'] for o in offices] == sorted(o['distance'] for o in offices)
+
+
+def test_radius_limits_gps_results(service):
+    result = service.find_offices(user_lat=PATNA[0], user_lng=PATNA[1], radius_km=120, limit=50)
+    assert result['offices'] and all(o['distance'] <= 120 for o in result['offices'])
+    assert len(result['offices']) < len(service.offices)
+    assert result['query']['radiusKm'] == 120
+
+
+def test_district_match_still_wins_over_gps(service):
+    result = service.find_offices(district='Gaya', user_lat=PATNA[0], user_lng=PATNA[1])
+    assert [o['district'] for o in result['offices']] == ['Gaya']
+    assert result['offices'][0]['distanceText'].endswith(' km')
+
+
+def test_unknown_pincode_with_gps_falls_back_to_nearest(service, monkeypatch):
+    monkeypatch.setattr(service, 'get_location_from_pincode', lambda pincode: {'success': False})
+    result = service.find_offices(pincode='999999', user_lat=PATNA[0], user_lng=PATNA[1])
+    assert result['offices'][0]['district'] == 'Patna'
+
+
+@pytest.mark.parametrize('query, district', [
+    ('Varansi', 'Varanasi'),
+    ('बनारस', 'Varanasi'),
+    ('Allahabad', 'Prayagraj'),
+    ('noida', 'Gautam Buddha Nagar'),
+    ('मुजफ्फरपुर', 'Muzaffarpur'),
+    ('Patna City', 'Patna'),
+    ('Begusaray', 'Begusarai'),
+])
+def test_district_aliases_and_typos(service, query, district):
+    result = service.find_offices(district=query)
+    assert [o['district'] for o in result['offices']] == [district]
+    assert result['offices'][0]['mapsLink'].startswith('https://www.google.com/maps/')
+
+
+def test_other_real_districts_are_not_typo_matched(service):
+    # Raipur/Satna are one or two edits from Jaipur/Patna but are districts of their own
+    for query in ('Raipur', 'Satna', 'Kaimur'):
+        assert 'NALSA' in service.find_offices(district=query)['offices'][0]['name']
+
+
+def test_state_name_in_hindi_lists_state_offices(service):
+    offices = service.find_offices(district='बिहार', limit=50)['offices']
+    assert len(offices) == 24 and {o['state'] for o in offices} == {'Bihar'}
+
+
+def test_pincode_district_is_matched_within_its_state(service, monkeypatch):
+    # Aurangabad is a district of both Bihar and Maharashtra
+    bihar, maharashtra = (next(o for o in service.offices if o['state'] == state)
+                          for state in ('Bihar', 'Maharashtra'))
+    offices = [dict(office, district='Aurangabad', districtHi='औरंगाबाद', pincode=pincode)
+               for office, pincode in ((bihar, '824101'), (maharashtra, '431001'))]
+    monkeypatch.setattr(service, 'directory', OfficeDirectory(offices))
+    monkeypatch.setattr(service, 'get_location_from_pincode', lambda pincode: {
+        'success': True, 'district': 'Aurangabad', 'state': 'Maharashtra', 'lat': None, 'lng': None})
+
+    assert len(service.find_offices(district='Aurangabad')['offices']) == 2
+    result = service.find_offices(pincode='431001')
+    assert [o['state'] for o in result['offices']] == ['Maharashtra']
+
+def test_responses_are_copies(service):
+    first = service.find_offices(district='Gaya', user_lat=PATNA[0], user_lng=PATNA[1])['offices'][0]
+    first['name'] = 'changed'
+    again = service.find_offices(district='Gaya')['offices'][0]
+    assert again['name'] == 'District Legal Services Authority, Gaya' and 'distance' not in again
+
+
+@pytest.fixture
+def client():
+    from flask import Flask
+    from app.routes.legal_aid_routes import legal_aid_bp
+
+    app = Flask(__name__)
+    app.register_blueprint(legal_aid_bp, url_prefix='/api')
+    return app.test_client()
+
+
+def test_suggest_endpoint(client):
+    data = client.get('/api/legal-aid/suggest?q=pat').get_json()
+    assert data['success'] and data['suggestions'][0]['query'] == 'Patna'
+
+    hindi = client.get('/api/legal-aid/suggest', query_string={'q': 'बना'}).get_json()['suggestions']
+    assert [(s['query'], s['matched']) for s in hindi] == [('Varanasi', 'बनारस')]
+
+    office = client.get('/api/legal-aid/suggest?q=tis').get_json()['suggestions']
+    assert office[0]['district'] == 'Central Delhi' and office[0]['matched'] == 'Tis Hazari'
+
+    state = client.get('/api/legal-aid/suggest?q=bih&limit=1').get_json()['suggestions']
+    assert state == [{'type': 'state', 'query': 'Bihar', 'state': 'Bihar', 'stateHi': 'बिहार',
+                      'offices': 24, 'matched': 'Bihar'}]
+
+    assert client.get('/api/legal-aid/suggest?q=').get_json()['suggestions'] == []
+    assert len(client.get('/api/legal-aid/suggest?q=a&limit=99').get_json()['suggestions']) <= 10
+
+
+def test_batch_resolves_coordinates_and_pincodes(service):
+    rows = [
+        {'name': 'A', 'lat': PATNA[0], 'lng': PATNA[1]},
+        {'name': 'B', 'pincode': '221002'},
+        {'name': 'C', 'pincode': '000000'},
+        {'name': 'D', 'lat': '95', 'lng': '80'},
+        {'name': 'E'},
+    ]
+    results = service.find_nearest_batch(rows, k=2)
+    assert [r['success'] for r in results] == [True, True, False, False, False]
+    assert results[0]['resolvedBy'] == 'coordinates' and results[0]['offices'][0]['district'] == 'Patna'
+    assert len(results[0]['offices']) == 2
+    assert results[1]['resolvedBy'] == 'pincode' and results[1]['offices'][0]['district'] == 'Varanasi'
+    assert [r['error'] for r in results[2:]] == ['Unknown pincode', 'Invalid coordinates', 'No location']
+    # Same answer as the single-place search
+    single = service.find_offices(user_lat=PATNA[0], user_lng=PATNA[1], limit=2)['offices']
+    assert [o['name'] for o in results[0]['offices']] == [o['name'] for o in single]
+
+
+def test_batch_endpoint_csv_and_jsonl(client):
+    body = 'name,lat,lng,pincode\nA,25.61,85.14,\nB,,,221002\nC,,,\n'
+    response = client.post('/api/find-legal-aid/batch?k=2', data=body, content_type='text/csv')
+    assert response.status_code == 200 and response.headers['X-Total-Rows'] == '3'
+    lines = response.get_data(as_text=True).lstrip('\ufeff').splitlines()
+    assert lines[0].startswith('index,name,pincode,lat,lng,resolvedBy,rank,officeName')
+    assert len(lines) == 1 + 2 + 2 + 1
+    assert lines[1].split(',')[6] == '1' and lines[-1].endswith('No location')
+
+    response = client.post('/api/find-legal-aid/batch?format=jsonl',
+                           json={'rows': [{'name': 'B', 'pincode': '221002'}]})
+    result, = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert result['offices'][0]['district'] == 'Varanasi' and len(result['offices']) == 1
+
+    assert client.post('/api/find-legal-aid/batch?format=xml', json={'rows': [{}]}).status_code == 400
+    assert client.post('/api/find-legal-aid/batch', json={'rows': []}).status_code == 400
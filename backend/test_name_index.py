@@ -0,0 +1,59 @@
+"""
+Tests for the place-name index (normalization, BK-tree, exact/partial/fuzzy lookup)
+"""
+
+import random
+
+from app.utils.name_index import BKTree, NameIndex, levenshtein, normalize_name
+
+
+def test_normalization_folds_spelling_noise():
+    assert normalize_name('मुज़फ़्फ़रपुर') == normalize_name('मुजफ्फरपुर')
+    assert normalize_name('गाँव') == normalize_name('गांव')
+    assert normalize_name('  BENGALURU. ') == 'bengaluru'
+    assert normalize_name('Saran (Chapra)') == 'saran chapra'
+    assert normalize_name('पटना।') == 'पटना'
+    assert normalize_name('Bihar_Sharif') == 'bihar sharif'
+
+
+def reference_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def test_bit_parallel_levenshtein_matches_dp():
+    rng = random.Random(0)
+    for _ in range(3000):
+        a = ''.join(rng.choice('abcपट') for _ in range(rng.randint(0, 12)))
+        b = ''.join(rng.choice('abcपट') for _ in range(rng.randint(0, 70)))
+        assert levenshtein(a, b) == reference_distance(a, b)
+
+
+def test_bk_tree_matches_brute_force():
+    rng = random.Random(1)
+    words = {''.join(rng.choice('abcde') for _ in range(rng.randint(2, 8))) for _ in range(400)}
+    tree = BKTree(words)
+    assert tree.size == len(words)
+    for query in ('abc', 'deadbe', 'aaaa', 'ecbd'):
+        for max_distance in (0, 1, 2):
+            expected = sorted((levenshtein(query, w), w) for w in words if levenshtein(query, w) <= max_distance)
+            assert tree.search(query, max_distance) == expected
+
+
+def test_name_index_lookups():
+    index = NameIndex([('Varanasi', 0), ('वाराणसी', 0), ('Banaras', 0), ('Patna', 1), ('पटना', 1),
+                       ('Gaya', 2), ('Bihar', 1), ('Bihar', 2)])
+    assert index.exact('VARANASI') == (0,) and index.exact('बनारस') == ()
+    assert index.exact('bihar') == (1, 2)
+    assert index.containing('Varan') == (0,)
+    assert index.containing('Patna City', both_ways=True) == (1,)
+    assert index.containing('Bodh Gaya', both_ways=True) == (2,)
+    assert index.containing('Gayaghat', both_ways=True) == ()
+    assert index.fuzzy('Varansi') == (0,)
+    assert index.fuzzy('पटणा') == (1,)
+    assert index.fuzzy('Gya') == ()  # too short to guess
@@ -0,0 +1,100 @@
+"""
+Tests for the hedged OCR router (fake engines, no network or Tesseract needed)
+"""
+
+import io
+import os
+import time
+
+from werkzeug.datastructures import FileStorage
+
+from app.services.ocr_router import OCRRouter, CLOUD, LOCAL
+from app.utils.upload_spool import SpooledUpload
+
+
+def fake_local_ocr(file_content):
+    """Module-level so the process pool can pickle it"""
+    time.sleep(0.05)
+    return {'success': True, 'text': 'स्थानीय OCR text', 'method': 'Pytesseract (Offline)'}
+
+
+def make_router(**kwargs):
+    return OCRRouter(local_workers=1, local_ocr=fake_local_ocr, local_available=True, **kwargs)
+
+
+def test_slow_cloud_is_hedged_by_local():
+    router = make_router()
+    router.stats[CLOUD].latencies.extend([0.1] * 20)  # observed p90 = 0.1s
+
+    def slow_cloud():
+        time.sleep(1.5)
+        return {'success': True, 'text': 'cloud text', 'method': 'OCR.space API (Cloud)'}
+
+    started = time.monotonic()
+    result = router.extract(lambda: b'image-bytes', False, slow_cloud)
+    assert result['method'] == 'Pytesseract (Offline)'
+    assert result['hedged'] is True
+    assert time.monotonic() - started < 1.5
+
+
+def test_cloud_failure_falls_back_to_local():
+    router = make_router()
+    result = router.extract(lambda: b'image-bytes', False, lambda: {'success': False, 'error': 'bad image'})
+    assert result['success'] is True
+    assert result['method'] == 'Pytesseract (Offline)'
+
+
+def test_quota_exhaustion_makes_local_primary():
+    router = make_router(monthly_quota=1)
+    assert router.primary_engine() == CLOUD
+    router.extract(lambda: b'%PDF', True, lambda: {'success': True, 'text': 'pdf text'})
+    assert router.primary_engine() == LOCAL
+    assert router.get_stats()['cloudQuota']['used'] == 1
+
+
+def test_rate_limit_error_starts_cooldown():
+    router = make_router()
+    router.extract(lambda: b'%PDF', True, lambda: {'success': False, 'error': 'You may only perform this action upto maximum 500 times'})
+    assert router.cloud_quota_available() is False
+    assert router.primary_engine() == LOCAL
+
+
+def test_file_size_error_does_not_start_cooldown():
+    router = make_router()
+    error = 'File size exceeds the maximum permissible file size limit of 1024 KB'
+    router.extract(lambda: b'%PDF', True, lambda: {'success': False, 'error': error})
+    assert router.cloud_quota_available() is True
+    assert router.primary_engine() == CLOUD
+
+
+def test_http_429_starts_cooldown():
+    router = make_router()
+    router.extract(lambda: b'%PDF', True, lambda: {'success': False, 'error': 'Slow down', 'statusCode': 429})
+    assert router.cloud_quota_available() is False
+
+
+def test_running_loser_can_still_read_the_upload():
+    router = make_router()
+    router.stats[CLOUD].latencies.extend([0.05] * 20)
+    payload = b'x' * 4096
+    reads = []
+
+    with SpooledUpload(FileStorage(stream=io.BufferedReader(io.BytesIO(payload)), filename='a.jpg'),
+                       threshold=0) as upload:
+        def slow_cloud():
+            time.sleep(0.5)
+            with upload.open() as handle:
+                reads.append(handle.read())
+            return {'success': True, 'text': 'cloud text'}
+
+        result = router.extract(upload.local_source, False, slow_cloud, hold=upload.hold)
+        path = upload.local_source()
+    # The request is over and the upload closed, but the cloud call is still running
+    assert result['method'] == 'Pytesseract (Offline)'
+    assert os.path.exists(path)
+
+    deadline = time.monotonic() + 3
+    while os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert reads == [payload]
+    assert not os.path.exists(path)
@@ -0,0 +1,144 @@
+"""
+Tests for the offline pincode directory and LegalAidService's pincode resolution
+(the India Post API is always faked)
+"""
+
+import time
+import threading
+
+import pytest
+
+from app.services import legal_aid_service as legal_aid_module
+from app.services.dlsa_directory import DlsaDirectoryStore
+from app.services.legal_aid_service import LegalAidService, PINCODE_SOURCE_OFFLINE, PINCODE_SOURCE_API
+from app.utils.pincode_table import PincodeTable, get_pincode_table, is_valid_pincode
+from app.utils.result_cache import TieredCache
+
+ROWS = [
+    ('842001', 'Muzaffarpur', 'Bihar', 26.12, 85.39),
+    ('800001', 'Patna', 'Bihar', 25.6016, 85.1246),
+    ('800002', 'Patna', 'Bihar', None, None),
+    ('110001', 'New Delhi', 'Delhi', 28.62, 77.21),
+]
+
+
+def test_lookup_is_exact():
+    table = PincodeTable(ROWS)
+    assert len(table) == 4 and len(table.places) == 3
+    assert table.lookup('800001') == {'pincode': '800001', 'district': 'Patna', 'state': 'Bihar',
+                                      'lat': 25.6016, 'lng': 85.1246}
+    assert table.lookup('800002')['lat'] is None
+    for missing in ('800003', '100000', '999999', '80000', '080001', 'abcdef', None):
+        assert table.lookup(missing) is None
+
+
+def test_is_valid_pincode():
+    assert is_valid_pincode('221002')
+    assert not any(is_valid_pincode(p) for p in ('021002', '22100', '2210022', '22 100', 221002))
+
+
+def test_bundled_table_covers_india():
+    table = get_pincode_table()
+    assert len(table) > 19000
+    assert table.lookup('800001')['district'] == 'Patna'
+    assert table.lookup('221002')['state'] == 'Uttar Pradesh'
+    assert table.lookup('110001')['state'] == 'Delhi'
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(legal_aid_module, '_pincode_api_cache', TieredCache('pincode', use_mongo=False))
+    monkeypatch.setattr(legal_aid_module, '_pincode_counters', {'apiCalls': 0, 'negativeHits': 0, 'coalesced': 0})
+    service = LegalAidService(store=DlsaDirectoryStore(use_mongo=False))
+    # Every pincode is "missing" from the bundled table unless a test says otherwise
+    monkeypatch.setattr(service, 'pincode_table', PincodeTable())
+    return service
+
+
+def test_known_pincode_never_calls_the_api(service, monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError('India Post API called for a bundled pincode')
+
+    monkeypatch.setattr(legal_aid_module.requests, 'get', no_network)
+    monkeypatch.setattr(service, 'pincode_table', get_pincode_table())
+    location = service.get_location_from_pincode('842001')
+    assert location['success'] and location['district'] == 'Muzaffarpur'
+    assert location['source'] == PINCODE_SOURCE_OFFLINE
+
+    result = service.find_offices(pincode='842001')
+    assert result['offices'][0]['district'] == 'Muzaffarpur'
+    assert result['offices'][0]['distanceText'].endswith(' km')
+    assert result['pincodeInfo']['source'] == PINCODE_SOURCE_OFFLINE
+
+
+def test_unknown_pincode_falls_back_to_cached_api(service, monkeypatch):
+    calls = []
+
+    def fake_api(pincode):
+        calls.append(pincode)
+        return {'success': True, 'district': 'Gaya', 'state': 'Bihar', 'pincode': pincode,
+                'source': PINCODE_SOURCE_API}
+
+    monkeypatch.setattr(service, '_fetch_pincode_location', fake_api)
+    assert service.get_location_from_pincode('823001')['district'] == 'Gaya'
+    assert service.get_location_from_pincode('823001')['district'] == 'Gaya'
+    assert calls == ['823001']
+
+    assert service.get_location_from_pincode('12345')['success'] is False
+    assert calls == ['823001']
+
+
+def test_failures_are_cached_briefly(service, monkeypatch):
+    calls = []
+
+    def timing_out(pincode):
+        calls.append(pincode)
+        return {'success': False, 'error': 'Request timeout'}
+
+    monkeypatch.setattr(service, '_fetch_pincode_location', timing_out)
+    monkeypatch.setattr(legal_aid_module, 'PINCODE_API_NEGATIVE_TTL', 0.2)
+    assert service.get_location_from_pincode('999999')['success'] is False
+    assert service.get_location_from_pincode('999999')['success'] is False
+    assert calls == ['999999']
+    assert legal_aid_module.get_pincode_cache_stats()['negativeHits'] == 1
+
+    time.sleep(0.25)
+    service.get_location_from_pincode('999999')
+    assert calls == ['999999', '999999']
+
+
+def test_concurrent_misses_share_one_call(service, monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def slow_api(pincode):
+        calls.append(pincode)
+        release.wait(5)
+        return {'success': True, 'district': 'Gaya', 'state': 'Bihar', 'pincode': pincode}
+
+    monkeypatch.setattr(service, '_fetch_pincode_location', slow_api)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.get_location_from_pincode('823001')))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while legal_aid_module.get_pincode_cache_stats()['coalesced'] < 7:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['823001']
+    assert [r['district'] for r in results] == ['Gaya'] * 8
+    stats = legal_aid_module.get_pincode_cache_stats()
+    assert (stats['apiCalls'], stats['coalesced'], stats['inFlight']) == (1, 7, 0)
+
+
+def test_cache_stats_for_health_endpoint(service, monkeypatch):
+    monkeypatch.setattr(service, '_fetch_pincode_location', lambda pincode: {'success': False})
+    service.get_location_from_pincode('999999')
+    service.get_location_from_pincode('999999')
+
+    stats = legal_aid_module.get_pincode_cache_stats()
+    assert stats['offlinePincodes'] > 19000
+    assert (stats['apiCalls'], stats['negativeHits'], stats['memoryHits']) == (1, 1, 1)
@@ -0,0 +1,30 @@
+"""
+Tests for the prefix trie behind legal-aid type-ahead
+"""
+
+import random
+
+from app.utils.prefix_trie import PrefixTrie
+
+
+def test_completions_match_brute_force():
+    rng = random.Random(2)
+    entries = [(''.join(rng.choice('abc') for _ in range(rng.randint(1, 6))), rng.random(), rng.randrange(40), None)
+               for _ in range(300)]
+    trie = PrefixTrie(entries, top_k=5)
+    for prefix in ('', 'a', 'ab', 'cab', 'bbb', 'zz'):
+        best = {}
+        for key, rank, item_id, _ in entries:
+            if key.startswith(prefix) and (item_id not in best or rank < best[item_id]):
+                best[item_id] = rank
+        expected = sorted(best, key=best.get)[:5]
+        assert [item_id for item_id, _ in trie.complete(prefix)] == expected
+        assert len(trie.complete(prefix, limit=2)) == min(2, len(expected))
+
+
+def test_values_report_the_matching_key():
+    trie = PrefixTrie([('varanasi', 1, 'VNS', 'Varanasi'), ('banaras', 2, 'VNS', 'Banaras'),
+                       ('bhopal', 1, 'BPL', 'Bhopal')])
+    assert trie.complete('ban') == [('VNS', 'Banaras')]
+    assert trie.complete('b') == [('BPL', 'Bhopal'), ('VNS', 'Banaras')]
+    assert trie.complete('x') == []
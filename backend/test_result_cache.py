@@ -0,0 +1,107 @@
+"""
+Tests for the two-tier result cache and draft caching
+"""
+
+import time
+from datetime import timedelta
+
+from app.services import draft_service
+from app.services.draft_service import DraftService
+from app.utils.result_cache import TieredCache, cache_key
+
+AI_LETTER = 'सेवा में,\nश्रीमान थाना प्रभारी महोदय,\n' + 'AI द्वारा लिखा गया पत्र। ' * 10
+
+
+class FakeCollection:
+    """Just enough of a pymongo collection for the cache"""
+
+    def __init__(self):
+        self.docs = {}
+
+    def find_one(self, query):
+        doc = self.docs.get(query['_id'])
+        if doc and doc['expiresAt'] > query['expiresAt']['$gt']:
+            return doc
+        return None
+
+    def replace_one(self, query, doc, upsert=False):
+        self.docs[query['_id']] = doc
+
+
+def test_keys_ignore_whitespace_and_empty_fields():
+    a = cache_key('draft', details='मेरे  घर में\nचोरी', sender={'name': ' Sita ', 'phone': ''})
+    b = cache_key('draft', details='मेरे घर में चोरी ', sender={'name': 'Sita'})
+    assert a == b
+    assert a != cache_key('draft', details='मेरे घर में चोरी', sender={'name': 'Gita'})
+    assert a != cache_key('enhance', details='मेरे घर में चोरी', sender={'name': 'Sita'})
+
+
+def test_two_tiers_and_stats():
+    collection = FakeCollection()
+    cache = TieredCache('test', collection=collection)
+    assert cache.get('k') is None
+    cache.set('k', {'draft': 'letter'}, latency=2.5)
+
+    value = cache.get('k')
+    value['draft'] = 'mutated'  # callers get private copies
+    assert cache.get('k') == {'draft': 'letter'}
+
+    # A fresh process: memory is empty, Mongo still has the entry
+    restarted = TieredCache('test', collection=collection)
+    assert restarted.get('k') == {'draft': 'letter'}
+    assert restarted.get('k') == {'draft': 'letter'}
+    stats = restarted.stats()
+    assert (stats['mongoHits'], stats['memoryHits'], stats['misses']) == (1, 1, 0)
+    assert stats['latencySavedSeconds'] == 5.0
+    assert cache.stats()['hitRatio'] == round(2 / 3, 3)
+
+
+def test_generate_draft_is_cached_and_bypassable(monkeypatch):
+    cache = TieredCache('draft', collection=FakeCollection())
+    monkeypatch.setitem(draft_service._result_caches, 'draft', cache)
+    calls = []
+
+    def fake_ai(*args):
+        calls.append(args)
+        time.sleep(0.05)
+        return AI_LETTER
+
+    service = DraftService()
+    service.ai_client = object()
+    service._generate_draft_with_ai = fake_ai
+    args = ('police_complaint', 'mere ghar me chori ho gai', 'hindi', {'name': 'Sita'})
+
+    first = service.generate_draft(*args)
+    second = service.generate_draft('police_complaint', ' mere ghar  me chori ho gai', 'hindi', {'name': 'Sita '})
+    assert len(calls) == 1
+    assert 'cached' not in first and second['cached'] is True
+    assert second['draft'] == first['draft'] and second['tips'] == first['tips']
+
+    service.generate_draft(*args, use_cache=False)
+    assert len(calls) == 2
+    assert cache.stats()['latencySavedSeconds'] >= 0.05
+
+
+def test_per_entry_ttl_overrides_default():
+    collection = FakeCollection()
+    cache = TieredCache('test', collection=collection, ttl=3600)
+    cache.set('short', 'failed', ttl=0.05)
+    cache.set('long', 'found')
+    assert cache.get('short') == 'failed'
+    time.sleep(0.1)
+    assert cache.get('short') is None
+    assert cache.get('long') == 'found'
+    assert collection.docs['long']['expiresAt'] - collection.docs['short']['expiresAt'] > timedelta(minutes=59)
+
+
+def test_entry_from_mongo_keeps_its_remaining_lifetime():
+    # Two workers sharing MongoDB: a short negative entry from one must not be
+    # kept for the default ttl in the other's memory
+    collection = FakeCollection()
+    writer = TieredCache('test', collection=collection, ttl=3600)
+    reader = TieredCache('test', collection=collection, ttl=3600)
+    writer.set('pincode:999999', {'success': False}, ttl=0.1)
+    assert reader.get('pincode:999999') == {'success': False}
+    assert reader.stats()['mongoHits'] == 1
+    time.sleep(0.15)
+    assert reader.get('pincode:999999') is None
@@ -0,0 +1,173 @@
+"""
+Tests for SchemeMatchingService's in-memory scheme snapshot (MongoDB is faked)
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.scheme_matching_service import (
+    SchemeMatchingService, BUILTIN_SCHEMES, SCHEME_SOURCE_BUILTIN, SCHEME_SOURCE_MONGO
+)
+
+
+class FakeSchemes:
+    """Just enough of the government_schemes collection"""
+
+    def __init__(self):
+        self.docs = []
+        self.reads = 0
+
+    def find(self, query, projection):
+        self.reads += 1
+        return [dict(doc) for doc in self.docs if doc.get('active') is not False]
+
+    def find_one(self, query):
+        return next((doc for doc in self.docs if doc['id'] == query['id']), None)
+
+    def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    def update_one(self, query, update, upsert=False):
+        doc = self.find_one(query)
+        if doc is None and upsert:
+            doc = {'id': query['id']}
+            self.docs.append(doc)
+        if doc is not None:
+            doc.update(update['$set'])
+        return SimpleNamespace(matched_count=int(doc is not None))
+
+
+class FakeVersions:
+    def __init__(self):
+        self.docs = {}
+        self.reads = 0
+
+    def find_one(self, query, projection):
+        self.reads += 1
+        return self.docs.get(query['_id'])
+
+    def find_one_and_update(self, query, update, upsert, return_document):
+        doc = self.docs.setdefault(query['_id'], {'_id': query['_id']})
+        doc['version'] = doc.get('version', 0) + update['$inc']['version']
+        doc.update(update['$set'])
+        return dict(doc)
+
+
+def scheme(scheme_id, **fields):
+    return {'id': scheme_id, 'name': scheme_id.title(), 'description': 'd', 'eligibility': 'e', **fields}
+
+
+@pytest.fixture
+def collections():
+    return FakeSchemes(), FakeVersions()
+
+
+def make_service(collections, refresh_interval=0):
+    schemes, versions = collections
+    return SchemeMatchingService(collection=schemes, versions=versions, refresh_interval=refresh_interval)
+
+
+def test_empty_database_serves_builtin_schemes(collections):
+    service = make_service(collections)
+    assert service.get_scheme_count() == len(BUILTIN_SCHEMES)
+    assert service.snapshot_info()['source'] == SCHEME_SOURCE_BUILTIN
+
+
+def test_writes_refresh_snapshot(collections):
+    service = make_service(collections)
+    service.seed_schemes()
+    assert service.snapshot_info()['version'] == 1
+    assert service.snapshot_info()['source'] == SCHEME_SOURCE_MONGO
+
+    assert service.add_scheme(scheme('new_scheme')) == ('new_scheme', None)
+    assert service.get_scheme_count() == len(BUILTIN_SCHEMES) + 1
+
+    service.update_scheme('new_scheme', {'name': 'Renamed'})
+    names = {s['id']: s['name'] for s in service.get_all_schemes()}
+    assert names['new_scheme'] == 'Renamed'
+
+    service.delete_scheme('new_scheme')
+    assert 'new_scheme' not in {s['id'] for s in service.get_all_schemes()}
+    assert service.snapshot_info()['version'] == 4
+    # Failed writes leave the version alone
+    assert service.update_scheme('missing', {'name': 'x'}) == (False, 'Scheme not found')
+    assert service.snapshot_info()['version'] == 4
+
+
+def test_matching_never_reads_mongo(collections):
+    schemes, versions = collections
+    service = make_service(collections)
+    service.seed_schemes()
+    reads = schemes.reads + versions.reads
+    for _ in range(3):
+        result = service.match_schemes(income=100000, land_size=1, category='SC')
+        service.get_all_schemes()
+    assert result['data']['totalSchemes'] == len(BUILTIN_SCHEMES)
+    assert schemes.reads + versions.reads == reads
+
+
+def test_listing_is_a_copy(collections):
+    service = make_service(collections)
+    service.get_all_schemes()[0]['name'] = 'changed'
+    assert service.get_all_schemes()[0]['name'] != 'changed'
+
+
+def test_other_workers_writes_are_polled(collections):
+    worker_a = make_service(collections)
+    worker_b = make_service(collections)
+    worker_a.add_scheme(scheme('from_a'))
+
+    schemes = collections[0]
+    reads = schemes.reads
+    assert worker_b.refresh_if_changed() is True
+    assert [s['id'] for s in worker_b.get_all_schemes()] == ['from_a']
+    # Unchanged version: only the version document is read
+    assert worker_b.refresh_if_changed() is False
+    assert schemes.reads == reads + 1
+
+
+def test_poller_thread(collections):
+    service = make_service(collections, refresh_interval=0.01)
+    try:
+        make_service(collections).add_scheme(scheme('late'))
+        deadline = time.monotonic() + 2
+        while service.snapshot_info()['version'] != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [s['id'] for s in service.get_all_schemes()] == ['late']
+    finally:
+        service._poller.stop(timeout=1)
+
+
+def test_transient_failure_at_startup_is_retried(collections):
+    schemes, versions = collections
+    make_service(collections).seed_schemes()
+    original_find = schemes.find
+
+    def failing_find(query, projection):
+        raise ConnectionError("MongoDB unreachable")
+
+    schemes.find = failing_find
+    service = make_service(collections)
+    # Built-in fallback, not stamped with the database's version
+    assert service.snapshot_info()['source'] == SCHEME_SOURCE_BUILTIN
+    assert service.snapshot_info()['version'] is None
+    assert service.refresh_if_changed() is False
+
+    schemes.find = original_find
+    assert service.refresh_if_changed() is True
+    assert service.snapshot_info() | {'loadedAt': None} == {
+        'version': 1, 'source': SCHEME_SOURCE_MONGO, 'schemes': len(BUILTIN_SCHEMES),
+        'loadedAt': None, 'polling': False
+    }
+
+
+def test_unseeded_database_is_picked_up_without_version_document(collections):
+    schemes, versions = collections
+    service = make_service(collections)
+    assert service.snapshot_info()['source'] == SCHEME_SOURCE_BUILTIN
+    # Written straight to the collection, no version bump
+    schemes.insert_one(scheme('direct'))
+    assert service.refresh_if_changed() is True
+    assert [s['id'] for s in service.get_all_schemes()] == ['direct']
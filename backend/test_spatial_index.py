@@ -0,0 +1,79 @@
+"""
+Tests for the KD-tree spatial index (checked against a brute-force scan)
+"""
+
+import random
+
+from app.utils import spatial_index
+from app.utils.spatial_index import SpatialIndex, CoordinateTable, haversine_km
+
+
+def random_points(count, seed=7):
+    rng = random.Random(seed)
+    return [(rng.uniform(-80, 80), rng.uniform(-180, 180)) for _ in range(count)]
+
+
+def brute_force(points, lat, lng):
+    return sorted((haversine_km(lat, lng, p_lat, p_lng), i) for i, (p_lat, p_lng) in enumerate(points))
+
+
+def test_nearest_matches_brute_force():
+    points = random_points(500)
+    index = SpatialIndex(points)
+    for lat, lng in random_points(50, seed=11):
+        expected = brute_force(points, lat, lng)[:7]
+        result = index.nearest(lat, lng, k=7)
+        assert [i for _, i in result] == [i for _, i in expected]
+        assert all(abs(a - b) < 1e-6 for (a, _), (b, _) in zip(result, expected))
+
+
+def test_within_matches_brute_force():
+    points = random_points(500)
+    index = SpatialIndex(points)
+    for lat, lng in random_points(30, seed=3):
+        expected = [i for d, i in brute_force(points, lat, lng) if d <= 1500]
+        assert [i for _, i in index.within(lat, lng, 1500)] == expected
+
+
+def test_antimeridian_and_limits():
+    index = SpatialIndex([(0.0, 179.9), (0.0, -179.9), (0.0, 170.0)])
+    (distance, nearest), = index.nearest(0.0, -179.95, k=1)
+    assert nearest == 1 and distance < 10
+    assert [i for _, i in index.nearest(0.0, 179.95, k=2)] == [0, 1]
+    assert index.nearest(0.0, 100.0, k=3, max_km=100) == []
+    assert SpatialIndex([]).nearest(0.0, 0.0, k=3) == []
+
+
+def test_coordinate_table_ranks_candidates_like_brute_force():
+    points = random_points(800)
+    table = CoordinateTable(points)
+    candidates = list(range(0, 800, 3))
+    for lat, lng in random_points(20, seed=5):
+        expected = sorted((haversine_km(lat, lng, *points[i]), i) for i in candidates)
+        result = table.nearest(lat, lng, 5, indices=candidates)
+        assert [i for _, i in result] == [i for _, i in expected[:5]]
+        assert all(abs(a - b) < 1e-6 for (a, _), (b, _) in zip(result, expected))
+        within = table.nearest(lat, lng, 1000, indices=candidates, max_km=2000)
+        assert [i for _, i in within] == [i for d, i in expected if d <= 2000]
+
+
+def test_coordinate_table_scalar_fallback(monkeypatch):
+    monkeypatch.setattr(spatial_index, 'NUMPY_AVAILABLE', False)
+    points = random_points(100)
+    table = CoordinateTable(points)
+    lat, lng = 20.0, 80.0
+    expected = sorted((haversine_km(lat, lng, *p), i) for i, p in enumerate(points))[:4]
+    assert [i for _, i in table.nearest(lat, lng, 4)] == [i for _, i in expected]
+
+
+def test_nearest_many_matches_single_queries():
+    points = random_points(500)
+    table = CoordinateTable(points)
+    queries = random_points(60, seed=9)
+    batched = table.nearest_many([lat for lat, _ in queries], [lng for _, lng in queries], k=3)
+    for (lat, lng), result in zip(queries, batched):
+        single = table.nearest(lat, lng, 3)
+        assert [i for _, i in result] == [i for _, i in single]
+        assert all(abs(a - b) < 1e-6 for (a, _), (b, _) in zip(result, single))
+    assert len(CoordinateTable(points[:2]).nearest_many([20.0], [80.0], k=5)[0]) == 2
+    assert table.nearest_many([], [], k=1) == []
@@ -0,0 +1,82 @@
+"""
+Tests for the precompiled Hinglish transliteration engine
+"""
+
+import re
+
+import pytest
+
+from app.utils.transliteration import HINGLISH_MAP, transliterate, transliterate_word
+from app.services.draft_service import DraftService
+from app.services.legal_tips_service import LegalTipsService
+
+
+def legacy_transliterate(text):
+    """The old per-call loop from DraftService._rewrite_with_builtin"""
+    converted = []
+    for word in text.split():
+        clean = word.strip('.,;:!?।|')
+        trail = word[len(clean):] if len(word) > len(clean) else ''
+        lookup = clean.lower()
+        if lookup in HINGLISH_MAP:
+            converted.append(HINGLISH_MAP[lookup] + trail)
+        else:
+            m = re.match(r'^(\d+)(lakh|hazar|hazaar|rupaiye|rupaye)$', lookup)
+            if m:
+                converted.append(f'{m.group(1)} {HINGLISH_MAP.get(m.group(2), m.group(2))}{trail}')
+            else:
+                converted.append(word)
+    return ' '.join(converted)
+
+
+SAMPLES = [
+    'mere ghar me kl chori ho gai rat ke lagbhar 12 baj rhe the 3 log pichhe se tala tod ke andar aaye aur mere 1lakh cash lekr chale gaye',
+    'boss ne 3 month se salary nhi di aur office se nikal diya bina notice ke.',
+    'Mera padosi ne meri 2 bigha zameen pe kabza kar liya hai!! police FIR nahi likh rahi|',
+    'पति ने 50000rupaye दहेज माँगा, mana karne par maarpeet ki।',
+    '',
+]
+
+
+@pytest.mark.parametrize('text', SAMPLES)
+def test_matches_legacy_loop(text):
+    assert transliterate(text) == legacy_transliterate(text)
+
+
+def test_words_and_number_units():
+    assert transliterate_word('Mera') == 'मेरा'
+    assert transliterate_word('5hazar') == '5 हज़ार'
+    assert transliterate_word('xyz') is None
+    assert transliterate('..hai.') == '..है.'
+
+
+def test_table_is_frozen():
+    with pytest.raises(TypeError):
+        HINGLISH_MAP['new'] = 'नया'
+
+
+def test_builtin_rewrite_uses_engine():
+    service = DraftService()
+    result = service._rewrite_with_builtin('mere ghar me chori ho gai. police ne kuch nahi kiya')
+    assert result['rewritten'].startswith('मेरे घर में चोरी हो गई।')
+    assert result['rewritten'].endswith('।')
+
+
+def test_table_keys_are_single_tokens():
+    assert all(key == key.split()[0] for key in HINGLISH_MAP)
+    assert transliterate('uske baad') == 'उसके बाद'
+
+
+def test_tips_search_ignores_function_words():
+    service = LegalTipsService()
+    service.tips_database = {'misc': [
+        {'id': 'police_help', 'hindi': 'पुलिस से मदद कैसे लें'},
+        {'id': 'bank_loan', 'hindi': 'बैंक से लोन की शिकायत'},
+        {'id': 'police_inform', 'hindi': 'पुलिस को सूचना दें'},
+        {'id': 'helpline', 'hindi': 'मदद के लिए हेल्पलाइन से संपर्क करें'},
+    ]}
+    assert service._expand_keywords('se') == {'se'}
+    assert [tip['id'] for tip in service.search_tips('police se madad')] == ['police_help']
+    # "ko" is not required to match, so this still finds पुलिस से मदद
+    assert [tip['id'] for tip in service.search_tips('police ko madad')] == ['police_help']
+    assert [tip['id'] for tip in service.search_tips('shikayat')] == ['bank_loan']
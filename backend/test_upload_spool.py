@@ -0,0 +1,56 @@
+"""
+Tests for disk-spooled upload handling
+"""
+
+import os
+from io import BytesIO
+
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import EnvironBuilder
+
+from app.utils.upload_spool import SpooledRequest, SpooledUpload, SPOOL_THRESHOLD
+
+
+def test_large_multipart_upload_is_spooled_to_named_file():
+    payload = b'x' * (SPOOL_THRESHOLD + 1)
+    builder = EnvironBuilder(method='POST', data={'document': (BytesIO(payload), 'notice.jpg')})
+    request = SpooledRequest(builder.get_environ())
+    try:
+        file = request.files['document']
+        with SpooledUpload(file) as upload:
+            assert upload.on_disk
+            assert upload.local_source() == file.stream.name
+            with upload.open() as handle:
+                assert handle.read() == payload
+    finally:
+        request.close()
+    assert not os.path.exists(file.stream.name)
+
+
+def test_small_upload_shares_one_buffer():
+    data = b'small image bytes'
+    file = FileStorage(stream=BytesIO(data), filename='notice.png')
+    with SpooledUpload(file) as upload:
+        assert not upload.on_disk
+        assert upload.size == len(data)
+        assert upload.local_source() is data
+        assert upload.open().read() == data
+
+
+def test_hold_outlives_the_request_spool():
+    payload = b'x' * (SPOOL_THRESHOLD + 1)
+    builder = EnvironBuilder(method='POST', data={'document': (BytesIO(payload), 'notice.jpg')})
+    request = SpooledRequest(builder.get_environ())
+    file = request.files['document']
+    with SpooledUpload(file) as upload:
+        release = upload.hold()
+        path = upload.local_source()
+        assert path != file.stream.name
+    request.close()
+    assert not os.path.exists(file.stream.name)
+
+    with open(path, 'rb') as handle:
+        assert handle.read() == payload
+    release()
+    release()  # idempotent
+    assert not os.path.exists(path)